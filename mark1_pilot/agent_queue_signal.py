@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+
+from sqlalchemy import make_url
+
+
+# Postgres channel that carries "a run was queued" notices; the payload is the
+# workspace id.
+AGENT_QUEUE_NOTIFY_CHANNEL = "supermega_agent_queue"
+# SQLite has no NOTIFY, so enqueue rewrites a sidecar file next to the database
+# and listeners in other processes watch it.
+AGENT_QUEUE_SIGNAL_SUFFIX = ".agent-queue"
+AGENT_QUEUE_WATCH_SECONDS = 0.2
+
+_LOGGER = logging.getLogger("supermega.agent_queue")
+
+
+class _LocalAgentQueueSignal:
+    """Process-wide condition variable for listeners in the enqueuing process."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        with self._condition:
+            return self._generation
+
+    def notify(self) -> None:
+        with self._condition:
+            self._generation += 1
+            self._condition.notify_all()
+
+    def wait(self, generation: int, timeout: float) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: self._generation != generation, timeout=max(0.0, timeout))
+
+
+_LOCAL_SIGNAL = _LocalAgentQueueSignal()
+
+
+def agent_queue_signal_path(sqlite_path: Path) -> Path:
+    return sqlite_path.with_name(sqlite_path.name + AGENT_QUEUE_SIGNAL_SUFFIX)
+
+
+def signal_agent_queue(workspace_id: str, *, signal_path: Path | None = None) -> None:
+    """Wake listeners after a run was committed to the queue.
+
+    Listeners in this process are woken directly; with ``signal_path`` the
+    sidecar file is replaced so file-watching listeners in other processes
+    wake too. Signalling is best effort: a listener that misses it still
+    picks the run up on its idle timeout.
+    """
+
+    _LOCAL_SIGNAL.notify()
+    if signal_path is None:
+        return
+    try:
+        temp_path = signal_path.with_name(f"{signal_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_text(f"{time.time_ns()} {workspace_id}\n", encoding="utf-8")
+        temp_path.replace(signal_path)
+    except OSError:
+        _LOGGER.warning("supermega.agent_queue: could not write the queue signal file", exc_info=True)
+
+
+def wake_agent_queue_listeners() -> None:
+    """Wake listeners in this process without a new run, e.g. to stop or re-claim."""
+
+    _LOCAL_SIGNAL.notify()
+
+
+class AgentQueueListener:
+    """Blocks until the queue may have new work.
+
+    ``wait`` returns True when woken by a signal and False on timeout. Every
+    listener also wakes on signals raised inside its own process.
+    """
+
+    kind = "local"
+    slice_seconds = AGENT_QUEUE_WATCH_SECONDS
+
+    def __init__(self) -> None:
+        self._generation = _LOCAL_SIGNAL.generation
+
+    def wait(self, timeout: float) -> bool:
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            generation = _LOCAL_SIGNAL.generation
+            if generation != self._generation:
+                self._generation = generation
+                return True
+            if self._poll():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._block(min(self.slice_seconds, remaining))
+
+    def _poll(self) -> bool:
+        return False
+
+    def _block(self, seconds: float) -> None:
+        _LOCAL_SIGNAL.wait(self._generation, seconds)
+
+    def close(self) -> None:
+        return None
+
+
+class FileAgentQueueListener(AgentQueueListener):
+    """Watches the SQLite sidecar signal file written by ``signal_agent_queue``."""
+
+    kind = "sqlite_file_watch"
+
+    def __init__(self, signal_path: Path) -> None:
+        super().__init__()
+        self.signal_path = signal_path
+        self._identity = self._stat()
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            stat = self.signal_path.stat()
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns)
+
+    def _poll(self) -> bool:
+        identity = self._stat()
+        if identity == self._identity:
+            return False
+        self._identity = identity
+        return identity is not None
+
+
+class PostgresAgentQueueListener(AgentQueueListener):
+    """LISTENs on ``AGENT_QUEUE_NOTIFY_CHANNEL`` over a dedicated connection."""
+
+    kind = "postgres_listen"
+
+    def __init__(self, database_url: str, *, workspace_id: str = "") -> None:
+        super().__init__()
+        try:
+            import psycopg
+        except ImportError as exc:  # pragma: no cover - dependency guard
+            raise RuntimeError("Postgres queue notifications need psycopg. Install requirements.txt first.") from exc
+        conninfo = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.workspace_id = str(workspace_id or "").strip()
+        self._notified = False
+        self._connection = psycopg.connect(conninfo, autocommit=True)
+        self._connection.execute(f"LISTEN {AGENT_QUEUE_NOTIFY_CHANNEL}")
+
+    def _poll(self) -> bool:
+        notified, self._notified = self._notified, False
+        return notified
+
+    def _block(self, seconds: float) -> None:
+        for notice in self._connection.notifies(timeout=seconds, stop_after=1):
+            if not self.workspace_id or notice.payload == self.workspace_id:
+                self._notified = True
+
+    def close(self) -> None:
+        self._connection.close()
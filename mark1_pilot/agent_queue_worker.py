@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, wait
+from datetime import datetime, timezone
+import threading
+import time
+from typing import Any, Callable
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from mark1_pilot.agent_governance import (
+    AgentGovernanceError,
+    agent_lease_heartbeat_seconds,
+    load_agent_workforce_policy,
+)
+from mark1_pilot.agent_queue_signal import AgentQueueListener, wake_agent_queue_listeners
+from mark1_pilot.agent_run_executor import ClaimedAgentRunExecutor
+from mark1_pilot.enterprise_store import claim_agent_runs, create_agent_run, renew_agent_run_lease
+
+
+# Throughput is reported over this trailing window.
+AGENT_QUEUE_THROUGHPUT_WINDOW_SECONDS = 600
+# A failed listener is reopened after this delay, doubling up to the cap.
+AGENT_QUEUE_LISTENER_RETRY_SECONDS = 5.0
+AGENT_QUEUE_LISTENER_RETRY_MAX_SECONDS = 300.0
+
+CompleteRun = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+def _queue_lag_seconds(row: dict[str, Any], now: datetime) -> float | None:
+    try:
+        created_at = datetime.fromisoformat(str(row.get("created_at", "")).strip())
+    except ValueError:
+        return None
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (now - created_at).total_seconds())
+
+
+class AgentQueueWorker:
+    """Long-running in-process consumer of the enterprise agent-run queue.
+
+    Claims go straight through ``claim_agent_runs`` and claimed runs execute
+    on a ``ClaimedAgentRunExecutor`` with lease heartbeats. Between claims
+    the worker blocks on ``listener`` until a run is queued, a run of its
+    own finishes, or ``idle_seconds`` pass; the idle timeout still picks up
+    runs that become claimable without a signal, such as requeued retries.
+
+    If the listener fails (for example its Postgres connection drops), the
+    worker keeps claiming on the idle timeout and reopens it through
+    ``reopen_listener`` with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        *,
+        database_url: str,
+        workspace_id: str,
+        job_types: list[str],
+        complete: CompleteRun,
+        listener: AgentQueueListener,
+        limit: int = 8,
+        executor: ClaimedAgentRunExecutor | None = None,
+        enqueue_defaults: bool = True,
+        enqueue_interval_seconds: float = 3600.0,
+        idle_seconds: float = 30.0,
+        claimed_by: str = "supervisor",
+        reopen_listener: Callable[[], AgentQueueListener] | None = None,
+        listener_retry_seconds: float = AGENT_QUEUE_LISTENER_RETRY_SECONDS,
+    ) -> None:
+        policy = load_agent_workforce_policy()
+        self.database_url = database_url
+        self.workspace_id = str(workspace_id)
+        self.job_types = list(job_types)
+        self.complete = complete
+        self.listener = listener
+        self.limit = max(1, int(limit))
+        self.executor = executor or ClaimedAgentRunExecutor(max_workers=policy.max_running)
+        self.heartbeat_seconds = agent_lease_heartbeat_seconds(policy)
+        self.enqueue_defaults_enabled = enqueue_defaults
+        self.enqueue_interval_seconds = max(1.0, float(enqueue_interval_seconds))
+        self.idle_seconds = max(0.01, float(idle_seconds))
+        self.claimed_by = claimed_by
+        self.reopen_listener = reopen_listener
+        self.listener_retry_seconds = max(0.01, float(listener_retry_seconds))
+        self._listener_backoff = self.listener_retry_seconds
+        self._listener_retry_at: float | None = None
+        self._listener_error = ""
+        self.next_enqueue_at = time.monotonic()
+        self.cycle_count = 0
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._in_flight: set[Future[dict[str, Any]]] = set()
+        self._started_at = time.monotonic()
+        self._completed_at: deque[float] = deque()
+        self._counters = {
+            "enqueued_runs": 0,
+            "claimed_runs": 0,
+            "completed_runs": 0,
+            "failed_runs": 0,
+            "wakeups_signalled": 0,
+            "wakeups_idle": 0,
+            "listener_errors": 0,
+        }
+        self._lag_count = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+        self._lag_last: float | None = None
+        self._run_seconds_total = 0.0
+
+    @property
+    def stop_requested(self) -> bool:
+        return self._stop.is_set()
+
+    def request_stop(self) -> None:
+        """Stop claiming; runs already claimed still finish during ``drain``."""
+
+        self._stop.set()
+        wake_agent_queue_listeners()
+
+    def enqueue_defaults(self) -> int:
+        queued = 0
+        for job_type in self.job_types:
+            try:
+                row = create_agent_run(
+                    self.database_url,
+                    workspace_id=self.workspace_id,
+                    job_type=job_type,
+                    source="supervisor",
+                    triggered_by="supervisor",
+                    respect_cadence=True,
+                )
+            except AgentGovernanceError:
+                continue
+            if str(row.get("status", "")).strip() == "queued":
+                queued += 1
+        with self._lock:
+            self._counters["enqueued_runs"] += queued
+        return queued
+
+    def claim_and_start(self) -> int:
+        with self._lock:
+            free_slots = self.executor.max_workers - len(self._in_flight)
+        if free_slots <= 0:
+            return 0
+        rows = claim_agent_runs(
+            self.database_url,
+            workspace_id=self.workspace_id,
+            job_types=self.job_types,
+            limit=min(self.limit, free_slots),
+            claimed_by=self.claimed_by,
+        )
+        now = datetime.now(timezone.utc)
+        for row in rows:
+            lag = _queue_lag_seconds(row, now)
+            with self._lock:
+                self._counters["claimed_runs"] += 1
+                if lag is not None:
+                    self._lag_count += 1
+                    self._lag_total += lag
+                    self._lag_max = max(self._lag_max, lag)
+                    self._lag_last = lag
+            started = time.monotonic()
+            future = self.executor.submit(
+                row,
+                complete=self.complete,
+                renew_lease=self._renew_lease,
+                heartbeat_seconds=self.heartbeat_seconds,
+            )
+            with self._lock:
+                self._in_flight.add(future)
+            future.add_done_callback(lambda done, started=started: self._finished(done, started))
+        return len(rows)
+
+    def _renew_lease(self, row: dict[str, Any]) -> dict[str, Any] | None:
+        return renew_agent_run_lease(
+            self.database_url,
+            workspace_id=self.workspace_id,
+            run_id=str(row.get("run_id", "")).strip(),
+            claim_token=str(row.get("claim_token", "")).strip(),
+        )
+
+    def _finished(self, future: Future[dict[str, Any]], started: float) -> None:
+        finished = time.monotonic()
+        failed = future.exception() is not None or str((future.result() or {}).get("status", "")).strip() == "error"
+        with self._lock:
+            self._in_flight.discard(future)
+            self._counters["failed_runs" if failed else "completed_runs"] += 1
+            self._completed_at.append(finished)
+            self._run_seconds_total += finished - started
+        # A freed slot may let the next queued run be claimed.
+        wake_agent_queue_listeners()
+
+    def _listener_failed(self, exc: Exception) -> str:
+        """Fall back to idle polling and schedule a reopen; returns the error to report."""
+
+        failed, self.listener = self.listener, AgentQueueListener()
+        try:
+            failed.close()
+        except Exception:
+            pass
+        self._listener_retry_at = time.monotonic() + self._listener_backoff
+        self._listener_backoff = min(self._listener_backoff * 2, AGENT_QUEUE_LISTENER_RETRY_MAX_SECONDS)
+        with self._lock:
+            self._counters["listener_errors"] += 1
+            self._listener_error = f"queue listener failed: {exc}"
+            return self._listener_error
+
+    def _reopen_listener_if_due(self) -> str:
+        if self._listener_retry_at is None or time.monotonic() < self._listener_retry_at:
+            return ""
+        if self.reopen_listener is None:
+            self._listener_retry_at = None
+            return ""
+        try:
+            listener = self.reopen_listener()
+        except Exception as exc:
+            return self._listener_failed(exc)
+        self.listener = listener
+        self._listener_retry_at = None
+        self._listener_backoff = self.listener_retry_seconds
+        with self._lock:
+            self._listener_error = ""
+        return ""
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait for claimed runs to finish; True when none are left running."""
+
+        with self._lock:
+            in_flight = set(self._in_flight)
+        _, not_done = wait(in_flight, timeout=timeout)
+        return not not_done
+
+    def metrics(self) -> dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            while self._completed_at and now - self._completed_at[0] > AGENT_QUEUE_THROUGHPUT_WINDOW_SECONDS:
+                self._completed_at.popleft()
+            window_seconds = min(AGENT_QUEUE_THROUGHPUT_WINDOW_SECONDS, max(now - self._started_at, 1.0))
+            finished_runs = self._counters["completed_runs"] + self._counters["failed_runs"]
+            return {
+                "listener": self.listener.kind,
+                "listener_error": self._listener_error,
+                "max_workers": self.executor.max_workers,
+                "in_flight": len(self._in_flight),
+                **self._counters,
+                "throughput_per_minute": round(len(self._completed_at) * 60 / window_seconds, 3),
+                "throughput_window_seconds": round(window_seconds, 1),
+                "queue_lag_seconds": {
+                    "last": round(self._lag_last, 3) if self._lag_last is not None else None,
+                    "mean": round(self._lag_total / self._lag_count, 3) if self._lag_count else None,
+                    "max": round(self._lag_max, 3) if self._lag_count else None,
+                },
+                "mean_run_seconds": round(self._run_seconds_total / finished_runs, 3) if finished_runs else None,
+            }
+
+    def run(
+        self,
+        *,
+        max_cycles: int = 0,
+        on_cycle: Callable[[str, str, int, int], None] | None = None,
+        drain_timeout: float | None = None,
+    ) -> bool:
+        """Claim and wait until stopped, then drain; returns ``drain``'s result.
+
+        ``on_cycle(status, last_error, claimed_count, enqueued_count)`` is
+        called after every claim pass and once more with ``"draining"``.
+        """
+
+        cycles = 0
+        while not self._stop.is_set() and (max_cycles <= 0 or cycles < max_cycles):
+            cycles += 1
+            self.cycle_count += 1
+            claimed_count = 0
+            enqueued_count = 0
+            last_error = ""
+            try:
+                if self.enqueue_defaults_enabled and time.monotonic() >= self.next_enqueue_at:
+                    enqueued_count = self.enqueue_defaults()
+                    self.next_enqueue_at = time.monotonic() + self.enqueue_interval_seconds
+                claimed_count = self.claim_and_start()
+            except (AgentGovernanceError, SQLAlchemyError, OSError, RuntimeError) as exc:
+                last_error = str(exc)
+            if on_cycle is not None:
+                on_cycle("error" if last_error else "listening", last_error, claimed_count, enqueued_count)
+            if claimed_count and not last_error:
+                continue
+            if self._stop.is_set():
+                break
+            listener_error = self._reopen_listener_if_due()
+            if not listener_error:
+                try:
+                    signalled = self.listener.wait(self.idle_seconds)
+                except Exception as exc:
+                    listener_error = self._listener_failed(exc)
+            if listener_error:
+                if on_cycle is not None:
+                    on_cycle("error", listener_error, 0, 0)
+                # Wait out one idle slice on the fallback before the next claim pass.
+                signalled = self.listener.wait(self.idle_seconds)
+            with self._lock:
+                self._counters["wakeups_signalled" if signalled else "wakeups_idle"] += 1
+
+        if on_cycle is not None:
+            on_cycle("draining", "", 0, 0)
+        return self.drain(drain_timeout)
+
+    def close(self) -> None:
+        self.executor.shutdown(wait_for_runs=True)
+        self.listener.close()
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+from mark1_pilot.agent_governance import agent_job_concurrency_limit
+
+
+# The queue processor answers within this many seconds even when claimed runs
+# are still executing, leaving headroom under the supervisor's 120 s timeout.
+AGENT_RUN_RESPONSE_DEADLINE_SECONDS = 90.0
+# A run still executing after this long stops renewing its lease, so the lease
+# expires and another worker can reclaim the run.
+AGENT_RUN_MAX_RUNTIME_SECONDS = 30 * 60.0
+
+_LOGGER = logging.getLogger("supermega.agent_runs")
+
+CompleteRun = Callable[[dict[str, Any]], dict[str, Any]]
+RenewLease = Callable[[dict[str, Any]], dict[str, Any] | None]
+
+
+class ClaimedAgentRunExecutor:
+    """Bounded worker pool for claimed agent runs.
+
+    At most ``max_workers`` runs execute at once, and no job type exceeds its
+    governance concurrency limit; a run whose job type is saturated waits
+    until a run of that type finishes. While a run executes its lease is
+    renewed every ``heartbeat_seconds``, so a run that outlives the HTTP
+    request that claimed it keeps its claim until it completes. A run that
+    hangs past ``max_runtime_seconds`` is abandoned: renewals stop, its future
+    fails with ``TimeoutError`` and its job-type slot is freed.
+
+    ``resize`` swaps in a pool of the new size for runs started afterwards;
+    runs already handed to the old pool finish there.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        concurrency_limit: Callable[[str], int] = agent_job_concurrency_limit,
+    ) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self._concurrency_limit = concurrency_limit
+        self._pool = self._new_pool(self.max_workers)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._running: dict[str, int] = {}
+        self._waiting: dict[str, deque[tuple[Future[dict[str, Any]], Callable[[], None]]]] = {}
+
+    @staticmethod
+    def _new_pool(max_workers: int) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="supermega-agent-run")
+
+    def resize(self, max_workers: int) -> None:
+        max_workers = max(1, int(max_workers))
+        with self._lock:
+            if self._closed or max_workers == self.max_workers:
+                return
+            previous, self._pool = self._pool, self._new_pool(max_workers)
+            self.max_workers = max_workers
+        previous.shutdown(wait=False)
+
+    def submit(
+        self,
+        row: dict[str, Any],
+        *,
+        complete: CompleteRun,
+        renew_lease: RenewLease,
+        heartbeat_seconds: float,
+        max_runtime_seconds: float = AGENT_RUN_MAX_RUNTIME_SECONDS,
+    ) -> Future[dict[str, Any]]:
+        job_type = str(row.get("job_type", "")).strip()
+        future: Future[dict[str, Any]] = Future()
+
+        def start() -> None:
+            with self._lock:
+                if not self._closed:
+                    self._pool.submit(
+                        self._execute, row, future, complete, renew_lease, heartbeat_seconds, max_runtime_seconds
+                    )
+                    return
+                self._running[job_type] = max(0, self._running.get(job_type, 0) - 1)
+            # The slot was handed over just as the executor shut down.
+            future.set_exception(RuntimeError("agent run executor is shut down"))
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("agent run executor is shut down")
+            if self._running.get(job_type, 0) < self._concurrency_limit(job_type):
+                self._running[job_type] = self._running.get(job_type, 0) + 1
+            else:
+                self._waiting.setdefault(job_type, deque()).append((future, start))
+                return future
+        start()
+        return future
+
+    def _execute(
+        self,
+        row: dict[str, Any],
+        future: Future[dict[str, Any]],
+        complete: CompleteRun,
+        renew_lease: RenewLease,
+        heartbeat_seconds: float,
+        max_runtime_seconds: float,
+    ) -> None:
+        job_type = str(row.get("job_type", "")).strip()
+        if not future.set_running_or_notify_cancel():
+            self._release(job_type)
+            return
+        # Whichever of completion and abandonment comes first settles the run.
+        settled = threading.Lock()
+
+        def abandon() -> None:
+            if settled.acquire(blocking=False):
+                future.set_exception(TimeoutError(f"agent run exceeded {max_runtime_seconds:g} s"))
+                self._release(job_type)
+
+        finished = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat,
+            args=(row, renew_lease, heartbeat_seconds, max_runtime_seconds, finished, abandon),
+            name="supermega-agent-lease",
+            daemon=True,
+        )
+        heartbeat.start()
+        error: BaseException | None = None
+        try:
+            result = complete(row)
+        except BaseException as exc:
+            error = exc
+        finished.set()
+        if not settled.acquire(blocking=False):
+            _LOGGER.warning(
+                "supermega.agent_runs: run %s finished after it was abandoned",
+                str(row.get("run_id", "")).strip() or "unknown",
+            )
+            return
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+        self._release(job_type)
+
+    @staticmethod
+    def _heartbeat(
+        row: dict[str, Any],
+        renew_lease: RenewLease,
+        heartbeat_seconds: float,
+        max_runtime_seconds: float,
+        finished: threading.Event,
+        abandon: Callable[[], None],
+    ) -> None:
+        deadline = time.monotonic() + max(0.0, max_runtime_seconds)
+        while not finished.wait(max(0.01, min(heartbeat_seconds, deadline - time.monotonic()))):
+            if time.monotonic() >= deadline:
+                _LOGGER.warning(
+                    "supermega.agent_runs: run %s exceeded its %g s max runtime; letting its lease expire",
+                    str(row.get("run_id", "")).strip() or "unknown",
+                    max_runtime_seconds,
+                )
+                abandon()
+                return
+            try:
+                renewed = renew_lease(row)
+            except Exception:
+                _LOGGER.warning("supermega.agent_runs: lease renewal failed", exc_info=True)
+                continue
+            if renewed is None:
+                _LOGGER.warning(
+                    "supermega.agent_runs: lease lost for run %s",
+                    str(row.get("run_id", "")).strip() or "unknown",
+                )
+                return
+
+    def _release(self, job_type: str) -> None:
+        with self._lock:
+            waiting = self._waiting.get(job_type)
+            if waiting:
+                _, start = waiting.popleft()
+            else:
+                self._running[job_type] = max(0, self._running.get(job_type, 0) - 1)
+                return
+        start()
+
+    def run(
+        self,
+        rows: list[dict[str, Any]],
+        *,
+        complete: CompleteRun,
+        renew_lease: RenewLease,
+        heartbeat_seconds: float,
+        deadline_seconds: float = AGENT_RUN_RESPONSE_DEADLINE_SECONDS,
+        max_runtime_seconds: float = AGENT_RUN_MAX_RUNTIME_SECONDS,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Run ``rows`` and return (completed rows, still-running claimed rows).
+
+        Completed rows keep claim order. Runs still executing at the deadline
+        carry on in the background under their lease heartbeat.
+        """
+
+        futures = [
+            self.submit(
+                row,
+                complete=complete,
+                renew_lease=renew_lease,
+                heartbeat_seconds=heartbeat_seconds,
+                max_runtime_seconds=max_runtime_seconds,
+            )
+            for row in rows
+        ]
+        wait(futures, timeout=max(0.0, deadline_seconds))
+        completed: list[dict[str, Any]] = []
+        pending: list[dict[str, Any]] = []
+        for row, future in zip(rows, futures):
+            if future.done():
+                completed.append(future.result())
+            else:
+                pending.append(row)
+        return completed, pending
+
+    def shutdown(self, *, wait_for_runs: bool = True) -> None:
+        """Stop accepting runs and cancel those still waiting on a job-type slot.
+
+        Cancelled runs keep their claim until the lease expires and the queue
+        hands them out again.
+        """
+
+        with self._lock:
+            self._closed = True
+            waiting = [future for queued in self._waiting.values() for future, _ in queued]
+            self._waiting.clear()
+            pool = self._pool
+        for future in waiting:
+            future.cancel()
+        pool.shutdown(wait=wait_for_runs)
+
+
+_SHARED_EXECUTOR: ClaimedAgentRunExecutor | None = None
+_SHARED_EXECUTOR_LOCK = threading.Lock()
+
+
+def shared_agent_run_executor(max_workers: int) -> ClaimedAgentRunExecutor:
+    """Return the process-wide executor, resized when ``max_workers`` changes.
+
+    Runs may outlive the request that claimed them, so the pool is shared
+    across requests rather than created per call.
+    """
+
+    global _SHARED_EXECUTOR
+    with _SHARED_EXECUTOR_LOCK:
+        if _SHARED_EXECUTOR is None:
+            _SHARED_EXECUTOR = ClaimedAgentRunExecutor(max_workers=max_workers)
+        elif _SHARED_EXECUTOR.max_workers != max(1, int(max_workers)):
+            _LOGGER.info(
+                "supermega.agent_runs: resizing the shared executor from %d to %d workers",
+                _SHARED_EXECUTOR.max_workers,
+                max(1, int(max_workers)),
+            )
+            _SHARED_EXECUTOR.resize(max_workers)
+        return _SHARED_EXECUTOR
+
+
+def shutdown_shared_agent_run_executor(*, wait_for_runs: bool = True) -> None:
+    """Shut the process-wide executor down; the next call creates a new one."""
+
+    global _SHARED_EXECUTOR
+    with _SHARED_EXECUTOR_LOCK:
+        executor, _SHARED_EXECUTOR = _SHARED_EXECUTOR, None
+    if executor is not None:
+        executor.shutdown(wait_for_runs=wait_for_runs)
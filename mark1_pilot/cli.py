@@ -610,7 +610,14 @@ def run_gmail_brief(config_path: str, profile: str, max_results: int, title: str
     return 0 if result.get("status") == "ready" else 1
 
 
-def run_search_index(config_path: str, char_limit: int, top_levels: list[str] | None) -> int:
+def run_search_index(
+    config_path: str,
+    char_limit: int,
+    top_levels: list[str] | None,
+    *,
+    full_rebuild: bool = False,
+    workers: int | None = None,
+) -> int:
     config = PilotConfig.from_path(config_path)
     output_dir = config.output.inventory_path
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -621,6 +628,8 @@ def run_search_index(config_path: str, char_limit: int, top_levels: list[str] |
         db_path,
         char_limit=char_limit,
         top_levels=set(top_levels) if top_levels else None,
+        incremental=not full_rebuild,
+        workers=workers,
     )
     _write_json(output_dir / "search_index_status.json", result)
     print(json.dumps(result, indent=2))
@@ -706,7 +715,12 @@ def run_erp_sync(config_path: str, watch_patterns: list[str]) -> int:
             service_account_json=config.drive.service_account_path,
             folder_id=config.drive.google_drive_folder_id,
         )
-        drive_index_status = drive_probe.list_folder_file_index(max_items=config.erp.drive_max_items)
+        drive_index_state_path = output_dir / config.erp.drive_index_state_file
+        drive_index_status = drive_probe.sync_folder_file_index(
+            drive_index_state_path,
+            max_items=config.erp.drive_max_items,
+            commit=False,
+        )
         _write_json(output_dir / "erp_drive_file_index_status.json", drive_index_status)
 
         if drive_index_status.get("status") == "ready":
@@ -715,6 +729,9 @@ def run_erp_sync(config_path: str, watch_patterns: list[str]) -> int:
                 config=config.erp,
                 drive_file_index=drive_index_status,
             )
+            # The page token only advances once the delta is in the ERP snapshot.
+            if drive_result.get("status") == "ready":
+                drive_probe.commit_folder_file_index(drive_index_state_path)
         else:
             drive_result = {
                 "status": "error",
@@ -2182,6 +2199,17 @@ def build_parser() -> argparse.ArgumentParser:
         default=[],
         help="Restrict indexing to one or more top-level folders or files from the local mirror.",
     )
+    search_index_parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="Drop the existing index and re-extract every file instead of updating changed files only.",
+    )
+    search_index_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Extraction worker processes (default: CPU count, at most 8).",
+    )
 
     search_query_parser = subparsers.add_parser(
         "search-query",
@@ -2600,7 +2628,13 @@ def main() -> int:
     if args.command == "gmail-brief":
         return run_gmail_brief(args.config, args.profile, args.max_results, args.title)
     if args.command == "search-index":
-        return run_search_index(args.config, args.char_limit, args.top_level)
+        return run_search_index(
+            args.config,
+            args.char_limit,
+            args.top_level,
+            full_rebuild=args.full_rebuild,
+            workers=args.workers,
+        )
     if args.command == "search-query":
         return run_search_query(args.config, args.query, args.top_k)
     if args.command == "brief-query":
@@ -214,6 +214,7 @@ class ERPConfig:
     drive_snapshot_file: str = "erp_drive_snapshot.json"
     drive_change_file: str = "erp_drive_change_register.json"
     drive_change_markdown_file: str = "erp_drive_change_register.md"
+    drive_index_state_file: str = "erp_drive_index_state.json"
     drive_max_items: int = 5000
     drive_watch_patterns: list[str] = field(
         default_factory=lambda: [
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import base64
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
+import threading
 from datetime import datetime
 from email.message import EmailMessage
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 from urllib.parse import parse_qs, quote, urlparse, urlunparse
 
 
@@ -22,6 +24,125 @@ NON_FATAL_AUTH_ERROR_HINTS = (
     "reauth",
     "consent",
 )
+GMAIL_METADATA_HEADERS = ["From", "To", "Subject", "Date"]
+# Gmail accepts up to 100 calls per batch but throttles large ones; 50 keeps a
+# batch well inside the per-user concurrency limit.
+GMAIL_BATCH_SIZE = 50
+GMAIL_FETCH_WORKERS = 4
+GMAIL_LIST_PAGE_SIZE = 100
+GMAIL_LIST_MAX_PAGE_SIZE = 500
+
+# Credentials are shared per (token file, scopes) and reloaded when the token
+# file changes; discovery clients wrap a non-thread-safe httplib2 transport, so
+# each thread builds and keeps its own.
+_CREDENTIALS_LOCK = threading.Lock()
+_CREDENTIALS: dict[tuple[str, tuple[str, ...]], tuple[int, Any]] = {}
+_THREAD_SERVICES = threading.local()
+
+
+def _gmail_service(token_json: Path, scopes: list[str]) -> tuple[Any, Any]:
+    """Return cached (credentials, service), refreshing expired credentials.
+
+    Raises ImportError when the Google client libraries are not installed.
+    """
+    from google.oauth2.credentials import Credentials
+    from google.auth.transport.requests import Request
+    from googleapiclient.discovery import build
+
+    key = (str(token_json.expanduser().resolve()), tuple(scopes))
+    stamp = token_json.stat().st_mtime_ns
+    with _CREDENTIALS_LOCK:
+        cached = _CREDENTIALS.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, Credentials.from_authorized_user_file(str(token_json), scopes=scopes))
+            _CREDENTIALS[key] = cached
+        credentials = cached[1]
+        if credentials.expired and credentials.refresh_token:
+            credentials.refresh(Request())
+
+    services = getattr(_THREAD_SERVICES, "services", None)
+    if services is None:
+        services = {}
+        _THREAD_SERVICES.services = services
+    entry = services.get(key)
+    if entry is None or entry[0] is not credentials:
+        entry = (credentials, build("gmail", "v1", credentials=credentials, cache_discovery=False))
+        services[key] = entry
+    return credentials, entry[1]
+
+
+def clear_gmail_service_cache() -> None:
+    """Forget cached credentials and this thread's Gmail clients."""
+    with _CREDENTIALS_LOCK:
+        _CREDENTIALS.clear()
+    _THREAD_SERVICES.services = {}
+
+
+def _thread_http(credentials: Any) -> Any:
+    import google_auth_httplib2
+    import httplib2
+
+    return google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+
+
+def _metadata_request(service: Any, message_id: str) -> Any:
+    return service.users().messages().get(
+        userId="me",
+        id=message_id,
+        format="metadata",
+        metadataHeaders=GMAIL_METADATA_HEADERS,
+    )
+
+
+def _message_summary(message: dict[str, Any]) -> dict[str, Any]:
+    headers = {
+        header["name"]: header["value"]
+        for header in message.get("payload", {}).get("headers", [])
+    }
+    return {
+        "id": message.get("id", ""),
+        "thread_id": message.get("threadId", ""),
+        "snippet": message.get("snippet", ""),
+        "from": headers.get("From", ""),
+        "to": headers.get("To", ""),
+        "subject": headers.get("Subject", ""),
+        "date": headers.get("Date", ""),
+    }
+
+
+def _fetch_message_metadata(service: Any, credentials: Any, message_ids: list[str]) -> list[dict[str, Any]]:
+    """Fetch metadata for ``message_ids`` in one batch call per GMAIL_BATCH_SIZE.
+
+    Messages a batch could not return (a throttled part, or a failed batch)
+    are fetched again with bounded concurrent single gets, each thread on its
+    own authorized transport. Output keeps the listing order.
+    """
+    found: dict[str, dict[str, Any]] = {}
+    retry: list[str] = []
+    for start in range(0, len(message_ids), GMAIL_BATCH_SIZE):
+        chunk = message_ids[start : start + GMAIL_BATCH_SIZE]
+
+        def collect(request_id: str, response: Any, exception: Exception | None) -> None:
+            if exception is None and isinstance(response, dict):
+                found[request_id] = response
+
+        try:
+            batch = service.new_batch_http_request(callback=collect)
+            for message_id in chunk:
+                batch.add(_metadata_request(service, message_id), request_id=message_id)
+            batch.execute()
+        except Exception:
+            pass
+        retry.extend(message_id for message_id in chunk if message_id not in found)
+
+    if retry:
+        def fetch(message_id: str) -> dict[str, Any]:
+            return _metadata_request(service, message_id).execute(http=_thread_http(credentials))
+
+        with ThreadPoolExecutor(max_workers=min(GMAIL_FETCH_WORKERS, len(retry))) as executor:
+            for message_id, message in zip(retry, executor.map(fetch, retry)):
+                found[message_id] = message
+    return [found[message_id] for message_id in message_ids if message_id in found]
 
 
 def _normalize_redirect_uri(uri: str) -> str:
@@ -153,24 +274,7 @@ class GmailProbe:
             }
 
         try:
-            from google.oauth2.credentials import Credentials
-            from google.auth.transport.requests import Request
-            from googleapiclient.discovery import build
-        except ImportError as exc:
-            return {
-                "status": "dependency_missing",
-                "message": f"Gmail API client libraries are not available: {exc}",
-            }
-
-        try:
-            scopes = [GMAIL_READONLY_SCOPE]
-            credentials = Credentials.from_authorized_user_file(
-                str(self.token_json),
-                scopes=scopes,
-            )
-            if credentials.expired and credentials.refresh_token:
-                credentials.refresh(Request())
-            service = build("gmail", "v1", credentials=credentials, cache_discovery=False)
+            _, service = _gmail_service(self.token_json, [GMAIL_READONLY_SCOPE])
             profile = service.users().getProfile(userId="me").execute()
             return {
                 "status": "ready",
@@ -178,6 +282,11 @@ class GmailProbe:
                 "email_address": profile.get("emailAddress", ""),
                 "messages_total": profile.get("messagesTotal", 0),
             }
+        except ImportError as exc:
+            return {
+                "status": "dependency_missing",
+                "message": f"Gmail API client libraries are not available: {exc}",
+            }
         except Exception as exc:
             message = str(exc)
             if any(hint in message.lower() for hint in NON_FATAL_AUTH_ERROR_HINTS):
@@ -533,6 +642,41 @@ class GmailProbe:
             "next_command": _recommended_cli_command("gmail-auth-start"),
         }
 
+    def iter_messages(
+        self,
+        query: str,
+        max_results: int = 10,
+        *,
+        page_size: int = GMAIL_LIST_PAGE_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield message summaries page by page: one list call and one batch each.
+
+        Raises ImportError without the Google client libraries and propagates
+        API errors; ``search_messages`` turns both into status payloads.
+        """
+        if not self.token_json or not self.token_json.exists():
+            raise FileNotFoundError("Gmail OAuth token file does not exist.")
+        credentials, service = _gmail_service(self.token_json, [GMAIL_READONLY_SCOPE])
+        page_size = max(1, min(int(page_size), GMAIL_LIST_MAX_PAGE_SIZE))
+        remaining = max(0, int(max_results))
+        page_token = ""
+        while remaining > 0:
+            list_kwargs: dict[str, Any] = {
+                "userId": "me",
+                "q": query,
+                "maxResults": min(page_size, remaining),
+            }
+            if page_token:
+                list_kwargs["pageToken"] = page_token
+            listing = service.users().messages().list(**list_kwargs).execute()
+            message_ids = [str(item["id"]) for item in listing.get("messages", [])][:remaining]
+            for message in _fetch_message_metadata(service, credentials, message_ids):
+                yield _message_summary(message)
+            remaining -= len(message_ids)
+            page_token = str(listing.get("nextPageToken") or "")
+            if not message_ids or not page_token:
+                break
+
     def search_messages(self, query: str, max_results: int = 10) -> dict[str, Any]:
         if not self.token_json or not self.token_json.exists():
             return {
@@ -541,67 +685,23 @@ class GmailProbe:
             }
 
         try:
-            from google.oauth2.credentials import Credentials
-            from google.auth.transport.requests import Request
-            from googleapiclient.discovery import build
+            results = list(self.iter_messages(query, max_results))
         except ImportError as exc:
             return {
                 "status": "dependency_missing",
                 "message": f"Gmail API client libraries are not available: {exc}",
             }
-
-        try:
-            scopes = [GMAIL_READONLY_SCOPE]
-            credentials = Credentials.from_authorized_user_file(
-                str(self.token_json),
-                scopes=scopes,
-            )
-            if credentials.expired and credentials.refresh_token:
-                credentials.refresh(Request())
-
-            service = build("gmail", "v1", credentials=credentials, cache_discovery=False)
-            listing = service.users().messages().list(
-                userId="me",
-                q=query,
-                maxResults=max_results,
-            ).execute()
-            messages = listing.get("messages", [])
-            results: list[dict[str, Any]] = []
-
-            for item in messages:
-                message = service.users().messages().get(
-                    userId="me",
-                    id=item["id"],
-                    format="metadata",
-                    metadataHeaders=["From", "To", "Subject", "Date"],
-                ).execute()
-                headers = {
-                    header["name"]: header["value"]
-                    for header in message.get("payload", {}).get("headers", [])
-                }
-                results.append(
-                    {
-                        "id": message.get("id", ""),
-                        "thread_id": message.get("threadId", ""),
-                        "snippet": message.get("snippet", ""),
-                        "from": headers.get("From", ""),
-                        "to": headers.get("To", ""),
-                        "subject": headers.get("Subject", ""),
-                        "date": headers.get("Date", ""),
-                    }
-                )
-
-            return {
-                "status": "ready",
-                "query": query,
-                "messages": results,
-            }
         except Exception as exc:
             return {
                 "status": "error",
                 "message": str(exc),
                 "query": query,
             }
+        return {
+            "status": "ready",
+            "query": query,
+            "messages": results,
+        }
 
     @staticmethod
     def build_compose_url(*, to: str, subject: str, body: str) -> str:
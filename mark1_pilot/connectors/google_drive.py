@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from collections import deque
 from datetime import datetime
+import json
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +13,63 @@ SHEETS_SCOPE = "https://www.googleapis.com/auth/spreadsheets"
 FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
 DOC_MIME_TYPE = "application/vnd.google-apps.document"
 SPREADSHEET_MIME_TYPE = "application/vnd.google-apps.spreadsheet"
+# A breadth-first crawl asks for the children of up to this many folders in one
+# files.list query ("'a' in parents or 'b' in parents ..."), keeping the query
+# string well under the Drive API's length limit.
+DRIVE_PARENTS_PER_QUERY = 20
+DRIVE_INDEX_STATE_VERSION = 1
+DRIVE_FILE_FIELDS = (
+    "id,name,mimeType,modifiedTime,size,md5Checksum,webViewLink,driveId,parents,trashed,"
+    "lastModifyingUser(emailAddress,displayName)"
+)
+
+
+def _folder_record(item: dict[str, Any], path: str, parent_id: str) -> dict[str, Any]:
+    return {
+        "id": item.get("id", ""),
+        "name": item.get("name", ""),
+        "path": path,
+        "mime_type": item.get("mimeType", ""),
+        "modified_time": item.get("modifiedTime", ""),
+        "web_view_link": item.get("webViewLink", ""),
+        "drive_id": item.get("driveId", ""),
+        "parent_id": parent_id,
+    }
+
+
+def _file_record(item: dict[str, Any], path: str, parent_id: str) -> dict[str, Any]:
+    return {
+        "id": item.get("id", ""),
+        "name": item.get("name", ""),
+        "path": path,
+        "mime_type": item.get("mimeType", ""),
+        "modified_time": item.get("modifiedTime", ""),
+        "size": item.get("size", ""),
+        "md5_checksum": item.get("md5Checksum", ""),
+        "web_view_link": item.get("webViewLink", ""),
+        "drive_id": item.get("driveId", ""),
+        "last_modified_by": item.get("lastModifyingUser", {}).get("emailAddress", ""),
+        "parent_id": parent_id,
+    }
+
+
+def _is_expired_page_token(exc: Exception) -> bool:
+    status = getattr(getattr(exc, "resp", None), "status", None)
+    return str(status) in {"400", "404", "410"} or "pagetoken" in str(exc).lower()
+
+
+def _pending_index_state_path(path: Path) -> Path:
+    return path.with_suffix(f"{path.suffix}.pending")
+
+
+def _load_index_state(path: Path) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != DRIVE_INDEX_STATE_VERSION:
+        return None
+    return payload
 
 
 class GoogleDriveProbe:
@@ -191,6 +250,93 @@ class GoogleDriveProbe:
                 "message": str(exc),
             }
 
+    def _get_root(self, service: Any) -> dict[str, Any]:
+        root = service.files().get(
+            fileId=self.folder_id,
+            fields="id,name,mimeType,webViewLink,driveId",
+            supportsAllDrives=True,
+        ).execute()
+        return {
+            "id": root.get("id", ""),
+            "name": root.get("name", ""),
+            "mime_type": root.get("mimeType", ""),
+            "web_view_link": root.get("webViewLink", ""),
+            "drive_id": root.get("driveId", ""),
+        }
+
+    @staticmethod
+    def _crawl(
+        service: Any,
+        start: list[tuple[str, str]],
+        *,
+        max_items: int,
+        page_size: int,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], bool]:
+        """Breadth-first crawl from ``start`` (folder id, path) pairs.
+
+        Children of up to DRIVE_PARENTS_PER_QUERY folders are listed per query;
+        each child is placed under whichever queried folder is its parent.
+        """
+        files: list[dict[str, Any]] = []
+        folders: list[dict[str, Any]] = []
+        queue: deque[tuple[str, str]] = deque(start)
+        visited: set[str] = set()
+        truncated = False
+
+        while queue and not truncated:
+            batch: dict[str, str] = {}
+            while queue and len(batch) < DRIVE_PARENTS_PER_QUERY:
+                folder_id, folder_path = queue.popleft()
+                if folder_id not in visited:
+                    visited.add(folder_id)
+                    batch[folder_id] = folder_path
+            if not batch:
+                continue
+            parents_query = " or ".join(
+                f"'{GoogleDriveProbe._escape_query_value(folder_id)}' in parents" for folder_id in batch
+            )
+
+            page_token = None
+            while True:
+                response = service.files().list(
+                    q=f"({parents_query}) and trashed = false",
+                    fields=f"nextPageToken,files({DRIVE_FILE_FIELDS})",
+                    orderBy="folder,name",
+                    pageSize=page_size,
+                    pageToken=page_token,
+                    supportsAllDrives=True,
+                    includeItemsFromAllDrives=True,
+                ).execute()
+
+                for item in response.get("files", []):
+                    parent_id = next((parent for parent in item.get("parents", []) if parent in batch), "")
+                    if not parent_id:
+                        continue
+                    folder_path = batch[parent_id]
+                    name = item.get("name", "")
+                    path = f"{folder_path}/{name}" if folder_path else name
+                    item_id = item.get("id", "")
+
+                    if item.get("mimeType", "") == FOLDER_MIME_TYPE:
+                        folders.append(_folder_record(item, path, parent_id))
+                        if item_id:
+                            queue.append((item_id, path))
+                        continue
+
+                    files.append(_file_record(item, path, parent_id))
+                    if len(files) >= max_items:
+                        truncated = True
+                        break
+
+                if truncated:
+                    break
+
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    break
+
+        return folders, files, truncated
+
     def list_folder_file_index(self, *, max_items: int = 5000, page_size: int = 200) -> dict[str, Any]:
         base_error = self._validate_base_config()
         if base_error:
@@ -206,104 +352,122 @@ class GoogleDriveProbe:
 
         try:
             service, _ = self._build_service([DRIVE_METADATA_SCOPE])
-            root = service.files().get(
-                fileId=self.folder_id,
-                fields="id,name,mimeType,webViewLink,driveId",
-                supportsAllDrives=True,
-            ).execute()
-
-            files: list[dict[str, Any]] = []
-            folders: list[dict[str, Any]] = []
-            queue: list[tuple[str, str]] = [(self.folder_id, "")]
-            visited: set[str] = set()
-            truncated = False
+            root = self._get_root(service)
+            folders, files, truncated = self._crawl(
+                service,
+                [(self.folder_id, "")],
+                max_items=max_items,
+                page_size=page_size,
+            )
+            return self._index_payload(root, folders, files, truncated=truncated, max_items=max_items)
+        except ImportError as exc:
+            return {
+                "status": "dependency_missing",
+                "message": f"Google API client libraries are not available: {exc}",
+            }
+        except Exception as exc:
+            return {
+                "status": "error",
+                "message": str(exc),
+            }
 
-            while queue and not truncated:
-                folder_id, folder_path = queue.pop(0)
-                if folder_id in visited:
-                    continue
-                visited.add(folder_id)
-
-                page_token = None
-                while True:
-                    response = service.files().list(
-                        q=f"'{folder_id}' in parents and trashed = false",
-                        fields=(
-                            "nextPageToken,"
-                            "files(id,name,mimeType,modifiedTime,size,md5Checksum,webViewLink,driveId,"
-                            "lastModifyingUser(emailAddress,displayName))"
-                        ),
-                        orderBy="folder,name",
-                        pageSize=page_size,
-                        pageToken=page_token,
-                        supportsAllDrives=True,
-                        includeItemsFromAllDrives=True,
-                    ).execute()
-
-                    for item in response.get("files", []):
-                        name = item.get("name", "")
-                        path = f"{folder_path}/{name}" if folder_path else name
-                        mime_type = item.get("mimeType", "")
-                        item_id = item.get("id", "")
-
-                        if mime_type == FOLDER_MIME_TYPE:
-                            folders.append(
-                                {
-                                    "id": item_id,
-                                    "name": name,
-                                    "path": path,
-                                    "mime_type": mime_type,
-                                    "modified_time": item.get("modifiedTime", ""),
-                                    "web_view_link": item.get("webViewLink", ""),
-                                    "drive_id": item.get("driveId", ""),
-                                }
-                            )
-                            if item_id:
-                                queue.append((item_id, path))
-                            continue
+    @staticmethod
+    def _index_payload(
+        root: dict[str, Any],
+        folders: list[dict[str, Any]],
+        files: list[dict[str, Any]],
+        *,
+        truncated: bool,
+        max_items: int,
+    ) -> dict[str, Any]:
+        return {
+            "status": "ready",
+            "generated_at": datetime.now().astimezone().isoformat(),
+            "truncated": truncated,
+            "max_items": max_items,
+            "root": root,
+            "folder_count": len(folders),
+            "file_count": len(files),
+            "folders": folders,
+            "files": files,
+        }
 
-                        files.append(
-                            {
-                                "id": item_id,
-                                "name": name,
-                                "path": path,
-                                "mime_type": mime_type,
-                                "modified_time": item.get("modifiedTime", ""),
-                                "size": item.get("size", ""),
-                                "md5_checksum": item.get("md5Checksum", ""),
-                                "web_view_link": item.get("webViewLink", ""),
-                                "drive_id": item.get("driveId", ""),
-                                "last_modified_by": item.get("lastModifyingUser", {}).get("emailAddress", ""),
-                            }
-                        )
-                        if len(files) >= max_items:
-                            truncated = True
-                            break
+    def sync_folder_file_index(
+        self,
+        state_path: Path,
+        *,
+        max_items: int = 5000,
+        page_size: int = 200,
+        commit: bool = True,
+    ) -> dict[str, Any]:
+        """Keep a local folder index current through the Drive Changes API.
+
+        The first run (and any run whose saved page token has expired, whose
+        folder or limit changed, or whose last index was truncated) does a full
+        crawl and saves a start page token taken just before it. Later runs page
+        through changes().list from that token, apply the deltas to the saved
+        index and report them under ``sync``.
+
+        With ``commit=False`` the new index and token are only staged; call
+        ``commit_folder_file_index`` once the delta has been consumed, so a
+        crash in between replays the same changes instead of skipping them.
+        """
+        base_error = self._validate_base_config()
+        if base_error:
+            return base_error
 
-                    if truncated:
-                        break
+        if not self.folder_id:
+            return {
+                "status": "missing_folder_id",
+                "message": "No Google Drive folder ID is configured.",
+            }
 
-                    page_token = response.get("nextPageToken")
-                    if not page_token:
-                        break
+        max_items = max(1, int(max_items))
+        state = _load_index_state(state_path)
 
-            return {
-                "status": "ready",
-                "generated_at": datetime.now().astimezone().isoformat(),
-                "truncated": truncated,
+        try:
+            service, _ = self._build_service([DRIVE_METADATA_SCOPE])
+            if (
+                state is not None
+                and state.get("folder_id") == self.folder_id
+                and state.get("max_items") == max_items
+                and state.get("start_page_token")
+                and not state.get("truncated")
+            ):
+                try:
+                    payload = self._apply_changes(service, state, max_items=max_items, page_size=page_size)
+                except Exception as exc:
+                    if not _is_expired_page_token(exc):
+                        raise
+                else:
+                    self._save_index_state(state_path, state, commit=commit)
+                    return payload
+
+            root = self._get_root(service)
+            token_kwargs: dict[str, Any] = {"supportsAllDrives": True}
+            if root.get("drive_id"):
+                token_kwargs["driveId"] = root["drive_id"]
+            start_page_token = service.changes().getStartPageToken(**token_kwargs).execute().get("startPageToken", "")
+            folders, files, truncated = self._crawl(
+                service,
+                [(self.folder_id, "")],
+                max_items=max_items,
+                page_size=page_size,
+            )
+            state = {
+                "version": DRIVE_INDEX_STATE_VERSION,
+                "folder_id": self.folder_id,
                 "max_items": max_items,
-                "root": {
-                    "id": root.get("id", ""),
-                    "name": root.get("name", ""),
-                    "mime_type": root.get("mimeType", ""),
-                    "web_view_link": root.get("webViewLink", ""),
-                    "drive_id": root.get("driveId", ""),
-                },
-                "folder_count": len(folders),
-                "file_count": len(files),
-                "folders": folders,
-                "files": files,
+                "start_page_token": start_page_token,
+                "truncated": truncated,
+                "root": root,
+                "folders": {folder["id"]: folder for folder in folders if folder.get("id")},
+                "files": {item["id"]: item for item in files if item.get("id")},
             }
+            self._save_index_state(state_path, state, commit=commit)
+            payload = self._index_payload(root, folders, files, truncated=truncated, max_items=max_items)
+            payload["sync"] = {"mode": "full", "changed_file_ids": [], "removed_file_ids": []}
+            return payload
         except ImportError as exc:
             return {
                 "status": "dependency_missing",
@@ -315,6 +479,182 @@ class GoogleDriveProbe:
                 "message": str(exc),
             }
 
+    @staticmethod
+    def _save_index_state(state_path: Path, state: dict[str, Any], *, commit: bool) -> None:
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        staged = state_path.with_suffix(f"{state_path.suffix}.tmp")
+        staged.write_text(json.dumps(state), encoding="utf-8")
+        staged.replace(_pending_index_state_path(state_path))
+        if commit:
+            GoogleDriveProbe.commit_folder_file_index(state_path)
+
+    @staticmethod
+    def commit_folder_file_index(state_path: Path) -> None:
+        """Promote the index state staged by ``sync_folder_file_index(commit=False)``."""
+        pending = _pending_index_state_path(state_path)
+        if pending.exists():
+            pending.replace(state_path)
+
+    def _apply_changes(
+        self,
+        service: Any,
+        state: dict[str, Any],
+        *,
+        max_items: int,
+        page_size: int,
+    ) -> dict[str, Any]:
+        root: dict[str, Any] = state["root"]
+        folders: dict[str, dict[str, Any]] = state["folders"]
+        files: dict[str, dict[str, Any]] = state["files"]
+        before = {file_id: item.get("path", "") for file_id, item in files.items()}
+        indexed_folders = set(folders)
+        changed: set[str] = set()
+
+        list_kwargs: dict[str, Any] = {
+            "fields": f"nextPageToken,newStartPageToken,changes(fileId,removed,file({DRIVE_FILE_FIELDS}))",
+            "pageSize": min(max(1, page_size), 1000),
+            "includeRemoved": True,
+            "supportsAllDrives": True,
+            "includeItemsFromAllDrives": True,
+        }
+        if root.get("drive_id"):
+            list_kwargs["driveId"] = root["drive_id"]
+        page_token = str(state["start_page_token"])
+        entries: dict[str, dict[str, Any] | None] = {}
+        while True:
+            response = service.changes().list(pageToken=page_token, **list_kwargs).execute()
+            for change in response.get("changes", []):
+                file_id = str(change.get("fileId", "")).strip()
+                item = change.get("file") or {}
+                if file_id:
+                    # Only the newest state of each file matters.
+                    entries[file_id] = None if change.get("removed") or item.get("trashed") else item
+            if response.get("newStartPageToken"):
+                state["start_page_token"] = response["newStartPageToken"]
+                break
+            page_token = response.get("nextPageToken", "")
+            if not page_token:
+                break
+
+        for file_id, item in entries.items():
+            if item is None:
+                folders.pop(file_id, None)
+                continue
+            if item.get("mimeType") != FOLDER_MIME_TYPE:
+                continue
+            folders[file_id] = _folder_record(item, "", "")
+            folders[file_id]["parents"] = list(item.get("parents", []))
+        # Resolve folder parents only after every folder change is known, so
+        # a new subtree is tracked regardless of the order its changes arrive in.
+        new_folders: list[str] = []
+        for file_id, item in entries.items():
+            if item is None or item.get("mimeType") != FOLDER_MIME_TYPE:
+                continue
+            record = folders[file_id]
+            parents = record.pop("parents", [])
+            record["parent_id"] = next(
+                (parent for parent in parents if parent == self.folder_id or parent in folders),
+                "",
+            )
+            new_folders.append(file_id)
+
+        for file_id, item in entries.items():
+            if item is not None and item.get("mimeType") == FOLDER_MIME_TYPE:
+                continue
+            files.pop(file_id, None)
+            if item is None:
+                continue
+            parent_id = next(
+                (parent for parent in item.get("parents", []) if parent == self.folder_id or parent in folders),
+                "",
+            )
+            if parent_id:
+                files[file_id] = _file_record(item, "", parent_id)
+                changed.add(file_id)
+
+        folder_paths = self._resolve_folder_paths(folders)
+        for folder_id in [folder_id for folder_id in folders if folder_id not in folder_paths]:
+            del folders[folder_id]
+        for folder_id, path in folder_paths.items():
+            folders[folder_id]["path"] = path
+
+        # A folder moved into the tree brings children the change feed never
+        # mentions, even when it does mention some of them; list every subtree
+        # that was not indexed before.
+        fresh_roots = [
+            (folder_id, folder_paths[folder_id])
+            for folder_id in new_folders
+            if folder_id in folder_paths and folder_id not in indexed_folders
+        ]
+        truncated = False
+        if fresh_roots:
+            sub_folders, sub_files, truncated = self._crawl(
+                service,
+                fresh_roots,
+                max_items=max(1, max_items - len(files)),
+                page_size=page_size,
+            )
+            for folder in sub_folders:
+                folders.setdefault(folder["id"], folder)
+            for item in sub_files:
+                files[item["id"]] = item
+                changed.add(item["id"])
+            folder_paths = self._resolve_folder_paths(folders)
+
+        for file_id in list(files):
+            item = files[file_id]
+            parent_id = item.get("parent_id", "")
+            if parent_id != self.folder_id and parent_id not in folder_paths:
+                del files[file_id]
+                continue
+            folder_path = "" if parent_id == self.folder_id else folder_paths[parent_id]
+            item["path"] = f"{folder_path}/{item.get('name', '')}" if folder_path else item.get("name", "")
+            if before.get(file_id) != item["path"]:
+                changed.add(file_id)
+
+        truncated = truncated or len(files) >= max_items
+        state["truncated"] = truncated
+        payload = self._index_payload(
+            root,
+            list(folders.values()),
+            list(files.values()),
+            truncated=truncated,
+            max_items=max_items,
+        )
+        payload["sync"] = {
+            "mode": "incremental",
+            "changed_file_ids": sorted(file_id for file_id in changed if file_id in files),
+            "removed_file_ids": sorted(file_id for file_id in before if file_id not in files),
+        }
+        return payload
+
+    def _resolve_folder_paths(self, folders: dict[str, dict[str, Any]]) -> dict[str, str]:
+        """Map every folder still connected to the root to its path."""
+        paths: dict[str, str] = {}
+
+        def resolve(folder_id: str, trail: set[str]) -> str | None:
+            if folder_id in paths:
+                return paths[folder_id]
+            record = folders.get(folder_id)
+            if record is None or folder_id in trail:
+                return None
+            parent_id = record.get("parent_id", "")
+            if parent_id == self.folder_id:
+                parent_path: str | None = ""
+            elif parent_id:
+                parent_path = resolve(parent_id, trail | {folder_id})
+            else:
+                parent_path = None
+            if parent_path is None:
+                return None
+            name = record.get("name", "")
+            paths[folder_id] = f"{parent_path}/{name}" if parent_path else name
+            return paths[folder_id]
+
+        for folder_id in folders:
+            resolve(folder_id, set())
+        return paths
+
     def list_shared_drives(self, page_size: int = 100) -> dict[str, Any]:
         base_error = self._validate_base_config()
         if base_error:
@@ -6,12 +6,16 @@ import hmac
 import json
 import os
 import secrets
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import Column, String, Text, or_, text
-from sqlalchemy.pool import NullPool
+from sqlalchemy import Column, String, Text, event, make_url, or_, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
 from sqlmodel import Field, SQLModel, Session, create_engine, select
 
 from mark1_pilot.agent_governance import (
@@ -28,6 +32,14 @@ from mark1_pilot.agent_governance import (
     plan_agent_capacity,
     verify_agent_budget_grant,
 )
+from mark1_pilot.agent_queue_signal import (
+    AGENT_QUEUE_NOTIFY_CHANNEL,
+    AgentQueueListener,
+    FileAgentQueueListener,
+    PostgresAgentQueueListener,
+    agent_queue_signal_path,
+    signal_agent_queue,
+)
 
 
 ENTERPRISE_DB_FILE = "supermega_enterprise.db"
@@ -865,24 +877,125 @@ def resolve_database_url(output_dir: Path) -> str:
     return f"sqlite:///{db_path.as_posix()}"
 
 
+ENTERPRISE_POSTGRES_POOL_SIZE = 5
+ENTERPRISE_POSTGRES_MAX_OVERFLOW = 10
+ENTERPRISE_POSTGRES_POOL_RECYCLE_SECONDS = 1800
+ENTERPRISE_SQLITE_POOL_SIZE = 8
+ENTERPRISE_SQLITE_BUSY_TIMEOUT_MS = 30000
+
+_ENGINE_LOCK = threading.RLock()
+_ENGINES: dict[str, Engine] = {}
+_SCHEMA_STAMPS: dict[str, tuple[str, tuple[int, int] | None]] = {}
+_SCHEMA_VERSION: str | None = None
+
+
 def _connect_args(database_url: str) -> dict[str, Any]:
     if database_url.startswith("sqlite"):
-        return {"check_same_thread": False}
+        return {"check_same_thread": False, "timeout": ENTERPRISE_SQLITE_BUSY_TIMEOUT_MS / 1000}
     return {}
 
 
-def get_engine(database_url: str):
+def _sqlite_file_path(database_url: str) -> Path | None:
+    if not database_url.startswith("sqlite"):
+        return None
+    database = make_url(database_url).database or ""
+    if not database or database == ":memory:" or database.startswith("file:"):
+        return None
+    return Path(database)
+
+
+def _sqlite_file_identity(database_url: str) -> tuple[int, int] | None:
+    path = _sqlite_file_path(database_url)
+    if path is None:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA busy_timeout={ENTERPRISE_SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    finally:
+        cursor.close()
+
+
+def _build_engine(database_url: str) -> Engine:
     engine_options: dict[str, Any] = {"connect_args": _connect_args(database_url)}
     if database_url.startswith("sqlite"):
-        # Store calls build short-lived engines, so do not retain SQLite file
-        # handles between calls. This also keeps local database rotation safe.
-        engine_options["poolclass"] = NullPool
+        if _sqlite_file_path(database_url) is not None:
+            # One shared pool per file; rotation is detected by ensure_schema
+            # through the file identity and handled by dispose_engines.
+            engine_options["poolclass"] = QueuePool
+            engine_options["pool_size"] = ENTERPRISE_SQLITE_POOL_SIZE
+            engine_options["max_overflow"] = 0
+            engine_options["pool_timeout"] = ENTERPRISE_SQLITE_BUSY_TIMEOUT_MS / 1000
+        engine = create_engine(database_url, **engine_options)
+        if _sqlite_file_path(database_url) is not None:
+            event.listen(engine, "connect", _apply_sqlite_pragmas)
+        return engine
+    engine_options["pool_size"] = ENTERPRISE_POSTGRES_POOL_SIZE
+    engine_options["max_overflow"] = ENTERPRISE_POSTGRES_MAX_OVERFLOW
+    engine_options["pool_recycle"] = ENTERPRISE_POSTGRES_POOL_RECYCLE_SECONDS
+    engine_options["pool_pre_ping"] = True
     return create_engine(database_url, **engine_options)
 
 
+def get_engine(database_url: str) -> Engine:
+    with _ENGINE_LOCK:
+        engine = _ENGINES.get(database_url)
+        if engine is None:
+            engine = _build_engine(database_url)
+            _ENGINES[database_url] = engine
+        return engine
+
+
+def dispose_engines(database_url: str | None = None) -> None:
+    """Drop cached engines and schema stamps, for one URL or for every URL.
+
+    Call this after deleting or replacing a database file in place so the next
+    store call reconnects and bootstraps the schema again.
+    """
+    with _ENGINE_LOCK:
+        urls = [database_url] if database_url is not None else list(_ENGINES) + list(_SCHEMA_STAMPS)
+        for url in urls:
+            engine = _ENGINES.pop(url, None)
+            _SCHEMA_STAMPS.pop(url, None)
+            if engine is not None:
+                engine.dispose()
+
+
+def enterprise_schema_version() -> str:
+    global _SCHEMA_VERSION
+    if _SCHEMA_VERSION is None:
+        shape = [
+            [table.name, sorted(f"{column.name}:{column.type}" for column in table.columns)]
+            for table in sorted(SQLModel.metadata.tables.values(), key=lambda item: item.name)
+        ]
+        _SCHEMA_VERSION = hashlib.sha256(json.dumps(shape, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    return _SCHEMA_VERSION
+
+
 def ensure_schema(database_url: str) -> None:
-    engine = get_engine(database_url)
-    SQLModel.metadata.create_all(engine)
+    """Create missing tables once per process, database and schema version."""
+    version = enterprise_schema_version()
+    if _SCHEMA_STAMPS.get(database_url) == (version, _sqlite_file_identity(database_url)):
+        return
+    with _ENGINE_LOCK:
+        identity = _sqlite_file_identity(database_url)
+        stamp = _SCHEMA_STAMPS.get(database_url)
+        if stamp == (version, identity):
+            return
+        if stamp is not None and stamp[1] != identity:
+            # The SQLite file was rotated underneath the pool.
+            dispose_engines(database_url)
+        SQLModel.metadata.create_all(get_engine(database_url))
+        _SCHEMA_STAMPS[database_url] = (version, _sqlite_file_identity(database_url))
 
 
 def ensure_workspace(
@@ -1554,6 +1667,7 @@ def ensure_user(
             )
             session.add(membership)
         session.commit()
+    _SESSION_CACHE.invalidate(database_url, username=normalized_username)
 
     return {
         "status": "ready",
@@ -1743,6 +1857,7 @@ def invite_workspace_member(
             session.add(membership)
             created = True
         session.commit()
+    _SESSION_CACHE.invalidate(database_url, username=normalized_email)
 
     member = next(
         (
@@ -1813,7 +1928,7 @@ def create_session(
     }
 
 
-def get_session(database_url: str, *, session_id: str) -> dict[str, Any] | None:
+def get_session(database_url: str, *, session_id: str, touch: bool = True) -> dict[str, Any] | None:
     ensure_schema(database_url)
     normalized_session_id = str(session_id or "").strip()
     if not normalized_session_id:
@@ -1831,9 +1946,10 @@ def get_session(database_url: str, *, session_id: str) -> dict[str, Any] | None:
             return None
         user = session.get(EnterpriseUser, session_row.username)
         workspace = session.get(EnterpriseWorkspace, session_row.workspace_id)
-        session_row.last_seen_at = now.isoformat()
-        session.add(session_row)
-        session.commit()
+        if touch:
+            session_row.last_seen_at = now.isoformat()
+            session.add(session_row)
+            session.commit()
         return {
             "session_id": session_row.session_id,
             "username": session_row.username,
@@ -1849,11 +1965,192 @@ def get_session(database_url: str, *, session_id: str) -> dict[str, Any] | None:
         }
 
 
+SESSION_CACHE_TTL_SECONDS = 30.0
+SESSION_CACHE_MAX_ENTRIES = 4096
+SESSION_TOUCH_FLUSH_SECONDS = 60.0
+
+
+class _SessionCache:
+    """Bounded TTL cache of resolved sessions with write-behind last_seen_at.
+
+    Entries are scoped to this process, so TTL bounds how long another worker
+    process can keep honouring a session it has not seen revoked.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+        self.pending_touches: dict[tuple[str, str], str] = {}
+        self.flushed_at: dict[tuple[str, str], float] = {}
+        # Earliest moment any pending touch becomes due; take_due() is O(1) until then.
+        self.next_flush_at = float("inf")
+
+    def lookup(self, key: tuple[str, str], now: float) -> dict[str, Any] | None:
+        with self.lock:
+            cached = self.entries.get(key)
+            if cached is None:
+                return None
+            cached_at, payload = cached
+            if now - cached_at >= SESSION_CACHE_TTL_SECONDS:
+                self.entries.pop(key, None)
+                return None
+            self.entries.move_to_end(key)
+            return payload
+
+    def store(self, key: tuple[str, str], payload: dict[str, Any], now: float) -> None:
+        with self.lock:
+            self.entries[key] = (now, payload)
+            self.entries.move_to_end(key)
+            self.flushed_at[key] = now
+            self.pending_touches.pop(key, None)
+            while len(self.entries) > SESSION_CACHE_MAX_ENTRIES:
+                evicted, _ = self.entries.popitem(last=False)
+                self.flushed_at.pop(evicted, None)
+
+    def touch(self, key: tuple[str, str], seen_at: str) -> None:
+        with self.lock:
+            self.pending_touches[key] = seen_at
+            self.next_flush_at = min(self.next_flush_at, self.flushed_at.get(key, 0.0) + SESSION_TOUCH_FLUSH_SECONDS)
+
+    def take_due(self, now: float) -> dict[str, dict[str, str]]:
+        """Remove and return, by database, every pending touch whose window has passed."""
+        with self.lock:
+            if now < self.next_flush_at:
+                return {}
+            due: dict[str, dict[str, str]] = {}
+            next_flush_at = float("inf")
+            for pending_key, pending_seen_at in list(self.pending_touches.items()):
+                flush_at = self.flushed_at.get(pending_key, 0.0) + SESSION_TOUCH_FLUSH_SECONDS
+                if now < flush_at:
+                    next_flush_at = min(next_flush_at, flush_at)
+                    continue
+                due.setdefault(pending_key[0], {})[pending_key[1]] = pending_seen_at
+                self.pending_touches.pop(pending_key, None)
+                self.flushed_at[pending_key] = now
+            self.next_flush_at = next_flush_at
+            return due
+
+    def drain(self, database_url: str | None) -> dict[str, dict[str, str]]:
+        with self.lock:
+            drained: dict[str, dict[str, str]] = {}
+            for key, seen_at in list(self.pending_touches.items()):
+                if database_url is not None and key[0] != database_url:
+                    continue
+                drained.setdefault(key[0], {})[key[1]] = seen_at
+                self.pending_touches.pop(key, None)
+            if not self.pending_touches:
+                self.next_flush_at = float("inf")
+            return drained
+
+    def invalidate(
+        self,
+        database_url: str,
+        *,
+        session_id: str = "",
+        username: str = "",
+    ) -> None:
+        with self.lock:
+            for key, (_, payload) in list(self.entries.items()):
+                if key[0] != database_url:
+                    continue
+                if session_id and key[1] != session_id:
+                    continue
+                if username and str(payload.get("username", "")) != username:
+                    continue
+                self.entries.pop(key, None)
+                self.flushed_at.pop(key, None)
+                if session_id:
+                    self.pending_touches.pop(key, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.pending_touches.clear()
+            self.flushed_at.clear()
+            self.next_flush_at = float("inf")
+
+
+_SESSION_CACHE = _SessionCache()
+
+
+def _write_session_touches(database_url: str, touches: dict[str, str]) -> None:
+    if not touches:
+        return
+    engine = get_engine(database_url)
+    with Session(engine) as session:
+        rows = session.exec(
+            select(EnterpriseSession).where(EnterpriseSession.session_id.in_(sorted(touches)))
+        ).all()
+        for row in rows:
+            seen_at = touches[row.session_id]
+            if seen_at > str(row.last_seen_at or ""):
+                row.last_seen_at = seen_at
+                session.add(row)
+        session.commit()
+
+
+def flush_session_touches(database_url: str | None = None) -> int:
+    """Write every pending last_seen_at touch now; returns the number written.
+
+    The service calls this on shutdown so buffered touches survive a restart.
+    """
+    written = 0
+    for url, touches in _SESSION_CACHE.drain(database_url).items():
+        _write_session_touches(url, touches)
+        written += len(touches)
+    return written
+
+
+def invalidate_cached_sessions(database_url: str, *, session_id: str = "", username: str = "") -> None:
+    _SESSION_CACHE.invalidate(
+        database_url,
+        session_id=str(session_id or "").strip(),
+        username=str(username or "").strip().lower(),
+    )
+
+
+def clear_session_cache() -> None:
+    _SESSION_CACHE.clear()
+
+
+def get_cached_session(database_url: str, *, session_id: str) -> dict[str, Any] | None:
+    """Resolve a session through the process cache, coalescing last_seen_at writes."""
+    normalized_session_id = str(session_id or "").strip()
+    if not normalized_session_id:
+        return None
+    key = (database_url, normalized_session_id)
+    monotonic_now = time.monotonic()
+    cached = _SESSION_CACHE.lookup(key, monotonic_now)
+    if cached is None:
+        resolved = get_session(database_url, session_id=normalized_session_id)
+        # Any lookup, not only a touch of the same session, flushes sessions
+        # that went quiet once their coalescing window has passed.
+        _flush_due_session_touches(monotonic_now)
+        if resolved is not None:
+            _SESSION_CACHE.store(key, resolved, monotonic_now)
+            return dict(resolved)
+        return None
+    now = datetime.now().astimezone()
+    if datetime.fromisoformat(str(cached["expires_at"])) <= now:
+        _SESSION_CACHE.invalidate(database_url, session_id=normalized_session_id)
+        return get_session(database_url, session_id=normalized_session_id)
+    seen_at = now.isoformat()
+    _SESSION_CACHE.touch(key, seen_at)
+    _flush_due_session_touches(monotonic_now)
+    return {**cached, "last_seen_at": seen_at}
+
+
+def _flush_due_session_touches(now: float) -> None:
+    for url, touches in _SESSION_CACHE.take_due(now).items():
+        _write_session_touches(url, touches)
+
+
 def revoke_session(database_url: str, *, session_id: str) -> None:
     ensure_schema(database_url)
     normalized_session_id = str(session_id or "").strip()
     if not normalized_session_id:
         return
+    _SESSION_CACHE.invalidate(database_url, session_id=normalized_session_id)
     engine = get_engine(database_url)
     with Session(engine) as session:
         session_row = session.get(EnterpriseSession, normalized_session_id)
@@ -2595,6 +2892,39 @@ def _resolve_agent_max_attempts(job_type: str, requested: int | None) -> int:
     return min(policy_max_attempts, max(1, requested))
 
 
+def _notify_agent_queue(session: Session, *, workspace_id: str) -> None:
+    """Queue a Postgres NOTIFY; it is delivered only if the enqueue commits."""
+    bind = session.get_bind()
+    if str(getattr(getattr(bind, "dialect", None), "name", "")).strip().lower() == "postgresql":
+        session.exec(
+            text("SELECT pg_notify(:channel, :payload)"),
+            params={"channel": AGENT_QUEUE_NOTIFY_CHANNEL, "payload": workspace_id},
+        )
+
+
+def _signal_agent_queue(database_url: str, *, workspace_id: str) -> None:
+    sqlite_path = _sqlite_file_path(database_url)
+    signal_agent_queue(
+        workspace_id,
+        signal_path=agent_queue_signal_path(sqlite_path) if sqlite_path is not None else None,
+    )
+
+
+def open_agent_queue_listener(database_url: str, *, workspace_id: str = "") -> AgentQueueListener:
+    """Open the wake-up channel that matches the database behind ``database_url``.
+
+    Postgres uses LISTEN/NOTIFY. A SQLite file database is watched through
+    its sidecar signal file, and anything else falls back to the in-process
+    condition variable.
+    """
+    if make_url(database_url).get_backend_name() == "postgresql":
+        return PostgresAgentQueueListener(database_url, workspace_id=workspace_id)
+    sqlite_path = _sqlite_file_path(database_url)
+    if sqlite_path is not None:
+        return FileAgentQueueListener(agent_queue_signal_path(sqlite_path))
+    return AgentQueueListener()
+
+
 def create_agent_run(
     database_url: str,
     *,
@@ -2678,8 +3008,10 @@ def create_agent_run(
             updated_at=now,
         )
         session.add(row)
+        _notify_agent_queue(session, workspace_id=str(workspace_id))
         session.commit()
         session.refresh(row)
+        _signal_agent_queue(database_url, workspace_id=str(workspace_id))
         return {
             **_agent_run_to_dict(row),
             "execution_authorized": False,
@@ -3199,6 +3531,60 @@ def complete_agent_run(
         }
 
 
+def renew_agent_run_lease(
+    database_url: str,
+    *,
+    workspace_id: str,
+    run_id: str,
+    claim_token: str,
+) -> dict[str, Any] | None:
+    """Extend a live execution lease by the policy lease length.
+
+    Returns the new expiry, or None when the claim is stale, consumed, or
+    already expired; the caller has then lost the run and must not complete
+    it.
+    """
+    normalized_claim_token = str(claim_token or "").strip()
+    if not normalized_claim_token:
+        raise AgentGovernanceError("agent_claim_required", "Agent lease renewal requires its private claim token.")
+    ensure_schema(database_url)
+    policy = load_agent_workforce_policy()
+    now_value = _agent_utc_now()
+    now = _agent_timestamp(now_value)
+    engine = get_engine(database_url)
+    with Session(engine) as session:
+        _agent_workspace_lock(session, str(workspace_id))
+        reconciled_expired = _reconcile_expired_agent_reservations(
+            session,
+            workspace_id=str(workspace_id),
+            now=now_value,
+        )
+        claim_digest = hashlib.sha256(normalized_claim_token.encode("utf-8")).hexdigest()
+        reservation = session.exec(
+            select(EnterpriseAgentBudgetReservation).where(
+                EnterpriseAgentBudgetReservation.workspace_id == str(workspace_id),
+                EnterpriseAgentBudgetReservation.run_id == str(run_id),
+                EnterpriseAgentBudgetReservation.claim_token_digest == claim_digest,
+                EnterpriseAgentBudgetReservation.status == "reserved",
+            )
+        ).first()
+        if not reservation:
+            if reconciled_expired:
+                session.commit()
+            else:
+                session.rollback()
+            return None
+        reservation.expires_at = _agent_timestamp(now_value + timedelta(seconds=policy.lease_seconds))
+        reservation.updated_at = now
+        session.add(reservation)
+        session.commit()
+        return {
+            "run_id": reservation.run_id,
+            "reservation_id": reservation.reservation_id,
+            "expires_at": reservation.expires_at,
+        }
+
+
 def add_leads(
     database_url: str,
     *,
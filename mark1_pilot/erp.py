@@ -241,48 +241,54 @@ def _drive_fingerprint(item: dict[str, Any]) -> str:
     return f"{modified}|{size}|{md5}|{path}"
 
 
-def _build_drive_snapshot(
-    *,
-    drive_file_index: dict[str, Any],
-    config: ERPConfig,
-) -> dict[str, Any]:
+def _drive_module_keywords(config: ERPConfig) -> dict[str, list[str]]:
     merged_keywords = dict(DEFAULT_MODULE_KEYWORDS)
     for module, module_keywords in (config.module_keywords or {}).items():
         merged_keywords[module] = module_keywords
+    return merged_keywords
 
-    watch_patterns = config.drive_watch_patterns or config.watch_patterns
-    files: dict[str, dict[str, Any]] = {}
 
-    for item in drive_file_index.get("files", []):
-        file_id = str(item.get("id", "")).strip()
-        if not file_id:
-            continue
+def _drive_snapshot_item(
+    item: dict[str, Any],
+    watch_patterns: list[str],
+    merged_keywords: dict[str, list[str]],
+) -> dict[str, Any] | None:
+    file_id = str(item.get("id", "")).strip()
+    if not file_id:
+        return None
 
-        path = _normalize(str(item.get("path", "")).strip())
-        if not path:
-            continue
+    path = _normalize(str(item.get("path", "")).strip())
+    if not path:
+        return None
 
-        top_level = path.split("/", 1)[0] if "/" in path else path
-        watch_match, matched_patterns = _matches_watch(path, watch_patterns)
+    top_level = path.split("/", 1)[0] if "/" in path else path
+    watch_match, matched_patterns = _matches_watch(path, watch_patterns)
+
+    normalized_item = {
+        "id": file_id,
+        "path": path,
+        "name": item.get("name", ""),
+        "top_level": top_level,
+        "mime_type": item.get("mime_type", ""),
+        "size_bytes": int(item.get("size", 0) or 0),
+        "modified_at": item.get("modified_time", ""),
+        "md5_checksum": item.get("md5_checksum", ""),
+        "web_view_link": item.get("web_view_link", ""),
+        "last_modified_by": item.get("last_modified_by", ""),
+        "module": _module_for_path(path, top_level, merged_keywords),
+        "watch_match": watch_match,
+        "matched_watch_patterns": matched_patterns,
+    }
+    normalized_item["fingerprint"] = _drive_fingerprint(normalized_item)
+    return normalized_item
 
-        normalized_item = {
-            "id": file_id,
-            "path": path,
-            "name": item.get("name", ""),
-            "top_level": top_level,
-            "mime_type": item.get("mime_type", ""),
-            "size_bytes": int(item.get("size", 0) or 0),
-            "modified_at": item.get("modified_time", ""),
-            "md5_checksum": item.get("md5_checksum", ""),
-            "web_view_link": item.get("web_view_link", ""),
-            "last_modified_by": item.get("last_modified_by", ""),
-            "module": _module_for_path(path, top_level, merged_keywords),
-            "watch_match": watch_match,
-            "matched_watch_patterns": matched_patterns,
-        }
-        normalized_item["fingerprint"] = _drive_fingerprint(normalized_item)
-        files[file_id] = normalized_item
 
+def _drive_snapshot_payload(
+    drive_file_index: dict[str, Any],
+    watch_patterns: list[str],
+    merged_keywords: dict[str, list[str]],
+    files: dict[str, dict[str, Any]],
+) -> dict[str, Any]:
     return {
         "generated_at": datetime.now(UTC).isoformat(),
         "source_generated_at": drive_file_index.get("generated_at", ""),
@@ -290,11 +296,75 @@ def _build_drive_snapshot(
         "truncated": bool(drive_file_index.get("truncated", False)),
         "max_items": int(drive_file_index.get("max_items", 0) or 0),
         "watch_patterns": watch_patterns,
+        "module_keywords": merged_keywords,
         "file_count": len(files),
         "files": files,
     }
 
 
+def _build_drive_snapshot(
+    *,
+    drive_file_index: dict[str, Any],
+    config: ERPConfig,
+) -> dict[str, Any]:
+    merged_keywords = _drive_module_keywords(config)
+    watch_patterns = config.drive_watch_patterns or config.watch_patterns
+    files: dict[str, dict[str, Any]] = {}
+
+    for item in drive_file_index.get("files", []):
+        normalized_item = _drive_snapshot_item(item, watch_patterns, merged_keywords)
+        if normalized_item is not None:
+            files[normalized_item["id"]] = normalized_item
+
+    return _drive_snapshot_payload(drive_file_index, watch_patterns, merged_keywords, files)
+
+
+def _apply_drive_delta(
+    *,
+    drive_file_index: dict[str, Any],
+    previous: dict[str, Any],
+    config: ERPConfig,
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]] | None:
+    """Roll the previous snapshot forward with an incremental index's delta.
+
+    Returns the new snapshot plus the previous and current snapshots narrowed
+    to the touched file ids, so only those are compared. Returns None when the
+    delta cannot be trusted against ``previous`` and a full rebuild is needed.
+    """
+    sync = drive_file_index.get("sync") or {}
+    watch_patterns = config.drive_watch_patterns or config.watch_patterns
+    merged_keywords = _drive_module_keywords(config)
+    # Untouched files keep their previous match, so a changed matcher needs a rebuild.
+    if (
+        sync.get("mode") != "incremental"
+        or (previous.get("root") or {}).get("id") != (drive_file_index.get("root") or {}).get("id")
+        or previous.get("watch_patterns") != watch_patterns
+        or previous.get("module_keywords") != merged_keywords
+    ):
+        return None
+
+    changed_ids = {str(file_id) for file_id in sync.get("changed_file_ids", [])}
+    touched_ids = changed_ids | {str(file_id) for file_id in sync.get("removed_file_ids", [])}
+    files = dict(previous.get("files", {}))
+    for file_id in touched_ids:
+        files.pop(file_id, None)
+    for item in drive_file_index.get("files", []):
+        if str(item.get("id", "")).strip() not in changed_ids:
+            continue
+        normalized_item = _drive_snapshot_item(item, watch_patterns, merged_keywords)
+        if normalized_item is not None:
+            files[normalized_item["id"]] = normalized_item
+
+    previous_files = previous.get("files", {})
+    current_snapshot = _drive_snapshot_payload(drive_file_index, watch_patterns, merged_keywords, files)
+    touched_current = {**current_snapshot, "files": {key: files[key] for key in touched_ids if key in files}}
+    touched_previous = {
+        **previous,
+        "files": {key: previous_files[key] for key in touched_ids if key in previous_files},
+    }
+    return current_snapshot, touched_previous, touched_current
+
+
 def _compare_drive_snapshots(
     current: dict[str, Any],
     previous: dict[str, Any] | None,
@@ -567,8 +637,18 @@ def sync_erp_drive_activity(
     markdown_path = output_dir / config.drive_change_markdown_file
 
     previous_snapshot = _load_previous_snapshot(snapshot_path)
-    current_snapshot = _build_drive_snapshot(drive_file_index=drive_file_index, config=config)
-    change_payload = _compare_drive_snapshots(current_snapshot, previous_snapshot, config.max_recent_changes)
+    delta = (
+        _apply_drive_delta(drive_file_index=drive_file_index, previous=previous_snapshot, config=config)
+        if previous_snapshot is not None
+        else None
+    )
+    if delta is not None:
+        current_snapshot, touched_previous, touched_current = delta
+        change_payload = _compare_drive_snapshots(touched_current, touched_previous, config.max_recent_changes)
+    else:
+        current_snapshot = _build_drive_snapshot(drive_file_index=drive_file_index, config=config)
+        change_payload = _compare_drive_snapshots(current_snapshot, previous_snapshot, config.max_recent_changes)
+    change_payload["sync_mode"] = (drive_file_index.get("sync") or {}).get("mode", "full")
 
     snapshot_path.write_text(json.dumps(current_snapshot, indent=2), encoding="utf-8")
     change_path.write_text(json.dumps(change_payload, indent=2), encoding="utf-8")
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any
+
+
+LEAD_CACHE_FILE = "lead_cache.sqlite3"
+LEAD_CACHE_TTL_SECONDS = 6 * 60 * 60
+LEAD_CACHE_MAX_ENTRIES = 2_000
+
+
+@dataclass(frozen=True)
+class LeadCacheEntry:
+    body: str
+    etag: str
+    last_modified: str
+    fetched_at: float
+
+
+class LeadCacheStats:
+    """Hit/miss counters for one lead hunt; safe to share across its threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            served = self.hits + self.revalidated
+            lookups = served + self.misses
+            return {
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "hit_rate": round(served / lookups, 3) if lookups else 0.0,
+            }
+
+
+def _cache_key(key: str) -> str:
+    # Keys are hashed so request URLs (which may carry API keys) never reach disk.
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class LeadResponseCache:
+    """Size-bounded, TTL-aware response cache persisted in one SQLite file.
+
+    Entries older than ``ttl_seconds`` are stale: callers may revalidate them
+    with the stored ETag / Last-Modified validators and ``touch`` them on a
+    304. Beyond ``max_entries`` the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl_seconds: float = LEAD_CACHE_TTL_SECONDS,
+        max_entries: int = LEAD_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.path = path.expanduser().resolve()
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._closed = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS lead_responses (
+                    cache_key TEXT PRIMARY KEY,
+                    body TEXT NOT NULL,
+                    etag TEXT NOT NULL DEFAULT '',
+                    last_modified TEXT NOT NULL DEFAULT '',
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS lead_responses_accessed ON lead_responses (accessed_at)"
+            )
+
+    def get(self, key: str) -> LeadCacheEntry | None:
+        with self._lock:
+            if self._closed:
+                return None
+            with self._connection:
+                row = self._connection.execute(
+                    "SELECT body, etag, last_modified, fetched_at FROM lead_responses WHERE cache_key = ?",
+                    (_cache_key(key),),
+                ).fetchone()
+                if row is None:
+                    return None
+                self._connection.execute(
+                    "UPDATE lead_responses SET accessed_at = ? WHERE cache_key = ?",
+                    (time.time(), _cache_key(key)),
+                )
+        return LeadCacheEntry(body=row[0], etag=row[1], last_modified=row[2], fetched_at=row[3])
+
+    def is_fresh(self, entry: LeadCacheEntry) -> bool:
+        return time.time() - entry.fetched_at < self.ttl_seconds
+
+    def put(self, key: str, body: str, *, etag: str = "", last_modified: str = "") -> None:
+        now = time.time()
+        with self._lock:
+            if self._closed:
+                return
+            with self._connection:
+                self._connection.execute(
+                    """
+                    INSERT INTO lead_responses (cache_key, body, etag, last_modified, fetched_at, accessed_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (cache_key) DO UPDATE SET
+                        body = excluded.body,
+                        etag = excluded.etag,
+                        last_modified = excluded.last_modified,
+                        fetched_at = excluded.fetched_at,
+                        accessed_at = excluded.accessed_at
+                    """,
+                    (_cache_key(key), body, etag, last_modified, now, now),
+                )
+                self._connection.execute(
+                    """
+                    DELETE FROM lead_responses WHERE cache_key IN (
+                        SELECT cache_key FROM lead_responses
+                        ORDER BY accessed_at DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,),
+                )
+
+    def touch(self, key: str) -> None:
+        """Mark a revalidated entry fresh again without rewriting its body."""
+        now = time.time()
+        with self._lock:
+            if self._closed:
+                return
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE lead_responses SET fetched_at = ?, accessed_at = ? WHERE cache_key = ?",
+                    (now, now, _cache_key(key)),
+                )
+
+    def count(self) -> int:
+        with self._lock:
+            return int(self._connection.execute("SELECT COUNT(*) FROM lead_responses").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the file; later lookups miss and writes are dropped."""
+        with self._lock:
+            self._closed = True
+            self._connection.close()
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from contextvars import ContextVar, copy_context
 import json
+import logging
 import re
 from html import unescape
-from typing import Any
+from threading import Lock
+import time
+from typing import Any, Callable, TypeVar
+from urllib.error import HTTPError
 from urllib.parse import parse_qs, urlencode, urlparse
 from urllib.request import Request, urlopen
 import os
+from pathlib import Path
+
+from .lead_cache import LEAD_CACHE_MAX_ENTRIES, LEAD_CACHE_TTL_SECONDS, LeadCacheStats, LeadResponseCache
 
 
 SEARCH_USER_AGENT = (
@@ -29,19 +38,124 @@ STOP_WORDS = {
     "from",
     "that",
 }
-
-
-def _http_get(url: str, *, timeout: int = 8, limit_bytes: int = 250_000) -> str:
-    request = Request(
-        url,
-        headers={
-            "User-Agent": SEARCH_USER_AGENT,
-            "Accept-Language": "en-US,en;q=0.9",
-        },
-    )
-    with urlopen(request, timeout=timeout) as response:
-        content = response.read(limit_bytes)
-    return content.decode("utf-8", errors="ignore")
+# One lead hunt fans its search queries, Places lookups and page enrichment
+# out over worker threads, but never runs past LEAD_HUNT_DEADLINE_SECONDS:
+# whatever has not answered by then is dropped and the hunt returns partial.
+LEAD_HUNT_DEADLINE_SECONDS = 20.0
+LEAD_SEARCH_WORKERS = 6
+LEAD_ENRICH_WORKERS = 4
+LEAD_HUNT_PARALLELISM = 4
+# Requests to the same host start at least this far apart, across every hunt
+# in the process, so a fan-out never bursts one search engine.
+LEAD_HOST_MIN_INTERVAL_SECONDS = 0.25
+EMPTY_PAGE_SIGNALS: dict[str, Any] = {"title": "", "emails": [], "phones": [], "social_profiles": []}
+
+_LOGGER = logging.getLogger("supermega.lead_finder")
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+_HOST_LOCK = Lock()
+_HOST_NEXT_START: dict[str, float] = {}
+# Recurring hunts mostly repeat yesterday's queries, so responses and parsed
+# candidates can be served from a persistent cache once one is configured.
+# Each discover_leads call counts its own hits through _HUNT_CACHE_STATS.
+_LEAD_CACHE: LeadResponseCache | None = None
+_LEAD_CACHE_LOCK = Lock()
+_HUNT_CACHE_STATS: ContextVar[LeadCacheStats | None] = ContextVar("lead_hunt_cache_stats", default=None)
+
+
+def configure_lead_cache(
+    path: Path | None,
+    *,
+    ttl_seconds: float = LEAD_CACHE_TTL_SECONDS,
+    max_entries: int = LEAD_CACHE_MAX_ENTRIES,
+) -> LeadResponseCache | None:
+    """Install (or with ``None`` remove) the process-wide lead response cache."""
+    global _LEAD_CACHE
+    cache = LeadResponseCache(path, ttl_seconds=ttl_seconds, max_entries=max_entries) if path is not None else None
+    with _LEAD_CACHE_LOCK:
+        previous, _LEAD_CACHE = _LEAD_CACHE, cache
+    # Lookups that already hold the old cache see it as empty once closed.
+    if previous is not None:
+        previous.close()
+    return cache
+
+
+def _record_cache(outcome: str) -> None:
+    stats = _HUNT_CACHE_STATS.get()
+    if stats is not None:
+        stats.record(outcome)
+
+
+def _submit(executor: ThreadPoolExecutor, function: Callable[..., _R], *args: Any, **kwargs: Any) -> Future:
+    # Each task runs in its own copy of the caller's context so the hunt's
+    # cache counters follow it onto the worker thread.
+    return executor.submit(copy_context().run, function, *args, **kwargs)
+
+
+def _wait_for_host_slot(url: str, deadline: float | None) -> None:
+    host = urlparse(url).netloc.lower()
+    with _HOST_LOCK:
+        now = time.monotonic()
+        if len(_HOST_NEXT_START) > 512:
+            for stale in [key for key, value in _HOST_NEXT_START.items() if value <= now]:
+                del _HOST_NEXT_START[stale]
+        start = max(now, _HOST_NEXT_START.get(host, 0.0))
+        if deadline is not None and start >= deadline:
+            raise TimeoutError(f"lead hunt deadline reached before {host} was free")
+        _HOST_NEXT_START[host] = start + LEAD_HOST_MIN_INTERVAL_SECONDS
+    if start > now:
+        time.sleep(start - now)
+
+
+def _http_get(
+    url: str,
+    *,
+    timeout: float = 8,
+    limit_bytes: int = 250_000,
+    deadline: float | None = None,
+    cacheable: Callable[[str], bool] | None = None,
+) -> str:
+    """Fetch ``url`` through the lead cache.
+
+    A 2xx body is only stored when ``cacheable`` accepts it, so provider
+    errors and captcha pages served with a 200 are never replayed.
+    """
+    cache = _LEAD_CACHE
+    entry = cache.get(f"url|{url}") if cache is not None else None
+    if cache is not None and entry is not None and cache.is_fresh(entry):
+        _record_cache("hits")
+        return entry.body
+    _wait_for_host_slot(url, deadline)
+    if deadline is not None:
+        timeout = min(timeout, deadline - time.monotonic())
+        if timeout <= 0:
+            raise TimeoutError("lead hunt deadline reached")
+    headers = {
+        "User-Agent": SEARCH_USER_AGENT,
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+    if entry is not None and entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry is not None and entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    request = Request(url, headers=headers)
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            content = response.read(limit_bytes)
+            etag = str(response.headers.get("ETag") or "")
+            last_modified = str(response.headers.get("Last-Modified") or "")
+    except HTTPError as error:
+        if error.code != 304 or cache is None or entry is None:
+            raise
+        cache.touch(f"url|{url}")
+        _record_cache("revalidated")
+        return entry.body
+    body = content.decode("utf-8", errors="ignore")
+    if cache is not None:
+        _record_cache("misses")
+        if cacheable is None or cacheable(body):
+            cache.put(f"url|{url}", body, etag=etag, last_modified=last_modified)
+    return body
 
 
 def _strip_html(value: str) -> str:
@@ -102,11 +216,46 @@ def _query_keywords(query: str, explicit_keywords: list[str] | None) -> list[str
     return output
 
 
-def _extract_page_signals(url: str) -> dict[str, Any]:
+def _map_bounded(
+    function: Callable[[_T], _R],
+    items: list[_T],
+    *,
+    workers: int,
+    deadline: float | None,
+    fallback: _R,
+) -> list[_R]:
+    """Apply ``function`` to ``items`` on at most ``workers`` threads, in order.
+
+    Items that have not finished by ``deadline`` (or that raise) yield
+    ``fallback``; the call itself never outlives the deadline.
+    """
+
+    if not items:
+        return []
+    executor = ThreadPoolExecutor(max_workers=max(1, min(workers, len(items))))
+    futures = [_submit(executor, function, item) for item in items]
+    try:
+        return [_future_result(future, deadline, fallback) for future in futures]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _future_result(future: Future, deadline: float | None, fallback: Any) -> Any:
+    remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+    try:
+        return future.result(timeout=remaining)
+    except FutureTimeout:
+        future.cancel()
+        return fallback
+    except Exception:
+        return fallback
+
+
+def _extract_page_signals(url: str, *, deadline: float | None = None) -> dict[str, Any]:
     try:
-        html = _http_get(url, timeout=12)
+        html = _http_get(url, timeout=12, deadline=deadline)
     except Exception:
-        return {"title": "", "emails": [], "phones": [], "social_profiles": []}
+        return dict(EMPTY_PAGE_SIGNALS)
 
     title_match = re.search(r"<title[^>]*>(.*?)</title>", html, flags=re.I | re.S)
     emails = _unique_values(re.findall(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", html, flags=re.I))
@@ -127,10 +276,13 @@ def _extract_page_signals(url: str) -> dict[str, Any]:
     }
 
 
-def _parse_duckduckgo_results(query: str, limit: int) -> list[dict[str, str]]:
+def _parse_duckduckgo_results(query: str, limit: int, *, deadline: float | None = None) -> list[dict[str, str]]:
     search_url = "https://html.duckduckgo.com/html/?" + urlencode({"q": query})
-    html = _http_get(search_url)
+    html = _http_get(search_url, deadline=deadline, cacheable=lambda body: bool(_duckduckgo_rows(body, 1)))
+    return _duckduckgo_rows(html, limit)
 
+
+def _duckduckgo_rows(html: str, limit: int) -> list[dict[str, str]]:
     anchor_pattern = re.compile(
         r'<a[^>]+class="result__a"[^>]+href="(?P<href>[^"]+)"[^>]*>(?P<title>.*?)</a>',
         flags=re.I | re.S,
@@ -161,10 +313,13 @@ def _parse_duckduckgo_results(query: str, limit: int) -> list[dict[str, str]]:
     return rows
 
 
-def _parse_bing_results(query: str, limit: int) -> list[dict[str, str]]:
+def _parse_bing_results(query: str, limit: int, *, deadline: float | None = None) -> list[dict[str, str]]:
     search_url = "https://www.bing.com/search?" + urlencode({"q": query})
-    html = _http_get(search_url)
+    html = _http_get(search_url, deadline=deadline, cacheable=lambda body: bool(_bing_rows(body, 1)))
+    return _bing_rows(html, limit)
+
 
+def _bing_rows(html: str, limit: int) -> list[dict[str, str]]:
     block_pattern = re.compile(r'<li class="b_algo".*?</li>', flags=re.I | re.S)
     link_pattern = re.compile(r'<h2><a href="(?P<href>[^"]+)"[^>]*>(?P<title>.*?)</a>', flags=re.I | re.S)
     snippet_pattern = re.compile(r'<p>(?P<snippet>.*?)</p>', flags=re.I | re.S)
@@ -195,7 +350,16 @@ def _parse_bing_results(query: str, limit: int) -> list[dict[str, str]]:
     return rows
 
 
-def _google_places_results(query: str, limit: int) -> list[dict[str, Any]]:
+def _places_payload_cacheable(body: str) -> bool:
+    # Places reports quota, key and backend failures as 200s with an error status.
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return False
+    return isinstance(payload, dict) and payload.get("status") in {"OK", "ZERO_RESULTS"}
+
+
+def _google_places_results(query: str, limit: int, *, deadline: float | None = None) -> list[dict[str, Any]]:
     api_key = (
         os.environ.get("GOOGLE_PLACES_API_KEY")
         or os.environ.get("GOOGLE_MAPS_API_KEY")
@@ -214,13 +378,13 @@ def _google_places_results(query: str, limit: int) -> list[dict[str, Any]]:
         }
     )
     try:
-        payload = json.loads(_http_get(text_url, timeout=8))
+        payload = json.loads(_http_get(text_url, timeout=8, deadline=deadline, cacheable=_places_payload_cacheable))
     except Exception:
         return []
 
     results = payload.get("results", []) if isinstance(payload, dict) else []
-    rows: list[dict[str, Any]] = []
-    for item in results[:limit]:
+
+    def place_row(item: dict[str, Any]) -> dict[str, Any]:
         place_id = str(item.get("place_id", "")).strip()
         details: dict[str, Any] = {}
         if place_id:
@@ -232,7 +396,9 @@ def _google_places_results(query: str, limit: int) -> list[dict[str, Any]]:
                 }
             )
             try:
-                detail_payload = json.loads(_http_get(detail_url, timeout=8))
+                detail_payload = json.loads(
+                    _http_get(detail_url, timeout=8, deadline=deadline, cacheable=_places_payload_cacheable)
+                )
                 details = detail_payload.get("result", {}) if isinstance(detail_payload, dict) else {}
             except Exception:
                 details = {}
@@ -244,37 +410,52 @@ def _google_places_results(query: str, limit: int) -> list[dict[str, Any]]:
                 str(details.get("international_phone_number", "")).strip(),
             ]
         )
-        page_signals = _extract_page_signals(website) if website else {"emails": [], "social_profiles": []}
+        page_signals = _extract_page_signals(website, deadline=deadline) if website else {"emails": [], "social_profiles": []}
+
+        return {
+            "name": str(details.get("name") or item.get("name") or "Unknown business").strip(),
+            "email": (page_signals.get("emails") or [""])[0] if isinstance(page_signals.get("emails"), list) else "",
+            "phone": phones[0] if phones else "",
+            "website": website,
+            "source": "Google Maps",
+            "source_url": str(details.get("url") or "").strip(),
+            "snippet": " | ".join(
+                part
+                for part in [
+                    str(item.get("formatted_address", "")).strip(),
+                    f"rating {item.get('rating')}" if item.get("rating") else "",
+                ]
+                if part
+            ),
+            "social_profiles": page_signals.get("social_profiles", [])[:3],
+            "fit_reasons": ["Google Maps result", "Business listing found"],
+            "provider": "Google Places",
+            "score": 6 + (2 if website else 0) + (2 if phones else 0) + (2 if page_signals.get("emails") else 0),
+        }
+
+    rows = _map_bounded(
+        place_row,
+        [item for item in results[:limit] if isinstance(item, dict)],
+        workers=LEAD_ENRICH_WORKERS,
+        deadline=deadline,
+        fallback=None,
+    )
+    return [row for row in rows if row is not None]
 
-        rows.append(
-            {
-                "name": str(details.get("name") or item.get("name") or "Unknown business").strip(),
-                "email": (page_signals.get("emails") or [""])[0] if isinstance(page_signals.get("emails"), list) else "",
-                "phone": phones[0] if phones else "",
-                "website": website,
-                "source": "Google Maps",
-                "source_url": str(details.get("url") or "").strip(),
-                "snippet": " | ".join(
-                    part
-                    for part in [
-                        str(item.get("formatted_address", "")).strip(),
-                        f"rating {item.get('rating')}" if item.get("rating") else "",
-                    ]
-                    if part
-                ),
-                "social_profiles": page_signals.get("social_profiles", [])[:3],
-                "fit_reasons": ["Google Maps result", "Business listing found"],
-                "provider": "Google Places",
-                "score": 6 + (2 if website else 0) + (2 if phones else 0) + (2 if page_signals.get("emails") else 0),
-            }
-        )
-    return rows
 
+def _candidate_source(candidate: dict[str, Any]) -> str:
+    return str(candidate.get("source", "")).strip() or _source_kind_for_url(str(candidate.get("url", "")))
 
-def _candidate_to_row(candidate: dict[str, Any], keywords: list[str]) -> dict[str, Any]:
-    source = str(candidate.get("source", "")).strip() or _source_kind_for_url(str(candidate.get("url", "")))
+
+def _candidate_to_row(
+    candidate: dict[str, Any],
+    keywords: list[str],
+    page_signals: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    source = _candidate_source(candidate)
     source_url = str(candidate.get("url", "")).strip()
-    page_signals = _extract_page_signals(source_url) if source == "Website" else {"title": "", "emails": [], "phones": [], "social_profiles": []}
+    if page_signals is None:
+        page_signals = _extract_page_signals(source_url) if source == "Website" else dict(EMPTY_PAGE_SIGNALS)
 
     title = str(page_signals.get("title") or candidate.get("title") or "Unknown lead").strip()
     email = (page_signals.get("emails") or [""])[0] if isinstance(page_signals.get("emails"), list) else ""
@@ -404,7 +585,57 @@ def parse_leads_from_text(raw_text: str) -> list[dict[str, Any]]:
     return sorted(rows, key=lambda item: (-int(item.get("score", 0)), str(item.get("name", ""))))[:15]
 
 
-def discover_leads(query: str, keywords: list[str] | None = None, sources: list[str] | None = None, limit: int = 10) -> dict[str, Any]:
+def _search_candidates(search_query: str, limit: int, deadline: float | None) -> tuple[str, list[dict[str, str]]]:
+    """Serve one search query from the parsed-candidate cache or the providers.
+
+    The query is counted once here; the page fetches behind a miss are not
+    counted again at the URL level.
+    """
+    cache = _LEAD_CACHE
+    cache_key = f"search|{limit}|{' '.join(search_query.lower().split())}"
+    if cache is not None:
+        entry = cache.get(cache_key)
+        if entry is not None and cache.is_fresh(entry):
+            try:
+                cached = json.loads(entry.body)
+                _record_cache("hits")
+                return str(cached["provider"]), list(cached["candidates"])
+            except (ValueError, KeyError, TypeError):
+                pass
+    if cache is not None:
+        _record_cache("misses")
+    stats_token = _HUNT_CACHE_STATS.set(None)
+    try:
+        provider, candidates = _search_provider_candidates(search_query, limit, deadline)
+    finally:
+        _HUNT_CACHE_STATS.reset(stats_token)
+    if cache is not None and candidates:
+        cache.put(cache_key, json.dumps({"provider": provider, "candidates": candidates}))
+    return provider, candidates
+
+
+def _search_provider_candidates(search_query: str, limit: int, deadline: float | None) -> tuple[str, list[dict[str, str]]]:
+    try:
+        candidates = _parse_duckduckgo_results(search_query, limit, deadline=deadline)
+    except Exception:
+        candidates = []
+    if candidates:
+        return "DuckDuckGo", candidates
+    try:
+        candidates = _parse_bing_results(search_query, limit, deadline=deadline)
+    except Exception:
+        candidates = []
+    return ("Bing" if candidates else ""), candidates
+
+
+def discover_leads(
+    query: str,
+    keywords: list[str] | None = None,
+    sources: list[str] | None = None,
+    limit: int = 10,
+    *,
+    deadline_seconds: float = LEAD_HUNT_DEADLINE_SECONDS,
+) -> dict[str, Any]:
     normalized_query = str(query or "").strip()
     if not normalized_query:
         return {"provider": "none", "rows": []}
@@ -412,33 +643,60 @@ def discover_leads(query: str, keywords: list[str] | None = None, sources: list[
     limit = max(1, min(int(limit or 10), 20))
     normalized_keywords = _query_keywords(normalized_query, keywords)
     active_sources = [source.strip().lower() for source in (sources or ["web", "social", "maps"]) if source.strip()]
+    deadline = time.monotonic() + max(0.0, float(deadline_seconds))
 
     rows: list[dict[str, Any]] = []
     providers: list[str] = []
-
-    if "maps" in active_sources:
-        places_rows = _google_places_results(normalized_query, min(5, limit))
-        if places_rows:
-            providers.append("Google Places")
-            rows.extend(places_rows)
-
-    per_query_limit = max(2, min(4, limit))
-    for search_query in _search_queries(normalized_query, active_sources):
+    partial = False
+    cache_stats = LeadCacheStats()
+    stats_token = _HUNT_CACHE_STATS.set(cache_stats)
+    try:
+        # Places and every search query are independent, so they all start at once;
+        # results are still folded in the serial order so output stays stable.
+        executor = ThreadPoolExecutor(max_workers=LEAD_SEARCH_WORKERS)
         try:
-            candidates = _parse_duckduckgo_results(search_query, per_query_limit)
-        except Exception:
-            candidates = []
-        if candidates:
-            providers.append("DuckDuckGo")
-        else:
-            try:
-                candidates = _parse_bing_results(search_query, per_query_limit)
-            except Exception:
-                candidates = []
-            if candidates:
-                providers.append("Bing")
-        for candidate in candidates:
-            rows.append(_candidate_to_row(candidate, normalized_keywords))
+            places_future = (
+                _submit(executor, _google_places_results, normalized_query, min(5, limit), deadline=deadline)
+                if "maps" in active_sources
+                else None
+            )
+            per_query_limit = max(2, min(4, limit))
+            search_futures = [
+                _submit(executor, _search_candidates, search_query, per_query_limit, deadline)
+                for search_query in _search_queries(normalized_query, active_sources)
+            ]
+            if places_future is not None:
+                places_rows = _future_result(places_future, deadline, None)
+                partial = partial or places_rows is None
+                if places_rows:
+                    providers.append("Google Places")
+                    rows.extend(places_rows)
+            candidates: list[dict[str, str]] = []
+            for future in search_futures:
+                provider, found = _future_result(future, deadline, (None, []))
+                partial = partial or provider is None
+                if provider:
+                    providers.append(provider)
+                candidates.extend(found)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        enrichment = _map_bounded(
+            lambda candidate: (
+                _extract_page_signals(str(candidate.get("url", "")).strip(), deadline=deadline)
+                if _candidate_source(candidate) == "Website"
+                else dict(EMPTY_PAGE_SIGNALS)
+            ),
+            candidates,
+            workers=LEAD_ENRICH_WORKERS,
+            deadline=deadline,
+            fallback=None,
+        )
+    finally:
+        _HUNT_CACHE_STATS.reset(stats_token)
+    for candidate, page_signals in zip(candidates, enrichment):
+        partial = partial or page_signals is None
+        rows.append(_candidate_to_row(candidate, normalized_keywords, page_signals or dict(EMPTY_PAGE_SIGNALS)))
 
     deduped = _dedupe_rows(rows)
     sorted_rows = sorted(
@@ -454,6 +712,8 @@ def discover_leads(query: str, keywords: list[str] | None = None, sources: list[
         "provider": " + ".join(_unique_values(providers)) or "DuckDuckGo",
         "keywords": normalized_keywords,
         "rows": sorted_rows,
+        "partial": partial,
+        "cache": cache_stats.as_dict() if _LEAD_CACHE is not None else None,
     }
 
 
@@ -467,3 +727,25 @@ def run_lead_finder(*, raw_text: str = "", query: str = "", keywords: list[str]
     if str(query or "").strip():
         return discover_leads(query=query, keywords=keywords, sources=sources, limit=limit)
     return {"provider": "Manual", "keywords": [], "rows": parse_leads_from_text(normalized_raw_text)}
+
+
+def run_lead_finder_batch(jobs: list[dict[str, Any]], *, parallelism: int = LEAD_HUNT_PARALLELISM) -> list[dict[str, Any]]:
+    """Run several ``run_lead_finder`` jobs at once; results keep the job order.
+
+    The per-host spacing is process-wide, so parallel hunts still share one
+    polite request rate per search engine. A job that raises is logged and
+    reported as ``status: "error"`` with its message, not as an empty result.
+    """
+
+    if not jobs:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(parallelism, len(jobs)))) as executor:
+        futures = [executor.submit(run_lead_finder, **job) for job in jobs]
+        results: list[dict[str, Any]] = []
+        for index, future in enumerate(futures):
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                _LOGGER.exception("supermega.lead_finder: lead hunt job %d failed", index)
+                results.append({"status": "error", "message": str(exc), "provider": "", "keywords": [], "rows": []})
+        return results
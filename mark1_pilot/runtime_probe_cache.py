@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Future
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable
+
+
+RUNTIME_PROBE_CACHE_MAX_ENTRIES = 256
+# An expired entry is still served, while one refresh runs, for this long;
+# older entries are rebuilt before the caller gets an answer.
+RUNTIME_PROBE_STALE_SECONDS = 3600
+RUNTIME_PROBE_MAX_WORKERS = 8
+RUNTIME_PROBE_REFRESH_WORKERS = 4
+
+_LOGGER = logging.getLogger("supermega.runtime_probes")
+
+
+class DaemonProbeExecutor:
+    """Pool of daemon threads for external probes.
+
+    ``max_workers`` threads serve probes normally. A probe submitted with a
+    ``timeout_seconds`` counts as stuck once it runs past that timeout, and
+    while probes are queued a replacement worker is started for each stuck
+    one, up to ``hard_cap`` threads in total. When a stuck probe finally
+    returns, its worker retires if the pool is still at full strength
+    without it. Daemon workers cannot hold up process exit the way
+    ``ThreadPoolExecutor`` workers do.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        *,
+        hard_cap: int | None = None,
+        thread_name_prefix: str = "supermega-probe",
+    ) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.hard_cap = max(self.max_workers, int(hard_cap if hard_cap is not None else self.max_workers * 4))
+        self._thread_name_prefix = thread_name_prefix
+        self._tasks: queue.SimpleQueue[tuple[Future[Any], Callable[[], Any], float | None]] = queue.SimpleQueue()
+        self._threads: set[threading.Thread] = set()
+        self._stuck_at: dict[threading.Thread, float] = {}
+        self._queued = 0
+        self._idle = 0
+        self._started = 0
+        self._lock = threading.Lock()
+
+    def _stuck_count(self, now: float) -> int:
+        return sum(1 for stuck_at in self._stuck_at.values() if stuck_at <= now)
+
+    def submit(self, fn: Callable[[], Any], *, timeout_seconds: float | None = None) -> Future[Any]:
+        future: Future[Any] = Future()
+        with self._lock:
+            self._queued += 1
+            self._tasks.put((future, fn, timeout_seconds))
+            stuck = self._stuck_count(time.monotonic())
+            if (
+                self._queued > self._idle
+                and len(self._threads) - stuck < self.max_workers
+                and len(self._threads) < self.hard_cap
+            ):
+                if stuck:
+                    _LOGGER.warning(
+                        "supermega.runtime_probes: %d probe worker(s) stuck past their timeout; starting a replacement",
+                        stuck,
+                    )
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self._thread_name_prefix}-{self._started}",
+                    daemon=True,
+                )
+                self._started += 1
+                self._threads.add(thread)
+                thread.start()
+        return future
+
+    def _work(self) -> None:
+        me = threading.current_thread()
+        while True:
+            with self._lock:
+                self._idle += 1
+            future, fn, timeout_seconds = self._tasks.get()
+            with self._lock:
+                self._idle -= 1
+                self._queued -= 1
+                self._stuck_at[me] = (
+                    time.monotonic() + max(0.0, float(timeout_seconds)) if timeout_seconds is not None else float("inf")
+                )
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn()
+                except BaseException as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+            with self._lock:
+                self._stuck_at.pop(me, None)
+                if len(self._threads) - self._stuck_count(time.monotonic()) > self.max_workers:
+                    self._threads.discard(me)
+                    return
+
+    def worker_count(self) -> int:
+        with self._lock:
+            return len(self._threads)
+
+
+class RuntimeProbeCache:
+    """Size-bounded TTL cache for slow runtime probes.
+
+    - A fresh entry is returned as is.
+    - An expired entry younger than ``stale_seconds`` is returned at once
+      while one background refresh rebuilds it.
+    - A missing or too-old entry is built by the first caller; concurrent
+      callers for the same key wait for that build instead of starting
+      their own (single flight). Builder errors reach every waiter and are
+      not cached.
+    - The least recently used entry is evicted past ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = RUNTIME_PROBE_CACHE_MAX_ENTRIES,
+        stale_seconds: float = RUNTIME_PROBE_STALE_SECONDS,
+        refresh_executor: DaemonProbeExecutor | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.stale_seconds = max(0.0, float(stale_seconds))
+        self._refresh_executor = refresh_executor or DaemonProbeExecutor(
+            RUNTIME_PROBE_REFRESH_WORKERS,
+            thread_name_prefix="supermega-probe-refresh",
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._in_flight: dict[str, Future[Any]] = {}
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+            "evictions": 0,
+        }
+
+    def get(self, key: str, ttl_seconds: float, builder: Callable[[], Any]) -> Any:
+        ttl = max(1.0, float(ttl_seconds))
+        with self._lock:
+            now = self._clock()
+            cached = self._entries.get(key)
+            if cached is not None:
+                expires_at, value = cached
+                if expires_at >= now:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return value
+                if now - expires_at <= self.stale_seconds:
+                    self._entries.move_to_end(key)
+                    self._stats["stale_hits"] += 1
+                    if key not in self._in_flight:
+                        self._stats["refreshes"] += 1
+                        self._in_flight[key] = self._refresh_executor.submit(
+                            lambda: self._build(key, ttl, builder, background=True)
+                        )
+                    return value
+            in_flight = self._in_flight.get(key)
+            leader = in_flight is None
+            if leader:
+                self._stats["misses"] += 1
+                in_flight = Future()
+                self._in_flight[key] = in_flight
+            else:
+                self._stats["coalesced"] += 1
+        if not leader:
+            return in_flight.result()
+        try:
+            value = self._build(key, ttl, builder, background=False)
+        except BaseException as exc:
+            in_flight.set_exception(exc)
+            raise
+        in_flight.set_result(value)
+        return value
+
+    def _build(self, key: str, ttl: float, builder: Callable[[], Any], *, background: bool) -> Any:
+        try:
+            value = builder()
+        except BaseException:
+            with self._lock:
+                self._in_flight.pop(key, None)
+                if background:
+                    self._stats["refresh_errors"] += 1
+            if background:
+                _LOGGER.warning("supermega.runtime_probes: refresh of %s failed; serving the stale value", key, exc_info=True)
+            raise
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+            self._in_flight.pop(key, None)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "in_flight": len(self._in_flight)}
+
+
+_SHARED_PROBE_EXECUTOR: DaemonProbeExecutor | None = None
+_SHARED_PROBE_EXECUTOR_LOCK = threading.Lock()
+
+
+def shared_probe_executor() -> DaemonProbeExecutor:
+    """Return the process-wide pool that runs timed external probes."""
+
+    global _SHARED_PROBE_EXECUTOR
+    with _SHARED_PROBE_EXECUTOR_LOCK:
+        if _SHARED_PROBE_EXECUTOR is None:
+            _SHARED_PROBE_EXECUTOR = DaemonProbeExecutor(RUNTIME_PROBE_MAX_WORKERS)
+        return _SHARED_PROBE_EXECUTOR
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import multiprocessing
+import os
 import sqlite3
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 from xml.etree import ElementTree
 from zipfile import ZipFile
 
@@ -24,6 +29,15 @@ SQLITE_PRAGMAS = (
     "PRAGMA synchronous=NORMAL;",
 )
 
+# Bump when the documents/documents_fts layout changes; an incremental build
+# against an index with another version (or another char_limit/top_levels)
+# rebuilds from scratch.
+SEARCH_INDEX_SCHEMA_VERSION = 2
+SEARCH_INDEX_MAX_WORKERS = 8
+# Below this many files to extract, process start-up costs more than it saves.
+SEARCH_INDEX_PARALLEL_MIN_FILES = 32
+_HASH_CHUNK_BYTES = 1024 * 1024
+
 
 def _iso(ts: float) -> str:
     return datetime.fromtimestamp(ts, UTC).isoformat()
@@ -101,6 +115,70 @@ def extract_search_text(path: Path, char_limit: int = 20000) -> str:
     return ""
 
 
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _extract_for_index(job: tuple[str, str, str, int, bool]) -> tuple[str, str | None, str, str]:
+    """Hash and extract one file; runs in a worker process.
+
+    Returns (rel_path, content or None when the hash matches the previous
+    one, sha256, error message).
+    """
+    rel_str, path_str, previous_sha256, char_limit, indexable = job
+    if not indexable:
+        # Nothing is extracted from other files, so re-inserting their
+        # metadata is cheaper than hashing them.
+        return rel_str, "", "", ""
+    path = Path(path_str)
+    try:
+        sha256 = _file_sha256(path)
+    except OSError as exc:
+        return rel_str, "", "", str(exc)
+    if previous_sha256 and sha256 == previous_sha256:
+        return rel_str, None, sha256, ""
+    try:
+        return rel_str, extract_search_text(path, char_limit=char_limit), sha256, ""
+    except Exception as exc:
+        return rel_str, "", sha256, str(exc)
+
+
+def _run_extraction(
+    jobs: list[tuple[str, str, str, int, bool]],
+    workers: int,
+) -> Iterable[tuple[str, str | None, str, str]]:
+    if workers <= 1 or len(jobs) < SEARCH_INDEX_PARALLEL_MIN_FILES:
+        return map(_extract_for_index, jobs)
+    # forkserver avoids forking a parent that may already run threads (the
+    # span exporter, HTTP pools) where the platform offers it.
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        chunksize = max(1, min(64, len(jobs) // (workers * 4)))
+        return list(pool.map(_extract_for_index, jobs, chunksize=chunksize))
+
+
+def _walk_files(root: Path) -> Iterable[tuple[str, os.DirEntry[str]]]:
+    """Yield (relative posix path, entry) for every file under ``root``.
+
+    os.scandir reuses the directory listing's file type, which saves a stat
+    per file over Path.rglob + is_file on large mirrors.
+    """
+    prefix = len(str(root)) + 1
+    pending = [str(root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path[prefix:].replace(os.sep, "/"), entry
+
+
 def _connect(db_path: Path) -> sqlite3.Connection:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(str(db_path), timeout=30)
@@ -115,6 +193,8 @@ def _init_schema(conn: sqlite3.Connection) -> None:
         DROP TABLE IF EXISTS documents;
         DROP TABLE IF EXISTS documents_fts;
 
+        DROP TABLE IF EXISTS index_meta;
+
         CREATE TABLE documents (
             path TEXT PRIMARY KEY,
             name TEXT NOT NULL,
@@ -123,7 +203,14 @@ def _init_schema(conn: sqlite3.Connection) -> None:
             size_bytes INTEGER NOT NULL,
             modified_at TEXT NOT NULL,
             indexed_at TEXT NOT NULL,
-            content TEXT NOT NULL
+            content TEXT NOT NULL,
+            mtime_ns INTEGER NOT NULL DEFAULT 0,
+            content_sha256 TEXT NOT NULL DEFAULT ''
+        );
+
+        CREATE TABLE index_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
         );
 
         CREATE VIRTUAL TABLE documents_fts USING fts5(
@@ -137,57 +224,128 @@ def _init_schema(conn: sqlite3.Connection) -> None:
     )
 
 
+def _index_settings(root: Path, char_limit: int, top_levels: set[str] | None) -> dict[str, str]:
+    return {
+        "schema_version": str(SEARCH_INDEX_SCHEMA_VERSION),
+        "root": str(root),
+        "char_limit": str(char_limit),
+        "top_levels": json.dumps(sorted(top_levels) if top_levels else []),
+    }
+
+
+def _reusable_index(db_path: Path, settings: dict[str, str]) -> bool:
+    if not db_path.exists():
+        return False
+    try:
+        conn = sqlite3.connect(str(db_path), timeout=30)
+        try:
+            stored = dict(conn.execute("SELECT key, value FROM index_meta").fetchall())
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return False
+    return stored == settings
+
+
+def _delete_document(conn: sqlite3.Connection, rowid: int) -> None:
+    conn.execute("DELETE FROM documents WHERE rowid = ?", (rowid,))
+    conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (rowid,))
+
+
 def build_search_index(
     root: Path,
     db_path: Path,
     *,
     char_limit: int = 20000,
     top_levels: set[str] | None = None,
+    incremental: bool = False,
+    workers: int | None = None,
 ) -> dict[str, Any]:
+    """Index every file under ``root`` into a SQLite FTS5 database.
+
+    With ``incremental`` an existing index built with the same settings is
+    kept: files whose size and mtime are unchanged are skipped, files whose
+    bytes hash the same as before only get their metadata refreshed, and
+    rows for paths no longer on disk are deleted. Extraction runs in a pool
+    of up to ``workers`` processes.
+    """
     root = root.expanduser().resolve()
     if not root.exists():
         raise FileNotFoundError(f"Local source root does not exist: {root}")
 
-    for candidate in (
-        db_path,
-        Path(f"{db_path}-wal"),
-        Path(f"{db_path}-shm"),
-    ):
-        if candidate.exists():
-            candidate.unlink()
+    if workers is None:
+        workers = min(SEARCH_INDEX_MAX_WORKERS, os.cpu_count() or 1)
+    settings = _index_settings(root, char_limit, top_levels)
+    mode = "incremental" if incremental and _reusable_index(db_path, settings) else "full"
+
+    if mode == "full":
+        for candidate in (
+            db_path,
+            Path(f"{db_path}-wal"),
+            Path(f"{db_path}-shm"),
+        ):
+            if candidate.exists():
+                candidate.unlink()
 
     conn = _connect(db_path)
-    indexed = 0
-    content_indexed = 0
+    extracted = 0
+    unchanged = 0
+    removed = 0
     errors: list[dict[str, str]] = []
     try:
-        _init_schema(conn)
+        if mode == "full":
+            _init_schema(conn)
+            conn.executemany("INSERT INTO index_meta (key, value) VALUES (?, ?)", settings.items())
         indexed_at = datetime.now(UTC).isoformat()
+        existing = {
+            row[0]: (row[1], row[2], row[3], row[4])
+            for row in conn.execute("SELECT path, rowid, size_bytes, mtime_ns, content_sha256 FROM documents")
+        }
 
-        for path in root.rglob("*"):
-            if not path.is_file():
-                continue
-
-            rel = path.relative_to(root)
-            rel_str = str(rel).replace("\\", "/")
-            ext = path.suffix.lower()
-            top_level = rel.parts[0] if rel.parts else "."
+        seen: set[str] = set()
+        stats: dict[str, tuple[Path, os.stat_result]] = {}
+        jobs: list[tuple[str, str, str, int, bool]] = []
+        for rel_str, entry in _walk_files(root):
+            top_level = rel_str.split("/", 1)[0]
             if top_levels and top_level not in top_levels:
                 continue
-            stat = path.stat()
-            content = ""
-
-            if ext in INDEXABLE_TEXT_EXTENSIONS:
-                try:
-                    content = extract_search_text(path, char_limit=char_limit)
-                except Exception as exc:
-                    errors.append({"path": rel_str, "error": str(exc)})
-                    content = ""
+            path = Path(entry.path)
+            stat = entry.stat()
+            seen.add(rel_str)
+            previous = existing.get(rel_str)
+            if previous is not None and previous[1] == stat.st_size and previous[2] == stat.st_mtime_ns:
+                unchanged += 1
+                continue
+            stats[rel_str] = (path, stat)
+            jobs.append(
+                (
+                    rel_str,
+                    str(path),
+                    previous[3] if previous is not None else "",
+                    char_limit,
+                    path.suffix.lower() in INDEXABLE_TEXT_EXTENSIONS,
+                )
+            )
 
-            if content.strip():
-                content_indexed += 1
+        for rel_str, content, sha256, error in _run_extraction(jobs, workers):
+            path, stat = stats[rel_str]
+            previous = existing.get(rel_str)
+            if content is None and previous is not None:
+                # Same bytes under a new mtime: keep the extracted text.
+                conn.execute(
+                    "UPDATE documents SET mtime_ns = ?, modified_at = ?, indexed_at = ? WHERE rowid = ?",
+                    (stat.st_mtime_ns, _iso(stat.st_mtime), indexed_at, previous[0]),
+                )
+                unchanged += 1
+                continue
+            if error:
+                errors.append({"path": rel_str, "error": error})
+            if previous is not None:
+                _delete_document(conn, previous[0])
 
-            conn.execute(
+            ext = path.suffix.lower()
+            top_level = rel_str.split("/", 1)[0]
+            cursor = conn.execute(
                 """
                 INSERT INTO documents (
                     path,
@@ -197,8 +355,10 @@ def build_search_index(
                     size_bytes,
                     modified_at,
                     indexed_at,
-                    content
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    content,
+                    mtime_ns,
+                    content_sha256
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     rel_str,
@@ -208,35 +368,51 @@ def build_search_index(
                     stat.st_size,
                     _iso(stat.st_mtime),
                     indexed_at,
-                    content,
+                    content or "",
+                    stat.st_mtime_ns,
+                    sha256,
                 ),
             )
             conn.execute(
                 """
-                INSERT INTO documents_fts (path, name, extension, top_level, content)
-                VALUES (?, ?, ?, ?, ?)
+                INSERT INTO documents_fts (rowid, path, name, extension, top_level, content)
+                VALUES (?, ?, ?, ?, ?, ?)
                 """,
                 (
+                    cursor.lastrowid,
                     rel_str,
                     path.name,
                     ext or "[no_extension]",
                     top_level,
-                    content,
+                    content or "",
                 ),
             )
-            indexed += 1
+            extracted += 1
+
+        for rel_str, previous in existing.items():
+            if rel_str not in seen:
+                _delete_document(conn, previous[0])
+                removed += 1
 
+        indexed, content_indexed = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(length(trim(content, char(32, 9, 10, 13))) > 0), 0) FROM documents"
+        ).fetchone()
         conn.commit()
     finally:
         conn.close()
 
     return {
         "status": "ready",
+        "mode": mode,
         "root": str(root),
         "db_path": str(db_path.resolve()),
         "top_levels": sorted(top_levels) if top_levels else [],
         "indexed_documents": indexed,
         "documents_with_content": content_indexed,
+        "extracted_documents": extracted,
+        "unchanged_documents": unchanged,
+        "removed_documents": removed,
+        "workers": workers,
         "error_count": len(errors),
         "errors": errors[:25],
     }
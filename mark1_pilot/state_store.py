@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import copy
 import hashlib
 import json
 import secrets
 import sqlite3
+import threading
 from contextlib import contextmanager
 from collections.abc import Iterator
 from datetime import datetime, timedelta
@@ -61,17 +63,123 @@ def _load_json(path: Path) -> Any:
         return {}
 
 
-@contextmanager
-def _connect(db_path: Path) -> Iterator[sqlite3.Connection]:
+_JSON_ARTIFACT_CACHE: dict[str, tuple[tuple[int, int], Any]] = {}
+_JSON_ARTIFACT_LOCK = threading.Lock()
+
+
+def load_json_artifact(path: Path) -> Any:
+    """Load a JSON artifact, re-parsing only when its mtime or size changes."""
+    key = str(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        with _JSON_ARTIFACT_LOCK:
+            _JSON_ARTIFACT_CACHE.pop(key, None)
+        return {}
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _JSON_ARTIFACT_LOCK:
+        cached = _JSON_ARTIFACT_CACHE.get(key)
+    if cached is None or cached[0] != signature:
+        cached = (signature, _load_json(path))
+        with _JSON_ARTIFACT_LOCK:
+            _JSON_ARTIFACT_CACHE[key] = cached
+    return copy.deepcopy(cached[1])
+
+
+# Bump whenever ensure_schema's DDL or migrations change; databases stamped
+# with an older PRAGMA user_version are migrated once on first use.
+STATE_SCHEMA_VERSION = 1
+STATE_SQLITE_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA mmap_size=134217728",
+)
+STATE_STATEMENT_CACHE_SIZE = 256
+
+_THREAD_CONNECTIONS = threading.local()
+_SCHEMA_LOCK = threading.Lock()
+_SCHEMA_READY: dict[str, tuple[int, int]] = {}
+
+
+class _PooledConnection:
+    __slots__ = ("connection", "identity", "depth")
+
+    def __init__(self, connection: sqlite3.Connection, identity: tuple[int, int] | None) -> None:
+        self.connection = connection
+        self.identity = identity
+        self.depth = 0
+
+
+def _file_identity(db_path: Path) -> tuple[int, int] | None:
+    try:
+        stat = db_path.stat()
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+def _open_connection(db_path: Path) -> sqlite3.Connection:
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    connection = sqlite3.connect(str(db_path))
+    connection = sqlite3.connect(str(db_path), cached_statements=STATE_STATEMENT_CACHE_SIZE)
     connection.row_factory = sqlite3.Row
-    connection.execute("PRAGMA journal_mode=WAL")
+    for pragma in STATE_SQLITE_PRAGMAS:
+        connection.execute(pragma)
+    return connection
+
+
+def _thread_pool() -> dict[str, _PooledConnection]:
+    pool = getattr(_THREAD_CONNECTIONS, "pool", None)
+    if pool is None:
+        pool = {}
+        _THREAD_CONNECTIONS.pool = pool
+    return pool
+
+
+def _checkout(db_path: Path) -> _PooledConnection:
+    key = str(db_path)
+    pool = _thread_pool()
+    pooled = pool.get(key)
+    if pooled is not None and pooled.depth == 0 and pooled.identity != _file_identity(db_path):
+        # The file was deleted or replaced; never keep writing to the old inode.
+        pooled.connection.close()
+        pooled = None
+    if pooled is None:
+        connection = _open_connection(db_path)
+        pooled = _PooledConnection(connection, _file_identity(db_path))
+        pool[key] = pooled
+    return pooled
+
+
+def close_state_connections() -> None:
+    """Close this thread's pooled connections and forget schema stamps."""
+    pool = _thread_pool()
+    for pooled in pool.values():
+        pooled.connection.close()
+    pool.clear()
+    with _SCHEMA_LOCK:
+        _SCHEMA_READY.clear()
+
+
+@contextmanager
+def _connect(db_path: Path) -> Iterator[sqlite3.Connection]:
+    pooled = _checkout(db_path)
+    connection = pooled.connection
+    if pooled.depth:
+        # Nested use shares the outer transaction; only the outermost block commits.
+        pooled.depth += 1
+        try:
+            yield connection
+        finally:
+            pooled.depth -= 1
+        return
+    pooled.depth = 1
     try:
         with connection:
             yield connection
     finally:
-        connection.close()
+        pooled.depth = 0
 
 
 def _agent_team_snapshot_key(tenant_key: str) -> str:
@@ -301,428 +409,589 @@ def _migrate_agent_team_runtime_tables(connection: sqlite3.Connection) -> None:
     connection.execute("DROP TABLE agent_teams_legacy")
 
 
-def ensure_schema(db_path: Path) -> None:
-    with _connect(db_path) as connection:
-        connection.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS actions (
-                action_id TEXT PRIMARY KEY,
-                lane TEXT NOT NULL,
-                title TEXT NOT NULL,
-                action_text TEXT NOT NULL,
-                owner TEXT NOT NULL,
-                priority TEXT NOT NULL,
-                due TEXT NOT NULL,
-                status TEXT NOT NULL,
-                source TEXT NOT NULL,
-                evidence_link TEXT NOT NULL,
-                evidence_path TEXT NOT NULL,
-                synced_at TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS snapshots (
-                snapshot_key TEXT PRIMARY KEY,
-                generated_at TEXT NOT NULL,
-                payload_json TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS contact_submissions (
-                submission_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                created_at TEXT NOT NULL,
-                source TEXT NOT NULL,
-                name TEXT NOT NULL,
-                email TEXT NOT NULL,
-                company TEXT NOT NULL,
-                workflow TEXT NOT NULL,
-                requested_package TEXT NOT NULL DEFAULT '',
-                data_summary TEXT NOT NULL,
-                goal TEXT NOT NULL,
-                status TEXT NOT NULL DEFAULT 'captured',
-                owner TEXT NOT NULL DEFAULT 'Revenue Pod',
-                next_step TEXT NOT NULL DEFAULT '',
-                workspace_id TEXT NOT NULL DEFAULT '',
-                lead_id TEXT NOT NULL DEFAULT '',
-                task_id TEXT NOT NULL DEFAULT ''
-            );
-
-            CREATE TABLE IF NOT EXISTS workspace_members (
-                email TEXT PRIMARY KEY,
-                created_at TEXT NOT NULL,
-                last_seen_at TEXT NOT NULL,
-                source TEXT NOT NULL,
-                name TEXT NOT NULL,
-                company TEXT NOT NULL,
-                role TEXT NOT NULL,
-                status TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS product_feedback (
-                feedback_id TEXT PRIMARY KEY,
-                created_at TEXT NOT NULL,
-                source TEXT NOT NULL,
-                surface TEXT NOT NULL,
-                category TEXT NOT NULL,
-                priority TEXT NOT NULL,
-                status TEXT NOT NULL,
-                note TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS decision_journal (
-                decision_id TEXT PRIMARY KEY,
-                created_at TEXT NOT NULL,
-                source TEXT NOT NULL,
-                title TEXT NOT NULL,
-                context TEXT NOT NULL,
-                decision_text TEXT NOT NULL,
-                rationale TEXT NOT NULL,
-                owner TEXT NOT NULL,
-                status TEXT NOT NULL,
-                due TEXT NOT NULL,
-                related_route TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS approval_queue (
-                approval_id TEXT PRIMARY KEY,
-                created_at TEXT NOT NULL,
-                source TEXT NOT NULL,
-                workspace_id TEXT NOT NULL DEFAULT '',
-                title TEXT NOT NULL,
-                summary TEXT NOT NULL,
-                approval_gate TEXT NOT NULL,
-                requested_by TEXT NOT NULL,
-                owner TEXT NOT NULL,
-                status TEXT NOT NULL,
-                due TEXT NOT NULL,
-                related_route TEXT NOT NULL,
-                related_entity TEXT NOT NULL,
-                evidence_link TEXT NOT NULL,
-                payload_json TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS lead_pipeline (
-                lead_id TEXT PRIMARY KEY,
-                created_at TEXT NOT NULL,
-                company_name TEXT NOT NULL,
-                archetype TEXT NOT NULL,
-                stage TEXT NOT NULL,
-                status TEXT NOT NULL,
-                owner TEXT NOT NULL,
-                campaign_goal TEXT NOT NULL,
-                service_pack TEXT NOT NULL,
-                wedge_product TEXT NOT NULL,
-                starter_modules_json TEXT NOT NULL,
-                semi_products_json TEXT NOT NULL,
-                outreach_subject TEXT NOT NULL,
-                outreach_message TEXT NOT NULL,
-                discovery_questions_json TEXT NOT NULL,
-                contact_email TEXT NOT NULL,
-                contact_phone TEXT NOT NULL,
-                website TEXT NOT NULL,
-                source TEXT NOT NULL,
-                source_url TEXT NOT NULL,
-                provider TEXT NOT NULL,
-                score INTEGER NOT NULL,
-                notes TEXT NOT NULL,
-                synced_at TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS lead_activity (
-                activity_id TEXT PRIMARY KEY,
-                lead_id TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                actor TEXT NOT NULL,
-                activity_type TEXT NOT NULL,
-                channel TEXT NOT NULL,
-                direction TEXT NOT NULL,
-                message TEXT NOT NULL,
-                stage_after TEXT NOT NULL,
-                next_step TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS attendance_events (
-                event_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                created_at TEXT NOT NULL,
-                employee_name TEXT NOT NULL,
-                employee_code TEXT NOT NULL,
-                shift_name TEXT NOT NULL,
-                station TEXT NOT NULL,
-                status TEXT NOT NULL,
-                method TEXT NOT NULL,
-                evidence_url TEXT NOT NULL,
-                note TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS quality_incidents (
-                incident_id TEXT PRIMARY KEY,
-                status TEXT NOT NULL,
-                severity TEXT NOT NULL,
-                owner TEXT NOT NULL,
-                supplier TEXT NOT NULL,
-                title TEXT NOT NULL,
-                summary TEXT NOT NULL,
-                source_type TEXT NOT NULL,
-                source_ref_json TEXT NOT NULL,
-                reported_at TEXT NOT NULL,
-                target_close_date TEXT NOT NULL,
-                synced_at TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS capa_actions (
-                capa_id TEXT PRIMARY KEY,
-                incident_id TEXT NOT NULL,
-                status TEXT NOT NULL,
-                owner TEXT NOT NULL,
-                action_title TEXT NOT NULL,
-                verification_criteria TEXT NOT NULL,
-                target_date TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                synced_at TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS maintenance_records (
-                maintenance_id TEXT PRIMARY KEY,
-                logged_at TEXT NOT NULL,
-                asset_name TEXT NOT NULL,
-                issue_type TEXT NOT NULL,
-                priority TEXT NOT NULL,
-                status TEXT NOT NULL,
-                owner TEXT NOT NULL,
-                downtime_minutes TEXT NOT NULL,
-                next_action TEXT NOT NULL,
-                evidence_link TEXT NOT NULL,
-                source_ref_json TEXT NOT NULL,
-                synced_at TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS supplier_risks (
-                risk_id TEXT PRIMARY KEY,
-                supplier TEXT NOT NULL,
-                status TEXT NOT NULL,
-                severity TEXT NOT NULL,
-                owner TEXT NOT NULL,
-                title TEXT NOT NULL,
-                summary TEXT NOT NULL,
-                eta TEXT NOT NULL,
-                risk_type TEXT NOT NULL,
-                source TEXT NOT NULL,
-                source_ref_json TEXT NOT NULL,
-                next_action TEXT NOT NULL,
-                synced_at TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS receiving_records (
-                receiving_id TEXT PRIMARY KEY,
-                received_at TEXT NOT NULL,
-                supplier TEXT NOT NULL,
-                po_or_pi TEXT NOT NULL,
-                grn_or_batch TEXT NOT NULL,
-                material TEXT NOT NULL,
-                expected_qty TEXT NOT NULL,
-                received_qty TEXT NOT NULL,
-                variance_note TEXT NOT NULL,
-                status TEXT NOT NULL,
-                owner TEXT NOT NULL,
-                next_action TEXT NOT NULL,
-                evidence_link TEXT NOT NULL,
-                source_ref_json TEXT NOT NULL,
-                synced_at TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS inventory_records (
-                inventory_id TEXT PRIMARY KEY,
-                captured_at TEXT NOT NULL,
-                item_code TEXT NOT NULL,
-                item_name TEXT NOT NULL,
-                warehouse TEXT NOT NULL,
-                on_hand_qty TEXT NOT NULL,
-                reserved_qty TEXT NOT NULL,
-                available_qty TEXT NOT NULL,
-                reorder_point TEXT NOT NULL,
-                status TEXT NOT NULL,
-                owner TEXT NOT NULL,
-                next_action TEXT NOT NULL,
-                evidence_link TEXT NOT NULL,
-                source_ref_json TEXT NOT NULL,
-                synced_at TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS metric_entries (
-                metric_id TEXT PRIMARY KEY,
-                captured_at TEXT NOT NULL,
-                metric_name TEXT NOT NULL,
-                metric_group TEXT NOT NULL,
-                metric_value TEXT NOT NULL,
-                unit TEXT NOT NULL,
-                period_label TEXT NOT NULL,
-                scope TEXT NOT NULL,
-                owner TEXT NOT NULL,
-                status TEXT NOT NULL,
-                notes TEXT NOT NULL,
-                evidence_link TEXT NOT NULL,
-                source_ref_json TEXT NOT NULL,
-                synced_at TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS agent_teams (
-                tenant_key TEXT NOT NULL,
-                team_id TEXT NOT NULL,
-                name TEXT NOT NULL,
-                status TEXT NOT NULL,
-                scaling_tier TEXT NOT NULL,
-                mission TEXT NOT NULL,
-                lead_agent TEXT NOT NULL,
-                cadence TEXT NOT NULL,
-                generated_at TEXT NOT NULL,
-                PRIMARY KEY (tenant_key, team_id)
-            );
-
-            CREATE TABLE IF NOT EXISTS agent_units (
-                tenant_key TEXT NOT NULL,
-                unit_id TEXT NOT NULL,
-                team_id TEXT NOT NULL,
-                name TEXT NOT NULL,
-                role TEXT NOT NULL,
-                mode TEXT NOT NULL,
-                output_schema TEXT NOT NULL,
-                write_scope TEXT NOT NULL,
-                approval_gate TEXT NOT NULL,
-                focus TEXT NOT NULL,
-                generated_at TEXT NOT NULL,
-                PRIMARY KEY (tenant_key, unit_id)
-            );
-
-            CREATE TABLE IF NOT EXISTS agent_operating_models (
-                tenant_key TEXT PRIMARY KEY,
-                version TEXT NOT NULL,
-                title TEXT NOT NULL,
-                summary TEXT NOT NULL,
-                manager_moves_json TEXT NOT NULL,
-                generated_at TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS agent_tool_registry (
-                tenant_key TEXT NOT NULL,
-                tool_id TEXT NOT NULL,
-                name TEXT NOT NULL,
-                category TEXT NOT NULL,
-                purpose TEXT NOT NULL,
-                generated_at TEXT NOT NULL,
-                PRIMARY KEY (tenant_key, tool_id)
-            );
-
-            CREATE TABLE IF NOT EXISTS agent_playbooks (
-                tenant_key TEXT NOT NULL,
-                playbook_id TEXT NOT NULL,
-                team_id TEXT NOT NULL,
-                name TEXT NOT NULL,
-                workspace TEXT NOT NULL,
-                lead_role TEXT NOT NULL,
-                mission TEXT NOT NULL,
-                cadence_json TEXT NOT NULL,
-                write_policy TEXT NOT NULL,
-                generated_at TEXT NOT NULL,
-                PRIMARY KEY (tenant_key, playbook_id)
-            );
-
-            CREATE TABLE IF NOT EXISTS agent_playbook_outputs (
-                tenant_key TEXT NOT NULL,
-                playbook_id TEXT NOT NULL,
-                output_index INTEGER NOT NULL,
-                output_text TEXT NOT NULL,
-                generated_at TEXT NOT NULL,
-                PRIMARY KEY (tenant_key, playbook_id, output_index)
-            );
-
-            CREATE TABLE IF NOT EXISTS agent_playbook_tools (
-                tenant_key TEXT NOT NULL,
-                playbook_id TEXT NOT NULL,
-                tool_index INTEGER NOT NULL,
-                tool_id TEXT NOT NULL,
-                mode TEXT NOT NULL,
-                scope TEXT NOT NULL,
-                generated_at TEXT NOT NULL,
-                PRIMARY KEY (tenant_key, playbook_id, tool_index)
-            );
-
-            CREATE TABLE IF NOT EXISTS agent_playbook_notes (
-                tenant_key TEXT NOT NULL,
-                playbook_id TEXT NOT NULL,
-                note_type TEXT NOT NULL,
-                note_index INTEGER NOT NULL,
-                note_text TEXT NOT NULL,
-                generated_at TEXT NOT NULL,
-                PRIMARY KEY (tenant_key, playbook_id, note_type, note_index)
-            );
-
-            CREATE TABLE IF NOT EXISTS agent_playbook_kpis (
-                tenant_key TEXT NOT NULL,
-                playbook_id TEXT NOT NULL,
-                kpi_index INTEGER NOT NULL,
-                kpi_name TEXT NOT NULL,
-                kpi_target TEXT NOT NULL,
-                generated_at TEXT NOT NULL,
-                PRIMARY KEY (tenant_key, playbook_id, kpi_index)
-            );
-
-            CREATE TABLE IF NOT EXISTS app_users (
-                username TEXT PRIMARY KEY,
-                display_name TEXT NOT NULL,
-                password_hash TEXT NOT NULL,
-                role TEXT NOT NULL,
-                status TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS app_sessions (
-                session_id TEXT PRIMARY KEY,
-                username TEXT NOT NULL,
-                role TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                expires_at TEXT NOT NULL,
-                last_seen_at TEXT NOT NULL
-            );
-            """
+# Register summaries read these trigger-maintained counters instead of
+# scanning the register tables. Expressions use "{row}" for NEW/OLD/src.
+REGISTER_COUNTER_DIMENSIONS: dict[str, dict[str, str]] = {
+    "actions": {"lane": "{row}.lane", "status": "{row}.status"},
+    "quality_incidents": {"status": "{row}.status", "supplier": "{row}.supplier"},
+    "capa_actions": {},
+    "supplier_risks": {"status": "{row}.status", "severity": "{row}.severity", "supplier": "{row}.supplier"},
+    "receiving_records": {
+        "status": "{row}.status",
+        "supplier": "{row}.supplier",
+        "variance": "CASE WHEN {row}.variance_note != 'matched' THEN 'variance' ELSE 'matched' END",
+    },
+    "inventory_records": {"status": "{row}.status", "warehouse": "{row}.warehouse"},
+    "maintenance_records": {"status": "{row}.status", "issue_type": "{row}.issue_type"},
+    "approval_queue": {"status": "{row}.status", "approval_gate": "{row}.approval_gate"},
+    "metric_entries": {"metric_group": "{row}.metric_group", "status": "{row}.status"},
+    "product_feedback": {"status": "{row}.status", "priority": "{row}.priority", "category": "{row}.category"},
+}
+_REGISTER_COUNTER_SCOPES: dict[str, str] = {"approval_queue": "{row}.workspace_id"}
+_REGISTER_COUNTER_TOTALS: dict[str, str] = {"maintenance_records": "{row}.downtime_minutes_value"}
+_REGISTER_COUNTER_ALL = "*"
+
+
+def _register_counter_dimensions(register: str) -> dict[str, str]:
+    return {_REGISTER_COUNTER_ALL: "''", **REGISTER_COUNTER_DIMENSIONS[register]}
+
+
+def _register_counter_trigger_sql(register: str) -> str:
+    scope = _REGISTER_COUNTER_SCOPES.get(register, "''")
+    total = _REGISTER_COUNTER_TOTALS.get(register, "0")
+
+    def increment(row: str) -> str:
+        return "".join(
+            f"""
+                INSERT INTO register_counters (register, scope, dimension, value, item_count, item_total)
+                VALUES ('{register}', {scope.format(row=row)}, '{dimension}', {expression.format(row=row)}, 1, {total.format(row=row)})
+                ON CONFLICT(register, scope, dimension, value) DO UPDATE SET
+                    item_count = item_count + 1,
+                    item_total = item_total + excluded.item_total;"""
+            for dimension, expression in _register_counter_dimensions(register).items()
         )
-        contact_columns = {
-            str(row["name"]).strip()
-            for row in connection.execute("PRAGMA table_info(contact_submissions)").fetchall()
-        }
-        if "requested_package" not in contact_columns:
-            connection.execute("ALTER TABLE contact_submissions ADD COLUMN requested_package TEXT NOT NULL DEFAULT ''")
-        if "status" not in contact_columns:
-            connection.execute("ALTER TABLE contact_submissions ADD COLUMN status TEXT NOT NULL DEFAULT 'captured'")
-        if "owner" not in contact_columns:
-            connection.execute("ALTER TABLE contact_submissions ADD COLUMN owner TEXT NOT NULL DEFAULT 'Revenue Pod'")
-        if "next_step" not in contact_columns:
-            connection.execute("ALTER TABLE contact_submissions ADD COLUMN next_step TEXT NOT NULL DEFAULT ''")
-        if "workspace_id" not in contact_columns:
-            connection.execute("ALTER TABLE contact_submissions ADD COLUMN workspace_id TEXT NOT NULL DEFAULT ''")
-        if "lead_id" not in contact_columns:
-            connection.execute("ALTER TABLE contact_submissions ADD COLUMN lead_id TEXT NOT NULL DEFAULT ''")
-        if "task_id" not in contact_columns:
-            connection.execute("ALTER TABLE contact_submissions ADD COLUMN task_id TEXT NOT NULL DEFAULT ''")
-        approval_columns = {
-            str(row["name"]).strip()
-            for row in connection.execute("PRAGMA table_info(approval_queue)").fetchall()
-        }
-        if "workspace_id" not in approval_columns:
-            connection.execute("ALTER TABLE approval_queue ADD COLUMN workspace_id TEXT NOT NULL DEFAULT ''")
-        connection.execute(
-            "CREATE INDEX IF NOT EXISTS idx_approval_queue_workspace_status "
-            "ON approval_queue (workspace_id, status, created_at DESC)"
+
+    def decrement(row: str) -> str:
+        return "".join(
+            f"""
+                UPDATE register_counters
+                SET item_count = item_count - 1, item_total = item_total - {total.format(row=row)}
+                WHERE register = '{register}' AND scope = {scope.format(row=row)}
+                    AND dimension = '{dimension}' AND value = {expression.format(row=row)};"""
+            for dimension, expression in _register_counter_dimensions(register).items()
         )
-        _migrate_agent_team_runtime_tables(connection)
-        connection.executescript(
-            """
-            CREATE INDEX IF NOT EXISTS idx_agent_teams_tenant_generated
-            ON agent_teams (tenant_key, generated_at DESC, name);
 
-            CREATE INDEX IF NOT EXISTS idx_agent_units_tenant_team
-            ON agent_units (tenant_key, team_id, name);
-            """
+    return f"""
+            CREATE TRIGGER IF NOT EXISTS register_counters_{register}_insert
+            AFTER INSERT ON {register} BEGIN{increment("NEW")}
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS register_counters_{register}_update
+            AFTER UPDATE ON {register} BEGIN{decrement("OLD")}{increment("NEW")}
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS register_counters_{register}_delete
+            AFTER DELETE ON {register} BEGIN{decrement("OLD")}
+            END;
+    """
+
+
+def _rebuild_register_counters(connection: sqlite3.Connection) -> None:
+    connection.execute("DELETE FROM register_counters")
+    for register in REGISTER_COUNTER_DIMENSIONS:
+        scope = _REGISTER_COUNTER_SCOPES.get(register, "''").format(row="src")
+        total = _REGISTER_COUNTER_TOTALS.get(register, "0").format(row="src")
+        for dimension, expression in _register_counter_dimensions(register).items():
+            value = expression.format(row="src")
+            connection.execute(
+                f"""
+                INSERT INTO register_counters (register, scope, dimension, value, item_count, item_total)
+                SELECT '{register}', {scope}, '{dimension}', {value}, COUNT(*), COALESCE(SUM({total}), 0)
+                FROM {register} AS src
+                GROUP BY {scope}, {value}
+                """
+            )
+
+
+def _ensure_register_counters(connection: sqlite3.Connection) -> None:
+    maintenance_columns = {
+        str(row["name"]).strip()
+        for row in connection.execute("PRAGMA table_info(maintenance_records)").fetchall()
+    }
+    if "downtime_minutes_value" not in maintenance_columns:
+        connection.execute(
+            "ALTER TABLE maintenance_records ADD COLUMN downtime_minutes_value REAL NOT NULL DEFAULT 0"
+        )
+        for row in connection.execute("SELECT maintenance_id, downtime_minutes FROM maintenance_records").fetchall():
+            connection.execute(
+                "UPDATE maintenance_records SET downtime_minutes_value = ? WHERE maintenance_id = ?",
+                (_coerce_number(str(row["downtime_minutes"])) or 0.0, row["maintenance_id"]),
+            )
+    # The installed trigger set is keyed by a digest of its definition, so a
+    # change to the counter dimensions replaces the triggers and recounts.
+    triggers = "".join(_register_counter_trigger_sql(register) for register in REGISTER_COUNTER_DIMENSIONS)
+    digest = hashlib.sha256(triggers.encode("utf-8")).hexdigest()
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS register_counter_definition (
+            singleton INTEGER PRIMARY KEY CHECK (singleton = 1),
+            digest TEXT NOT NULL
         )
+        """
+    )
+    installed = connection.execute("SELECT digest FROM register_counter_definition").fetchone()
+    if installed is not None and str(installed[0]) == digest:
+        return
+    stale = connection.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'register\\_counters\\_%' ESCAPE '\\'"
+    ).fetchall()
+    for row in stale:
+        connection.execute(f'DROP TRIGGER IF EXISTS "{row[0]}"')
+    connection.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS register_counters (
+            register TEXT NOT NULL,
+            scope TEXT NOT NULL,
+            dimension TEXT NOT NULL,
+            value TEXT NOT NULL,
+            item_count INTEGER NOT NULL DEFAULT 0,
+            item_total REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (register, scope, dimension, value)
+        );
+        """
+        + triggers
+    )
+    _rebuild_register_counters(connection)
+    connection.execute(
+        """
+        INSERT INTO register_counter_definition (singleton, digest) VALUES (1, ?)
+        ON CONFLICT(singleton) DO UPDATE SET digest = excluded.digest
+        """,
+        (digest,),
+    )
+
+
+def ensure_schema(db_path: Path) -> None:
+    key = str(db_path)
+    identity = _file_identity(db_path)
+    if identity is not None and _SCHEMA_READY.get(key) == identity:
+        return
+    with _SCHEMA_LOCK, _connect(db_path) as connection:
+        version = int(connection.execute("PRAGMA user_version").fetchone()[0])
+        if version < STATE_SCHEMA_VERSION:
+            _migrate_schema(connection)
+            connection.execute(f"PRAGMA user_version = {STATE_SCHEMA_VERSION}")
+        else:
+            _ensure_register_counters(connection)
         connection.commit()
+    identity = _file_identity(db_path)
+    if identity is not None:
+        with _SCHEMA_LOCK:
+            _SCHEMA_READY[key] = identity
+
+
+def _migrate_schema(connection: sqlite3.Connection) -> None:
+    connection.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS actions (
+            action_id TEXT PRIMARY KEY,
+            lane TEXT NOT NULL,
+            title TEXT NOT NULL,
+            action_text TEXT NOT NULL,
+            owner TEXT NOT NULL,
+            priority TEXT NOT NULL,
+            due TEXT NOT NULL,
+            status TEXT NOT NULL,
+            source TEXT NOT NULL,
+            evidence_link TEXT NOT NULL,
+            evidence_path TEXT NOT NULL,
+            synced_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS snapshots (
+            snapshot_key TEXT PRIMARY KEY,
+            generated_at TEXT NOT NULL,
+            payload_json TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS contact_submissions (
+            submission_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created_at TEXT NOT NULL,
+            source TEXT NOT NULL,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            company TEXT NOT NULL,
+            workflow TEXT NOT NULL,
+            requested_package TEXT NOT NULL DEFAULT '',
+            data_summary TEXT NOT NULL,
+            goal TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'captured',
+            owner TEXT NOT NULL DEFAULT 'Revenue Pod',
+            next_step TEXT NOT NULL DEFAULT '',
+            workspace_id TEXT NOT NULL DEFAULT '',
+            lead_id TEXT NOT NULL DEFAULT '',
+            task_id TEXT NOT NULL DEFAULT ''
+        );
+
+        CREATE TABLE IF NOT EXISTS workspace_members (
+            email TEXT PRIMARY KEY,
+            created_at TEXT NOT NULL,
+            last_seen_at TEXT NOT NULL,
+            source TEXT NOT NULL,
+            name TEXT NOT NULL,
+            company TEXT NOT NULL,
+            role TEXT NOT NULL,
+            status TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS product_feedback (
+            feedback_id TEXT PRIMARY KEY,
+            created_at TEXT NOT NULL,
+            source TEXT NOT NULL,
+            surface TEXT NOT NULL,
+            category TEXT NOT NULL,
+            priority TEXT NOT NULL,
+            status TEXT NOT NULL,
+            note TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS decision_journal (
+            decision_id TEXT PRIMARY KEY,
+            created_at TEXT NOT NULL,
+            source TEXT NOT NULL,
+            title TEXT NOT NULL,
+            context TEXT NOT NULL,
+            decision_text TEXT NOT NULL,
+            rationale TEXT NOT NULL,
+            owner TEXT NOT NULL,
+            status TEXT NOT NULL,
+            due TEXT NOT NULL,
+            related_route TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS approval_queue (
+            approval_id TEXT PRIMARY KEY,
+            created_at TEXT NOT NULL,
+            source TEXT NOT NULL,
+            workspace_id TEXT NOT NULL DEFAULT '',
+            title TEXT NOT NULL,
+            summary TEXT NOT NULL,
+            approval_gate TEXT NOT NULL,
+            requested_by TEXT NOT NULL,
+            owner TEXT NOT NULL,
+            status TEXT NOT NULL,
+            due TEXT NOT NULL,
+            related_route TEXT NOT NULL,
+            related_entity TEXT NOT NULL,
+            evidence_link TEXT NOT NULL,
+            payload_json TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS lead_pipeline (
+            lead_id TEXT PRIMARY KEY,
+            created_at TEXT NOT NULL,
+            company_name TEXT NOT NULL,
+            archetype TEXT NOT NULL,
+            stage TEXT NOT NULL,
+            status TEXT NOT NULL,
+            owner TEXT NOT NULL,
+            campaign_goal TEXT NOT NULL,
+            service_pack TEXT NOT NULL,
+            wedge_product TEXT NOT NULL,
+            starter_modules_json TEXT NOT NULL,
+            semi_products_json TEXT NOT NULL,
+            outreach_subject TEXT NOT NULL,
+            outreach_message TEXT NOT NULL,
+            discovery_questions_json TEXT NOT NULL,
+            contact_email TEXT NOT NULL,
+            contact_phone TEXT NOT NULL,
+            website TEXT NOT NULL,
+            source TEXT NOT NULL,
+            source_url TEXT NOT NULL,
+            provider TEXT NOT NULL,
+            score INTEGER NOT NULL,
+            notes TEXT NOT NULL,
+            synced_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS lead_activity (
+            activity_id TEXT PRIMARY KEY,
+            lead_id TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            actor TEXT NOT NULL,
+            activity_type TEXT NOT NULL,
+            channel TEXT NOT NULL,
+            direction TEXT NOT NULL,
+            message TEXT NOT NULL,
+            stage_after TEXT NOT NULL,
+            next_step TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS attendance_events (
+            event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created_at TEXT NOT NULL,
+            employee_name TEXT NOT NULL,
+            employee_code TEXT NOT NULL,
+            shift_name TEXT NOT NULL,
+            station TEXT NOT NULL,
+            status TEXT NOT NULL,
+            method TEXT NOT NULL,
+            evidence_url TEXT NOT NULL,
+            note TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS quality_incidents (
+            incident_id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            severity TEXT NOT NULL,
+            owner TEXT NOT NULL,
+            supplier TEXT NOT NULL,
+            title TEXT NOT NULL,
+            summary TEXT NOT NULL,
+            source_type TEXT NOT NULL,
+            source_ref_json TEXT NOT NULL,
+            reported_at TEXT NOT NULL,
+            target_close_date TEXT NOT NULL,
+            synced_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS capa_actions (
+            capa_id TEXT PRIMARY KEY,
+            incident_id TEXT NOT NULL,
+            status TEXT NOT NULL,
+            owner TEXT NOT NULL,
+            action_title TEXT NOT NULL,
+            verification_criteria TEXT NOT NULL,
+            target_date TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            synced_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS maintenance_records (
+            maintenance_id TEXT PRIMARY KEY,
+            logged_at TEXT NOT NULL,
+            asset_name TEXT NOT NULL,
+            issue_type TEXT NOT NULL,
+            priority TEXT NOT NULL,
+            status TEXT NOT NULL,
+            owner TEXT NOT NULL,
+            downtime_minutes TEXT NOT NULL,
+            next_action TEXT NOT NULL,
+            evidence_link TEXT NOT NULL,
+            source_ref_json TEXT NOT NULL,
+            synced_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS supplier_risks (
+            risk_id TEXT PRIMARY KEY,
+            supplier TEXT NOT NULL,
+            status TEXT NOT NULL,
+            severity TEXT NOT NULL,
+            owner TEXT NOT NULL,
+            title TEXT NOT NULL,
+            summary TEXT NOT NULL,
+            eta TEXT NOT NULL,
+            risk_type TEXT NOT NULL,
+            source TEXT NOT NULL,
+            source_ref_json TEXT NOT NULL,
+            next_action TEXT NOT NULL,
+            synced_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS receiving_records (
+            receiving_id TEXT PRIMARY KEY,
+            received_at TEXT NOT NULL,
+            supplier TEXT NOT NULL,
+            po_or_pi TEXT NOT NULL,
+            grn_or_batch TEXT NOT NULL,
+            material TEXT NOT NULL,
+            expected_qty TEXT NOT NULL,
+            received_qty TEXT NOT NULL,
+            variance_note TEXT NOT NULL,
+            status TEXT NOT NULL,
+            owner TEXT NOT NULL,
+            next_action TEXT NOT NULL,
+            evidence_link TEXT NOT NULL,
+            source_ref_json TEXT NOT NULL,
+            synced_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS inventory_records (
+            inventory_id TEXT PRIMARY KEY,
+            captured_at TEXT NOT NULL,
+            item_code TEXT NOT NULL,
+            item_name TEXT NOT NULL,
+            warehouse TEXT NOT NULL,
+            on_hand_qty TEXT NOT NULL,
+            reserved_qty TEXT NOT NULL,
+            available_qty TEXT NOT NULL,
+            reorder_point TEXT NOT NULL,
+            status TEXT NOT NULL,
+            owner TEXT NOT NULL,
+            next_action TEXT NOT NULL,
+            evidence_link TEXT NOT NULL,
+            source_ref_json TEXT NOT NULL,
+            synced_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS metric_entries (
+            metric_id TEXT PRIMARY KEY,
+            captured_at TEXT NOT NULL,
+            metric_name TEXT NOT NULL,
+            metric_group TEXT NOT NULL,
+            metric_value TEXT NOT NULL,
+            unit TEXT NOT NULL,
+            period_label TEXT NOT NULL,
+            scope TEXT NOT NULL,
+            owner TEXT NOT NULL,
+            status TEXT NOT NULL,
+            notes TEXT NOT NULL,
+            evidence_link TEXT NOT NULL,
+            source_ref_json TEXT NOT NULL,
+            synced_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS agent_teams (
+            tenant_key TEXT NOT NULL,
+            team_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            status TEXT NOT NULL,
+            scaling_tier TEXT NOT NULL,
+            mission TEXT NOT NULL,
+            lead_agent TEXT NOT NULL,
+            cadence TEXT NOT NULL,
+            generated_at TEXT NOT NULL,
+            PRIMARY KEY (tenant_key, team_id)
+        );
+
+        CREATE TABLE IF NOT EXISTS agent_units (
+            tenant_key TEXT NOT NULL,
+            unit_id TEXT NOT NULL,
+            team_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            role TEXT NOT NULL,
+            mode TEXT NOT NULL,
+            output_schema TEXT NOT NULL,
+            write_scope TEXT NOT NULL,
+            approval_gate TEXT NOT NULL,
+            focus TEXT NOT NULL,
+            generated_at TEXT NOT NULL,
+            PRIMARY KEY (tenant_key, unit_id)
+        );
+
+        CREATE TABLE IF NOT EXISTS agent_operating_models (
+            tenant_key TEXT PRIMARY KEY,
+            version TEXT NOT NULL,
+            title TEXT NOT NULL,
+            summary TEXT NOT NULL,
+            manager_moves_json TEXT NOT NULL,
+            generated_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS agent_tool_registry (
+            tenant_key TEXT NOT NULL,
+            tool_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            category TEXT NOT NULL,
+            purpose TEXT NOT NULL,
+            generated_at TEXT NOT NULL,
+            PRIMARY KEY (tenant_key, tool_id)
+        );
+
+        CREATE TABLE IF NOT EXISTS agent_playbooks (
+            tenant_key TEXT NOT NULL,
+            playbook_id TEXT NOT NULL,
+            team_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            workspace TEXT NOT NULL,
+            lead_role TEXT NOT NULL,
+            mission TEXT NOT NULL,
+            cadence_json TEXT NOT NULL,
+            write_policy TEXT NOT NULL,
+            generated_at TEXT NOT NULL,
+            PRIMARY KEY (tenant_key, playbook_id)
+        );
+
+        CREATE TABLE IF NOT EXISTS agent_playbook_outputs (
+            tenant_key TEXT NOT NULL,
+            playbook_id TEXT NOT NULL,
+            output_index INTEGER NOT NULL,
+            output_text TEXT NOT NULL,
+            generated_at TEXT NOT NULL,
+            PRIMARY KEY (tenant_key, playbook_id, output_index)
+        );
+
+        CREATE TABLE IF NOT EXISTS agent_playbook_tools (
+            tenant_key TEXT NOT NULL,
+            playbook_id TEXT NOT NULL,
+            tool_index INTEGER NOT NULL,
+            tool_id TEXT NOT NULL,
+            mode TEXT NOT NULL,
+            scope TEXT NOT NULL,
+            generated_at TEXT NOT NULL,
+            PRIMARY KEY (tenant_key, playbook_id, tool_index)
+        );
+
+        CREATE TABLE IF NOT EXISTS agent_playbook_notes (
+            tenant_key TEXT NOT NULL,
+            playbook_id TEXT NOT NULL,
+            note_type TEXT NOT NULL,
+            note_index INTEGER NOT NULL,
+            note_text TEXT NOT NULL,
+            generated_at TEXT NOT NULL,
+            PRIMARY KEY (tenant_key, playbook_id, note_type, note_index)
+        );
+
+        CREATE TABLE IF NOT EXISTS agent_playbook_kpis (
+            tenant_key TEXT NOT NULL,
+            playbook_id TEXT NOT NULL,
+            kpi_index INTEGER NOT NULL,
+            kpi_name TEXT NOT NULL,
+            kpi_target TEXT NOT NULL,
+            generated_at TEXT NOT NULL,
+            PRIMARY KEY (tenant_key, playbook_id, kpi_index)
+        );
+
+        CREATE TABLE IF NOT EXISTS app_users (
+            username TEXT PRIMARY KEY,
+            display_name TEXT NOT NULL,
+            password_hash TEXT NOT NULL,
+            role TEXT NOT NULL,
+            status TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS app_sessions (
+            session_id TEXT PRIMARY KEY,
+            username TEXT NOT NULL,
+            role TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            expires_at TEXT NOT NULL,
+            last_seen_at TEXT NOT NULL
+        );
+        """
+    )
+    contact_columns = {
+        str(row["name"]).strip()
+        for row in connection.execute("PRAGMA table_info(contact_submissions)").fetchall()
+    }
+    if "requested_package" not in contact_columns:
+        connection.execute("ALTER TABLE contact_submissions ADD COLUMN requested_package TEXT NOT NULL DEFAULT ''")
+    if "status" not in contact_columns:
+        connection.execute("ALTER TABLE contact_submissions ADD COLUMN status TEXT NOT NULL DEFAULT 'captured'")
+    if "owner" not in contact_columns:
+        connection.execute("ALTER TABLE contact_submissions ADD COLUMN owner TEXT NOT NULL DEFAULT 'Revenue Pod'")
+    if "next_step" not in contact_columns:
+        connection.execute("ALTER TABLE contact_submissions ADD COLUMN next_step TEXT NOT NULL DEFAULT ''")
+    if "workspace_id" not in contact_columns:
+        connection.execute("ALTER TABLE contact_submissions ADD COLUMN workspace_id TEXT NOT NULL DEFAULT ''")
+    if "lead_id" not in contact_columns:
+        connection.execute("ALTER TABLE contact_submissions ADD COLUMN lead_id TEXT NOT NULL DEFAULT ''")
+    if "task_id" not in contact_columns:
+        connection.execute("ALTER TABLE contact_submissions ADD COLUMN task_id TEXT NOT NULL DEFAULT ''")
+    approval_columns = {
+        str(row["name"]).strip()
+        for row in connection.execute("PRAGMA table_info(approval_queue)").fetchall()
+    }
+    if "workspace_id" not in approval_columns:
+        connection.execute("ALTER TABLE approval_queue ADD COLUMN workspace_id TEXT NOT NULL DEFAULT ''")
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_approval_queue_workspace_status "
+        "ON approval_queue (workspace_id, status, created_at DESC)"
+    )
+    _migrate_agent_team_runtime_tables(connection)
+    connection.executescript(
+        """
+        CREATE INDEX IF NOT EXISTS idx_agent_teams_tenant_generated
+        ON agent_teams (tenant_key, generated_at DESC, name);
+
+        CREATE INDEX IF NOT EXISTS idx_agent_units_tenant_team
+        ON agent_units (tenant_key, team_id, name);
+        """
+    )
+    _ensure_register_counters(connection)
+    connection.commit()
 
 
 def upsert_snapshot(db_path: Path, key: str, payload: Any) -> None:
@@ -2820,32 +3089,30 @@ def list_approval_entries(
     ]
 
 
-def load_approval_summary(db_path: Path, *, workspace_id: str | None = None) -> dict[str, Any]:
-    ensure_schema(db_path)
-    normalized_workspace_id = str(workspace_id or "").strip()
-    where_clause = " WHERE workspace_id = ?" if workspace_id is not None else ""
-    params: tuple[Any, ...] = (normalized_workspace_id,) if workspace_id is not None else ()
-    with _connect(db_path) as connection:
-        total = int(connection.execute(f"SELECT COUNT(*) FROM approval_queue{where_clause}", params).fetchone()[0])
-        status_rows = connection.execute(
-            f"SELECT status, COUNT(*) AS item_count FROM approval_queue{where_clause} GROUP BY status",
-            params,
-        ).fetchall()
-        gate_rows = connection.execute(
-            f"SELECT approval_gate, COUNT(*) AS item_count FROM approval_queue{where_clause} "
-            "GROUP BY approval_gate ORDER BY item_count DESC, approval_gate LIMIT 5",
-            params,
-        ).fetchall()
+def _approval_summary(connection: sqlite3.Connection, *, workspace_id: str | None = None) -> dict[str, Any]:
+    scope = str(workspace_id or "").strip() if workspace_id is not None else None
     return {
-        "approval_count": total,
-        "by_status": {str(row["status"]): int(row["item_count"]) for row in status_rows},
+        "approval_count": _register_total(connection, "approval_queue", scope=scope)[0],
+        "by_status": dict(_register_counts(connection, "approval_queue", "status", scope=scope)),
         "top_gates": [
-            {"approval_gate": str(row["approval_gate"]), "item_count": int(row["item_count"])}
-            for row in gate_rows
+            {"approval_gate": approval_gate, "item_count": item_count}
+            for approval_gate, item_count in _register_counts(
+                connection,
+                "approval_queue",
+                "approval_gate",
+                scope=scope,
+                limit=5,
+            )
         ],
     }
 
 
+def load_approval_summary(db_path: Path, *, workspace_id: str | None = None) -> dict[str, Any]:
+    ensure_schema(db_path)
+    with _connect(db_path) as connection:
+        return _approval_summary(connection, workspace_id=workspace_id)
+
+
 def add_attendance_event(
     db_path: Path,
     *,
@@ -3294,11 +3561,12 @@ def add_maintenance_record(
                 status,
                 owner,
                 downtime_minutes,
+                downtime_minutes_value,
                 next_action,
                 evidence_link,
                 source_ref_json,
                 synced_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 maintenance_id,
@@ -3309,6 +3577,7 @@ def add_maintenance_record(
                 normalized_status,
                 normalized_owner,
                 normalized_downtime_minutes,
+                _coerce_number(normalized_downtime_minutes) or 0.0,
                 normalized_next_action,
                 normalized_evidence,
                 json.dumps(source_ref),
@@ -3512,21 +3781,49 @@ def list_actions(
     ]
 
 
+def _register_counts(
+    connection: sqlite3.Connection,
+    register: str,
+    dimension: str,
+    *,
+    scope: str | None = None,
+    limit: int | None = None,
+) -> list[tuple[str, int]]:
+    scope_clause = " AND scope = ?" if scope is not None else ""
+    params: tuple[Any, ...] = (register, dimension) + ((scope,) if scope is not None else ())
+    order_clause = " ORDER BY item_count DESC, value LIMIT ?" if limit is not None else " ORDER BY value"
+    rows = connection.execute(
+        "SELECT value, SUM(item_count) AS item_count FROM register_counters "
+        f"WHERE register = ? AND dimension = ?{scope_clause} GROUP BY value HAVING SUM(item_count) > 0"
+        f"{order_clause}",
+        params + ((limit,) if limit is not None else ()),
+    ).fetchall()
+    return [(str(row["value"]), int(row["item_count"])) for row in rows]
+
+
+def _register_total(connection: sqlite3.Connection, register: str, *, scope: str | None = None) -> tuple[int, float]:
+    scope_clause = " AND scope = ?" if scope is not None else ""
+    params: tuple[Any, ...] = (register, _REGISTER_COUNTER_ALL) + ((scope,) if scope is not None else ())
+    row = connection.execute(
+        "SELECT COALESCE(SUM(item_count), 0), COALESCE(SUM(item_total), 0) FROM register_counters "
+        f"WHERE register = ? AND dimension = ?{scope_clause}",
+        params,
+    ).fetchone()
+    return int(row[0]), float(row[1])
+
+
+def _action_summary(connection: sqlite3.Connection) -> dict[str, Any]:
+    return {
+        "total_items": _register_total(connection, "actions")[0],
+        "by_lane": dict(_register_counts(connection, "actions", "lane")),
+        "by_status": dict(_register_counts(connection, "actions", "status")),
+    }
+
+
 def load_action_summary(db_path: Path) -> dict[str, Any]:
     ensure_schema(db_path)
     with _connect(db_path) as connection:
-        total = int(connection.execute("SELECT COUNT(*) FROM actions").fetchone()[0])
-        lane_rows = connection.execute(
-            "SELECT lane, COUNT(*) AS item_count FROM actions GROUP BY lane"
-        ).fetchall()
-        status_rows = connection.execute(
-            "SELECT status, COUNT(*) AS item_count FROM actions GROUP BY status"
-        ).fetchall()
-    return {
-        "total_items": total,
-        "by_lane": {str(row["lane"]): int(row["item_count"]) for row in lane_rows},
-        "by_status": {str(row["status"]): int(row["item_count"]) for row in status_rows},
-    }
+        return _action_summary(connection)
 
 
 def list_quality_incidents(db_path: Path, *, status: str | None = None, limit: int = 100) -> list[dict[str, Any]]:
@@ -3574,28 +3871,24 @@ def list_quality_incidents(db_path: Path, *, status: str | None = None, limit: i
     ]
 
 
-def load_quality_summary(db_path: Path) -> dict[str, Any]:
-    ensure_schema(db_path)
-    with _connect(db_path) as connection:
-        incident_total = int(connection.execute("SELECT COUNT(*) FROM quality_incidents").fetchone()[0])
-        capa_total = int(connection.execute("SELECT COUNT(*) FROM capa_actions").fetchone()[0])
-        status_rows = connection.execute(
-            "SELECT status, COUNT(*) AS item_count FROM quality_incidents GROUP BY status"
-        ).fetchall()
-        supplier_rows = connection.execute(
-            "SELECT supplier, COUNT(*) AS item_count FROM quality_incidents GROUP BY supplier ORDER BY item_count DESC, supplier LIMIT 5"
-        ).fetchall()
+def _quality_summary(connection: sqlite3.Connection) -> dict[str, Any]:
     return {
-        "incident_count": incident_total,
-        "capa_count": capa_total,
-        "by_status": {str(row["status"]): int(row["item_count"]) for row in status_rows},
+        "incident_count": _register_total(connection, "quality_incidents")[0],
+        "capa_count": _register_total(connection, "capa_actions")[0],
+        "by_status": dict(_register_counts(connection, "quality_incidents", "status")),
         "top_suppliers": [
-            {"supplier": str(row["supplier"]), "incident_count": int(row["item_count"])}
-            for row in supplier_rows
+            {"supplier": supplier, "incident_count": item_count}
+            for supplier, item_count in _register_counts(connection, "quality_incidents", "supplier", limit=5)
         ],
     }
 
 
+def load_quality_summary(db_path: Path) -> dict[str, Any]:
+    ensure_schema(db_path)
+    with _connect(db_path) as connection:
+        return _quality_summary(connection)
+
+
 def list_capa_actions(db_path: Path, *, status: str | None = None, limit: int = 100) -> list[dict[str, Any]]:
     ensure_schema(db_path)
     query = """
@@ -3694,30 +3987,24 @@ def list_supplier_risks(
     ]
 
 
-def load_supplier_risk_summary(db_path: Path) -> dict[str, Any]:
-    ensure_schema(db_path)
-    with _connect(db_path) as connection:
-        total = int(connection.execute("SELECT COUNT(*) FROM supplier_risks").fetchone()[0])
-        status_rows = connection.execute(
-            "SELECT status, COUNT(*) AS item_count FROM supplier_risks GROUP BY status"
-        ).fetchall()
-        severity_rows = connection.execute(
-            "SELECT severity, COUNT(*) AS item_count FROM supplier_risks GROUP BY severity"
-        ).fetchall()
-        supplier_rows = connection.execute(
-            "SELECT supplier, COUNT(*) AS item_count FROM supplier_risks GROUP BY supplier ORDER BY item_count DESC, supplier LIMIT 5"
-        ).fetchall()
+def _supplier_risk_summary(connection: sqlite3.Connection) -> dict[str, Any]:
     return {
-        "risk_count": total,
-        "by_status": {str(row["status"]): int(row["item_count"]) for row in status_rows},
-        "by_severity": {str(row["severity"]): int(row["item_count"]) for row in severity_rows},
+        "risk_count": _register_total(connection, "supplier_risks")[0],
+        "by_status": dict(_register_counts(connection, "supplier_risks", "status")),
+        "by_severity": dict(_register_counts(connection, "supplier_risks", "severity")),
         "top_suppliers": [
-            {"supplier": str(row["supplier"]), "risk_count": int(row["item_count"])}
-            for row in supplier_rows
+            {"supplier": supplier, "risk_count": item_count}
+            for supplier, item_count in _register_counts(connection, "supplier_risks", "supplier", limit=5)
         ],
     }
 
 
+def load_supplier_risk_summary(db_path: Path) -> dict[str, Any]:
+    ensure_schema(db_path)
+    with _connect(db_path) as connection:
+        return _supplier_risk_summary(connection)
+
+
 def list_receiving_records(
     db_path: Path,
     *,
@@ -3782,34 +4069,27 @@ def list_receiving_records(
     ]
 
 
-def load_receiving_summary(db_path: Path) -> dict[str, Any]:
-    ensure_schema(db_path)
-    with _connect(db_path) as connection:
-        total = int(connection.execute("SELECT COUNT(*) FROM receiving_records").fetchone()[0])
-        status_rows = connection.execute(
-            "SELECT status, COUNT(*) AS item_count FROM receiving_records GROUP BY status"
-        ).fetchall()
-        supplier_rows = connection.execute(
-            "SELECT supplier, COUNT(*) AS item_count FROM receiving_records GROUP BY supplier ORDER BY item_count DESC, supplier LIMIT 5"
-        ).fetchall()
-        variance_rows = connection.execute(
-            "SELECT COUNT(*) FROM receiving_records WHERE variance_note != 'matched'"
-        ).fetchone()
-        hold_rows = connection.execute(
-            "SELECT COUNT(*) FROM receiving_records WHERE status IN ('hold', 'blocked', 'review')"
-        ).fetchone()
+def _receiving_summary(connection: sqlite3.Connection) -> dict[str, Any]:
+    by_status = dict(_register_counts(connection, "receiving_records", "status"))
+    by_variance = dict(_register_counts(connection, "receiving_records", "variance"))
     return {
-        "receiving_count": total,
-        "by_status": {str(row["status"]): int(row["item_count"]) for row in status_rows},
-        "variance_count": int(variance_rows[0] if variance_rows else 0),
-        "hold_count": int(hold_rows[0] if hold_rows else 0),
+        "receiving_count": _register_total(connection, "receiving_records")[0],
+        "by_status": by_status,
+        "variance_count": by_variance.get("variance", 0),
+        "hold_count": sum(by_status.get(status, 0) for status in ("hold", "blocked", "review")),
         "top_suppliers": [
-            {"supplier": str(row["supplier"]), "receiving_count": int(row["item_count"])}
-            for row in supplier_rows
+            {"supplier": supplier, "receiving_count": item_count}
+            for supplier, item_count in _register_counts(connection, "receiving_records", "supplier", limit=5)
         ],
     }
 
 
+def load_receiving_summary(db_path: Path) -> dict[str, Any]:
+    ensure_schema(db_path)
+    with _connect(db_path) as connection:
+        return _receiving_summary(connection)
+
+
 def list_inventory_records(
     db_path: Path,
     *,
@@ -3874,34 +4154,26 @@ def list_inventory_records(
     ]
 
 
-def load_inventory_summary(db_path: Path) -> dict[str, Any]:
-    ensure_schema(db_path)
-    with _connect(db_path) as connection:
-        total = int(connection.execute("SELECT COUNT(*) FROM inventory_records").fetchone()[0])
-        status_rows = connection.execute(
-            "SELECT status, COUNT(*) AS item_count FROM inventory_records GROUP BY status"
-        ).fetchall()
-        warehouse_rows = connection.execute(
-            "SELECT warehouse, COUNT(*) AS item_count FROM inventory_records GROUP BY warehouse ORDER BY item_count DESC, warehouse LIMIT 5"
-        ).fetchall()
-        reorder_rows = connection.execute(
-            "SELECT COUNT(*) FROM inventory_records WHERE status = 'reorder'"
-        ).fetchone()
-        watch_rows = connection.execute(
-            "SELECT COUNT(*) FROM inventory_records WHERE status = 'watch'"
-        ).fetchone()
+def _inventory_summary(connection: sqlite3.Connection) -> dict[str, Any]:
+    by_status = dict(_register_counts(connection, "inventory_records", "status"))
     return {
-        "inventory_count": total,
-        "by_status": {str(row["status"]): int(row["item_count"]) for row in status_rows},
-        "reorder_count": int(reorder_rows[0] if reorder_rows else 0),
-        "watch_count": int(watch_rows[0] if watch_rows else 0),
+        "inventory_count": _register_total(connection, "inventory_records")[0],
+        "by_status": by_status,
+        "reorder_count": by_status.get("reorder", 0),
+        "watch_count": by_status.get("watch", 0),
         "top_warehouses": [
-            {"warehouse": str(row["warehouse"]), "item_count": int(row["item_count"])}
-            for row in warehouse_rows
+            {"warehouse": warehouse, "item_count": item_count}
+            for warehouse, item_count in _register_counts(connection, "inventory_records", "warehouse", limit=5)
         ],
     }
 
 
+def load_inventory_summary(db_path: Path) -> dict[str, Any]:
+    ensure_schema(db_path)
+    with _connect(db_path) as connection:
+        return _inventory_summary(connection)
+
+
 def list_maintenance_records(
     db_path: Path,
     *,
@@ -3960,41 +4232,29 @@ def list_maintenance_records(
     ]
 
 
-def load_maintenance_summary(db_path: Path) -> dict[str, Any]:
-    ensure_schema(db_path)
-    with _connect(db_path) as connection:
-        total = int(connection.execute("SELECT COUNT(*) FROM maintenance_records").fetchone()[0])
-        status_rows = connection.execute(
-            "SELECT status, COUNT(*) AS item_count FROM maintenance_records GROUP BY status"
-        ).fetchall()
-        type_rows = connection.execute(
-            "SELECT issue_type, COUNT(*) AS item_count FROM maintenance_records GROUP BY issue_type ORDER BY item_count DESC, issue_type LIMIT 5"
-        ).fetchall()
-        breakdown_rows = connection.execute(
-            "SELECT COUNT(*) FROM maintenance_records WHERE issue_type = 'breakdown'"
-        ).fetchone()
-        downtime_rows = connection.execute(
-            "SELECT downtime_minutes FROM maintenance_records"
-        ).fetchall()
-
-    downtime_total = 0.0
-    for row in downtime_rows:
-        downtime_value = _coerce_number(str(row["downtime_minutes"]))
-        if downtime_value is not None:
-            downtime_total += downtime_value
-
+def _maintenance_summary(connection: sqlite3.Connection) -> dict[str, Any]:
+    total, downtime_total = _register_total(connection, "maintenance_records")
+    # The counter is maintained incrementally, so trim float drift before
+    # deciding whether the total is a whole number of minutes.
+    downtime_total = round(downtime_total, 6)
     return {
         "maintenance_count": total,
-        "by_status": {str(row["status"]): int(row["item_count"]) for row in status_rows},
-        "breakdown_count": int(breakdown_rows[0] if breakdown_rows else 0),
+        "by_status": dict(_register_counts(connection, "maintenance_records", "status")),
+        "breakdown_count": dict(_register_counts(connection, "maintenance_records", "issue_type")).get("breakdown", 0),
         "downtime_minutes_total": int(downtime_total) if float(downtime_total).is_integer() else round(downtime_total, 2),
         "top_issue_types": [
-            {"issue_type": str(row["issue_type"]), "item_count": int(row["item_count"])}
-            for row in type_rows
+            {"issue_type": issue_type, "item_count": item_count}
+            for issue_type, item_count in _register_counts(connection, "maintenance_records", "issue_type", limit=5)
         ],
     }
 
 
+def load_maintenance_summary(db_path: Path) -> dict[str, Any]:
+    ensure_schema(db_path)
+    with _connect(db_path) as connection:
+        return _maintenance_summary(connection)
+
+
 def list_metric_entries(
     db_path: Path,
     *,
@@ -4056,46 +4316,72 @@ def list_metric_entries(
     ]
 
 
+def _metric_summary(connection: sqlite3.Connection) -> dict[str, Any]:
+    group_rows = _register_counts(connection, "metric_entries", "metric_group", limit=8)
+    return {
+        "metric_count": _register_total(connection, "metric_entries")[0],
+        "by_group": dict(group_rows),
+        "by_status": dict(_register_counts(connection, "metric_entries", "status")),
+        "top_groups": [
+            {"metric_group": metric_group, "item_count": item_count}
+            for metric_group, item_count in group_rows
+        ],
+    }
+
+
 def load_metric_summary(db_path: Path) -> dict[str, Any]:
     ensure_schema(db_path)
     with _connect(db_path) as connection:
-        total = int(connection.execute("SELECT COUNT(*) FROM metric_entries").fetchone()[0])
-        group_rows = connection.execute(
-            "SELECT metric_group, COUNT(*) AS item_count FROM metric_entries GROUP BY metric_group ORDER BY item_count DESC, metric_group LIMIT 8"
-        ).fetchall()
-        status_rows = connection.execute(
-            "SELECT status, COUNT(*) AS item_count FROM metric_entries GROUP BY status"
-        ).fetchall()
+        return _metric_summary(connection)
+
+
+def _product_feedback_summary(connection: sqlite3.Connection) -> dict[str, Any]:
+    by_status = dict(_register_counts(connection, "product_feedback", "status"))
     return {
-        "metric_count": total,
-        "by_group": {str(row["metric_group"]): int(row["item_count"]) for row in group_rows},
-        "by_status": {str(row["status"]): int(row["item_count"]) for row in status_rows},
-        "top_groups": [
-            {"metric_group": str(row["metric_group"]), "item_count": int(row["item_count"])}
-            for row in group_rows
-        ],
+        "feedback_count": _register_total(connection, "product_feedback")[0],
+        "open_count": by_status.get("open", 0) + by_status.get("review", 0),
+        "high_priority_count": dict(_register_counts(connection, "product_feedback", "priority")).get("high", 0),
+        "by_category": dict(_register_counts(connection, "product_feedback", "category", limit=8)),
     }
 
 
 def load_product_feedback_summary(db_path: Path) -> dict[str, Any]:
     ensure_schema(db_path)
     with _connect(db_path) as connection:
-        total = int(connection.execute("SELECT COUNT(*) FROM product_feedback").fetchone()[0])
-        open_rows = connection.execute(
-            "SELECT COUNT(*) FROM product_feedback WHERE status IN ('open', 'review')"
-        ).fetchone()
-        high_rows = connection.execute(
-            "SELECT COUNT(*) FROM product_feedback WHERE priority = 'high'"
-        ).fetchone()
-        category_rows = connection.execute(
-            "SELECT category, COUNT(*) AS item_count FROM product_feedback GROUP BY category ORDER BY item_count DESC, category LIMIT 8"
+        return _product_feedback_summary(connection)
+
+
+DASHBOARD_SNAPSHOT_KEYS = ("product_lab", "solution_portfolio_manifest", "platform_digest")
+
+
+def load_dashboard_summary(db_path: Path, *, workspace_id: str | None = None) -> dict[str, Any]:
+    """Answer every register summary from one connection and one read snapshot."""
+    ensure_schema(db_path)
+    with _connect(db_path) as connection:
+        connection.execute("BEGIN")
+        snapshot_rows = connection.execute(
+            "SELECT snapshot_key, payload_json FROM snapshots WHERE snapshot_key IN (?, ?, ?)",
+            DASHBOARD_SNAPSHOT_KEYS,
         ).fetchall()
-    return {
-        "feedback_count": total,
-        "open_count": int(open_rows[0] if open_rows else 0),
-        "high_priority_count": int(high_rows[0] if high_rows else 0),
-        "by_category": {str(row["category"]): int(row["item_count"]) for row in category_rows},
-    }
+        summary: dict[str, Any] = {
+            "actions": _action_summary(connection),
+            "quality": _quality_summary(connection),
+            "supplier_watch": _supplier_risk_summary(connection),
+            "receiving": _receiving_summary(connection),
+            "inventory": _inventory_summary(connection),
+            "maintenance": _maintenance_summary(connection),
+            "approvals": _approval_summary(connection, workspace_id=workspace_id),
+            "metrics": _metric_summary(connection),
+            "feedback": _product_feedback_summary(connection),
+        }
+    snapshots: dict[str, Any] = {}
+    for row in snapshot_rows:
+        try:
+            snapshots[str(row["snapshot_key"])] = json.loads(row["payload_json"])
+        except Exception:
+            snapshots[str(row["snapshot_key"])] = {}
+    summary["snapshots"] = snapshots
+    return summary
 
 
 def sync_agent_team_system(db_path: Path, payload: dict[str, Any]) -> dict[str, Any]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import importlib
 import json
 import os
 import signal
@@ -11,10 +12,15 @@ from datetime import datetime
 from http.cookiejar import CookieJar
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Any
+from typing import Any, Callable
 from urllib.error import HTTPError, URLError
 from urllib.request import HTTPCookieProcessor, Request, build_opener
 
+try:
+    from dotenv import load_dotenv
+except ImportError:  # pragma: no cover - optional dependency
+    load_dotenv = None
+
 
 DEFAULT_JOB_TYPES = [
     "revenue_scout",
@@ -25,6 +31,8 @@ DEFAULT_JOB_TYPES = [
     "founder_brief",
     "github_release_watch",
 ]
+WORKER_MODES = ("http", "push")
+REPO_ROOT = Path(__file__).resolve().parent.parent
 
 
 def _timestamp() -> str:
@@ -51,6 +59,20 @@ def _request_json(
         return json.loads(response.read().decode("utf-8") or "{}")
 
 
+def _load_local_env_files(repo_root: Path | None) -> None:
+    """Load the same local env files the service loads, without overriding the environment."""
+    if load_dotenv is None:
+        return
+    root = repo_root or REPO_ROOT
+    for candidate in (
+        root / ".env.app.local",
+        root / ".env.local",
+        Path.home() / "OneDrive - BDA" / ".env.app.local",
+    ):
+        if candidate.exists():
+            load_dotenv(candidate, override=False)
+
+
 def _status_file_path(repo_root: Path | None) -> Path:
     pilot_data_env = str(os.getenv("SUPERMEGA_PILOT_DATA", "")).strip()
     if pilot_data_env:
@@ -95,6 +117,8 @@ class SupervisorConfig:
     password: str
     workspace_slug: str
     status_path: Path
+    worker_mode: str = "http"
+    repo_root: Path | None = None
 
 
 class SupervisorRuntime:
@@ -102,7 +126,11 @@ class SupervisorRuntime:
         self.config = config
         self.stop_requested = False
         self.opener = build_opener(HTTPCookieProcessor(CookieJar()))
-        self.mode = "internal_queue" if config.cron_token else "workspace_session"
+        if config.worker_mode == "push":
+            self.mode = "in_process_queue"
+        else:
+            self.mode = "internal_queue" if config.cron_token else "workspace_session"
+        self.worker: Any = None
         existing_status = _read_status(config.status_path)
         self.cycle_count = int(existing_status.get("cycle_count", 0) or 0)
         self.last_started_at = str(existing_status.get("last_started_at", "")).strip()
@@ -114,8 +142,10 @@ class SupervisorRuntime:
 
     def _handle_stop(self, signum: int, _frame: Any) -> None:
         self.stop_requested = True
+        if self.worker is not None:
+            self.worker.request_stop()
         self._persist_status(
-            status="stopping",
+            status="draining" if self.worker is not None else "stopping",
             last_error=f"received signal {signum}",
             last_processed_count=0,
             last_enqueued_count=0,
@@ -147,6 +177,8 @@ class SupervisorRuntime:
             "job_types": self.config.job_types,
             "enqueue_defaults": self.config.enqueue_defaults,
         }
+        if self.worker is not None:
+            payload["worker"] = self.worker.metrics()
         _write_status(self.config.status_path, payload)
 
     def _health_ready(self) -> tuple[bool, str]:
@@ -240,7 +272,84 @@ class SupervisorRuntime:
             )
         return int(payload.get("processed_count", payload.get("count", 0)) or 0)
 
+    def _load_agent_run_completer(self, database_url: str) -> Callable[[dict[str, Any]], dict[str, Any]]:
+        """Bind the service's job runner so push mode runs jobs as /process-queue does."""
+        if self.config.repo_root is not None and str(self.config.repo_root) not in sys.path:
+            sys.path.insert(0, str(self.config.repo_root))
+        # Deferred: the service module pulls in the web stack, which HTTP mode never needs.
+        service = importlib.import_module("tools.serve_solution")
+        from mark1_pilot.lead_cache import LEAD_CACHE_FILE
+        from mark1_pilot.lead_finder import configure_lead_cache
+        from mark1_pilot.state_store import resolve_state_db
+
+        pilot_data = self.config.status_path.parent
+        configure_lead_cache(pilot_data / LEAD_CACHE_FILE)
+        state_db = resolve_state_db(pilot_data)
+
+        def complete(row: dict[str, Any]) -> dict[str, Any]:
+            return service._complete_existing_agent_run(
+                state_db=state_db,
+                enterprise_db_url=database_url,
+                workspace_id=str(row.get("workspace_id", "")).strip(),
+                run_id=str(row.get("run_id", "")).strip(),
+                job_type=str(row.get("job_type", "")).strip(),
+                claim_token=str(row.get("claim_token", "")).strip(),
+                payload=row.get("payload", {}) if isinstance(row.get("payload", {}), dict) else {},
+            )
+
+        return complete
+
+    def _run_push_worker(self) -> int:
+        from mark1_pilot.agent_queue_worker import AgentQueueWorker
+        from mark1_pilot.enterprise_store import ensure_workspace, open_agent_queue_listener, resolve_database_url
+
+        database_url = resolve_database_url(self.config.status_path.parent)
+        workspace = ensure_workspace(
+            database_url,
+            slug=self.config.workspace_slug,
+            name=str(os.getenv("SUPERMEGA_WORKSPACE_NAME", "SuperMega Lab")).strip() or "SuperMega Lab",
+        )
+        workspace_id = str(workspace["workspace_id"])
+        self.worker = AgentQueueWorker(
+            database_url=database_url,
+            workspace_id=workspace_id,
+            job_types=self.config.job_types,
+            complete=self._load_agent_run_completer(database_url),
+            listener=open_agent_queue_listener(database_url, workspace_id=workspace_id),
+            reopen_listener=lambda: open_agent_queue_listener(database_url, workspace_id=workspace_id),
+            limit=self.config.limit,
+            enqueue_defaults=self.config.enqueue_defaults,
+            enqueue_interval_seconds=max(self.config.interval_minutes, 1) * 60,
+            idle_seconds=max(self.config.poll_seconds, 1),
+        )
+        if self.stop_requested:
+            self.worker.request_stop()
+
+        def record_cycle(status: str, last_error: str, claimed_count: int, enqueued_count: int) -> None:
+            if status != "draining":
+                self.cycle_count += 1
+            if claimed_count:
+                self.last_started_at = _timestamp()
+            self.last_finished_at = _timestamp()
+            self._persist_status(
+                status=status,
+                last_error=last_error,
+                last_processed_count=claimed_count,
+                last_enqueued_count=enqueued_count,
+                health_status="in_process",
+            )
+
+        try:
+            self.worker.run(max_cycles=self.config.max_cycles, on_cycle=record_cycle)
+        finally:
+            self.worker.close()
+        self.last_finished_at = _timestamp()
+        self._persist_status(status="stopped", health_status="in_process")
+        return 0
+
     def run(self) -> int:
+        if self.config.worker_mode == "push":
+            return self._run_push_worker()
         while not self.stop_requested and (self.config.max_cycles <= 0 or self.cycle_count < self.config.max_cycles):
             self.cycle_count += 1
             self.last_started_at = _timestamp()
@@ -306,6 +415,12 @@ def _parse_args(argv: list[str]) -> SupervisorConfig:
     parser.add_argument("--no-enqueue-defaults", dest="enqueue_defaults", action="store_false")
     parser.set_defaults(enqueue_defaults=True)
     parser.add_argument("--job-type", action="append", dest="job_types")
+    parser.add_argument(
+        "--worker-mode",
+        choices=WORKER_MODES,
+        default=str(os.getenv("SUPERMEGA_SUPERVISOR_WORKER_MODE", "http")).strip().lower() or "http",
+        help="http polls the service endpoints; push claims from the enterprise store and wakes on queue notifications.",
+    )
     args = parser.parse_args(argv)
 
     repo_root_raw = str(args.repo_root or "").strip()
@@ -325,11 +440,21 @@ def _parse_args(argv: list[str]) -> SupervisorConfig:
         password=str(os.getenv("SUPERMEGA_APP_PASSWORD", "supermega-demo")).strip() or "supermega-demo",
         workspace_slug=str(os.getenv("SUPERMEGA_WORKSPACE_SLUG", "supermega-lab")).strip() or "supermega-lab",
         status_path=_status_file_path(repo_root),
+        worker_mode=str(args.worker_mode),
+        repo_root=repo_root,
     )
 
 
 def main(argv: list[str] | None = None) -> int:
-    config = _parse_args(argv or sys.argv[1:])
+    argv = argv or sys.argv[1:]
+    # Env files must be loaded before argument defaults read the environment, so
+    # push mode resolves the same database and workspace the service enqueues into.
+    preparser = argparse.ArgumentParser(add_help=False)
+    preparser.add_argument("--repo-root", default="")
+    known, _ = preparser.parse_known_args(argv)
+    repo_root_raw = str(known.repo_root or "").strip()
+    _load_local_env_files(Path(repo_root_raw).resolve() if repo_root_raw else None)
+    config = _parse_args(argv)
     runtime = SupervisorRuntime(config)
     return runtime.run()
 
@@ -0,0 +1,265 @@
+begin;
+
+-- Segmented workspace state. Until v13 every surface was one state_json blob,
+-- rewritten whole on every command and capped at 64 KiB by the runtime. From
+-- v14 the runtime (PostgresTrialStore, SUPERMEGA_TRIAL_SCHEMA_VERSION=14)
+-- stores the long commerce collections -- orders, movements, closes and
+-- purchaseOrders -- as sealed chunks in workspace_state_segments. The
+-- workspace_state row keeps a small head document whose "$segments" object
+-- lists each collection's newest inline records and the sha256 digests of its
+-- older chunks. Command events store the same heads.
+--
+-- Chunks are content-addressed and immutable: the runtime role may SELECT and
+-- INSERT them for its own workspace, never UPDATE or DELETE. A command inserts
+-- only the chunks its new head references that the locked head did not, so an
+-- append-heavy workspace writes one head row and at most one new chunk per
+-- command. The optimistic version contract stays on workspace_state and is
+-- unchanged; chunks carry no version because they never change.
+--
+-- There is deliberately no foreign key to workspace_state: a command inserts
+-- its chunks before the head that references them, all in one transaction.
+--
+-- A command whose new head drops chunks the locked head referenced calls
+-- collect_workspace_state_segments for them. The function removes only chunks
+-- of the session workspace that no state row and no event head references any
+-- more; it is the sole way chunks are deleted, so the runtime role itself keeps
+-- no DELETE privilege.
+--
+-- Reviewed and local-rehearsed only as of authoring; NOT proven on a hosted
+-- branch and NOT applied anywhere. Do not apply to production without a
+-- disposable-branch proof first, per house discipline.
+
+do $guard$
+begin
+  if not exists (
+    select 1
+    from app_private.trial_schema_meta
+    where component = 'private_trial_backend'
+      and schema_version = 13
+  ) then
+    raise exception using
+      errcode = '55000',
+      message = 'private trial backend v14 requires schema version 13';
+  end if;
+end
+$guard$;
+
+create table app_private.workspace_state_segments (
+  workspace_id text not null,
+  surface text not null
+    check (surface in ('company', 'commerce', 'production', 'website', 'setup')),
+  digest text not null check (digest ~ '^sha256:[0-9a-f]{64}$'),
+  records jsonb not null check (jsonb_typeof(records) = 'array'),
+  created_at timestamptz not null default transaction_timestamp(),
+  primary key (workspace_id, surface, digest)
+);
+
+alter table app_private.workspace_state_segments enable row level security;
+alter table app_private.workspace_state_segments force row level security;
+
+create policy workspace_state_segments_member_read
+on app_private.workspace_state_segments
+for select
+to supermega_trial_backend
+using (
+  workspace_id = (select current_setting('app.workspace_id', true))
+  and (select current_setting('app.actor_kind', true)) in ('human', 'service', 'agent')
+  and exists (
+    select 1
+    from app_private.workspace_memberships membership
+    where membership.workspace_id = workspace_state_segments.workspace_id
+      and membership.actor_id = (select current_setting('app.actor_id', true))
+      and membership.actor_kind = (select current_setting('app.actor_kind', true))
+      and membership.status = 'active'
+      and (
+        workspace_state_segments.surface || '.read' = any(membership.capabilities)
+        or workspace_state_segments.surface || '.write' = any(membership.capabilities)
+      )
+  )
+);
+
+-- The surface check above limits chunks to state surfaces, each of which is
+-- written under exactly its own "<surface>.write" capability.
+create policy workspace_state_segments_capability_insert
+on app_private.workspace_state_segments
+for insert
+to supermega_trial_backend
+with check (
+  workspace_id = (select current_setting('app.workspace_id', true))
+  and (select current_setting('app.actor_kind', true)) in ('human', 'service', 'agent')
+  and exists (
+    select 1
+    from app_private.workspace_memberships membership
+    where membership.workspace_id = workspace_state_segments.workspace_id
+      and membership.actor_id = (select current_setting('app.actor_id', true))
+      and membership.actor_kind = (select current_setting('app.actor_kind', true))
+      and membership.status = 'active'
+      and workspace_state_segments.surface || '.write' = any(membership.capabilities)
+  )
+);
+
+create policy workspace_state_segments_access_gate
+on app_private.workspace_state_segments
+as restrictive
+for all
+to supermega_trial_backend
+using (app_private.workspace_is_active(workspace_state_segments.workspace_id))
+with check (app_private.workspace_is_active(workspace_state_segments.workspace_id));
+
+grant select, insert on app_private.workspace_state_segments to supermega_trial_backend;
+
+create function app_private.collect_workspace_state_segments(
+  target_workspace_id text,
+  target_surface text,
+  candidate_digests text[]
+)
+returns integer
+language plpgsql
+security definer
+set search_path = pg_catalog, app_private
+as $$
+declare
+  removed_count integer;
+begin
+  if target_workspace_id is distinct from (select current_setting('app.workspace_id', true)) then
+    raise exception using
+      errcode = '42501',
+      message = 'state segment collection is limited to the session workspace';
+  end if;
+
+  delete from app_private.workspace_state_segments segment
+  where segment.workspace_id = target_workspace_id
+    and segment.surface = target_surface
+    and segment.digest = any(candidate_digests)
+    and not exists (
+      select 1
+      from app_private.workspace_state state_row
+      where state_row.workspace_id = segment.workspace_id
+        and state_row.surface = segment.surface
+        and jsonb_path_exists(
+          state_row.state_json,
+          '$."$segments".*.chunks[*] ? (@ == $digest)',
+          jsonb_build_object('digest', segment.digest)
+        )
+    )
+    and not exists (
+      select 1
+      from app_private.workspace_events event_row
+      where event_row.workspace_id = segment.workspace_id
+        and event_row.surface = segment.surface
+        and (
+          jsonb_path_exists(
+            event_row.result_json,
+            '$.state."$segments".*.chunks[*] ? (@ == $digest)',
+            jsonb_build_object('digest', segment.digest)
+          )
+          or jsonb_path_exists(
+            event_row.payload_json,
+            '$.state."$segments".*.chunks[*] ? (@ == $digest)',
+            jsonb_build_object('digest', segment.digest)
+          )
+        )
+    );
+  get diagnostics removed_count = row_count;
+  return removed_count;
+end
+$$;
+
+revoke all on function app_private.collect_workspace_state_segments(text, text, text[]) from public;
+grant execute on function app_private.collect_workspace_state_segments(text, text, text[])
+  to supermega_trial_backend;
+
+update app_private.trial_schema_meta
+set schema_version = 14,
+    applied_at = transaction_timestamp()
+where component = 'private_trial_backend'
+  and schema_version = 13;
+
+do $verify$
+begin
+  if not exists (
+    select 1
+    from app_private.trial_schema_meta
+    where component = 'private_trial_backend'
+      and schema_version = 14
+  ) then
+    raise exception using
+      errcode = '55000',
+      message = 'private trial backend v14 did not reach schema version 14';
+  end if;
+
+  if not exists (
+    select 1
+    from pg_class table_record
+    join pg_namespace schema_record on schema_record.oid = table_record.relnamespace
+    where schema_record.nspname = 'app_private'
+      and table_record.relname = 'workspace_state_segments'
+      and table_record.relrowsecurity
+      and table_record.relforcerowsecurity
+  ) then
+    raise exception using
+      errcode = '55000',
+      message = 'private trial backend v14 state segments must force row level security';
+  end if;
+
+  if (
+    select count(*)
+    from pg_policies
+    where schemaname = 'app_private'
+      and tablename = 'workspace_state_segments'
+      and array_to_string(roles, ',') = 'supermega_trial_backend'
+      and (cmd, permissive, policyname) in (
+        ('SELECT', 'PERMISSIVE', 'workspace_state_segments_member_read'),
+        ('INSERT', 'PERMISSIVE', 'workspace_state_segments_capability_insert'),
+        ('ALL', 'RESTRICTIVE', 'workspace_state_segments_access_gate')
+      )
+  ) <> 3 then
+    raise exception using
+      errcode = '55000',
+      message = 'private trial backend v14 state segment policies are missing';
+  end if;
+
+  if not has_table_privilege(
+    'supermega_trial_backend', 'app_private.workspace_state_segments', 'SELECT'
+  ) or not has_table_privilege(
+    'supermega_trial_backend', 'app_private.workspace_state_segments', 'INSERT'
+  ) then
+    raise exception using
+      errcode = '55000',
+      message = 'private trial backend v14 state segment grants are missing';
+  end if;
+
+  if not exists (
+    select 1
+    from pg_proc function_record
+    join pg_namespace schema_record on schema_record.oid = function_record.pronamespace
+    where schema_record.nspname = 'app_private'
+      and function_record.proname = 'collect_workspace_state_segments'
+      and function_record.prosecdef
+  ) or not has_function_privilege(
+    'supermega_trial_backend',
+    'app_private.collect_workspace_state_segments(text, text, text[])',
+    'EXECUTE'
+  ) then
+    raise exception using
+      errcode = '55000',
+      message = 'private trial backend v14 state segment collector is missing';
+  end if;
+
+  -- Chunks are immutable: the runtime role must never rewrite or remove one
+  -- directly; unreferenced chunks go only through the collector.
+  if exists (
+    select 1
+    from unnest(array['UPDATE', 'DELETE', 'TRUNCATE']) privilege_name
+    where has_table_privilege(
+      'supermega_trial_backend', 'app_private.workspace_state_segments', privilege_name
+    )
+  ) then
+    raise exception using
+      errcode = '55000',
+      message = 'private trial backend v14 must keep state segments append-only for the runtime role';
+  end if;
+end
+$verify$;
+
+commit;
@@ -102,11 +102,29 @@ AGENT_JOB_MAX_ATTEMPTS: dict[str, int] = {
     "github_release_watch": 1,
 }
 
+# Runs of one job type that may execute at the same time on a worker. Each
+# job keeps at most one run in flight, matching the claim path, which never
+# reserves two runs of the same job type.
+AGENT_JOB_CONCURRENCY_LIMITS: dict[str, int] = {
+    "revenue_scout": 1,
+    "list_clerk": 1,
+    "task_triage": 1,
+    "template_clerk": 1,
+    "ops_watch": 1,
+    "founder_brief": 1,
+    "github_release_watch": 1,
+}
+
+# A running worker renews its execution lease this often (as a share of the
+# lease), so a slow but healthy run is never reconciled as expired.
+AGENT_LEASE_HEARTBEAT_FRACTION = 3
+
 if (
     set(AGENT_JOB_UNITS) != set(AGENT_JOB_DAILY_LIMITS)
     or set(AGENT_JOB_UNITS) != set(AGENT_JOB_PRIORITIES)
     or set(AGENT_JOB_UNITS) != set(AGENT_JOB_CADENCE_SECONDS)
     or set(AGENT_JOB_UNITS) != set(AGENT_JOB_MAX_ATTEMPTS)
+    or set(AGENT_JOB_UNITS) != set(AGENT_JOB_CONCURRENCY_LIMITS)
 ):
     raise RuntimeError("agent_job_policy_contract_invalid")
 if (
@@ -221,6 +239,8 @@ class AgentWorkforcePolicy:
             "job_cadence_seconds": dict(AGENT_JOB_CADENCE_SECONDS),
             "cadence_admission_contract": AGENT_CADENCE_ADMISSION_CONTRACT,
             "job_max_attempts": dict(AGENT_JOB_MAX_ATTEMPTS),
+            "job_concurrency_limits": dict(AGENT_JOB_CONCURRENCY_LIMITS),
+            "lease_heartbeat_seconds": agent_lease_heartbeat_seconds(self),
             "automation_lanes": {name: list(job_types) for name, job_types in AGENT_AUTOMATION_LANES.items()},
             "automated_job_types": list(AGENT_AUTOMATED_JOB_TYPES),
             "retry_policy_contract": AGENT_RETRY_POLICY_CONTRACT,
@@ -373,6 +393,18 @@ def agent_job_max_attempts(job_type: str) -> int:
         raise AgentGovernanceError("agent_job_type_not_allowed", f"Unsupported agent job type: {normalized or 'blank'}.") from exc
 
 
+def agent_job_concurrency_limit(job_type: str) -> int:
+    normalized = str(job_type or "").strip().lower()
+    try:
+        return AGENT_JOB_CONCURRENCY_LIMITS[normalized]
+    except KeyError as exc:
+        raise AgentGovernanceError("agent_job_type_not_allowed", f"Unsupported agent job type: {normalized or 'blank'}.") from exc
+
+
+def agent_lease_heartbeat_seconds(policy: AgentWorkforcePolicy) -> int:
+    return max(10, policy.lease_seconds // AGENT_LEASE_HEARTBEAT_FRACTION)
+
+
 def _agent_job_sequence(values: Sequence[object] | None, *, field: str) -> list[str]:
     if values is None:
         return []
@@ -5,7 +5,7 @@ from __future__ import annotations
 import re
 from hashlib import sha256
 import json
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from typing import Any
@@ -29,15 +29,14 @@ from supermega_runtime.ecommerce_buying_lifecycle import (
 from supermega_runtime.shop_inventory_runtime import (
     ShopInventoryValidationError,
     reserve_shop_inventory_order,
-    shop_inventory_available_balances,
-    shop_inventory_balances,
-    shop_inventory_business_partners,
-    shop_inventory_supplier_policies,
-    shop_inventory_sku_available_to_promise,
-    shop_inventory_sku_totals,
-    validate_shop_inventory_state,
+    shop_inventory_view,
 )
-from supermega_runtime.trial_store import TrialValidationError
+from supermega_runtime.state_memo import (
+    copy_json_tree,
+    remember_validated_state,
+    validated_state,
+)
+from supermega_runtime.trial_store import TrialValidationError, apply_state_delta
 
 
 COMMERCE_SCHEMA = "supermega.commerce.workspace.v2"
@@ -1406,7 +1405,7 @@ def validate_commerce_state(value: object) -> dict[str, Any]:
     _unique(item_skus, "Item SKU")
     if "inventoryFoundation" in state:
         try:
-            validate_shop_inventory_state(state["inventoryFoundation"], item_skus)
+            shop_inventory_view(state["inventoryFoundation"], item_skus)
         except ShopInventoryValidationError as exc:
             raise TrialValidationError(
                 f"commerce state.inventoryFoundation is invalid: {exc}"
@@ -1833,11 +1832,11 @@ def validate_commerce_state(value: object) -> dict[str, Any]:
     supplier_sourcing_by_id: dict[str, dict[str, Any]] = {}
     newer_supplier_sourcing: dict[str, Any] | None = None
     inventory_vendor_ids: dict[str, str] = {}
-    inventory_supplier_policies: list[dict[str, Any]] = []
+    inventory_supplier_policies: list[Mapping[str, Any]] = []
     if "inventoryFoundation" in state:
-        partners = shop_inventory_business_partners(state["inventoryFoundation"], item_skus)
-        inventory_vendor_ids = {str(vendor["name"]): str(vendor["id"]) for vendor in partners["vendors"]}
-        inventory_supplier_policies = shop_inventory_supplier_policies(state["inventoryFoundation"], item_skus)
+        inventory = shop_inventory_view(state["inventoryFoundation"], item_skus)
+        inventory_vendor_ids = {str(vendor["name"]): str(vendor["id"]) for vendor in inventory.vendors}
+        inventory_supplier_policies = list(inventory.supplier_policies)
     for index, candidate in enumerate(supplier_sourcing_decisions):
         field = f"supplierSourcingDecisions[{index}]"
         decision = _object(candidate, field)
@@ -4535,21 +4534,29 @@ def validate_commerce_state(value: object) -> dict[str, Any]:
         ],
         "Commerce action ID",
     )
-    return deepcopy(state)
+    return copy_json_tree(state)
 
 
-def _payload(payload: Mapping[str, Any]) -> tuple[dict[str, Any], dict[str, str]]:
-    if set(payload) != {"state", "evidence"}:
-        raise TrialValidationError("Commerce payload must contain exactly state and evidence objects.")
+def _trusted_commerce_state(value: object) -> dict[str, Any]:
+    return validated_state("commerce", value, validate_commerce_state)
+
+
+def _evidence(payload: Mapping[str, Any]) -> dict[str, str]:
     evidence = _object(payload.get("evidence"), "evidence")
     _exact_fields(evidence, "evidence", required=_EVIDENCE_FIELDS)
-    validated_evidence = {
+    return {
         "actionId": _text(evidence["actionId"], "evidence.actionId", maximum=160),
         "capturedAt": _timestamp(evidence["capturedAt"], "evidence.capturedAt"),
         "actor": _text(evidence["actor"], "evidence.actor"),
         "reason": _text(evidence["reason"], "evidence.reason"),
         "evidenceReference": _text(evidence["evidenceReference"], "evidence.evidenceReference"),
     }
+
+
+def _payload(payload: Mapping[str, Any]) -> tuple[dict[str, Any], dict[str, str]]:
+    if set(payload) != {"state", "evidence"}:
+        raise TrialValidationError("Commerce payload must contain exactly state and evidence objects.")
+    validated_evidence = _evidence(payload)
     return validate_commerce_state(payload.get("state")), validated_evidence
 
 
@@ -4595,7 +4602,7 @@ def _apply_storefront_merchandising_import(
             "Ecommerce merchandising import evidence does not match the reviewed package."
         )
 
-    current_state = validate_commerce_state(current)
+    current_state = _trusted_commerce_state(current)
     configuration = _storefront_configuration(current_state)
     if configuration is None:
         raise TrialValidationError(
@@ -5367,7 +5374,7 @@ def commerce_shop_demand_intelligence(
 ) -> dict[str, Any]:
     """Project explainable 28-day Shop demand without changing operational state."""
 
-    state = validate_commerce_state(value)
+    state = _trusted_commerce_state(value)
     canonical_as_of = _timestamp(as_of, "Shop demand asOf")
     as_of_time = datetime.fromisoformat(canonical_as_of.replace("Z", "+00:00"))
     lookback_days = 28
@@ -5428,13 +5435,13 @@ def commerce_shop_demand_intelligence(
         order for order in purchase_orders if purchase_progress(order)[1]
     ]
     catalog_skus = sorted(str(item["sku"]) for item in state["items"])
-    policies: list[dict[str, Any]] = []
+    policies: Sequence[Mapping[str, Any]] = ()
     vendor_names: dict[str, str] = {}
     inventory = state.get("inventoryFoundation")
     if inventory is not None:
-        partners = shop_inventory_business_partners(inventory, catalog_skus)
-        vendor_names = {vendor["id"]: vendor["name"] for vendor in partners["vendors"]}
-        policies = shop_inventory_supplier_policies(inventory, catalog_skus)
+        view = shop_inventory_view(inventory, catalog_skus)
+        vendor_names = {vendor["id"]: vendor["name"] for vendor in view.vendors}
+        policies = view.supplier_policies
 
     def select_policy(sku: str, recent_supplier: str | None) -> Mapping[str, Any] | None:
         active = [
@@ -5647,7 +5654,7 @@ def commerce_shop_procurement_decision(
 ) -> dict[str, Any]:
     """Rank retained supplier evidence for owner review without creating a requisition or purchase."""
 
-    state = validate_commerce_state(value)
+    state = _trusted_commerce_state(value)
     canonical_as_of = _timestamp(as_of, "Shop procurement asOf")
     as_of_time = datetime.fromisoformat(canonical_as_of.replace("Z", "+00:00"))
     plan = _object(replenishment_value, "Shop replenishment plan")
@@ -5714,12 +5721,12 @@ def commerce_shop_procurement_decision(
 
     catalog_skus = sorted(str(item["sku"]) for item in state["items"])
     inventory = state.get("inventoryFoundation")
-    vendors: list[Mapping[str, Any]] = []
-    policies: list[Mapping[str, Any]] = []
+    vendors: Sequence[Mapping[str, Any]] = ()
+    policies: Sequence[Mapping[str, Any]] = ()
     if inventory is not None:
-        partners = shop_inventory_business_partners(inventory, catalog_skus)
-        vendors = [vendor for vendor in partners["vendors"] if isinstance(vendor, Mapping)]
-        policies = shop_inventory_supplier_policies(inventory, catalog_skus)
+        view = shop_inventory_view(inventory, catalog_skus)
+        vendors = view.vendors
+        policies = view.supplier_policies
     vendor_ids = {str(vendor["name"]): str(vendor["id"]) for vendor in vendors}
     vendor_names = {str(vendor["id"]): str(vendor["name"]) for vendor in vendors}
     status_rank = {"on_track": 0, "collecting": 1, "attention": 2}
@@ -5969,7 +5976,7 @@ def create_commerce_order_from_intent(
 ) -> dict[str, Any]:
     """Build a priced, attributable order and reservation inside the state lock."""
 
-    current = validate_commerce_state(current_value)
+    current = _trusted_commerce_state(current_value)
     intent = _object(intent_value, "order intent")
     _exact_fields(
         intent,
@@ -6222,7 +6229,7 @@ def commerce_order_acknowledgement(
 ) -> dict[str, Any] | None:
     """Build a deterministic customer-safe acknowledgement without external side effects."""
 
-    current = validate_commerce_state(state)
+    current = _trusted_commerce_state(state)
     order = next(
         (candidate for candidate in current["orders"] if candidate["id"] == order_id),
         None,
@@ -6587,7 +6594,7 @@ def commerce_daily_close_export(
 ) -> dict[str, Any] | None:
     """Project one attributable close into a deterministic, PII-minimised ledger artifact."""
 
-    current = validate_commerce_state(state)
+    current = _trusted_commerce_state(state)
     close = next(
         (candidate for candidate in current["closes"] if candidate["id"] == close_id),
         None,
@@ -6885,7 +6892,7 @@ def commerce_accounting_handoff(
 ) -> dict[str, Any] | None:
     """Create a balanced, review-only handoff with correction settlement traceability."""
 
-    current = validate_commerce_state(state)
+    current = _trusted_commerce_state(state)
     close_export = commerce_daily_close_export(current, close_id)
     if close_export is None:
         return None
@@ -7162,7 +7169,7 @@ def commerce_supplier_payables_handoff(
 ) -> dict[str, Any] | None:
     """Create a deterministic AP review packet without posting or initiating payment."""
 
-    current = validate_commerce_state(state)
+    current = _trusted_commerce_state(state)
     invoiced_orders = sorted(
         (
             purchase_order for purchase_order in _purchase_orders(current)
@@ -7304,7 +7311,7 @@ def commerce_supplier_payables_aging(
 ) -> dict[str, Any]:
     """Prioritize reviewed supplier payables without creating payment authority."""
 
-    current = validate_commerce_state(state)
+    current = _trusted_commerce_state(state)
     canonical_as_of = _timestamp(as_of, "Supplier payables aging asOf")
     as_of_time = datetime.fromisoformat(canonical_as_of.replace("Z", "+00:00"))
     blocked_invoice_count = 0
@@ -7408,7 +7415,7 @@ def _configured_storefront_preview_digest(
 def commerce_storefront_preview_digest(state: Mapping[str, Any]) -> str:
     """Return the digest of the saved storefront rendered from the current Shop state."""
 
-    current = validate_commerce_state(state)
+    current = _trusted_commerce_state(state)
     configuration = _storefront_configuration(current)
     if configuration is None:
         raise TrialValidationError(
@@ -7623,27 +7630,19 @@ def _order_inventory_transition(
         )
     catalog_skus = [str(item["sku"]) for item in current["items"]]
     try:
-        before = validate_shop_inventory_state(current_foundation, catalog_skus)
-        after = validate_shop_inventory_state(next_foundation, catalog_skus)
-        before_physical = shop_inventory_sku_totals(before, catalog_skus)
-        after_physical = shop_inventory_sku_totals(after, catalog_skus)
-        before_available = shop_inventory_sku_available_to_promise(
-            before, catalog_skus
-        )
-        after_available = shop_inventory_sku_available_to_promise(
-            after, catalog_skus
-        )
+        before = shop_inventory_view(current_foundation, catalog_skus)
+        after = shop_inventory_view(next_foundation, catalog_skus)
     except ShopInventoryValidationError as exc:
         raise TrialValidationError(str(exc)) from exc
-    if (
-        len(after["commands"]) != len(before["commands"]) + 1
-        or after["commands"][:-1] != before["commands"]
-        or after["commands"][-1]["payload"].get("kind") != kind
-    ):
+    before_physical = before.sku_totals
+    after_physical = after.sku_totals
+    before_available = before.sku_available_to_promise
+    after_available = after.sku_available_to_promise
+    if not after.extends(before, kind=kind):
         raise TrialValidationError(
             f"the order must append exactly one {kind} location command."
         )
-    command = after["commands"][-1]["payload"]
+    command = after.latest_payload()
     prefix = {
         "order_reserve": "ORS",
         "order_release": "ORL",
@@ -7658,10 +7657,9 @@ def _order_inventory_transition(
         )
     expected_lines = {str(line["sku"]): int(line["quantity"]) for line in lines}
     reserve_commands = [
-        entry["payload"]
-        for entry in (after["commands"] if kind == "order_reserve" else before["commands"])
-        if entry["payload"].get("kind") == "order_reserve"
-        and entry["payload"].get("orderId") == order["id"]
+        payload
+        for payload in (after if kind == "order_reserve" else before).payloads("order_reserve")
+        if payload.get("orderId") == order["id"]
     ]
     if len(reserve_commands) != 1:
         raise TrialValidationError(
@@ -7692,12 +7690,7 @@ def _order_inventory_transition(
         ) + int(allocation["quantity"])
     if kind == "order_reserve":
         expected_allocations: list[dict[str, Any]] = []
-        try:
-            available_balances = shop_inventory_available_balances(
-                before, catalog_skus
-            )
-        except ShopInventoryValidationError as exc:
-            raise TrialValidationError(str(exc)) from exc
+        available_balances = before.available_balances
         for sku, line_quantity in sorted(expected_lines.items()):
             remaining = line_quantity
             candidates = sorted(
@@ -7814,27 +7807,19 @@ def _order_return_inventory_transition(
         )
     catalog_skus = [str(item["sku"]) for item in current["items"]]
     try:
-        before = validate_shop_inventory_state(current_foundation, catalog_skus)
-        after = validate_shop_inventory_state(next_foundation, catalog_skus)
-        before_physical = shop_inventory_sku_totals(before, catalog_skus)
-        after_physical = shop_inventory_sku_totals(after, catalog_skus)
-        before_available = shop_inventory_sku_available_to_promise(
-            before, catalog_skus
-        )
-        after_available = shop_inventory_sku_available_to_promise(
-            after, catalog_skus
-        )
+        before = shop_inventory_view(current_foundation, catalog_skus)
+        after = shop_inventory_view(next_foundation, catalog_skus)
     except ShopInventoryValidationError as exc:
         raise TrialValidationError(str(exc)) from exc
-    if (
-        len(after["commands"]) != len(before["commands"]) + 1
-        or after["commands"][:-1] != before["commands"]
-        or after["commands"][-1]["payload"].get("kind") != "order_return"
-    ):
+    before_physical = before.sku_totals
+    after_physical = after.sku_totals
+    before_available = before.sku_available_to_promise
+    after_available = after.sku_available_to_promise
+    if not after.extends(before, kind="order_return"):
         raise TrialValidationError(
             "a sellable return must append exactly one order return location command."
         )
-    command = after["commands"][-1]["payload"]
+    command = after.latest_payload()
     if (
         command.get("id")
         != _order_return_inventory_command_id(
@@ -7895,18 +7880,15 @@ def _validate_inventory_initialized(
         raise TrialValidationError("Shop location inventory state is required.")
     catalog_skus = [str(item["sku"]) for item in current["items"]]
     try:
-        validated = validate_shop_inventory_state(
+        validated = shop_inventory_view(
             foundation,
             catalog_skus,
             require_current_catalog_digest=True,
         )
-        totals = shop_inventory_sku_totals(validated, catalog_skus)
     except ShopInventoryValidationError as exc:
         raise TrialValidationError(str(exc)) from exc
-    if (
-        validated["revision"] != 1
-        or validated["commands"][0]["payload"]["kind"] != "import"
-    ):
+    totals = validated.sku_totals
+    if validated.revision != 1 or validated.latest_payload()["kind"] != "import":
         raise TrialValidationError(
             "commerce.inventory.initialized must record exactly one opening import."
         )
@@ -7932,23 +7914,15 @@ def _validate_inventory_transferred(
         raise TrialValidationError("Shop location inventory must be initialized first.")
     catalog_skus = [str(item["sku"]) for item in current["items"]]
     try:
-        before = validate_shop_inventory_state(current_foundation, catalog_skus)
-        after = validate_shop_inventory_state(next_foundation, catalog_skus)
-        before_totals = shop_inventory_sku_totals(before, catalog_skus)
-        after_totals = shop_inventory_sku_totals(after, catalog_skus)
-        before_available = shop_inventory_sku_available_to_promise(
-            before, catalog_skus
-        )
-        after_available = shop_inventory_sku_available_to_promise(
-            after, catalog_skus
-        )
+        before = shop_inventory_view(current_foundation, catalog_skus)
+        after = shop_inventory_view(next_foundation, catalog_skus)
     except ShopInventoryValidationError as exc:
         raise TrialValidationError(str(exc)) from exc
-    if (
-        after["revision"] != before["revision"] + 1
-        or after["commands"][:-1] != before["commands"]
-        or after["commands"][-1]["payload"]["kind"] != "transfer"
-    ):
+    before_totals = before.sku_totals
+    after_totals = after.sku_totals
+    before_available = before.sku_available_to_promise
+    after_available = after.sku_available_to_promise
+    if not after.extends(before, kind="transfer"):
         raise TrialValidationError(
             "commerce.inventory.transferred must append exactly one transfer command."
         )
@@ -8005,23 +7979,15 @@ def _validate_inventory_master_created(
         raise TrialValidationError("Shop location inventory must be initialized first.")
     catalog_skus = [str(item["sku"]) for item in current["items"]]
     try:
-        before = validate_shop_inventory_state(current_foundation, catalog_skus)
-        after = validate_shop_inventory_state(next_foundation, catalog_skus)
-        before_totals = shop_inventory_sku_totals(before, catalog_skus)
-        after_totals = shop_inventory_sku_totals(after, catalog_skus)
-        before_available = shop_inventory_sku_available_to_promise(
-            before, catalog_skus
-        )
-        after_available = shop_inventory_sku_available_to_promise(
-            after, catalog_skus
-        )
+        before = shop_inventory_view(current_foundation, catalog_skus)
+        after = shop_inventory_view(next_foundation, catalog_skus)
     except ShopInventoryValidationError as exc:
         raise TrialValidationError(str(exc)) from exc
-    if (
-        after["revision"] != before["revision"] + 1
-        or after["commands"][:-1] != before["commands"]
-        or after["commands"][-1]["payload"]["kind"] != "master_create"
-    ):
+    before_totals = before.sku_totals
+    after_totals = after.sku_totals
+    before_available = before.sku_available_to_promise
+    after_available = after.sku_available_to_promise
+    if not after.extends(before, kind="master_create"):
         raise TrialValidationError(
             "commerce.inventory.master_created must append exactly one master-create command."
         )
@@ -8052,23 +8018,15 @@ def _validate_inventory_supplier_policy_saved(
         raise TrialValidationError("Shop location inventory must be initialized first.")
     catalog_skus = [str(item["sku"]) for item in current["items"]]
     try:
-        before = validate_shop_inventory_state(current_foundation, catalog_skus)
-        after = validate_shop_inventory_state(next_foundation, catalog_skus)
-        before_totals = shop_inventory_sku_totals(before, catalog_skus)
-        after_totals = shop_inventory_sku_totals(after, catalog_skus)
-        before_available = shop_inventory_sku_available_to_promise(
-            before, catalog_skus
-        )
-        after_available = shop_inventory_sku_available_to_promise(
-            after, catalog_skus
-        )
+        before = shop_inventory_view(current_foundation, catalog_skus)
+        after = shop_inventory_view(next_foundation, catalog_skus)
     except ShopInventoryValidationError as exc:
         raise TrialValidationError(str(exc)) from exc
-    if (
-        after["revision"] != before["revision"] + 1
-        or after["commands"][:-1] != before["commands"]
-        or after["commands"][-1]["payload"]["kind"] != "supplier_policy_set"
-    ):
+    before_totals = before.sku_totals
+    after_totals = after.sku_totals
+    before_available = before.sku_available_to_promise
+    after_available = after.sku_available_to_promise
+    if not after.extends(before, kind="supplier_policy_set"):
         raise TrialValidationError(
             "commerce.inventory.supplier_policy_saved must append exactly one supplier-policy command."
         )
@@ -8978,9 +8936,7 @@ def _validate_counted(
         catalog_skus = sorted(item["sku"] for item in current["items"])
         matching_balances = [
             balance
-            for balance in shop_inventory_balances(
-                before_foundation, catalog_skus
-            )
+            for balance in shop_inventory_view(before_foundation, catalog_skus).balances
             if balance["stockUnitId"] == location_count["stockUnitId"]
             and balance["locationId"] == location_count["locationId"]
         ]
@@ -9048,28 +9004,20 @@ def _validate_production_inventory_transition(
         )
     catalog_skus = [str(item["sku"]) for item in current["items"]]
     try:
-        before = validate_shop_inventory_state(current_foundation, catalog_skus)
-        after = validate_shop_inventory_state(next_foundation, catalog_skus)
-        before_physical = shop_inventory_sku_totals(before, catalog_skus)
-        after_physical = shop_inventory_sku_totals(after, catalog_skus)
-        before_available = shop_inventory_sku_available_to_promise(
-            before, catalog_skus
-        )
-        after_available = shop_inventory_sku_available_to_promise(
-            after, catalog_skus
-        )
-        available_balances = shop_inventory_available_balances(before, catalog_skus)
+        before = shop_inventory_view(current_foundation, catalog_skus)
+        after = shop_inventory_view(next_foundation, catalog_skus)
     except ShopInventoryValidationError as exc:
         raise TrialValidationError(str(exc)) from exc
-    if (
-        len(after["commands"]) != len(before["commands"]) + 1
-        or after["commands"][:-1] != before["commands"]
-        or after["commands"][-1]["payload"].get("kind") != "production_issue"
-    ):
+    before_physical = before.sku_totals
+    after_physical = after.sku_totals
+    before_available = before.sku_available_to_promise
+    after_available = after.sku_available_to_promise
+    available_balances = before.available_balances
+    if not after.extends(before, kind="production_issue"):
         raise TrialValidationError(
             "the Plant request must append exactly one production issue location command."
         )
-    command = after["commands"][-1]["payload"]
+    command = after.latest_payload()
     request_id = str(movement["productionRequestId"])
     if (
         command.get("id") != _production_inventory_command_id(request_id)
@@ -9219,31 +9167,22 @@ def _validate_production_return_inventory_transition(
         )
     catalog_skus = [str(item["sku"]) for item in current["items"]]
     try:
-        before = validate_shop_inventory_state(current_foundation, catalog_skus)
-        after = validate_shop_inventory_state(next_foundation, catalog_skus)
-        before_physical = shop_inventory_sku_totals(before, catalog_skus)
-        after_physical = shop_inventory_sku_totals(after, catalog_skus)
-        before_available = shop_inventory_sku_available_to_promise(
-            before, catalog_skus
-        )
-        after_available = shop_inventory_sku_available_to_promise(
-            after, catalog_skus
-        )
+        before = shop_inventory_view(current_foundation, catalog_skus)
+        after = shop_inventory_view(next_foundation, catalog_skus)
     except ShopInventoryValidationError as exc:
         raise TrialValidationError(str(exc)) from exc
-    if (
-        len(after["commands"]) != len(before["commands"]) + 1
-        or after["commands"][:-1] != before["commands"]
-        or after["commands"][-1]["payload"].get("kind") != "production_return"
-    ):
+    before_physical = before.sku_totals
+    after_physical = after.sku_totals
+    before_available = before.sku_available_to_promise
+    after_available = after.sku_available_to_promise
+    if not after.extends(before, kind="production_return"):
         raise TrialValidationError(
             "the Plant material return must append exactly one production return location command."
         )
     source_commands = [
-        envelope["payload"]
-        for envelope in before["commands"]
-        if envelope["payload"].get("kind") == "production_issue"
-        and envelope["payload"].get("proof", {}).get("actionId")
+        payload
+        for payload in before.payloads("production_issue")
+        if payload.get("proof", {}).get("actionId")
         == movement["productionIssueActionId"]
     ]
     if len(source_commands) != 1:
@@ -9251,7 +9190,7 @@ def _validate_production_return_inventory_transition(
             "the Plant material return source issue is not retained in location inventory."
         )
     source = source_commands[0]
-    command = after["commands"][-1]["payload"]
+    command = after.latest_payload()
     if (
         command.get("id")
         != _production_return_command_id(
@@ -9367,28 +9306,19 @@ def _validate_production_receipt_inventory_transition(
         )
     catalog_skus = [str(item["sku"]) for item in current["items"]]
     try:
-        before = validate_shop_inventory_state(current_foundation, catalog_skus)
-        after = validate_shop_inventory_state(next_foundation, catalog_skus)
-        before_physical = shop_inventory_sku_totals(before, catalog_skus)
-        after_physical = shop_inventory_sku_totals(after, catalog_skus)
-        before_available = shop_inventory_sku_available_to_promise(
-            before, catalog_skus
-        )
-        after_available = shop_inventory_sku_available_to_promise(
-            after, catalog_skus
-        )
+        before = shop_inventory_view(current_foundation, catalog_skus)
+        after = shop_inventory_view(next_foundation, catalog_skus)
     except ShopInventoryValidationError as exc:
         raise TrialValidationError(str(exc)) from exc
-    if (
-        len(after["commands"]) != len(before["commands"]) + 1
-        or after["commands"][:-1] != before["commands"]
-        or after["commands"][-1]["payload"].get("kind")
-        != "production_receipt"
-    ):
+    before_physical = before.sku_totals
+    after_physical = after.sku_totals
+    before_available = before.sku_available_to_promise
+    after_available = after.sku_available_to_promise
+    if not after.extends(before, kind="production_receipt"):
         raise TrialValidationError(
             "the Plant batch receipt must append exactly one location receipt command."
         )
-    command = after["commands"][-1]["payload"]
+    command = after.latest_payload()
     release_id = str(movement["productionReleaseId"])
     if (
         command.get("id") != _production_receipt_command_id(release_id)
@@ -9605,13 +9535,11 @@ def _validate_purchase_order_created(
     if foundation is not None:
         catalog_skus = [str(item["sku"]) for item in current["items"]]
         try:
-            partners = shop_inventory_business_partners(foundation, catalog_skus)
+            vendors = shop_inventory_view(foundation, catalog_skus).vendors
         except ShopInventoryValidationError as exc:
             raise TrialValidationError(str(exc)) from exc
         supplier = str(next_orders[0]["supplier"])
-        matching_vendors = [
-            vendor for vendor in partners["vendors"] if vendor["name"] == supplier
-        ]
+        matching_vendors = [vendor for vendor in vendors if vendor["name"] == supplier]
         if len(matching_vendors) != 1:
             raise TrialValidationError(
                 "a location-managed purchase order must use one retained supplier master."
@@ -9694,33 +9622,19 @@ def _validate_purchase_order_received(
         )
     catalog_skus = [str(item["sku"]) for item in current["items"]]
     try:
-        before_foundation = validate_shop_inventory_state(
-            current_foundation, catalog_skus
-        )
-        after_foundation = validate_shop_inventory_state(
-            next_foundation, catalog_skus
-        )
-        before_totals = shop_inventory_sku_totals(
-            before_foundation, catalog_skus
-        )
-        after_totals = shop_inventory_sku_totals(after_foundation, catalog_skus)
-        before_available = shop_inventory_sku_available_to_promise(
-            before_foundation, catalog_skus
-        )
-        after_available = shop_inventory_sku_available_to_promise(
-            after_foundation, catalog_skus
-        )
+        before_foundation = shop_inventory_view(current_foundation, catalog_skus)
+        after_foundation = shop_inventory_view(next_foundation, catalog_skus)
     except ShopInventoryValidationError as exc:
         raise TrialValidationError(str(exc)) from exc
-    if (
-        after_foundation["revision"] != before_foundation["revision"] + 1
-        or after_foundation["commands"][:-1] != before_foundation["commands"]
-        or after_foundation["commands"][-1]["payload"]["kind"] != "receipt"
-    ):
+    before_totals = before_foundation.sku_totals
+    after_totals = after_foundation.sku_totals
+    before_available = before_foundation.sku_available_to_promise
+    after_available = after_foundation.sku_available_to_promise
+    if not after_foundation.extends(before_foundation, kind="receipt"):
         raise TrialValidationError(
             "managed purchase receipt must append exactly one location receipt."
         )
-    location_receipt = after_foundation["commands"][-1]["payload"]
+    location_receipt = after_foundation.latest_payload()
     location_proof = location_receipt["proof"]
     if (
         location_receipt["purchaseOrderId"] != purchase_order_id
@@ -10144,7 +10058,7 @@ def create_commerce_storefront_request_from_intent(
 ) -> dict[str, Any]:
     """Retain one customer checkout request without accepting browser-built Shop state."""
 
-    current = validate_commerce_state(current_value)
+    current = _trusted_commerce_state(current_value)
     intent = _object(intent_value, "storefront request intent")
     _exact_fields(
         intent,
@@ -10814,12 +10728,132 @@ _TRANSITION_VALIDATORS = {
 }
 
 
+_UNCHANGED_GUARDS: tuple[
+    tuple[str, frozenset[str], Callable[[Mapping[str, Any], Mapping[str, Any]], None]],
+    ...,
+] = (
+    ("catalogChanges", frozenset({"commerce.item.updated"}), _require_catalog_changes_unchanged),
+    (
+        "catalogBaselines",
+        frozenset({"commerce.item.created", "commerce.item.updated"}),
+        _require_catalog_baselines_unchanged,
+    ),
+    (
+        "storefrontRequests",
+        frozenset({"commerce.storefront_request.received"}),
+        _require_storefront_requests_unchanged,
+    ),
+    (
+        "storefrontConfiguration",
+        frozenset({"commerce.storefront.configuration.saved"}),
+        _require_storefront_configuration_unchanged,
+    ),
+    (
+        "taxConfigurations",
+        frozenset({"commerce.tax_configuration.saved"}),
+        _require_tax_configurations_unchanged,
+    ),
+    (
+        "accountMappingConfigurations",
+        frozenset({"commerce.account_mapping.saved"}),
+        _require_account_mapping_configurations_unchanged,
+    ),
+    (
+        "customerCreditPolicies",
+        frozenset({"commerce.customer_credit_policy.saved"}),
+        _require_customer_credit_policies_unchanged,
+    ),
+    (
+        "promotionPolicies",
+        frozenset({"commerce.promotion_policy.saved"}),
+        _require_promotion_policies_unchanged,
+    ),
+    (
+        "shippingPolicies",
+        frozenset({"commerce.shipping_policy.saved"}),
+        _require_shipping_policies_unchanged,
+    ),
+    (
+        "paymentPolicies",
+        frozenset({"commerce.payment_policy.saved"}),
+        _require_payment_policies_unchanged,
+    ),
+    (
+        "serviceSchedule",
+        frozenset(
+            {
+                "commerce.service_schedule.initialized",
+                "commerce.service_schedule.saved",
+            }
+        ),
+        _require_service_schedule_unchanged,
+    ),
+    (
+        "purchaseBudgetEnvelopes",
+        frozenset({"commerce.purchase_budget.approved"}),
+        _require_purchase_budget_envelopes_unchanged,
+    ),
+    (
+        "supplierSourcingDecisions",
+        frozenset({"commerce.supplier_sourcing.approved"}),
+        _require_supplier_sourcing_decisions_unchanged,
+    ),
+    (
+        "purchaseRequisitions",
+        frozenset({"commerce.purchase_requisition.approved"}),
+        _require_purchase_requisitions_unchanged,
+    ),
+    (
+        "purchaseOrders",
+        frozenset(
+            {
+                "commerce.purchase_order.created",
+                "commerce.purchase_order.cancelled",
+                "commerce.supplier_invoice.recorded",
+                "commerce.supplier_invoice.payable_ready",
+                "commerce.supplier_return.authorized",
+                "commerce.supplier_credit.recorded",
+            }
+        ),
+        _require_purchase_orders_unchanged,
+    ),
+    (
+        "inventoryFoundation",
+        frozenset(
+            {
+                "commerce.inventory.initialized",
+                "commerce.inventory.master_created",
+                "commerce.inventory.supplier_policy_saved",
+                "commerce.inventory.transferred",
+                "commerce.stock.counted",
+                "commerce.production_material.issued",
+                "commerce.production_material.returned",
+                "commerce.production_batch.received",
+                "commerce.purchase_order.received",
+                "commerce.order.created",
+                "commerce.order.cancelled",
+                "commerce.order.advanced",
+                "commerce.order.return_recorded",
+                "commerce.website_intake.converted",
+            }
+        ),
+        _require_inventory_foundation_unchanged,
+    ),
+)
+
+
 def reduce_commerce_state(
     event_type: str,
     current: Mapping[str, Any],
     payload: Mapping[str, Any],
 ) -> dict[str, Any]:
-    """Accept only one declared Commerce lifecycle transition per command."""
+    """Accept only one declared Commerce lifecycle transition per command.
+
+    ``payload`` carries either the whole next ``state`` or a ``delta`` of the
+    top-level collections the command changed (see ``apply_state_delta``).
+    Either way the next snapshot is validated in full; a delta only spares the
+    caller resending unchanged collections and the unchanged-collection checks.
+    """
 
     if event_type not in COMMERCE_EVENTS:
         raise TrialValidationError("event_type must be a supported Commerce lifecycle event.")
@@ -10851,7 +10885,21 @@ def reduce_commerce_state(
             ),
             "evidence": payload.get("evidence"),
         }
-    next_state, evidence = _payload(payload)
+    current_state: dict[str, Any] | None = None
+    changed_keys: frozenset[str] | None = None
+    if "delta" in payload:
+        if event_type == "commerce.workspace.initialized":
+            raise TrialValidationError("Commerce initialization requires a whole state, not a delta.")
+        if set(payload) != {"delta", "evidence"}:
+            raise TrialValidationError(
+                "Commerce delta payload must contain exactly delta and evidence objects."
+            )
+        evidence = _evidence(payload)
+        current_state = _trusted_commerce_state(current)
+        next_state = validate_commerce_state(apply_state_delta(current_state, payload["delta"]))
+        changed_keys = frozenset(payload["delta"])
+    else:
+        next_state, evidence = _payload(payload)
     if event_type == "commerce.workspace.initialized":
         if dict(current):
             raise TrialValidationError("managed Commerce is already initialized.")
@@ -10876,68 +10924,20 @@ def reduce_commerce_state(
             or _payment_policies(next_state)
         ):
             raise TrialValidationError("Commerce initialization requires a non-empty catalog and no operating history.")
+        remember_validated_state("commerce", next_state)
         return next_state
 
-    current_state = validate_commerce_state(current)
-    if event_type != "commerce.item.updated":
-        _require_catalog_changes_unchanged(current_state, next_state)
-    if event_type not in {"commerce.item.created", "commerce.item.updated"}:
-        _require_catalog_baselines_unchanged(current_state, next_state)
-    if event_type != "commerce.storefront_request.received":
-        _require_storefront_requests_unchanged(current_state, next_state)
-    if event_type != "commerce.storefront.configuration.saved":
-        _require_storefront_configuration_unchanged(current_state, next_state)
-    if event_type != "commerce.tax_configuration.saved":
-        _require_tax_configurations_unchanged(current_state, next_state)
-    if event_type != "commerce.account_mapping.saved":
-        _require_account_mapping_configurations_unchanged(current_state, next_state)
-    if event_type != "commerce.customer_credit_policy.saved":
-        _require_customer_credit_policies_unchanged(current_state, next_state)
-    if event_type != "commerce.promotion_policy.saved":
-        _require_promotion_policies_unchanged(current_state, next_state)
-    if event_type != "commerce.shipping_policy.saved":
-        _require_shipping_policies_unchanged(current_state, next_state)
-    if event_type != "commerce.payment_policy.saved":
-        _require_payment_policies_unchanged(current_state, next_state)
-    if event_type not in {
-        "commerce.service_schedule.initialized",
-        "commerce.service_schedule.saved",
-    }:
-        _require_service_schedule_unchanged(current_state, next_state)
-    if event_type != "commerce.purchase_budget.approved":
-        _require_purchase_budget_envelopes_unchanged(current_state, next_state)
-    if event_type != "commerce.supplier_sourcing.approved":
-        _require_supplier_sourcing_decisions_unchanged(current_state, next_state)
-    if event_type != "commerce.purchase_requisition.approved":
-        _require_purchase_requisitions_unchanged(current_state, next_state)
-    if event_type not in {
-        "commerce.purchase_order.created",
-        "commerce.purchase_order.cancelled",
-        "commerce.supplier_invoice.recorded",
-        "commerce.supplier_invoice.payable_ready",
-        "commerce.supplier_return.authorized",
-        "commerce.supplier_credit.recorded",
-    }:
-        _require_purchase_orders_unchanged(current_state, next_state)
-    if event_type not in {
-        "commerce.inventory.initialized",
-        "commerce.inventory.master_created",
-        "commerce.inventory.supplier_policy_saved",
-        "commerce.inventory.transferred",
-        "commerce.stock.counted",
-        "commerce.production_material.issued",
-        "commerce.production_material.returned",
-        "commerce.production_batch.received",
-        "commerce.purchase_order.received",
-        "commerce.order.created",
-        "commerce.order.cancelled",
-        "commerce.order.advanced",
-        "commerce.order.return_recorded",
-        "commerce.website_intake.converted",
-    }:
-        _require_inventory_foundation_unchanged(current_state, next_state)
+    if current_state is None:
+        current_state = _trusted_commerce_state(current)
+    for key, exempt_events, require_unchanged in _UNCHANGED_GUARDS:
+        if event_type in exempt_events:
+            continue
+        if changed_keys is not None and key not in changed_keys:
+            continue
+        require_unchanged(current_state, next_state)
     _TRANSITION_VALIDATORS[event_type](current_state, next_state)
     _validate_event_evidence(event_type, current_state, next_state, evidence)
+    remember_validated_state("commerce", next_state)
     return next_state
 
 
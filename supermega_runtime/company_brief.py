@@ -11,6 +11,7 @@ from typing import Any
 from supermega_runtime.commerce_runtime import validate_commerce_state
 from supermega_runtime.managed_context import managed_context_brief_projection, managed_context_from_company_state
 from supermega_runtime.production_runtime import validate_production_state
+from supermega_runtime.state_memo import validated_state
 from supermega_runtime.trial_store import ApprovalRecord, TrialState, TrialValidationError
 from supermega_runtime.website_runtime import validate_website_state
 
@@ -184,7 +185,7 @@ def _project_commerce(record: TrialState | None) -> tuple[dict[str, object], dic
     if record is None or (record.version == 0 and not record.state):
         return _empty_shop(), _empty_ecommerce()
     try:
-        state = validate_commerce_state(record.state)
+        state = validated_state("commerce", record.state, validate_commerce_state)
     except TrialValidationError:
         return _empty_shop("invalid"), _empty_ecommerce("invalid")
     items = state["items"]
@@ -218,7 +219,7 @@ def _project_plant(record: TrialState | None) -> dict[str, object]:
     if record is None or (record.version == 0 and not record.state):
         return _empty_plant()
     try:
-        state = validate_production_state(record.state)
+        state = validated_state("production", record.state, validate_production_state)
     except TrialValidationError:
         return _empty_plant("invalid")
     jobs = state["jobs"]
@@ -242,7 +243,7 @@ def _project_website(record: TrialState | None) -> dict[str, object]:
     if record is None or (record.version == 0 and not record.state):
         return _empty_website()
     try:
-        state = validate_website_state(record.state)
+        state = validated_state("website", record.state, validate_website_state)
     except TrialValidationError:
         return _empty_website("invalid")
     pages = state["pages"]
@@ -183,6 +183,17 @@ def _nearest_rank(values: list[int], percentile: float) -> int | None:
     return ordered[max(0, ceil(len(ordered) * percentile) - 1)]
 
 
+def order_intake_latency_summary(latencies: Sequence[int]) -> dict[str, int | None]:
+    """Return the nearest-rank p50/p95 and max the evaluator reports."""
+
+    values = list(latencies)
+    return {
+        "p50": _nearest_rank(values, 0.50),
+        "p95": _nearest_rank(values, 0.95),
+        "max": max(values) if values else None,
+    }
+
+
 def _fixture_findings(
     fixture: Mapping[str, Any],
     draft: OrderIntakeDraft,
@@ -480,11 +491,7 @@ def evaluate_order_intake_results(
             "schema_attempts": schema_attempts,
         },
         "usage": {
-            "latency_ms": {
-                "p50": _nearest_rank(latencies, 0.50),
-                "p95": _nearest_rank(latencies, 0.95),
-                "max": max(latencies) if latencies else None,
-            },
+            "latency_ms": order_intake_latency_summary(latencies),
             "input_tokens": input_tokens,
             "cached_input_tokens": cached_input_tokens,
             "output_tokens": output_tokens,
@@ -501,4 +508,5 @@ __all__ = [
     "ORDER_INTAKE_FIXTURE_SCHEMA",
     "ORDER_INTAKE_RESULT_SCHEMA",
     "evaluate_order_intake_results",
+    "order_intake_latency_summary",
 ]
@@ -7,22 +7,29 @@ durable daily admission budget used by the SuperMega company gateway.
 
 Two providers implement the same contract — OpenAI Responses and Anthropic
 Messages — and both fail closed with zero network calls when their key is
-absent.
+absent. Each provider keeps a bounded pool of keep-alive connections to its
+endpoint, so bulk runs pay the TCP and TLS handshake once per connection
+rather than once per message.
 """
 
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from hashlib import sha256
 import hmac
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
 import json
 import os
-from threading import RLock
+import select
+import ssl
+from threading import BoundedSemaphore, Lock, RLock
 from typing import Any, Protocol
 from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
 from urllib.request import HTTPRedirectHandler, ProxyHandler, Request, build_opener
 from uuid import uuid4
 
@@ -62,7 +69,11 @@ ORDER_INTAKE_REASONING_EFFORT = "low"
 ORDER_INTAKE_TIMEOUT_SECONDS = 20.0
 COMPANY_DAILY_BUDGET_DEFAULT_UNITS = 500_000
 COMPANY_DAILY_BUDGET_HARD_MAX_UNITS = 2_000_000
+ORDER_INTAKE_DEFAULT_CONNECTIONS = 4
+ORDER_INTAKE_HARD_MAX_CONNECTIONS = 16
+ORDER_INTAKE_BUDGET_POOL_TIMEOUT_SECONDS = 5.0
 
+_LOOPBACK_HOSTS = frozenset({"127.0.0.1", "::1", "localhost"})
 _MODEL_NAME = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._:-")
 _ANTHROPIC_RATE_LIMIT_ERROR_TYPES = frozenset({"overloaded_error", "rate_limit_error"})
 _ANTHROPIC_QUOTA_ERROR_TYPES = frozenset({"billing_error", "insufficient_quota"})
@@ -213,18 +224,60 @@ class PostgresOrderIntakeBudget:
         cap_units: int,
         *,
         provider_label: str = ORDER_INTAKE_PROVIDER_OPENAI,
+        pool_size: int = 0,
     ):
         self._database_url = database_url
         self._cap_units = max(1, min(int(cap_units), COMPANY_DAILY_BUDGET_HARD_MAX_UNITS))
         self._provider_label = provider_label
+        self._pool_size = max(0, min(int(pool_size), ORDER_INTAKE_HARD_MAX_CONNECTIONS))
+        self._pool: Any = None
+        self._pool_lock = RLock()
+
+    def _connection_pool(self) -> Any:
+        """Return the shared pool, or None when pooling is disabled."""
+
+        if self._pool_size <= 0:
+            return None
+        with self._pool_lock:
+            if self._pool is None:
+                from psycopg_pool import ConnectionPool
+
+                self._pool = ConnectionPool(
+                    self._database_url,
+                    kwargs={"connect_timeout": 5},
+                    min_size=0,
+                    max_size=self._pool_size,
+                    timeout=ORDER_INTAKE_BUDGET_POOL_TIMEOUT_SECONDS,
+                    name="supermega-order-intake-budget",
+                    open=True,
+                )
+            return self._pool
+
+    @contextmanager
+    def _connection(self) -> Iterator[Any]:
+        """Yield one committed-on-exit connection, pooled when enabled."""
+
+        pool = self._connection_pool()
+        if pool is None:
+            import psycopg
+
+            with psycopg.connect(self._database_url, connect_timeout=5) as connection:
+                yield connection
+            return
+        with pool.connection() as connection:
+            yield connection
+
+    def close(self) -> None:
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
 
     def reserve(self, *, workspace_id: str, reserved_units: int) -> OrderIntakeBudgetReservation:
         reservation_id = str(uuid4())
         window = datetime.now(UTC).date().isoformat()
         try:
-            import psycopg
-
-            with psycopg.connect(self._database_url, connect_timeout=5) as connection:
+            with self._connection() as connection:
                 row = connection.execute(
                     "select * from public.supermega_reserve_ai_budget(%s,%s,%s,%s,%s,%s,%s)",
                     (
@@ -261,9 +314,7 @@ class PostgresOrderIntakeBudget:
         if status not in {"consumed", "failed", "released"}:
             return
         try:
-            import psycopg
-
-            with psycopg.connect(self._database_url, connect_timeout=5) as connection:
+            with self._connection() as connection:
                 connection.execute(
                     """update public.supermega_ai_budget_reservations
                           set status=%s, actual_units=%s, settled_at=now()
@@ -299,52 +350,35 @@ def _reject_json_constant(value: str) -> None:
     raise ValueError(f"unsupported JSON constant: {value}")
 
 
-def _openai_transport(
-    api_key: str,
-    payload: Mapping[str, Any],
-    timeout_seconds: float,
-) -> Mapping[str, Any]:
-    encoded = json.dumps(
+def _encoded_provider_payload(payload: Mapping[str, Any]) -> bytes:
+    return json.dumps(
         payload,
         ensure_ascii=False,
         separators=(",", ":"),
         allow_nan=False,
     ).encode("utf-8")
-    request = Request(
-        OPENAI_RESPONSES_URL,
-        data=encoded,
-        method="POST",
-        headers={
-            "accept": "application/json",
-            "authorization": f"Bearer {api_key}",
-            "content-type": "application/json",
-            "user-agent": "supermega-order-intake/1.0",
-        },
-    )
-    opener = build_opener(ProxyHandler({}), _NoRedirectHandler())
-    try:
-        with opener.open(request, timeout=timeout_seconds) as response:
-            if response.status != 200:
-                raise OrderIntakeProviderError("order_intake_provider_unavailable")
-            raw = response.read(MAX_ORDER_INTAKE_PROVIDER_RESPONSE_BYTES + 1)
-    except HTTPError as exc:
-        error_code = ""
-        try:
-            error_body = json.loads(exc.read(32_000))
-            error_detail = error_body.get("error", {}) if isinstance(error_body, Mapping) else {}
-            if isinstance(error_detail, Mapping):
-                error_code = str(error_detail.get("code") or error_detail.get("type") or "").strip()
-        except (UnicodeDecodeError, json.JSONDecodeError, ValueError):
-            error_code = ""
-        if exc.code == 429 and error_code == "insufficient_quota":
-            code = "order_intake_provider_quota_exhausted"
-        elif exc.code == 429:
-            code = "order_intake_provider_rate_limited"
-        else:
-            code = "order_intake_provider_unavailable"
-        raise OrderIntakeProviderError(code) from exc
-    except (TimeoutError, URLError, OSError) as exc:
-        raise OrderIntakeProviderError("order_intake_provider_unavailable") from exc
+
+
+def _openai_headers(api_key: str) -> dict[str, str]:
+    return {
+        "accept": "application/json",
+        "authorization": f"Bearer {api_key}",
+        "content-type": "application/json",
+        "user-agent": "supermega-order-intake/1.0",
+    }
+
+
+def _anthropic_headers(api_key: str) -> dict[str, str]:
+    return {
+        "accept": "application/json",
+        "anthropic-version": ANTHROPIC_API_VERSION,
+        "content-type": "application/json",
+        "user-agent": "supermega-order-intake/1.0",
+        "x-api-key": api_key,
+    }
+
+
+def _provider_response(raw: bytes) -> Mapping[str, Any]:
     if len(raw) > MAX_ORDER_INTAKE_PROVIDER_RESPONSE_BYTES:
         raise OrderIntakeProviderError("order_intake_provider_invalid_response")
     try:
@@ -360,11 +394,27 @@ def _openai_transport(
     return parsed
 
 
-def _anthropic_http_error_code(error: HTTPError) -> str:
+def _openai_error_code(status: int, body: bytes) -> str:
+    error_code = ""
+    try:
+        error_body = json.loads(body)
+        error_detail = error_body.get("error", {}) if isinstance(error_body, Mapping) else {}
+        if isinstance(error_detail, Mapping):
+            error_code = str(error_detail.get("code") or error_detail.get("type") or "").strip()
+    except (UnicodeDecodeError, json.JSONDecodeError, ValueError):
+        error_code = ""
+    if status == 429 and error_code == "insufficient_quota":
+        return "order_intake_provider_quota_exhausted"
+    if status == 429:
+        return "order_intake_provider_rate_limited"
+    return "order_intake_provider_unavailable"
+
+
+def _anthropic_error_code(status: int, body: bytes) -> str:
     error_type = ""
     error_message = ""
     try:
-        error_body = json.loads(error.read(32_000))
+        error_body = json.loads(body)
         error_detail = error_body.get("error", {}) if isinstance(error_body, Mapping) else {}
         if isinstance(error_detail, Mapping):
             error_type = str(error_detail.get("type") or "").strip().casefold()
@@ -377,33 +427,53 @@ def _anthropic_http_error_code(error: HTTPError) -> str:
     )
     if quota_exhausted:
         return "order_intake_provider_quota_exhausted"
-    if error.code == 429 or error_type in _ANTHROPIC_RATE_LIMIT_ERROR_TYPES:
+    if status == 429 or error_type in _ANTHROPIC_RATE_LIMIT_ERROR_TYPES:
         return "order_intake_provider_rate_limited"
     return "order_intake_provider_unavailable"
 
 
+def _openai_transport(
+    api_key: str,
+    payload: Mapping[str, Any],
+    timeout_seconds: float,
+) -> Mapping[str, Any]:
+    """Send one unpooled OpenAI request; providers default to a pooled transport."""
+
+    request = Request(
+        OPENAI_RESPONSES_URL,
+        data=_encoded_provider_payload(payload),
+        method="POST",
+        headers=_openai_headers(api_key),
+    )
+    opener = build_opener(ProxyHandler({}), _NoRedirectHandler())
+    try:
+        with opener.open(request, timeout=timeout_seconds) as response:
+            if response.status != 200:
+                raise OrderIntakeProviderError("order_intake_provider_unavailable")
+            raw = response.read(MAX_ORDER_INTAKE_PROVIDER_RESPONSE_BYTES + 1)
+    except HTTPError as exc:
+        raise OrderIntakeProviderError(_openai_error_code(exc.code, exc.read(32_000))) from exc
+    except (TimeoutError, URLError, OSError) as exc:
+        raise OrderIntakeProviderError("order_intake_provider_unavailable") from exc
+    return _provider_response(raw)
+
+
+def _anthropic_http_error_code(error: HTTPError) -> str:
+    return _anthropic_error_code(error.code, error.read(32_000))
+
+
 def _anthropic_transport(
     api_key: str,
     payload: Mapping[str, Any],
     timeout_seconds: float,
 ) -> Mapping[str, Any]:
-    encoded = json.dumps(
-        payload,
-        ensure_ascii=False,
-        separators=(",", ":"),
-        allow_nan=False,
-    ).encode("utf-8")
+    """Send one unpooled Anthropic request; providers default to a pooled transport."""
+
     request = Request(
         ANTHROPIC_MESSAGES_URL,
-        data=encoded,
+        data=_encoded_provider_payload(payload),
         method="POST",
-        headers={
-            "accept": "application/json",
-            "anthropic-version": ANTHROPIC_API_VERSION,
-            "content-type": "application/json",
-            "user-agent": "supermega-order-intake/1.0",
-            "x-api-key": api_key,
-        },
+        headers=_anthropic_headers(api_key),
     )
     opener = build_opener(ProxyHandler({}), _NoRedirectHandler())
     try:
@@ -415,19 +485,169 @@ def _anthropic_transport(
         raise OrderIntakeProviderError(_anthropic_http_error_code(exc)) from exc
     except (TimeoutError, URLError, OSError) as exc:
         raise OrderIntakeProviderError("order_intake_provider_unavailable") from exc
-    if len(raw) > MAX_ORDER_INTAKE_PROVIDER_RESPONSE_BYTES:
-        raise OrderIntakeProviderError("order_intake_provider_invalid_response")
-    try:
-        parsed = json.loads(
-            raw,
-            object_pairs_hook=_strict_json_object,
-            parse_constant=_reject_json_constant,
-        )
-    except (UnicodeDecodeError, json.JSONDecodeError, ValueError) as exc:
-        raise OrderIntakeProviderError("order_intake_provider_invalid_response") from exc
-    if not isinstance(parsed, Mapping):
-        raise OrderIntakeProviderError("order_intake_provider_invalid_response")
-    return parsed
+    return _provider_response(raw)
+
+
+class ProviderConnectionPool:
+    """Bounded keep-alive connections to one provider origin.
+
+    At most ``max_connections`` requests are in flight at once; a finished
+    connection goes back to an idle stack and is reused while the server keeps
+    it open. A POST is never resent: an idle connection the server has already
+    closed is discarded before the request goes out, and a connection that
+    fails once the request is on the wire fails the call. Redirects are never
+    followed and no proxy is consulted. Plain HTTP is accepted only on
+    loopback, for local stand-in servers.
+    """
+
+    def __init__(self, url: str, *, max_connections: int = ORDER_INTAKE_DEFAULT_CONNECTIONS):
+        parts = urlsplit(url)
+        if not parts.hostname or (
+            parts.scheme != "https"
+            and not (parts.scheme == "http" and parts.hostname in _LOOPBACK_HOSTS)
+        ):
+            raise OrderIntakeProviderError("order_intake_provider_not_configured")
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = f"{parts.path or '/'}{'?' + parts.query if parts.query else ''}"
+        self._context = ssl.create_default_context() if parts.scheme == "https" else None
+        self.max_connections = max(1, min(int(max_connections), ORDER_INTAKE_HARD_MAX_CONNECTIONS))
+        self._slots = BoundedSemaphore(self.max_connections)
+        self._idle: list[HTTPConnection] = []
+        self._lock = Lock()
+        self.connections_opened = 0
+
+    def _open(self, timeout_seconds: float) -> HTTPConnection:
+        with self._lock:
+            self.connections_opened += 1
+        if self._context is not None:
+            return HTTPSConnection(
+                self._host, self._port, timeout=timeout_seconds, context=self._context
+            )
+        return HTTPConnection(self._host, self._port, timeout=timeout_seconds)
+
+    @staticmethod
+    def _stale(connection: HTTPConnection) -> bool:
+        """Whether an idle connection was closed by the server.
+
+        An idle keep-alive socket has nothing to read until the server closes
+        it, so any readable byte or EOF means it must not carry a request.
+        """
+
+        sock = connection.sock
+        if sock is None:
+            return True
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def _checkout(self, timeout_seconds: float) -> HTTPConnection:
+        while True:
+            with self._lock:
+                connection = self._idle.pop() if self._idle else None
+            if connection is None:
+                return self._open(timeout_seconds)
+            if not self._stale(connection):
+                return connection
+            connection.close()
+
+    def post(
+        self,
+        body: bytes,
+        headers: Mapping[str, str],
+        timeout_seconds: float,
+        *,
+        response_limit: int,
+    ) -> tuple[int, bytes]:
+        """Return the status and at most ``response_limit + 1`` body bytes."""
+
+        if not self._slots.acquire(timeout=timeout_seconds):
+            raise OrderIntakeProviderError("order_intake_provider_unavailable")
+        try:
+            connection = self._checkout(timeout_seconds)
+            try:
+                connection.timeout = timeout_seconds
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout_seconds)
+                connection.request("POST", self._path, body=body, headers=dict(headers))
+                response = connection.getresponse()
+                raw = response.read(response_limit + 1)
+            except BaseException:
+                # The provider may already have acted on the request, so it is
+                # never resent; the caller sees the provider as unavailable.
+                connection.close()
+                raise
+            if response.will_close or not response.isclosed():
+                connection.close()
+            else:
+                with self._lock:
+                    self._idle.append(connection)
+            return response.status, raw
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+class PooledProviderTransport:
+    """A provider transport that reuses one connection pool for every call.
+
+    ``url`` replaces the provider endpoint, which lets tests and rehearsals
+    point the real request path at a local stand-in server.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        *,
+        url: str | None = None,
+        max_connections: int = ORDER_INTAKE_DEFAULT_CONNECTIONS,
+    ):
+        if provider == ORDER_INTAKE_PROVIDER_OPENAI:
+            default_url, self._headers, self._error_code = (
+                OPENAI_RESPONSES_URL,
+                _openai_headers,
+                _openai_error_code,
+            )
+        elif provider == ORDER_INTAKE_PROVIDER_ANTHROPIC:
+            default_url, self._headers, self._error_code = (
+                ANTHROPIC_MESSAGES_URL,
+                _anthropic_headers,
+                _anthropic_error_code,
+            )
+        else:
+            raise OrderIntakeProviderError("order_intake_provider_not_configured")
+        self.pool = ProviderConnectionPool(url or default_url, max_connections=max_connections)
+
+    def __call__(
+        self,
+        api_key: str,
+        payload: Mapping[str, Any],
+        timeout_seconds: float,
+    ) -> Mapping[str, Any]:
+        try:
+            status, raw = self.pool.post(
+                _encoded_provider_payload(payload),
+                self._headers(api_key),
+                timeout_seconds,
+                response_limit=MAX_ORDER_INTAKE_PROVIDER_RESPONSE_BYTES,
+            )
+        except (TimeoutError, HTTPException, OSError) as exc:
+            raise OrderIntakeProviderError("order_intake_provider_unavailable") from exc
+        if 200 < status < 300:
+            raise OrderIntakeProviderError("order_intake_provider_unavailable")
+        if status != 200:
+            raise OrderIntakeProviderError(self._error_code(status, raw[:32_000]))
+        return _provider_response(raw)
+
+    def close(self) -> None:
+        self.pool.close()
 
 
 def _environment_cap() -> int:
@@ -441,6 +661,17 @@ def _environment_cap() -> int:
     return min(parsed, COMPANY_DAILY_BUDGET_HARD_MAX_UNITS)
 
 
+def _environment_connections() -> int:
+    raw = str(os.getenv("SUPERMEGA_ORDER_INTAKE_MAX_CONNECTIONS") or "").strip()
+    try:
+        parsed = int(raw)
+    except ValueError:
+        parsed = ORDER_INTAKE_DEFAULT_CONNECTIONS
+    if parsed <= 0:
+        parsed = ORDER_INTAKE_DEFAULT_CONNECTIONS
+    return min(parsed, ORDER_INTAKE_HARD_MAX_CONNECTIONS)
+
+
 def _hosted_runtime() -> bool:
     return any(
         str(os.getenv(name) or "").strip()
@@ -554,7 +785,7 @@ class OpenAIOrderIntakeProvider:
         model: str = DEFAULT_ORDER_INTAKE_MODEL,
         safety_secret: str = "",
         timeout_seconds: float = ORDER_INTAKE_TIMEOUT_SECONDS,
-        transport: ProviderTransport = _openai_transport,
+        transport: ProviderTransport | None = None,
     ):
         key = api_key.strip()
         if not key:
@@ -564,7 +795,15 @@ class OpenAIOrderIntakeProvider:
         self._model = _safe_model_name(model)
         self._safety_secret = (safety_secret or key).encode("utf-8")
         self._timeout_seconds = max(5.0, min(float(timeout_seconds), 30.0))
-        self._transport = transport
+        self._transport = transport or PooledProviderTransport(ORDER_INTAKE_PROVIDER_OPENAI)
+
+    def close(self) -> None:
+        """Close the budget's database pool and the provider connections."""
+
+        for resource in (self._budget, self._transport):
+            close = getattr(resource, "close", None)
+            if callable(close):
+                close()
 
     @classmethod
     def from_environment(cls) -> "OpenAIOrderIntakeProvider | None":
@@ -572,10 +811,11 @@ class OpenAIOrderIntakeProvider:
         if not api_key:
             return None
         cap = _environment_cap()
+        connections = _environment_connections()
         database_url = str(os.getenv("SUPERMEGA_DATABASE_URL") or "").strip()
         if _hosted_runtime():
             budget: OrderIntakeBudget = (
-                PostgresOrderIntakeBudget(database_url, cap)
+                PostgresOrderIntakeBudget(database_url, cap, pool_size=connections)
                 if database_url
                 else UnavailableOrderIntakeBudget()
             )
@@ -586,6 +826,9 @@ class OpenAIOrderIntakeProvider:
             budget=budget,
             model=str(os.getenv("SUPERMEGA_ORDER_INTAKE_MODEL") or DEFAULT_ORDER_INTAKE_MODEL),
             safety_secret=str(os.getenv("SUPERMEGA_ORDER_INTAKE_SAFETY_SECRET") or ""),
+            transport=PooledProviderTransport(
+                ORDER_INTAKE_PROVIDER_OPENAI, max_connections=connections
+            ),
         )
 
     async def generate(
@@ -726,7 +969,7 @@ class AnthropicOrderIntakeProvider:
         model: str = DEFAULT_ANTHROPIC_ORDER_INTAKE_MODEL,
         safety_secret: str = "",
         timeout_seconds: float = ORDER_INTAKE_TIMEOUT_SECONDS,
-        transport: ProviderTransport = _anthropic_transport,
+        transport: ProviderTransport | None = None,
     ):
         key = api_key.strip()
         if not key:
@@ -736,7 +979,15 @@ class AnthropicOrderIntakeProvider:
         self._model = _safe_model_name(model)
         self._safety_secret = (safety_secret or key).encode("utf-8")
         self._timeout_seconds = max(5.0, min(float(timeout_seconds), 30.0))
-        self._transport = transport
+        self._transport = transport or PooledProviderTransport(ORDER_INTAKE_PROVIDER_ANTHROPIC)
+
+    def close(self) -> None:
+        """Close the budget's database pool and the provider connections."""
+
+        for resource in (self._budget, self._transport):
+            close = getattr(resource, "close", None)
+            if callable(close):
+                close()
 
     @classmethod
     def from_environment(cls) -> "AnthropicOrderIntakeProvider | None":
@@ -744,6 +995,7 @@ class AnthropicOrderIntakeProvider:
         if not api_key:
             return None
         cap = _environment_cap()
+        connections = _environment_connections()
         database_url = str(os.getenv("SUPERMEGA_DATABASE_URL") or "").strip()
         if _hosted_runtime():
             budget: OrderIntakeBudget = (
@@ -751,6 +1003,7 @@ class AnthropicOrderIntakeProvider:
                     database_url,
                     cap,
                     provider_label=ORDER_INTAKE_PROVIDER_ANTHROPIC,
+                    pool_size=connections,
                 )
                 if database_url
                 else UnavailableOrderIntakeBudget()
@@ -764,6 +1017,9 @@ class AnthropicOrderIntakeProvider:
                 os.getenv("SUPERMEGA_ORDER_INTAKE_MODEL") or DEFAULT_ANTHROPIC_ORDER_INTAKE_MODEL
             ),
             safety_secret=str(os.getenv("SUPERMEGA_ORDER_INTAKE_SAFETY_SECRET") or ""),
+            transport=PooledProviderTransport(
+                ORDER_INTAKE_PROVIDER_ANTHROPIC, max_connections=connections
+            ),
         )
 
     async def generate(
@@ -928,13 +1184,17 @@ __all__ = [
     "DEFAULT_ORDER_INTAKE_MODEL",
     "InMemoryOrderIntakeBudget",
     "MAX_ORDER_INTAKE_CATALOG_ITEMS",
+    "ORDER_INTAKE_DEFAULT_CONNECTIONS",
+    "ORDER_INTAKE_HARD_MAX_CONNECTIONS",
     "ORDER_INTAKE_PROVIDER_ANTHROPIC",
     "ORDER_INTAKE_PROVIDER_OPENAI",
     "OpenAIOrderIntakeProvider",
     "OrderIntakeBudget",
     "OrderIntakeDraftProvider",
     "OrderIntakeProviderError",
+    "PooledProviderTransport",
     "PostgresOrderIntakeBudget",
+    "ProviderConnectionPool",
     "UnavailableOrderIntakeBudget",
     "order_intake_provider_from_environment",
 ]
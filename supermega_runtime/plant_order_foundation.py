@@ -8,14 +8,22 @@ batch without attributable approval.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping, Sequence
 from datetime import datetime
 from hashlib import sha256
 import json
 import re
+from threading import RLock
 import unicodedata
 from typing import Any
 
+from supermega_runtime.state_memo import (
+    copy_json_tree,
+    remember_validated_state,
+    validated_state,
+)
+
 
 PLANT_ORDER_STATE_SCHEMA = "supermega.plant.order_foundation.v1"
 PLANT_ORDER_PLAN_CONTRACT = "supermega.plant.reviewed_plan.v1"
@@ -65,6 +73,7 @@ _MAX_COMMANDS = 2_000
 _MAX_MATERIALS = 100
 _MAX_WORK_CENTRES = 50
 _MAX_ROUTING_STEPS = 100
+_ENGINE_LIMIT = 64
 
 
 class PlantOrderValidationError(ValueError):
@@ -1327,71 +1336,76 @@ def _empty_projection() -> dict[str, Any]:
     }
 
 
-def _replay_commands(commands: list[dict[str, Any]]) -> dict[str, Any]:
-    if not commands:
-        return _empty_projection()
-
-    plan: dict[str, Any] | None = None
-    plan_history: list[dict[str, Any]] = []
-    plan_revisions: list[dict[str, Any]] = []
-    latest_availability: dict[str, Any] | None = None
-    order_release: dict[str, Any] | None = None
-    effectiveness_window: dict[str, Any] | None = None
-    calibrations: dict[str, dict[str, Any]] = {}
-    quality_reworks: list[dict[str, Any]] = []
-    material_substitutions: dict[str, dict[str, Any]] = {}
-    issued: dict[str, int] = {}
-    operation_quantities: dict[str, int] = {}
-    operation_minutes: dict[str, int] = {}
-    material_issue_commands: list[dict[str, Any]] = []
-    operation_commands: list[dict[str, Any]] = []
-    output_entries: list[dict[str, Any]] = []
-    inspections: list[dict[str, Any]] = []
-    batch_release: dict[str, Any] | None = None
-    total_output = 0
-
-    for index, command in enumerate(commands):
+class _PlantOrderReplay:
+    """Left fold over Plant order commands.
+
+    ``apply`` validates one command against everything folded so far and
+    ``projection`` derives the read model without mutating the fold, so an
+    append can extend a cached fold instead of replaying the whole chain.
+    """
+
+    def __init__(self) -> None:
+        self.plan: dict[str, Any] | None = None
+        self.plan_history: list[dict[str, Any]] = []
+        self.plan_revisions: list[dict[str, Any]] = []
+        self.latest_availability: dict[str, Any] | None = None
+        self.order_release: dict[str, Any] | None = None
+        self.effectiveness_window: dict[str, Any] | None = None
+        self.calibrations: dict[str, dict[str, Any]] = {}
+        self.quality_reworks: list[dict[str, Any]] = []
+        self.material_substitutions: dict[str, dict[str, Any]] = {}
+        self.issued: dict[str, int] = {}
+        self.operation_quantities: dict[str, int] = {}
+        self.operation_minutes: dict[str, int] = {}
+        self.material_issue_commands: list[dict[str, Any]] = []
+        self.operation_commands: list[dict[str, Any]] = []
+        self.output_entries: list[dict[str, Any]] = []
+        self.inspections: list[dict[str, Any]] = []
+        self.batch_release: dict[str, Any] | None = None
+        self.total_output = 0
+
+    def apply(self, index: int, command: dict[str, Any]) -> None:
         field = f"commands[{index}].payload"
         kind = command["kind"]
         if index == 0 and kind != "import_plan":
             raise _fail("The first Plant order command must be the reviewed plan.")
         if kind == "import_plan":
-            if plan is not None or index != 0:
+            if self.plan is not None or index != 0:
                 raise _fail(f"{field} attempts to replace the immutable reviewed plan.")
-            plan = command["package"]
-            plan_history.append(command["package"])
-            issued = {row["materialId"]: 0 for row in plan["materials"]}
-            operation_quantities = {
-                row["operationId"]: 0 for row in plan["routing"]
+            self.plan = command["package"]
+            self.plan_history.append(command["package"])
+            self.issued = {row["materialId"]: 0 for row in self.plan["materials"]}
+            self.operation_quantities = {
+                row["operationId"]: 0 for row in self.plan["routing"]
             }
-            operation_minutes = {
-                row["operationId"]: 0 for row in plan["routing"]
+            self.operation_minutes = {
+                row["operationId"]: 0 for row in self.plan["routing"]
             }
-            continue
-        if plan is None:
+            return
+        if self.plan is None:
             raise _fail(f"{field} has no reviewed plan.")
-        job = plan["job"]
+        job = self.plan["job"]
 
         if kind == "supersede_plan":
             successor = command["package"]
-            if order_release is not None:
+            if self.order_release is not None:
                 raise _fail(f"{field} cannot supersede a released work package.")
-            if len(plan_revisions) >= PLANT_ORDER_PLAN_REVISION_MAX:
+            if len(self.plan_revisions) >= PLANT_ORDER_PLAN_REVISION_MAX:
                 raise _fail(f"{field} exceeds the plan revision limit.")
             if (
-                plan["contract"] != PLANT_ORDER_EFFECTIVE_PLAN_CONTRACT
+                self.plan["contract"] != PLANT_ORDER_EFFECTIVE_PLAN_CONTRACT
                 or successor["contract"] != PLANT_ORDER_EFFECTIVE_PLAN_CONTRACT
             ):
                 raise _fail(
                     f"{field} requires version 4 effective-dated predecessor and successor plans."
                 )
-            if command["supersededPlanId"] != plan["planId"]:
+            if command["supersededPlanId"] != self.plan["planId"]:
                 raise _fail(f"{field}.supersededPlanId is not the current reviewed plan.")
-            if successor["planId"] == plan["planId"]:
+            if successor["planId"] == self.plan["planId"]:
                 raise _fail(f"{field}.package.planId must identify a new reviewed plan.")
             if any(
                 retained["planId"] == successor["planId"]
-                for retained in plan_history
+                for retained in self.plan_history
             ):
                 raise _fail(
                     f"{field}.package.planId was already retained in this revision chain."
@@ -1413,44 +1427,44 @@ def _replay_commands(commands: list[dict[str, Any]]) -> dict[str, Any]:
                 raise _fail(
                     f"{field}.package must remain effective after its supersession review."
                 )
-            plan = successor
-            plan_history.append(successor)
-            plan_revisions.append(command)
-            latest_availability = None
-            effectiveness_window = None
-            calibrations.clear()
-            quality_reworks.clear()
-            material_substitutions.clear()
-            material_issue_commands.clear()
-            operation_commands.clear()
-            output_entries.clear()
-            inspections.clear()
-            batch_release = None
-            total_output = 0
-            issued = {row["materialId"]: 0 for row in successor["materials"]}
-            operation_quantities = {
+            self.plan = successor
+            self.plan_history.append(successor)
+            self.plan_revisions.append(command)
+            self.latest_availability = None
+            self.effectiveness_window = None
+            self.calibrations.clear()
+            self.quality_reworks.clear()
+            self.material_substitutions.clear()
+            self.material_issue_commands.clear()
+            self.operation_commands.clear()
+            self.output_entries.clear()
+            self.inspections.clear()
+            self.batch_release = None
+            self.total_output = 0
+            self.issued = {row["materialId"]: 0 for row in successor["materials"]}
+            self.operation_quantities = {
                 row["operationId"]: 0 for row in successor["routing"]
             }
-            operation_minutes = {
+            self.operation_minutes = {
                 row["operationId"]: 0 for row in successor["routing"]
             }
-            continue
+            return
 
         if kind == "availability_check":
-            if order_release is not None:
+            if self.order_release is not None:
                 raise _fail(f"{field} cannot replace availability after order release.")
-            latest_availability = _availability_projection(plan, command)
-            continue
+            self.latest_availability = _availability_projection(self.plan, command)
+            return
 
         if kind == "record_calibration":
-            if not _is_controlled_plan(plan):
+            if not _is_controlled_plan(self.plan):
                 raise _fail(f"{field} requires a version 3 or 4 controlled plan.")
-            if batch_release is not None:
+            if self.batch_release is not None:
                 raise _fail(f"{field} follows final batch release.")
             work_centre_id = command["workCentreId"]
-            if not any(row["workCentreId"] == work_centre_id for row in plan["routing"]):
+            if not any(row["workCentreId"] == work_centre_id for row in self.plan["routing"]):
                 raise _fail(f"{field}.workCentreId is not in the reviewed routing.")
-            previous = calibrations.get(work_centre_id)
+            previous = self.calibrations.get(work_centre_id)
             if previous is not None:
                 calibrated = datetime.fromisoformat(command["calibratedAt"].replace("Z", "+00:00"))
                 valid_until = datetime.fromisoformat(command["validUntil"].replace("Z", "+00:00"))
@@ -1458,51 +1472,53 @@ def _replay_commands(commands: list[dict[str, Any]]) -> dict[str, Any]:
                 previous_valid_until = datetime.fromisoformat(previous["validUntil"].replace("Z", "+00:00"))
                 if calibrated <= previous_calibrated or valid_until <= previous_valid_until:
                     raise _fail(f"{field} does not advance the retained calibration.")
-            calibrations[work_centre_id] = command
-            continue
+            self.calibrations[work_centre_id] = command
+            return
 
         if kind == "release_order":
-            if order_release is not None:
+            if self.order_release is not None:
                 raise _fail(f"{field} attempts to release the order twice.")
-            if latest_availability is None:
+            if self.latest_availability is None:
                 raise _fail(f"{field} requires a current availability check.")
-            if command["availabilityCheckId"] != latest_availability["checkId"]:
+            if command["availabilityCheckId"] != self.latest_availability["checkId"]:
                 raise _fail(f"{field} references a stale availability check.")
-            if not latest_availability["passed"]:
+            if not self.latest_availability["passed"]:
                 raise _fail(f"{field} cannot release an order with a shortfall.")
-            _assert_plan_effective_at_release(plan, command["proof"]["capturedAt"], field)
-            if _is_controlled_plan(plan):
-                routed_centres = sorted({row["workCentreId"] for row in plan["routing"]})
+            _assert_plan_effective_at_release(self.plan, command["proof"]["capturedAt"], field)
+            if _is_controlled_plan(self.plan):
+                routed_centres = sorted({row["workCentreId"] for row in self.plan["routing"]})
                 missing = [
                     work_centre_id
                     for work_centre_id in routed_centres
-                    if work_centre_id not in calibrations
-                    or not _calibration_covers(calibrations[work_centre_id], command["proof"]["capturedAt"])
+                    if work_centre_id not in self.calibrations
+                    or not _calibration_covers(
+                        self.calibrations[work_centre_id], command["proof"]["capturedAt"]
+                    )
                 ]
                 if missing:
                     raise _fail(f"{field} requires current calibration for {', '.join(missing)}.")
-            order_release = command
-            continue
+            self.order_release = command
+            return
 
-        if order_release is None:
+        if self.order_release is None:
             raise _fail(f"{field} requires human order release.")
         if kind == "record_effectiveness":
-            if command["planId"] != plan["planId"] or command["jobId"] != job["jobId"]:
+            if command["planId"] != self.plan["planId"] or command["jobId"] != job["jobId"]:
                 raise _fail(f"{field} is not bound to the reviewed order.")
-            routed_centres = sorted({row["workCentreId"] for row in plan["routing"]})
+            routed_centres = sorted({row["workCentreId"] for row in self.plan["routing"]})
             observed_centres = [row["workCentreId"] for row in command["workCentres"]]
             if routed_centres != observed_centres:
                 raise _fail(f"{field} must cover every and only routed work centre.")
-            effectiveness_window = command
-            continue
-        if batch_release is not None:
+            self.effectiveness_window = command
+            return
+        if self.batch_release is not None:
             raise _fail(f"{field} follows final batch release.")
 
         if kind == "approve_material_substitution":
             material = next(
                 (
                     row
-                    for row in plan["materials"]
+                    for row in self.plan["materials"]
                     if row["materialId"] == command["materialId"]
                 ),
                 None,
@@ -1511,7 +1527,7 @@ def _replay_commands(commands: list[dict[str, Any]]) -> dict[str, Any]:
                 raise _fail(f"{field}.materialId is not in the reviewed BOM.")
             if command["substituteMaterialId"] == command["materialId"] or any(
                 row["materialId"] == command["substituteMaterialId"]
-                for row in plan["materials"]
+                for row in self.plan["materials"]
             ):
                 raise _fail(
                     f"{field}.substituteMaterialId must be a distinct non-BOM material."
@@ -1523,29 +1539,29 @@ def _replay_commands(commands: list[dict[str, Any]]) -> dict[str, Any]:
                 raise _fail(
                     f"{field}.originalQuantityPerUnitMilli must match the reviewed BOM basis."
                 )
-            if issued[command["materialId"]] != 0:
+            if self.issued[command["materialId"]] != 0:
                 raise _fail(f"{field} must precede material issue.")
-            if command["materialId"] in material_substitutions:
+            if command["materialId"] in self.material_substitutions:
                 raise _fail(
                     f"{field} attempts to approve a second substitute for one BOM material."
                 )
             _safe_product(
-                plan["job"]["targetQuantity"],
+                self.plan["job"]["targetQuantity"],
                 command["substituteQuantityPerUnitMilli"],
                 f"{field}.substituteQuantityPerUnitMilli",
             )
-            material_substitutions[command["materialId"]] = command
-            continue
+            self.material_substitutions[command["materialId"]] = command
+            return
 
-        latest_inspection = inspections[-1] if inspections else None
+        latest_inspection = self.inspections[-1] if self.inspections else None
         current_hold = bool(
             latest_inspection
-            and latest_inspection["inspectedQuantity"] == total_output
+            and latest_inspection["inspectedQuantity"] == self.total_output
             and latest_inspection["result"] == "fail"
         )
 
         if kind == "record_quality_rework":
-            if not _is_controlled_plan(plan):
+            if not _is_controlled_plan(self.plan):
                 raise _fail(f"{field} requires a version 3 or 4 controlled plan.")
             if (
                 not current_hold
@@ -1553,52 +1569,58 @@ def _replay_commands(commands: list[dict[str, Any]]) -> dict[str, Any]:
                 or command["inspectionId"] != latest_inspection["id"]
             ):
                 raise _fail(f"{field} requires the current failed inspection.")
-            if any(row["inspectionId"] == command["inspectionId"] for row in quality_reworks):
+            if any(row["inspectionId"] == command["inspectionId"] for row in self.quality_reworks):
                 raise _fail(f"{field} attempts to rework one failed inspection twice.")
             if command["quantity"] != latest_inspection["rejectedQuantity"]:
                 raise _fail(f"{field}.quantity must equal the current rejected quantity.")
             operation = next(
-                (row for row in plan["routing"] if row["operationId"] == command["operationId"]),
+                (
+                    row
+                    for row in self.plan["routing"]
+                    if row["operationId"] == command["operationId"]
+                ),
                 None,
             )
             if operation is None:
                 raise _fail(f"{field}.operationId is not in the reviewed routing.")
-            calibration = calibrations.get(operation["workCentreId"])
+            calibration = self.calibrations.get(operation["workCentreId"])
             if calibration is None or not _calibration_covers(
                 calibration, command["proof"]["capturedAt"]
             ):
                 raise _fail(f"{field} requires current calibration for {operation['workCentreId']}.")
-            next_minutes = operation_minutes[operation["operationId"]] + command["actualMinutesMilli"]
+            next_minutes = (
+                self.operation_minutes[operation["operationId"]] + command["actualMinutesMilli"]
+            )
             if next_minutes > _MAX_SAFE_INTEGER:
                 raise _fail(f"{field}.actualMinutesMilli exceeds the supported range.")
-            operation_minutes[operation["operationId"]] = next_minutes
-            quality_reworks.append(command)
-            continue
+            self.operation_minutes[operation["operationId"]] = next_minutes
+            self.quality_reworks.append(command)
+            return
 
         if kind == "issue_material":
             if current_hold:
                 raise _fail(f"{field} is blocked by the failed current inspection.")
-            material_plan = {row["materialId"]: row for row in plan["materials"]}
+            material_plan = {row["materialId"]: row for row in self.plan["materials"]}
             material_id = command["materialId"]
             if material_id not in material_plan:
                 raise _fail(f"{field}.materialId is not in the reviewed BOM.")
-            if latest_availability is None:
+            if self.latest_availability is None:
                 raise _fail(f"{field} has no released availability evidence.")
             availability = next(
                 row
-                for row in latest_availability["materials"]
+                for row in self.latest_availability["materials"]
                 if row["materialId"] == material_id
             )
             if command["inputLotId"] != availability["inputLotId"]:
                 raise _fail(f"{field}.inputLotId differs from the released lot.")
-            next_issued = issued[material_id] + command["quantityMilli"]
+            next_issued = self.issued[material_id] + command["quantityMilli"]
             if next_issued > availability["requiredQuantityMilli"]:
                 raise _fail(f"{field} exceeds the reviewed BOM requirement.")
             if next_issued > availability["availableQuantityMilli"]:
                 raise _fail(f"{field} exceeds released material availability.")
-            issued[material_id] = next_issued
-            material_issue_commands.append(command)
-            continue
+            self.issued[material_id] = next_issued
+            self.material_issue_commands.append(command)
+            return
 
         if kind == "issue_substitute_material":
             if current_hold:
@@ -1606,14 +1628,14 @@ def _replay_commands(commands: list[dict[str, Any]]) -> dict[str, Any]:
             material = next(
                 (
                     row
-                    for row in plan["materials"]
+                    for row in self.plan["materials"]
                     if row["materialId"] == command["materialId"]
                 ),
                 None,
             )
             if material is None:
                 raise _fail(f"{field}.materialId is not in the reviewed BOM.")
-            approval = material_substitutions.get(command["materialId"])
+            approval = self.material_substitutions.get(command["materialId"])
             if approval is None or approval["id"] != command["substitutionId"]:
                 raise _fail(
                     f"{field}.substitutionId does not reference the approved substitute "
@@ -1638,9 +1660,9 @@ def _replay_commands(commands: list[dict[str, Any]]) -> dict[str, Any]:
                 raise _fail(
                     f"{field}.substituteQuantityMilli exceeds the supported conversion range."
                 )
-            next_issued = issued[command["materialId"]] + credited_quantity
+            next_issued = self.issued[command["materialId"]] + credited_quantity
             required_quantity = _safe_product(
-                plan["job"]["targetQuantity"],
+                self.plan["job"]["targetQuantity"],
                 material["quantityPerUnitMilli"],
                 f"material requirement for {material['materialId']}",
             )
@@ -1648,14 +1670,14 @@ def _replay_commands(commands: list[dict[str, Any]]) -> dict[str, Any]:
                 raise _fail(
                     f"{field} exceeds the reviewed BOM requirement after approved conversion."
                 )
-            issued[command["materialId"]] = next_issued
-            material_issue_commands.append(command)
-            continue
+            self.issued[command["materialId"]] = next_issued
+            self.material_issue_commands.append(command)
+            return
 
         if kind == "record_operation":
             if current_hold:
                 raise _fail(f"{field} is blocked by the failed current inspection.")
-            if plan["contract"] not in {
+            if self.plan["contract"] not in {
                 PLANT_ORDER_EXECUTION_PLAN_CONTRACT,
                 PLANT_ORDER_CONTROLLED_PLAN_CONTRACT,
                 PLANT_ORDER_EFFECTIVE_PLAN_CONTRACT,
@@ -1664,283 +1686,372 @@ def _replay_commands(commands: list[dict[str, Any]]) -> dict[str, Any]:
             operation_index = next(
                 (
                     route_index
-                    for route_index, row in enumerate(plan["routing"])
+                    for route_index, row in enumerate(self.plan["routing"])
                     if row["operationId"] == command["operationId"]
                 ),
                 -1,
             )
             if operation_index < 0:
                 raise _fail(f"{field}.operationId is not in the reviewed routing.")
-            if _is_controlled_plan(plan):
-                work_centre_id = plan["routing"][operation_index]["workCentreId"]
-                calibration = calibrations.get(work_centre_id)
+            if _is_controlled_plan(self.plan):
+                work_centre_id = self.plan["routing"][operation_index]["workCentreId"]
+                calibration = self.calibrations.get(work_centre_id)
                 if calibration is None or not _calibration_covers(calibration, command["proof"]["capturedAt"]):
                     raise _fail(f"{field} requires current calibration for {work_centre_id}.")
-            completed_quantity = operation_quantities[command["operationId"]]
+            completed_quantity = self.operation_quantities[command["operationId"]]
             next_completed_quantity = completed_quantity + command["quantity"]
             if next_completed_quantity > job["targetQuantity"]:
                 raise _fail(f"{field} exceeds the reviewed operation target.")
             available_input_quantity = (
                 job["targetQuantity"]
                 if operation_index == 0
-                else operation_quantities[
-                    plan["routing"][operation_index - 1]["operationId"]
+                else self.operation_quantities[
+                    self.plan["routing"][operation_index - 1]["operationId"]
                 ]
             )
             if next_completed_quantity > available_input_quantity:
                 raise _fail(
                     f"{field} exceeds quantity completed by the prior operation."
                 )
-            for material in plan["materials"]:
+            for material in self.plan["materials"]:
                 required_for_progress = _safe_product(
                     next_completed_quantity,
                     material["quantityPerUnitMilli"],
                     f"material issue requirement for {material['materialId']}",
                 )
-                if issued[material["materialId"]] < required_for_progress:
+                if self.issued[material["materialId"]] < required_for_progress:
                     raise _fail(
                         f"{field} lacks issued {material['materialId']} for operation progress."
                     )
             next_minutes = (
-                operation_minutes[command["operationId"]]
+                self.operation_minutes[command["operationId"]]
                 + command["actualMinutesMilli"]
             )
             if next_minutes > _MAX_SAFE_INTEGER:
                 raise _fail(f"{field}.actualMinutesMilli exceeds the supported range.")
-            operation_quantities[command["operationId"]] = next_completed_quantity
-            operation_minutes[command["operationId"]] = next_minutes
-            operation_commands.append(command)
-            continue
+            self.operation_quantities[command["operationId"]] = next_completed_quantity
+            self.operation_minutes[command["operationId"]] = next_minutes
+            self.operation_commands.append(command)
+            return
 
         if kind == "record_output":
             if current_hold:
                 raise _fail(f"{field} is blocked by the failed current inspection.")
             if command["outputBatchId"] != job["outputBatchId"]:
                 raise _fail(f"{field}.outputBatchId differs from the reviewed batch.")
-            next_output = total_output + command["quantity"]
+            next_output = self.total_output + command["quantity"]
             if next_output > job["targetQuantity"]:
                 raise _fail(f"{field} exceeds the reviewed order target.")
-            if plan["contract"] in {
+            if self.plan["contract"] in {
                 PLANT_ORDER_EXECUTION_PLAN_CONTRACT,
                 PLANT_ORDER_CONTROLLED_PLAN_CONTRACT,
                 PLANT_ORDER_EFFECTIVE_PLAN_CONTRACT,
             }:
-                final_operation_id = plan["routing"][-1]["operationId"]
-                if operation_quantities[final_operation_id] < next_output:
+                final_operation_id = self.plan["routing"][-1]["operationId"]
+                if self.operation_quantities[final_operation_id] < next_output:
                     raise _fail(
                         f"{field} exceeds completed final-operation quantity."
                     )
-            for material in plan["materials"]:
+            for material in self.plan["materials"]:
                 required_for_output = _safe_product(
                     next_output,
                     material["quantityPerUnitMilli"],
                     f"material issue requirement for {material['materialId']}",
                 )
-                if issued[material["materialId"]] < required_for_output:
+                if self.issued[material["materialId"]] < required_for_output:
                     raise _fail(
                         f"{field} lacks issued {material['materialId']} for the recorded output."
                     )
-            total_output = next_output
-            output_entries.append(command)
-            continue
+            self.total_output = next_output
+            self.output_entries.append(command)
+            return
 
         if kind == "inspect_output":
             if command["outputBatchId"] != job["outputBatchId"]:
                 raise _fail(f"{field}.outputBatchId differs from the reviewed batch.")
-            if total_output < 1 or command["inspectedQuantity"] != total_output:
+            if self.total_output < 1 or command["inspectedQuantity"] != self.total_output:
                 raise _fail(f"{field} must inspect all currently recorded output.")
             if (
                 current_hold
-                and _is_controlled_plan(plan)
+                and _is_controlled_plan(self.plan)
                 and latest_inspection is not None
-                and not any(row["inspectionId"] == latest_inspection["id"] for row in quality_reworks)
+                and not any(
+                    row["inspectionId"] == latest_inspection["id"] for row in self.quality_reworks
+                )
             ):
                 raise _fail(f"{field} requires attributable rework for the current failed inspection.")
-            inspections.append(command)
-            continue
+            self.inspections.append(command)
+            return
 
         if command["outputBatchId"] != job["outputBatchId"]:
             raise _fail(f"{field}.outputBatchId differs from the reviewed batch.")
-        if total_output != job["targetQuantity"]:
+        if self.total_output != job["targetQuantity"]:
             raise _fail(f"{field} requires the complete reviewed output target.")
-        if not inspections or command["inspectionId"] != inspections[-1]["id"]:
+        if not self.inspections or command["inspectionId"] != self.inspections[-1]["id"]:
             raise _fail(f"{field} requires the latest current inspection.")
-        latest_inspection = inspections[-1]
+        latest_inspection = self.inspections[-1]
         if (
             latest_inspection["result"] != "pass"
-            or latest_inspection["inspectedQuantity"] != total_output
-            or latest_inspection["acceptedQuantity"] != total_output
+            or latest_inspection["inspectedQuantity"] != self.total_output
+            or latest_inspection["acceptedQuantity"] != self.total_output
         ):
             raise _fail(f"{field} cannot release output that is unaccepted or held.")
-        batch_release = command
+        self.batch_release = command
 
-    if plan is None:
-        raise _fail("Plant order command history lacks its reviewed plan.")
 
-    material_plan = {row["materialId"]: row for row in plan["materials"]}
-    availability_rows = {
-        row["materialId"]: row
-        for row in (latest_availability["materials"] if latest_availability else [])
-    }
-    material_rows = []
-    for material_id in sorted(material_plan):
-        row = material_plan[material_id]
-        required = _safe_product(
-            plan["job"]["targetQuantity"],
-            row["quantityPerUnitMilli"],
-            f"material requirement for {material_id}",
-        )
-        availability = availability_rows.get(material_id)
-        material_rows.append(
-            {
-                **row,
-                "requiredQuantityMilli": required,
-                "issuedQuantityMilli": issued[material_id],
-                "remainingToIssueMilli": required - issued[material_id],
-                "inputLotId": availability["inputLotId"] if availability else None,
-                "availableQuantityMilli": (
-                    availability["availableQuantityMilli"] if availability else None
-                ),
-            }
-        )
+    def projection(self) -> dict[str, Any]:
+        if self.plan is None:
+            return _empty_projection()
 
-    genealogy = []
-    for command in material_issue_commands:
-        material = material_plan[command["materialId"]]
-        row = {
-            "materialId": command["materialId"],
-            "inputLotId": command["inputLotId"],
-            "outputBatchId": plan["job"]["outputBatchId"],
-            "unit": material["unit"],
+        material_plan = {row["materialId"]: row for row in self.plan["materials"]}
+        availability_rows = {
+            row["materialId"]: row
+            for row in (self.latest_availability["materials"] if self.latest_availability else [])
         }
-        if command["kind"] == "issue_material":
-            row["issuedQuantityMilli"] = command["quantityMilli"]
-        else:
-            approval = material_substitutions[command["materialId"]]
-            row.update(
+        material_rows = []
+        for material_id in sorted(material_plan):
+            row = material_plan[material_id]
+            required = _safe_product(
+                self.plan["job"]["targetQuantity"],
+                row["quantityPerUnitMilli"],
+                f"material requirement for {material_id}",
+            )
+            availability = availability_rows.get(material_id)
+            material_rows.append(
                 {
-                    "issuedQuantityMilli": (
-                        command["substituteQuantityMilli"]
-                        * approval["originalQuantityPerUnitMilli"]
-                        // approval["substituteQuantityPerUnitMilli"]
+                    **row,
+                    "requiredQuantityMilli": required,
+                    "issuedQuantityMilli": self.issued[material_id],
+                    "remainingToIssueMilli": required - self.issued[material_id],
+                    "inputLotId": availability["inputLotId"] if availability else None,
+                    "availableQuantityMilli": (
+                        availability["availableQuantityMilli"] if availability else None
                     ),
-                    "substitutionId": command["substitutionId"],
-                    "substituteMaterialId": command["substituteMaterialId"],
-                    "substituteQuantityMilli": command["substituteQuantityMilli"],
-                    "substituteUnit": approval["substituteUnit"],
                 }
             )
-        genealogy.append(row)
 
-    operations = []
-    for index, row in enumerate(plan["routing"]):
-        completed_quantity = operation_quantities[row["operationId"]]
-        available_input_quantity = (
-            plan["job"]["targetQuantity"]
-            if index == 0
-            else operation_quantities[plan["routing"][index - 1]["operationId"]]
-        )
-        operation_status = (
-            "complete"
-            if completed_quantity == plan["job"]["targetQuantity"]
-            else "in_progress"
-            if completed_quantity
-            else "ready"
-            if available_input_quantity > 0
-            else "blocked"
+        genealogy = []
+        for command in self.material_issue_commands:
+            material = material_plan[command["materialId"]]
+            row = {
+                "materialId": command["materialId"],
+                "inputLotId": command["inputLotId"],
+                "outputBatchId": self.plan["job"]["outputBatchId"],
+                "unit": material["unit"],
+            }
+            if command["kind"] == "issue_material":
+                row["issuedQuantityMilli"] = command["quantityMilli"]
+            else:
+                approval = self.material_substitutions[command["materialId"]]
+                row.update(
+                    {
+                        "issuedQuantityMilli": (
+                            command["substituteQuantityMilli"]
+                            * approval["originalQuantityPerUnitMilli"]
+                            // approval["substituteQuantityPerUnitMilli"]
+                        ),
+                        "substitutionId": command["substitutionId"],
+                        "substituteMaterialId": command["substituteMaterialId"],
+                        "substituteQuantityMilli": command["substituteQuantityMilli"],
+                        "substituteUnit": approval["substituteUnit"],
+                    }
+                )
+            genealogy.append(row)
+
+        operations = []
+        for index, row in enumerate(self.plan["routing"]):
+            completed_quantity = self.operation_quantities[row["operationId"]]
+            available_input_quantity = (
+                self.plan["job"]["targetQuantity"]
+                if index == 0
+                else self.operation_quantities[self.plan["routing"][index - 1]["operationId"]]
+            )
+            operation_status = (
+                "complete"
+                if completed_quantity == self.plan["job"]["targetQuantity"]
+                else "in_progress"
+                if completed_quantity
+                else "ready"
+                if available_input_quantity > 0
+                else "blocked"
+            )
+            operations.append(
+                {
+                    **row,
+                    "completedQuantity": completed_quantity,
+                    "remainingQuantity": self.plan["job"]["targetQuantity"]
+                    - completed_quantity,
+                    "plannedMinutesMilli": _safe_product(
+                        self.plan["job"]["targetQuantity"],
+                        row["minutesPerUnitMilli"],
+                        f"planned operation minutes for {row['operationId']}",
+                    ),
+                    "actualMinutesMilli": self.operation_minutes[row["operationId"]],
+                    "status": operation_status,
+                }
+            )
+
+        latest_inspection = self.inspections[-1] if self.inspections else None
+        inspection_is_current = bool(
+            latest_inspection and latest_inspection["inspectedQuantity"] == self.total_output
         )
-        operations.append(
+        quality_hold = (
             {
-                **row,
-                "completedQuantity": completed_quantity,
-                "remainingQuantity": plan["job"]["targetQuantity"]
-                - completed_quantity,
-                "plannedMinutesMilli": _safe_product(
-                    plan["job"]["targetQuantity"],
-                    row["minutesPerUnitMilli"],
-                    f"planned operation minutes for {row['operationId']}",
-                ),
-                "actualMinutesMilli": operation_minutes[row["operationId"]],
-                "status": operation_status,
+                "inspectionId": latest_inspection["id"],
+                "rejectedQuantity": latest_inspection["rejectedQuantity"],
+                "proof": latest_inspection["proof"],
             }
+            if inspection_is_current and latest_inspection["result"] == "fail"
+            else None
         )
+        if self.batch_release:
+            status = "released_to_stock"
+        elif quality_hold:
+            status = "quality_hold"
+        elif self.order_release is None:
+            status = (
+                "planned"
+                if self.latest_availability is None
+                else "ready"
+                if self.latest_availability["passed"]
+                else "shortfall"
+            )
+        elif self.total_output == self.plan["job"]["targetQuantity"]:
+            status = (
+                "ready_to_release"
+                if inspection_is_current and latest_inspection["result"] == "pass"
+                else "inspection_due"
+            )
+        elif self.total_output or self.material_issue_commands or self.operation_commands:
+            status = "in_process"
+        else:
+            status = "released"
 
-    latest_inspection = inspections[-1] if inspections else None
-    inspection_is_current = bool(
-        latest_inspection and latest_inspection["inspectedQuantity"] == total_output
-    )
-    quality_hold = (
+        return {
+            "plan": self.plan,
+            "planHistory": self.plan_history,
+            "planRevisions": self.plan_revisions,
+            "status": status,
+            "latestAvailability": self.latest_availability,
+            "orderRelease": self.order_release,
+            "calibrations": [self.calibrations[key] for key in sorted(self.calibrations)],
+            "qualityReworks": self.quality_reworks,
+            "materialSubstitutions": [
+                self.material_substitutions[key] for key in sorted(self.material_substitutions)
+            ],
+            "materialIssues": self.material_issue_commands,
+            "effectivenessWindow": self.effectiveness_window,
+            "materials": material_rows,
+            "routing": self.plan["routing"],
+            "operations": operations,
+            "workCentres": (
+                self.latest_availability["workCentres"] if self.latest_availability else []
+            ),
+            "outputEntries": self.output_entries,
+            "totalOutput": self.total_output,
+            "inspections": self.inspections,
+            "latestInspection": latest_inspection,
+            "qualityHold": quality_hold,
+            "batchRelease": self.batch_release,
+            "genealogy": genealogy,
+            "metrics": {
+                "targetQuantity": self.plan["job"]["targetQuantity"],
+                "issuedMaterialCount": sum(1 for quantity in self.issued.values() if quantity),
+                "completedOperationCount": sum(
+                    1 for operation in operations if operation["status"] == "complete"
+                ),
+                "actualOperationMinutesMilli": sum(self.operation_minutes.values()),
+                "outputQuantity": self.total_output,
+                "acceptedQuantity": (
+                    latest_inspection["acceptedQuantity"]
+                    if inspection_is_current and latest_inspection
+                    else 0
+                ),
+            },
+        }
+
+
+class _PlantOrderEngine:
+    """Command-id index and replay fold for one validated chain at ``head_digest``.
+
+    The engine owns private copies of every payload it indexes. An append
+    checks the new envelope against the index and folds only that envelope;
+    a command that fails part-way leaves the engine unusable, so callers
+    discard it and the next command rebuilds from the validated chain.
+    """
+
+    def __init__(self) -> None:
+        self.head_digest = EMPTY_PLANT_ORDER_DIGEST
+        self.payloads: dict[str, dict[str, Any]] = {}
+        self.action_ids: set[str] = set()
+        self.captured_at: datetime | None = None
+        self.replay = _PlantOrderReplay()
+
+    @classmethod
+    def from_commands(cls, commands: Sequence[Mapping[str, Any]]) -> _PlantOrderEngine:
+        engine = cls()
+        for command in commands:
+            engine.advance(copy_json_tree(command["payload"]), command["digest"])
+        return engine
+
+    def advance(self, payload: dict[str, Any], digest: str) -> None:
+        index = len(self.payloads)
+        field = f"Plant order state.commands[{index}]"
+        if index >= _MAX_COMMANDS:
+            raise _fail(
+                f"Plant order state.commands must contain between 0 and {_MAX_COMMANDS} items."
+            )
+        captured_at = datetime.fromisoformat(
+            payload["proof"]["capturedAt"].replace("Z", "+00:00")
+        )
+        if self.captured_at is not None and captured_at < self.captured_at:
+            raise _fail(f"{field}.payload.proof.capturedAt moves backwards.")
+        if payload["id"] in self.payloads:
+            raise _fail("Plant order command IDs contains duplicates.")
+        if payload["proof"]["actionId"] in self.action_ids:
+            raise _fail("Plant order action IDs contains duplicates.")
+        self.replay.apply(index, payload)
+        self.payloads[payload["id"]] = payload
+        self.action_ids.add(payload["proof"]["actionId"])
+        self.captured_at = captured_at
+        self.head_digest = digest
+
+
+# Engines are keyed by head digest, which commits to the whole command chain.
+# A command checks its engine out of the cache and returns it only once the
+# engine is consistent again, so no two callers ever fold into one engine.
+_ENGINE_LOCK = RLock()
+_ENGINES: OrderedDict[str, _PlantOrderEngine] = OrderedDict()
+
+
+def _checkin_engine(engine: _PlantOrderEngine) -> None:
+    with _ENGINE_LOCK:
+        _ENGINES[engine.head_digest] = engine
+        _ENGINES.move_to_end(engine.head_digest)
+        while len(_ENGINES) > _ENGINE_LIMIT:
+            _ENGINES.popitem(last=False)
+
+
+def _checkout_engine(validated: Mapping[str, Any]) -> _PlantOrderEngine:
+    with _ENGINE_LOCK:
+        engine = _ENGINES.pop(validated["headDigest"], None)
+    if engine is None:
+        engine = _PlantOrderEngine.from_commands(validated["commands"])
+    return engine
+
+
+def _projection_document(
+    validated: Mapping[str, Any],
+    engine: _PlantOrderEngine,
+) -> dict[str, Any]:
+    return _canonical_copy(
         {
-            "inspectionId": latest_inspection["id"],
-            "rejectedQuantity": latest_inspection["rejectedQuantity"],
-            "proof": latest_inspection["proof"],
+            "contract": PLANT_ORDER_PROJECTION_CONTRACT,
+            "revision": validated["revision"],
+            "headDigest": validated["headDigest"],
+            **engine.replay.projection(),
         }
-        if inspection_is_current and latest_inspection["result"] == "fail"
-        else None
     )
-    if batch_release:
-        status = "released_to_stock"
-    elif quality_hold:
-        status = "quality_hold"
-    elif order_release is None:
-        status = (
-            "planned"
-            if latest_availability is None
-            else "ready"
-            if latest_availability["passed"]
-            else "shortfall"
-        )
-    elif total_output == plan["job"]["targetQuantity"]:
-        status = (
-            "ready_to_release"
-            if inspection_is_current and latest_inspection["result"] == "pass"
-            else "inspection_due"
-        )
-    elif total_output or material_issue_commands or operation_commands:
-        status = "in_process"
-    else:
-        status = "released"
-
-    return {
-        "plan": plan,
-        "planHistory": plan_history,
-        "planRevisions": plan_revisions,
-        "status": status,
-        "latestAvailability": latest_availability,
-        "orderRelease": order_release,
-        "calibrations": [calibrations[key] for key in sorted(calibrations)],
-        "qualityReworks": quality_reworks,
-        "materialSubstitutions": [
-            material_substitutions[key] for key in sorted(material_substitutions)
-        ],
-        "materialIssues": material_issue_commands,
-        "effectivenessWindow": effectiveness_window,
-        "materials": material_rows,
-        "routing": plan["routing"],
-        "operations": operations,
-        "workCentres": latest_availability["workCentres"] if latest_availability else [],
-        "outputEntries": output_entries,
-        "totalOutput": total_output,
-        "inspections": inspections,
-        "latestInspection": latest_inspection,
-        "qualityHold": quality_hold,
-        "batchRelease": batch_release,
-        "genealogy": genealogy,
-        "metrics": {
-            "targetQuantity": plan["job"]["targetQuantity"],
-            "issuedMaterialCount": sum(1 for quantity in issued.values() if quantity),
-            "completedOperationCount": sum(
-                1 for operation in operations if operation["status"] == "complete"
-            ),
-            "actualOperationMinutesMilli": sum(operation_minutes.values()),
-            "outputQuantity": total_output,
-            "acceptedQuantity": (
-                latest_inspection["acceptedQuantity"]
-                if inspection_is_current and latest_inspection
-                else 0
-            ),
-        },
-    }
 
 
 def validate_plant_order_state(value: object) -> dict[str, Any]:
@@ -2006,7 +2117,7 @@ def validate_plant_order_state(value: object) -> dict[str, Any]:
     expected_head = prior_digest if commands else EMPTY_PLANT_ORDER_DIGEST
     if head_digest != expected_head:
         raise _fail("Plant order state.headDigest does not match its command chain.")
-    _replay_commands([command["payload"] for command in commands])
+    _checkin_engine(_PlantOrderEngine.from_commands(commands))
     return _canonical_copy(
         {
             "schema": PLANT_ORDER_STATE_SCHEMA,
@@ -2020,18 +2131,16 @@ def validate_plant_order_state(value: object) -> dict[str, Any]:
 def project_plant_order(state: object) -> dict[str, Any]:
     """Derive readiness, execution, quality, and genealogy from immutable commands."""
 
-    validated = validate_plant_order_state(state)
-    projection = _replay_commands(
-        [command["payload"] for command in validated["commands"]]
-    )
-    return _canonical_copy(
-        {
-            "contract": PLANT_ORDER_PROJECTION_CONTRACT,
-            "revision": validated["revision"],
-            "headDigest": validated["headDigest"],
-            **projection,
-        }
-    )
+    validated = validated_state("plant_order", state, validate_plant_order_state)
+    with _ENGINE_LOCK:
+        engine = _ENGINES.get(validated["headDigest"])
+        if engine is not None:
+            _ENGINES.move_to_end(validated["headDigest"])
+            return _projection_document(validated, engine)
+    engine = _PlantOrderEngine.from_commands(validated["commands"])
+    document = _projection_document(validated, engine)
+    _checkin_engine(engine)
+    return document
 
 
 def _ratio_basis_points(numerator: int, denominator: int) -> int | None:
@@ -2419,7 +2528,7 @@ def project_plant_order_financial_cost(projection: Mapping[str, Any]) -> dict[st
 def build_plant_order_cost_review_packet(state: object) -> dict[str, Any] | None:
     """Build a detached, digest-bound ERP review packet without posting cost."""
 
-    source_state = validate_plant_order_state(state)
+    source_state = validated_state("plant_order", state, validate_plant_order_state)
     projection = project_plant_order(source_state)
     if projection["plan"] is None:
         return None
@@ -2493,32 +2602,42 @@ def _append_command(
     *,
     expected_head_digest: object,
 ) -> dict[str, Any]:
-    current = validate_plant_order_state(state)
+    current = validated_state("plant_order", state, validate_plant_order_state)
     canonical_payload = _command_payload(payload, "command payload")
-    for command in current["commands"]:
-        existing = command["payload"]
-        if existing["id"] != canonical_payload["id"]:
-            continue
-        if existing != canonical_payload:
-            raise _fail("The Plant order command ID was already used with different evidence.")
-        return {"state": current, "replayed": True}
-    expected = _digest(expected_head_digest, "expected_head_digest")
-    if expected != current["headDigest"]:
-        raise _fail("The Plant order snapshot changed before this command was applied.")
-    sequence = current["revision"] + 1
-    body = {
-        "sequence": sequence,
-        "previousDigest": current["headDigest"],
-        "payload": canonical_payload,
-    }
-    envelope = {**body, "digest": _canonical_digest(body)}
-    candidate = {
-        "schema": PLANT_ORDER_STATE_SCHEMA,
-        "revision": sequence,
-        "headDigest": envelope["digest"],
-        "commands": [*current["commands"], envelope],
-    }
-    return {"state": validate_plant_order_state(candidate), "replayed": False}
+    engine = _checkout_engine(current)
+    intact = True
+    try:
+        existing = engine.payloads.get(canonical_payload["id"])
+        if existing is not None:
+            if existing != canonical_payload:
+                raise _fail("The Plant order command ID was already used with different evidence.")
+            return {"state": current, "replayed": True}
+        expected = _digest(expected_head_digest, "expected_head_digest")
+        if expected != current["headDigest"]:
+            raise _fail("The Plant order snapshot changed before this command was applied.")
+        sequence = current["revision"] + 1
+        body = {
+            "sequence": sequence,
+            "previousDigest": current["headDigest"],
+            "payload": canonical_payload,
+        }
+        envelope = {**body, "digest": _canonical_digest(body)}
+        intact = False
+        engine.advance(copy_json_tree(canonical_payload), envelope["digest"])
+        intact = True
+    finally:
+        if intact:
+            _checkin_engine(engine)
+    next_state = _canonical_copy(
+        {
+            "schema": PLANT_ORDER_STATE_SCHEMA,
+            "revision": sequence,
+            "headDigest": envelope["digest"],
+            "commands": [*current["commands"], envelope],
+        }
+    )
+    remember_validated_state("plant_order", next_state)
+    return {"state": next_state, "replayed": False}
 
 
 def apply_plant_order_plan(
@@ -12,6 +12,7 @@ from supermega_runtime.plant_order_foundation import (
     project_plant_order,
 )
 from supermega_runtime.production_runtime import validate_production_state
+from supermega_runtime.state_memo import validated_state
 from supermega_runtime.trial_store import TrialValidationError
 
 
@@ -22,7 +23,7 @@ _MAX_SAFE_INTEGER = 9_007_199_254_740_991
 
 
 def production_material_requests(value: object) -> list[dict[str, Any]]:
-    production = validate_production_state(value)
+    production = validated_state("production", value, validate_production_state)
     execution = production.get("orderExecution")
     if not isinstance(execution, Mapping):
         return []
@@ -116,7 +117,7 @@ def require_shop_issue_matches_plant(
     next_commerce: Mapping[str, Any],
     production: Mapping[str, Any],
 ) -> None:
-    current = validate_commerce_state(current_commerce)
+    current = validated_state("commerce", current_commerce, validate_commerce_state)
     requests = production_material_requests(production)
     next_movements = next_commerce.get("movements")
     if (
@@ -151,7 +152,7 @@ def require_shop_issue_matches_plant(
 def require_shop_issue_before_plant_progress(
     next_production: Mapping[str, Any], commerce: Mapping[str, Any]
 ) -> None:
-    production = validate_production_state(next_production)
+    production = validated_state("production", next_production, validate_production_state)
     execution = production.get("orderExecution")
     if not isinstance(execution, Mapping) or not execution["commands"]:
         return
@@ -159,7 +160,7 @@ def require_shop_issue_before_plant_progress(
     if latest_kind not in {"record_operation", "record_output"}:
         return
     requests = production_material_requests(production)
-    shop = validate_commerce_state(commerce)
+    shop = validated_state("commerce", commerce, validate_commerce_state)
     missing = [
         request["requestId"]
         for request in requests
@@ -226,7 +227,7 @@ def project_production_material_requirements(
 ) -> dict[str, Any] | None:
     """Project order-bound BOM coverage without purchasing or issuing stock."""
 
-    production = validate_production_state(production_value)
+    production = validated_state("production", production_value, validate_production_state)
     execution = production.get("orderExecution")
     if not isinstance(execution, Mapping):
         return None
@@ -234,7 +235,7 @@ def project_production_material_requirements(
     plan = projection.get("plan")
     if not isinstance(plan, Mapping):
         return None
-    commerce = validate_commerce_state(commerce_value)
+    commerce = validated_state("commerce", commerce_value, validate_commerce_state)
     requests = production_material_requests(production)
     relevant_skus = {
         material["shopSupply"]["sku"]
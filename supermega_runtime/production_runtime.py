@@ -20,6 +20,11 @@ from supermega_runtime.plant_order_foundation import (
     project_plant_order,
     validate_plant_order_state,
 )
+from supermega_runtime.state_memo import (
+    copy_json_tree,
+    remember_validated_state,
+    validated_state,
+)
 from supermega_runtime.trial_store import TrialValidationError
 
 
@@ -1625,6 +1630,54 @@ def _validate_event(
     return event
 
 
+class _ProductionEventIndex:
+    """One pass over validated Production events for history checks and projections.
+
+    Groups keep the newest-first order of ``state["events"]``. Action IDs are
+    unique once the state validator has checked them, so each maps to one event.
+    """
+
+    def __init__(self, events: Sequence[dict[str, Any]]) -> None:
+        self.events = events
+        self._by_kind: dict[str, list[dict[str, Any]]] = {}
+        self._by_subject: dict[str, list[dict[str, Any]]] = {}
+        self._by_action: dict[str, dict[str, Any]] = {}
+        self._positions: dict[int, int] = {}
+        self._created_at: dict[int, datetime] = {}
+        for position, event in enumerate(events):
+            self._by_kind.setdefault(event["kind"], []).append(event)
+            self._by_subject.setdefault(event["subjectId"], []).append(event)
+            self._by_action[event["actionId"]] = event
+            self._positions[id(event)] = position
+
+    def of_kind(self, kind: str) -> list[dict[str, Any]]:
+        return self._by_kind.get(kind, [])
+
+    def subject(self, subject_id: str, *kinds: str) -> list[dict[str, Any]]:
+        """Return events about one subject, optionally limited to ``kinds``."""
+
+        events = self._by_subject.get(subject_id, [])
+        if not kinds:
+            return events
+        return [event for event in events if event["kind"] in kinds]
+
+    def action(self, action_id: str, kind: str) -> dict[str, Any] | None:
+        event = self._by_action.get(action_id)
+        return event if event is not None and event["kind"] == kind else None
+
+    def position(self, event: Mapping[str, Any]) -> int:
+        return self._positions[id(event)]
+
+    def created_at(self, event: Mapping[str, Any], field: str) -> datetime:
+        """Parse an event's ``createdAt`` once, however many checks compare it."""
+
+        parsed = self._created_at.get(id(event))
+        if parsed is None:
+            parsed = _parsed_timestamp(event["createdAt"], field)[1]
+            self._created_at[id(event)] = parsed
+        return parsed
+
+
 def _quality_prior_issue_ids(
     issues: Sequence[dict[str, Any]],
     issue_id: str,
@@ -1664,20 +1717,12 @@ def _quality_prior_issue_ids(
 
 def _validate_issue_history(
     issues: Sequence[dict[str, Any]],
-    events: Sequence[dict[str, Any]],
+    history: _ProductionEventIndex,
     machines: Sequence[dict[str, Any]],
 ) -> None:
     for index, issue in enumerate(issues):
-        opened = [
-            event
-            for event in events
-            if event["kind"] == "issue_opened" and event["subjectId"] == issue["id"]
-        ]
-        resolved = [
-            event
-            for event in events
-            if event["kind"] == "issue_resolved" and event["subjectId"] == issue["id"]
-        ]
+        opened = history.subject(issue["id"], "issue_opened")
+        resolved = history.subject(issue["id"], "issue_resolved")
         if len(opened) != 1:
             raise TrialValidationError(
                 f"issues[{index}] must be backed by exactly one opening event."
@@ -1730,23 +1775,17 @@ def _validate_issue_history(
                 f"issues[{index}] maintenance finding source does not match its immutable opening event."
             )
         if issue_source is not None:
-            completions = [
-                event
-                for event in events
-                if event["kind"] == "maintenance_completed"
-                and event["actionId"] == issue_source["completionActionId"]
-            ]
-            if len(completions) != 1:
+            completion = history.action(
+                issue_source["completionActionId"], "maintenance_completed"
+            )
+            if completion is None:
                 raise TrialValidationError(
                     f"issues[{index}] maintenance finding source requires exactly one reviewed completion."
                 )
-            completion = completions[0]
-            starts = [
-                event
-                for event in events
-                if event["kind"] == "maintenance_started"
-                and event["actionId"] == completion["maintenanceStartActionId"]
-            ]
+            start_event = history.action(
+                completion["maintenanceStartActionId"], "maintenance_started"
+            )
+            starts = [start_event] if start_event is not None else []
             source_machines = [
                 machine
                 for machine in machines
@@ -1776,7 +1815,7 @@ def _validate_issue_history(
                 raise TrialValidationError(
                     f"issues[{index}] maintenance finding source does not match reviewed completion evidence."
                 )
-            if events.index(opening_event) >= events.index(completion):
+            if history.position(opening_event) >= history.position(completion):
                 raise TrialValidationError(
                     f"issues[{index}] maintenance finding problem must follow its reviewed completion."
                 )
@@ -1830,7 +1869,7 @@ def _validate_issue_history(
                 raise TrialValidationError(
                     f"issues[{index}] quality recurrence links do not match prior CAPA evidence."
                 )
-        if events.index(event) >= events.index(opened[0]):
+        if history.position(event) >= history.position(opened[0]):
             raise TrialValidationError(
                 f"issues[{index}] resolution must follow its opening event."
             )
@@ -1838,12 +1877,12 @@ def _validate_issue_history(
 
 def _validate_output_history(
     jobs: Sequence[dict[str, Any]],
-    events: Sequence[dict[str, Any]],
+    history: _ProductionEventIndex,
 ) -> None:
     shift_totals: dict[tuple[str, str], int] = {}
-    for event in events:
+    for event in history.of_kind("output_recorded"):
         shift_ref = event.get("shiftRef")
-        if event["kind"] != "output_recorded" or shift_ref is None:
+        if shift_ref is None:
             continue
         output_kind = event.get("outputKind", "good")
         shift_key = (shift_ref, output_kind)
@@ -1854,19 +1893,16 @@ def _validate_output_history(
             )
         shift_totals[shift_key] = next_total
     for index, job in enumerate(jobs):
+        outputs = history.subject(job["id"], "output_recorded")
         recorded_good = sum(
             event["quantity"]
-            for event in events
-            if event["kind"] == "output_recorded"
-            and event["subjectId"] == job["id"]
-            and event.get("outputKind", "good") == "good"
+            for event in outputs
+            if event.get("outputKind", "good") == "good"
         )
         recorded_scrap = sum(
             event["quantity"]
-            for event in events
-            if event["kind"] == "output_recorded"
-            and event["subjectId"] == job["id"]
-            and event.get("outputKind") == "scrap"
+            for event in outputs
+            if event.get("outputKind") == "scrap"
         )
         if recorded_good != job["output"]:
             raise TrialValidationError(
@@ -1880,15 +1916,13 @@ def _validate_output_history(
 
 def _validate_material_history(
     jobs: Sequence[dict[str, Any]],
-    events: Sequence[dict[str, Any]],
+    history: _ProductionEventIndex,
 ) -> None:
     totals: dict[tuple[str, str, str], int] = {}
-    for index, event in enumerate(events):
-        if event["kind"] != "material_consumed":
-            continue
+    for event in history.of_kind("material_consumed"):
         quantity_milli, _ = _material_quantity(
             event["quantity"],
-            f"events[{index}].quantity",
+            f"events[{history.position(event)}].quantity",
         )
         key = (event["shiftRef"], event["materialRef"], event["materialUnit"])
         next_total = totals.get(key, 0) + quantity_milli
@@ -1901,9 +1935,7 @@ def _validate_material_history(
     for index, job in enumerate(jobs):
         good_at_event = 0
         scrap_at_event = 0
-        for event in reversed(events):
-            if event["subjectId"] != job["id"]:
-                continue
+        for event in reversed(history.subject(job["id"])):
             if event["kind"] == "job_schedule_updated":
                 if good_at_event + scrap_at_event >= job["target"]:
                     raise TrialValidationError(
@@ -1926,26 +1958,20 @@ def _validate_material_history(
 
 def _validate_job_history(
     jobs: Sequence[dict[str, Any]],
-    events: Sequence[dict[str, Any]],
+    history: _ProductionEventIndex,
     opening_job_ids: Sequence[str] | None = None,
 ) -> None:
     if not jobs:
         raise TrialValidationError("Production must retain its initial job.")
     retained_opening_job_ids = tuple(opening_job_ids or (jobs[-1]["id"],))
     retained_opening_job_id_set = frozenset(retained_opening_job_ids)
-    created_events = [
-        event for event in events if event["kind"] == "job_created"
-    ]
+    created_events = history.of_kind("job_created")
     if len(created_events) != len(jobs) - len(retained_opening_job_ids):
         raise TrialValidationError(
             "Every job after the opening plan requires one immutable creation event."
         )
     for index, job in enumerate(jobs):
-        matches = [
-            event
-            for event in created_events
-            if event["subjectId"] == job["id"]
-        ]
+        matches = history.subject(job["id"], "job_created")
         if job["id"] in retained_opening_job_id_set:
             if matches:
                 raise TrialValidationError(
@@ -1972,12 +1998,7 @@ def _validate_job_history(
                     f"jobs[{index}] Shop demand source does not match its creation evidence."
                 )
 
-        schedule_events = [
-            event
-            for event in events
-            if event["kind"] == "job_schedule_updated"
-            and event["subjectId"] == job["id"]
-        ]
+        schedule_events = history.subject(job["id"], "job_schedule_updated")
         job_schedule_fields = _JOB_SCHEDULE_FIELDS.intersection(job)
         expected_priority: object | None = None
         expected_due_at: object | None = None
@@ -2028,7 +2049,7 @@ def _validate_job_history(
             )
             if (
                 creation_event is not None
-                and events.index(event) >= events.index(creation_event)
+                and history.position(event) >= history.position(creation_event)
             ):
                 raise TrialValidationError(
                     f"jobs[{index}] schedule update predates job creation."
@@ -2144,20 +2165,18 @@ def _validate_job_history(
 
         if creation_event is None:
             continue
-        creation_index = events.index(creation_event)
+        creation_index = history.position(creation_event)
         if any(
-            events.index(event) >= creation_index
-            for event in events
-            if event["kind"]
-            in {
+            history.position(event) >= creation_index
+            for event in history.subject(
+                job["id"],
                 "job_schedule_updated",
                 "job_closed",
                 "output_recorded",
                 "material_consumed",
                 "quality_hold_placed",
                 "quality_hold_released",
-            }
-            and event["subjectId"] == job["id"]
+            )
         ):
             raise TrialValidationError(
                 f"jobs[{index}] activity cannot predate its creation event."
@@ -2167,9 +2186,7 @@ def _validate_job_history(
             < datetime.fromisoformat(
                 creation_event["createdAt"].replace("Z", "+00:00")
             )
-            for event in events
-            if event["kind"] == "material_consumed"
-            and event["subjectId"] == job["id"]
+            for event in history.subject(job["id"], "material_consumed")
         ):
             raise TrialValidationError(
                 f"jobs[{index}] material use timestamp cannot predate its creation event."
@@ -2178,14 +2195,10 @@ def _validate_job_history(
 
 def _validate_job_closure_history(
     jobs: Sequence[dict[str, Any]],
-    events: Sequence[dict[str, Any]],
+    history: _ProductionEventIndex,
 ) -> None:
     for index, job in enumerate(jobs):
-        close_events = [
-            event
-            for event in events
-            if event["kind"] == "job_closed" and event["subjectId"] == job["id"]
-        ]
+        close_events = history.subject(job["id"], "job_closed")
         closure = job.get("closure")
         if closure is None:
             if close_events:
@@ -2218,18 +2231,18 @@ def _validate_job_closure_history(
             raise TrialValidationError(
                 f"jobs[{index}] close summary is not canonical."
             )
-        close_index = events.index(event)
+        close_index = history.position(event)
+        job_events = history.subject(job["id"])
         creation_event = next(
             (
                 candidate
-                for candidate in events
+                for candidate in job_events
                 if candidate["kind"] == "job_created"
-                and candidate["subjectId"] == job["id"]
             ),
             None,
         )
         if creation_event is not None and (
-            close_index >= events.index(creation_event)
+            close_index >= history.position(creation_event)
             or datetime.fromisoformat(event["createdAt"].replace("Z", "+00:00"))
             < datetime.fromisoformat(
                 creation_event["createdAt"].replace("Z", "+00:00")
@@ -2239,8 +2252,7 @@ def _validate_job_closure_history(
                 f"jobs[{index}] closure predates job creation."
             )
         if any(
-            event_index < close_index
-            and candidate["subjectId"] == job["id"]
+            history.position(candidate) < close_index
             and candidate["kind"]
             in {
                 "job_schedule_updated",
@@ -2248,7 +2260,7 @@ def _validate_job_closure_history(
                 "material_consumed",
                 "quality_hold_placed",
             }
-            for event_index, candidate in enumerate(events)
+            for candidate in job_events
         ):
             raise TrialValidationError(
                 f"jobs[{index}] has scheduling, output, material use, or a new "
@@ -2256,27 +2268,25 @@ def _validate_job_closure_history(
             )
         closed_at = datetime.fromisoformat(event["createdAt"].replace("Z", "+00:00"))
         if any(
-            event_index < close_index
-            and candidate["subjectId"] == job["id"]
+            history.position(candidate) < close_index
             and datetime.fromisoformat(
                 candidate["createdAt"].replace("Z", "+00:00")
             )
             < closed_at
-            for event_index, candidate in enumerate(events)
+            for candidate in job_events
         ):
             raise TrialValidationError(
                 f"jobs[{index}] activity appended after closure predates the "
                 "close timestamp."
             )
         if any(
-            event_index > close_index
-            and candidate["subjectId"] == job["id"]
+            history.position(candidate) > close_index
             and candidate["kind"] != "job_created"
             and datetime.fromisoformat(
                 candidate["createdAt"].replace("Z", "+00:00")
             )
             > closed_at
-            for event_index, candidate in enumerate(events)
+            for candidate in job_events
         ):
             raise TrialValidationError(
                 f"jobs[{index}] closure timestamp contradicts earlier activity."
@@ -2285,25 +2295,13 @@ def _validate_job_closure_history(
 
 def _validate_quality_hold_history(
     jobs: Sequence[dict[str, Any]],
-    events: Sequence[dict[str, Any]],
+    history: _ProductionEventIndex,
 ) -> None:
     for index, job in enumerate(jobs):
-        newest_first = [
-            event
-            for event in events
-            if event["kind"]
-            in {"quality_hold_placed", "quality_hold_released"}
-            and event["subjectId"] == job["id"]
-        ]
-        creation_event = next(
-            (
-                event
-                for event in events
-                if event["kind"] == "job_created"
-                and event["subjectId"] == job["id"]
-            ),
-            None,
+        newest_first = history.subject(
+            job["id"], "quality_hold_placed", "quality_hold_released"
         )
+        creation_event = next(iter(history.subject(job["id"], "job_created")), None)
         if creation_event is not None and any(
             datetime.fromisoformat(
                 event["createdAt"].replace("Z", "+00:00")
@@ -2376,15 +2374,10 @@ def _validate_quality_hold_history(
 
 def _validate_machine_history(
     machines: Sequence[dict[str, Any]],
-    events: Sequence[dict[str, Any]],
+    history: _ProductionEventIndex,
 ) -> None:
     for index, machine in enumerate(machines):
-        commissioning_events = [
-            event
-            for event in events
-            if event["kind"] == "equipment_commissioned"
-            and event["subjectId"] == machine["id"]
-        ]
+        commissioning_events = history.subject(machine["id"], "equipment_commissioned")
         if len(commissioning_events) > 1:
             raise TrialValidationError(
                 f"machines[{index}] has duplicate commissioning history."
@@ -2395,12 +2388,7 @@ def _validate_machine_history(
             if commissioning_event is not None
             else "running"
         )
-        newest_first = [
-            event
-            for event in events
-            if event["kind"] == "machine_state_changed"
-            and event["subjectId"] == machine["id"]
-        ]
+        newest_first = history.subject(machine["id"], "machine_state_changed")
         if not newest_first:
             if machine["state"] != initial_state:
                 raise TrialValidationError(
@@ -2433,15 +2421,12 @@ def _validate_machine_history(
 
 def _validate_downtime_history(
     machines: Sequence[dict[str, Any]],
-    events: Sequence[dict[str, Any]],
+    history: _ProductionEventIndex,
 ) -> None:
     for index, machine in enumerate(machines):
-        newest_first = [
-            event
-            for event in events
-            if event["kind"] in {"downtime_started", "downtime_ended"}
-            and event["subjectId"] == machine["id"]
-        ]
+        newest_first = history.subject(
+            machine["id"], "downtime_started", "downtime_ended"
+        )
         active_start: dict[str, Any] | None = None
         previous_activity_at: datetime | None = None
         for event in reversed(newest_first):
@@ -2484,15 +2469,12 @@ def _validate_downtime_history(
 
 def _validate_maintenance_history(
     machines: Sequence[dict[str, Any]],
-    events: Sequence[dict[str, Any]],
+    history: _ProductionEventIndex,
 ) -> None:
     for index, machine in enumerate(machines):
-        newest_first = [
-            event
-            for event in events
-            if event["kind"] in {"maintenance_started", "maintenance_completed"}
-            and event["subjectId"] == machine["id"]
-        ]
+        newest_first = history.subject(
+            machine["id"], "maintenance_started", "maintenance_completed"
+        )
         active_start: dict[str, Any] | None = None
         previous_activity_at: datetime | None = None
         for event in reversed(newest_first):
@@ -2551,11 +2533,9 @@ def _validate_maintenance_history(
 def _validate_equipment_import_history(
     equipment_master: Mapping[str, Any] | None,
     machines: Sequence[dict[str, Any]],
-    events: Sequence[dict[str, Any]],
+    history: _ProductionEventIndex,
 ) -> None:
-    import_events = [
-        event for event in events if event["kind"] == "equipment_master_imported"
-    ]
+    import_events = history.of_kind("equipment_master_imported")
     assets = equipment_master["assets"] if equipment_master is not None else []
     if not assets:
         if import_events:
@@ -2608,21 +2588,15 @@ def _validate_equipment_import_history(
 def _validate_equipment_commissioning_history(
     equipment_master: Mapping[str, Any] | None,
     machines: Sequence[dict[str, Any]],
-    events: Sequence[dict[str, Any]],
+    history: _ProductionEventIndex,
     opening_plan: Mapping[str, Any] | None,
 ) -> None:
     assets = equipment_master["assets"] if equipment_master is not None else []
     machine_by_id = {machine["id"]: machine for machine in machines}
-    commission_events = [
-        event for event in events if event["kind"] == "equipment_commissioned"
-    ]
+    commission_events = history.of_kind("equipment_commissioned")
     commissioned_ids: set[str] = set()
     for asset in assets:
-        matches = [
-            event
-            for event in commission_events
-            if event["subjectId"] == asset["id"]
-        ]
+        matches = history.subject(asset["id"], "equipment_commissioned")
         machine = machine_by_id.get(asset["id"])
         if asset["commissioningStatus"] == "not_commissioned":
             if matches or machine is not None:
@@ -2655,20 +2629,15 @@ def _validate_equipment_commissioning_history(
         commissioned_at = _timestamp(
             event["createdAt"], "equipment commissioning createdAt"
         )
-        later_lifecycle = [
-            candidate
-            for candidate in events
-            if candidate["subjectId"] == asset["id"]
-            and candidate["kind"]
-            in {
-                "machine_state_changed",
-                "downtime_started",
-                "downtime_ended",
-                "maintenance_started",
-                "maintenance_completed",
-                "equipment_maintenance_strategy_saved",
-            }
-        ]
+        later_lifecycle = history.subject(
+            asset["id"],
+            "machine_state_changed",
+            "downtime_started",
+            "downtime_ended",
+            "maintenance_started",
+            "maintenance_completed",
+            "equipment_maintenance_strategy_saved",
+        )
         if any(
             _timestamp(candidate["createdAt"], "equipment lifecycle createdAt")
             < commissioned_at
@@ -2695,39 +2664,27 @@ def _validate_equipment_commissioning_history(
 
 def _validate_equipment_maintenance_strategy_history(
     equipment_master: Mapping[str, Any] | None,
-    events: Sequence[dict[str, Any]],
+    history: _ProductionEventIndex,
 ) -> None:
     assets = equipment_master["assets"] if equipment_master is not None else []
-    strategy_events = [
-        event
-        for event in events
-        if event["kind"] == "equipment_maintenance_strategy_saved"
-    ]
-    maintenance_events = [
-        event
-        for event in events
-        if event["kind"] in {"maintenance_started", "maintenance_completed"}
-    ]
+    strategy_events = history.of_kind("equipment_maintenance_strategy_saved")
     retained_events = 0
     for asset in assets:
-        matches = [
-            event for event in strategy_events if event["subjectId"] == asset["id"]
-        ]
-        asset_maintenance_events = [
-            event for event in maintenance_events if event["subjectId"] == asset["id"]
-        ]
+        matches = history.subject(asset["id"], "equipment_maintenance_strategy_saved")
+        asset_maintenance_events = history.subject(
+            asset["id"], "maintenance_started", "maintenance_completed"
+        )
         for maintenance_event in asset_maintenance_events:
-            maintenance_at = _parsed_timestamp(
-                maintenance_event["createdAt"], "maintenance execution createdAt"
-            )[1]
+            maintenance_at = history.created_at(
+                maintenance_event, "maintenance execution createdAt"
+            )
             applicable_strategy = next(
                 (
                     strategy_event
                     for strategy_event in matches
-                    if _parsed_timestamp(
-                        strategy_event["createdAt"],
-                        "maintenance strategy createdAt",
-                    )[1]
+                    if history.created_at(
+                        strategy_event, "maintenance strategy createdAt"
+                    )
                     <= maintenance_at
                 ),
                 None,
@@ -2941,35 +2898,39 @@ def validate_production_state(value: object) -> dict[str, Any]:
         raise TrialValidationError(
             "Production revision must equal the append-only event count."
         )
-    for index, event in enumerate(events):
-        if event["kind"] != "shift_closed":
-            continue
+    history = _ProductionEventIndex(events)
+    for event in history.of_kind("shift_closed"):
+        index = history.position(event)
         if event["sourceRevision"] != len(events) - index - 1:
             raise TrialValidationError(
                 f"events[{index}] shift close source revision does not match its append position."
             )
     _validate_job_history(
         jobs,
-        events,
+        history,
         opening_plan["jobIds"] if opening_plan is not None else None,
     )
-    _validate_job_closure_history(jobs, events)
-    _validate_output_history(jobs, events)
-    _validate_material_history(jobs, events)
-    _validate_quality_hold_history(jobs, events)
-    _validate_issue_history(issues, events, machines)
-    _validate_machine_history(machines, events)
-    _validate_downtime_history(machines, events)
-    _validate_maintenance_history(machines, events)
-    _validate_equipment_import_history(equipment_master, machines, events)
+    _validate_job_closure_history(jobs, history)
+    _validate_output_history(jobs, history)
+    _validate_material_history(jobs, history)
+    _validate_quality_hold_history(jobs, history)
+    _validate_issue_history(issues, history, machines)
+    _validate_machine_history(machines, history)
+    _validate_downtime_history(machines, history)
+    _validate_maintenance_history(machines, history)
+    _validate_equipment_import_history(equipment_master, machines, history)
     _validate_equipment_commissioning_history(
         equipment_master,
         machines,
-        events,
+        history,
         opening_plan,
     )
-    _validate_equipment_maintenance_strategy_history(equipment_master, events)
-    return deepcopy(state)
+    _validate_equipment_maintenance_strategy_history(equipment_master, history)
+    return copy_json_tree(state)
+
+
+def _validated_production_state(value: object) -> dict[str, Any]:
+    return validated_state("production", value, validate_production_state)
 
 
 def project_production_maintenance_due_queue(
@@ -2978,13 +2939,14 @@ def project_production_maintenance_due_queue(
 ) -> dict[str, Any]:
     """Project reviewed preventive-maintenance due work without dispatching it."""
 
-    state = validate_production_state(value)
+    state = _validated_production_state(value)
     as_of_value = _maintenance_timestamp(as_of, "maintenance due queue asOf")
     as_of_time = datetime.fromisoformat(as_of_value.replace("Z", "+00:00"))
     criticality_rank = {"critical": 0, "high": 1, "medium": 2, "low": 3}
     items: list[dict[str, Any]] = []
     equipment_master = state.get("equipmentMaster")
     assets = equipment_master["assets"] if equipment_master is not None else []
+    history = _ProductionEventIndex(state["events"])
     for asset in assets:
         strategy = asset.get("maintenanceStrategy")
         if asset["commissioningStatus"] != "commissioned" or strategy is None:
@@ -2994,10 +2956,8 @@ def project_production_maintenance_due_queue(
         latest_completion = next(
             (
                 event
-                for event in state["events"]
-                if event["kind"] == "maintenance_completed"
-                and event["subjectId"] == asset["id"]
-                and event.get("maintenanceStrategyActionId") == strategy["actionId"]
+                for event in history.subject(asset["id"], "maintenance_completed")
+                if event.get("maintenanceStrategyActionId") == strategy["actionId"]
             ),
             None,
         )
@@ -3837,7 +3797,7 @@ def _reduce_equipment_master_import(
         raise TrialValidationError(
             "Equipment master import must contain exactly equipment and evidence."
         )
-    current_state = validate_production_state(current)
+    current_state = _validated_production_state(current)
     evidence = _evidence(payload.get("evidence"))
     if evidence["reason"] != "Imported reviewed Plant equipment master":
         raise TrialValidationError("Equipment master import reason is not canonical.")
@@ -3930,7 +3890,7 @@ def _reduce_equipment_commission(
             "Equipment commissioning must contain exactly one asset, installation, "
             "initial observation, safety baseline, and evidence."
         )
-    current_state = validate_production_state(current)
+    current_state = _validated_production_state(current)
     evidence = _evidence(payload.get("evidence"))
     if evidence["reason"] != "Commissioned reviewed Plant equipment":
         raise TrialValidationError("Equipment commissioning reason is not canonical.")
@@ -4033,7 +3993,7 @@ def _reduce_equipment_maintenance_strategy(
             "Equipment maintenance strategy must contain exactly one asset, owner, "
             "interval, next due time, procedure, safety baseline, and evidence."
         )
-    current_state = validate_production_state(current)
+    current_state = _validated_production_state(current)
     evidence = _evidence(payload.get("evidence"))
     if evidence["reason"] != "Saved reviewed preventive maintenance strategy":
         raise TrialValidationError(
@@ -4374,7 +4334,7 @@ def create_production_job_from_intent(
 ) -> dict[str, Any]:
     """Create one scheduled Plant job from a narrow server-owned intent."""
 
-    current = validate_production_state(current_value)
+    current = _validated_production_state(current_value)
     intent = _object(intent_value, "production job intent")
     _exact_fields(
         intent,
@@ -4452,8 +4412,8 @@ def require_shop_demand_source_current(
 ) -> None:
     """Reject a Plant job when its immutable Shop demand snapshot is stale."""
 
-    production = validate_production_state(production_value)
-    commerce = validate_commerce_state(commerce_value)
+    production = _validated_production_state(production_value)
+    commerce = validated_state("commerce", commerce_value, validate_commerce_state)
     source = _shop_demand_source(source_value, "production job intent.shopDemandSource")
     snapshot = source["snapshot"]
     matches = [item for item in commerce["items"] if item["sku"] == snapshot["sku"]]
@@ -4605,13 +4565,14 @@ def reduce_production_state(
                 )
         return next_state
 
-    current_state = validate_production_state(current)
+    current_state = _validated_production_state(current)
     if current_state.get("openingPlan") != next_state.get("openingPlan"):
         raise TrialValidationError(
             "Production opening plan evidence is immutable after initialization."
         )
     if event_type == "production.order_execution.recorded":
         _validate_order_execution_recorded(current_state, next_state, evidence)
+        remember_validated_state("production", next_state)
         return next_state
     if (
         current_state.get("orderExecution") != next_state.get("orderExecution")
@@ -4627,6 +4588,7 @@ def reduce_production_state(
         evidence=evidence,
     )
     _TRANSITION_VALIDATORS[event_type](current_state, next_state, event)
+    remember_validated_state("production", next_state)
     return next_state
 
 
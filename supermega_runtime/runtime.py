@@ -6,7 +6,8 @@ trial gate is configured. No legacy client runtime is imported here.
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
 from copy import deepcopy
 from datetime import datetime
 from datetime import timezone
@@ -33,13 +34,14 @@ from supermega_runtime.order_intake_provider import (
 from supermega_runtime.production_runtime import reduce_production_state
 from supermega_runtime.activation_email import send_self_serve_welcome_email
 from supermega_runtime.supabase_auth import SupabaseAuthConfig, verify_supabase_user_identity
-from supermega_runtime.telemetry.tracing import instrument_app as instrument_telemetry
+from supermega_runtime.telemetry.tracing import flush_tracing, instrument_app as instrument_telemetry
 from supermega_runtime.trial_runtime import TrialSignupSession, create_trial_router
 from supermega_runtime.trial_store import (
     PostgresTrialStore,
     TrialNotReadyError,
     TrialPrincipal,
     TrialValidationError,
+    max_state_bytes,
 )
 from supermega_runtime.website_runtime import reduce_website_state
 
@@ -56,6 +58,10 @@ _MIN_IDENTITY_SECRET_BYTES = 32
 _MIN_IDENTITY_SECRET_DISTINCT_BYTES = 10
 _DEFAULT_CORS_ORIGINS = "https://app.supermega.dev,https://supermega.dev,https://www.supermega.dev"
 _MAX_CORS_ORIGINS = 16
+# Warm serverless instances keep a few verified trial-store connections open;
+# 0 disables pooling and restores one connection per request.
+_DEFAULT_TRIAL_POOL_SIZE = 4
+_MAX_TRIAL_POOL_SIZE = 32
 _MAX_CORS_CONFIGURATION_BYTES = 8 * 1024
 _MAX_CORS_ORIGIN_BYTES = 512
 _DNS_LABEL = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?$")
@@ -143,6 +149,17 @@ def _flag(name: str, *, default: bool = False) -> bool:
     return value.casefold() in {"1", "true", "yes", "on"}
 
 
+def _bounded_int(name: str, *, default: int, maximum: int) -> int:
+    value = _text(os.getenv(name))
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        return default
+    return min(max(parsed, 0), maximum)
+
+
 def _identity_secret_ready(value: object) -> bool:
     """Apply a bounded fail-closed check to the gateway HMAC key material."""
 
@@ -263,8 +280,9 @@ def reduce_trial_state(
         encoded = json.dumps(state, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
     except (TypeError, ValueError) as exc:
         raise TrialValidationError("state must be valid JSON.") from exc
-    if len(encoded) > 64 * 1024:
-        raise TrialValidationError("state exceeds the 64 KiB trial limit.")
+    limit = max_state_bytes(surface)
+    if len(encoded) > limit:
+        raise TrialValidationError(f"state exceeds the {limit // 1024} KiB trial limit.")
     return deepcopy(state)
 
 
@@ -1004,17 +1022,34 @@ def create_app() -> FastAPI:
         database_url,
         reducer=reduce_trial_state,
         write_enabled=_flag("SUPERMEGA_TRIAL_WRITES_ENABLED"),
+        pool_size=_bounded_int("SUPERMEGA_TRIAL_POOL_SIZE", default=_DEFAULT_TRIAL_POOL_SIZE, maximum=_MAX_TRIAL_POOL_SIZE),
     )
     try:
         order_intake_provider = order_intake_provider_from_environment()
     except OrderIntakeProviderError:
         order_intake_provider = None
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            # Close pooled trial connections instead of dropping them at exit or reload.
+            store.close()
+            # The order intake budget pool and provider keep-alive sockets too.
+            close_provider = getattr(order_intake_provider, "close", None)
+            if callable(close_provider):
+                close_provider()
+            # Export queued spans while the exporter's output is still open.
+            flush_tracing()
+
     app = FastAPI(
         title="SuperMega Service",
         version=SERVICE_VERSION,
         docs_url=None,
         redoc_url=None,
         openapi_url=None,
+        lifespan=lifespan,
     )
     origins = _cors_origins(os.getenv("SUPERMEGA_CORS_ORIGINS"))
     app.add_middleware(
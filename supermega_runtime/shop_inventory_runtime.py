@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from copy import deepcopy
 from datetime import datetime
 from hashlib import sha256
 import json
 import re
+from threading import RLock
+from types import MappingProxyType
 import unicodedata
 from typing import Any, Mapping, Sequence
 
@@ -24,12 +27,16 @@ _MAX_SAFE_INTEGER = 9_007_199_254_740_991
 _PRODUCTION_MATERIAL_UNITS = frozenset(
     {"kg", "g", "l", "ml", "pcs", "pack", "bag", "roll", "sheet", "m", "cm"}
 )
+# Verified logs are checkpointed by (headDigest, revision, catalog). A later
+# state whose prefix equals a checkpoint only verifies and projects its new
+# envelopes; the lookback bounds how many trailing envelopes are probed.
+SHOP_INVENTORY_CHECKPOINT_LIMIT = 64
+_CHECKPOINT_LOOKBACK = 16
 
 
 class ShopInventoryValidationError(ValueError):
     """Raised when location inventory evidence is malformed or inconsistent."""
 
-
 def _object(value: object, field: str) -> dict[str, Any]:
     if not isinstance(value, Mapping):
         raise ShopInventoryValidationError(f"{field} must be an object.")
@@ -110,14 +117,27 @@ def _timestamp(value: object, field: str) -> tuple[str, datetime]:
     return candidate, parsed
 
 
-def _canonical_digest(value: object) -> str:
-    encoded = json.dumps(
+def _copy_json(value: Any) -> Any:
+    """Copy canonical JSON data; much cheaper than deepcopy for long command logs."""
+
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _canonical_json(value: object) -> bytes:
+    return json.dumps(
         value,
         ensure_ascii=False,
         separators=(",", ":"),
         sort_keys=True,
     ).encode("utf-8")
-    return f"sha256:{sha256(encoded).hexdigest()}"
+
+
+def _canonical_digest(value: object) -> str:
+    return f"sha256:{sha256(_canonical_json(value)).hexdigest()}"
 
 
 def shop_inventory_catalog_digest(catalog_skus: Sequence[str]) -> str:
@@ -1124,19 +1144,64 @@ def _plan_order_return_allocations(
     )
 
 
-def _project(commands: list[dict[str, Any]]) -> dict[str, Any]:
-    clients: dict[str, dict[str, str]] = {}
-    vendors: dict[str, dict[str, str]] = {}
-    supplier_policies: dict[tuple[str, str], dict[str, Any]] = {}
-    locations: set[str] = set()
-    units: dict[str, dict[str, str]] = {}
-    balances: dict[tuple[str, str], dict[str, int]] = {}
-    reservations: dict[str, dict[str, Any]] = {}
-    returned_by_reservation: dict[str, int] = {}
-    production_issues: dict[str, dict[str, Any]] = {}
-    production_returned_by_issue: dict[str, dict[str, int]] = {}
-    production_returned_by_allocation: dict[tuple[str, str, str], int] = {}
-    import_count = 0
+def _new_ledger() -> dict[str, Any]:
+    return {
+        "clients": {},
+        "vendors": {},
+        "supplierPolicies": {},
+        "locations": set(),
+        "units": {},
+        "balances": {},
+        "reservations": {},
+        "returnedByReservation": {},
+        "productionIssues": {},
+        "productionReturnedByIssue": {},
+        "productionReturnedByAllocation": {},
+        "importCount": 0,
+    }
+
+
+def _copy_ledger(ledger: Mapping[str, Any]) -> dict[str, Any]:
+    """Copy a checkpointed ledger so applying new commands never mutates it.
+
+    Only balances and reservations are updated in place by the projection; every
+    other row is replaced wholesale, so a shallow copy of those maps is enough.
+    """
+
+    copied = {
+        key: value.copy() if isinstance(value, (dict, set)) else value
+        for key, value in ledger.items()
+    }
+    copied["balances"] = {
+        key: dict(balance) for key, balance in ledger["balances"].items()
+    }
+    copied["reservations"] = {
+        key: dict(reservation) for key, reservation in ledger["reservations"].items()
+    }
+    return copied
+
+
+def _apply_commands(
+    ledger: dict[str, Any], commands: Sequence[dict[str, Any]], start: int = 0
+) -> None:
+    """Apply command payloads, numbered from ``start``, to a projection ledger."""
+
+    clients: dict[str, dict[str, str]] = ledger["clients"]
+    vendors: dict[str, dict[str, str]] = ledger["vendors"]
+    supplier_policies: dict[tuple[str, str], dict[str, Any]] = ledger["supplierPolicies"]
+    locations: set[str] = ledger["locations"]
+    units: dict[str, dict[str, str]] = ledger["units"]
+    balances: dict[tuple[str, str], dict[str, int]] = ledger["balances"]
+    reservations: dict[str, dict[str, Any]] = ledger["reservations"]
+    returned_by_reservation: dict[str, int] = ledger["returnedByReservation"]
+    production_issues: dict[str, dict[str, Any]] = ledger["productionIssues"]
+    production_returned_by_issue: dict[str, dict[str, int]] = ledger[
+        "productionReturnedByIssue"
+    ]
+    production_returned_by_allocation: dict[tuple[str, str, str], int] = ledger[
+        "productionReturnedByAllocation"
+    ]
+    import_count: int = ledger["importCount"]
 
     def current_balance(stock_unit_id: str, location_id: str) -> dict[str, int]:
         return balances.setdefault(
@@ -1168,7 +1233,7 @@ def _project(commands: list[dict[str, Any]]) -> dict[str, Any]:
         balance["onHand"] = on_hand
         balance["reserved"] = reserved
 
-    for index, command in enumerate(commands):
+    for index, command in enumerate(commands, start):
         field = f"commands[{index}].payload"
         if index == 0 and command["kind"] != "import":
             raise ShopInventoryValidationError("the first command must be an import.")
@@ -1578,6 +1643,15 @@ def _project(commands: list[dict[str, Any]]) -> dict[str, Any]:
         raise ShopInventoryValidationError("inventory command kind cannot be projected.")
     if commands and import_count != 1:
         raise ShopInventoryValidationError("inventory history lacks its opening import.")
+    ledger["importCount"] = import_count
+
+
+def _ledger_projection(ledger: Mapping[str, Any]) -> dict[str, Any]:
+    clients: dict[str, dict[str, str]] = ledger["clients"]
+    vendors: dict[str, dict[str, str]] = ledger["vendors"]
+    supplier_policies: dict[tuple[str, str], dict[str, Any]] = ledger["supplierPolicies"]
+    units: dict[str, dict[str, str]] = ledger["units"]
+    balances: dict[tuple[str, str], dict[str, int]] = ledger["balances"]
     sku_totals: dict[str, int] = {}
     sku_available: dict[str, int] = {}
     for (unit_id, _location_id), balance in balances.items():
@@ -1599,17 +1673,229 @@ def _project(commands: list[dict[str, Any]]) -> dict[str, Any]:
             sku: value for sku, value in sku_available.items() if value > 0
         },
         "balances": balances,
-        "reservations": reservations,
+        "reservations": ledger["reservations"],
         "units": units,
     }
 
 
-def validate_shop_inventory_state(
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class ShopInventoryView:
+    """Read-only projections of one verified inventory state.
+
+    A view is built once per (headDigest, revision, catalog) and doubles as the
+    checkpoint later states resume verification from. Projections are computed
+    on first use and returned as read-only mappings and tuples; command payloads
+    are only handed out as copies.
+    """
+
+    __slots__ = (
+        "revision",
+        "head_digest",
+        "_commands",
+        "_command_ids",
+        "_action_ids",
+        "_captured_at",
+        "_ledger",
+        "_projections",
+        "_encoded_commands",
+    )
+
+    def __init__(
+        self,
+        *,
+        commands: tuple[dict[str, Any], ...],
+        command_ids: frozenset[str],
+        action_ids: frozenset[str],
+        captured_at: datetime | None,
+        ledger: dict[str, Any],
+    ) -> None:
+        self.revision = len(commands)
+        self.head_digest = commands[-1]["digest"] if commands else EMPTY_SHOP_INVENTORY_DIGEST
+        self._commands = commands
+        self._command_ids = command_ids
+        self._action_ids = action_ids
+        self._captured_at = captured_at
+        self._ledger = ledger
+        self._projections: dict[str, Any] = {}
+        self._encoded_commands: tuple[bytes, ...] | None = None
+
+    def _canonical_commands(self) -> tuple[bytes, ...]:
+        if self._encoded_commands is None:
+            self._encoded_commands = tuple(
+                _canonical_json(command) for command in self._commands
+            )
+        return self._encoded_commands
+
+    def _projection(self, name: str) -> Any:
+        cached = self._projections.get(name)
+        if cached is None:
+            if "base" not in self._projections:
+                self._projections["base"] = _ledger_projection(self._ledger)
+            base = self._projections["base"]
+            if name == "balances":
+                cached = _freeze(_balance_rows(base))
+            elif name == "availableBalances":
+                cached = _freeze(_available_balance_rows(base))
+            else:
+                cached = _freeze(base[name])
+            self._projections[name] = cached
+        return cached
+
+    @property
+    def sku_totals(self) -> Mapping[str, int]:
+        return self._projection("skuTotals")
+
+    @property
+    def sku_available_to_promise(self) -> Mapping[str, int]:
+        return self._projection("skuAvailableToPromise")
+
+    @property
+    def clients(self) -> tuple[Mapping[str, str], ...]:
+        return self._projection("clients")
+
+    @property
+    def vendors(self) -> tuple[Mapping[str, str], ...]:
+        return self._projection("vendors")
+
+    @property
+    def supplier_policies(self) -> tuple[Mapping[str, Any], ...]:
+        return self._projection("supplierPolicies")
+
+    @property
+    def balances(self) -> tuple[Mapping[str, Any], ...]:
+        return self._projection("balances")
+
+    @property
+    def available_balances(self) -> tuple[Mapping[str, Any], ...]:
+        return self._projection("availableBalances")
+
+    def has_command(self, command_id: str) -> bool:
+        return command_id in self._command_ids
+
+    def extends(self, previous: ShopInventoryView, *, kind: str | None = None) -> bool:
+        """Return whether this state appends exactly one command to ``previous``."""
+
+        return (
+            self.revision == previous.revision + 1
+            and self._commands[:-1] == previous._commands
+            and (kind is None or self._commands[-1]["payload"]["kind"] == kind)
+        )
+
+    def latest_payload(self) -> dict[str, Any]:
+        if not self._commands:
+            raise ShopInventoryValidationError("inventory command is missing.")
+        return _copy_json(self._commands[-1]["payload"])
+
+    def payloads(self, kind: str) -> list[dict[str, Any]]:
+        return [
+            _copy_json(command["payload"])
+            for command in self._commands
+            if command["payload"]["kind"] == kind
+        ]
+
+    def state(self) -> dict[str, Any]:
+        return _copy_json(
+            {
+                "schema": SHOP_INVENTORY_SCHEMA,
+                "revision": self.revision,
+                "headDigest": self.head_digest,
+                "commands": list(self._commands),
+            }
+        )
+
+
+_CHECKPOINT_LOCK = RLock()
+_CHECKPOINTS: OrderedDict[tuple[str, int, tuple[str, ...]], ShopInventoryView] = (
+    OrderedDict()
+)
+
+
+def _same_canonical_commands(
+    raw_commands: list[Any], verified: tuple[bytes, ...]
+) -> bool:
+    try:
+        return all(
+            _canonical_json(raw) == encoded
+            for raw, encoded in zip(raw_commands, verified, strict=True)
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def _trusted_prefix(
+    raw_commands: list[Any], catalog: tuple[str, ...]
+) -> ShopInventoryView | None:
+    """Return the longest checkpoint that the submitted log extends unchanged."""
+
+    with _CHECKPOINT_LOCK:
+        for length in range(
+            len(raw_commands), max(0, len(raw_commands) - _CHECKPOINT_LOOKBACK), -1
+        ):
+            envelope = raw_commands[length - 1]
+            digest = envelope.get("digest") if isinstance(envelope, Mapping) else None
+            if not isinstance(digest, str):
+                continue
+            key = (digest, length, catalog)
+            checkpoint = _CHECKPOINTS.get(key)
+            if checkpoint is None:
+                continue
+            # The digest only names the prefix; the submitted envelopes must still
+            # encode exactly like the verified ones before their checks can be
+            # skipped. Plain equality would accept True or 1.0 for 1.
+            if not _same_canonical_commands(
+                raw_commands[:length], checkpoint._canonical_commands()
+            ):
+                return None
+            _CHECKPOINTS.move_to_end(key)
+            return checkpoint
+    return None
+
+
+def _remember_checkpoint(catalog: tuple[str, ...], checkpoint: ShopInventoryView) -> None:
+    if not checkpoint.revision:
+        return
+    key = (checkpoint.head_digest, checkpoint.revision, catalog)
+    with _CHECKPOINT_LOCK:
+        _CHECKPOINTS[key] = checkpoint
+        _CHECKPOINTS.move_to_end(key)
+        while len(_CHECKPOINTS) > SHOP_INVENTORY_CHECKPOINT_LIMIT:
+            _CHECKPOINTS.popitem(last=False)
+
+
+def clear_shop_inventory_checkpoints() -> None:
+    with _CHECKPOINT_LOCK:
+        _CHECKPOINTS.clear()
+
+
+def shop_inventory_view(
     value: object,
     catalog_skus: Sequence[str],
     *,
     require_current_catalog_digest: bool = False,
-) -> dict[str, Any]:
+    full_verification: bool = False,
+) -> ShopInventoryView:
+    """Verify an inventory log and return its shared read-only view.
+
+    Verification resumes from the longest checkpoint the log extends unchanged.
+    ``full_verification`` ignores checkpoints and re-verifies every envelope,
+    digest and projection step; audits use it to recheck a stored log end to end.
+    """
+
     trusted_catalog = sorted({_text(sku, "catalog sku", 80) for sku in catalog_skus})
     if not trusted_catalog:
         raise ShopInventoryValidationError("catalog skus cannot be empty.")
@@ -1621,12 +1907,22 @@ def validate_shop_inventory_state(
     raw_commands = _list(state["commands"], "inventory state.commands", 0, 2_000)
     if revision != len(raw_commands):
         raise ShopInventoryValidationError("inventory revision does not match command count.")
+    catalog_key = tuple(trusted_catalog)
+    checkpoint = None if full_verification else _trusted_prefix(raw_commands, catalog_key)
     commands: list[dict[str, Any]] = []
     command_ids: set[str] = set()
     action_ids: set[str] = set()
     previous_digest = EMPTY_SHOP_INVENTORY_DIGEST
     previous_timestamp: datetime | None = None
-    for index, candidate in enumerate(raw_commands):
+    if checkpoint is not None:
+        commands = list(checkpoint._commands)
+        command_ids = set(checkpoint._command_ids)
+        action_ids = set(checkpoint._action_ids)
+        previous_digest = checkpoint.head_digest
+        previous_timestamp = checkpoint._captured_at
+    start = len(commands)
+    for index in range(start, len(raw_commands)):
+        candidate = raw_commands[index]
         field = f"inventory state.commands[{index}]"
         envelope = _exact(
             candidate, field, {"sequence", "previousDigest", "payload", "digest"}
@@ -1665,15 +1961,34 @@ def validate_shop_inventory_state(
         package_digest = commands[0]["payload"]["package"]["catalogSkuDigest"]
         if package_digest != shop_inventory_catalog_digest(trusted_catalog):
             raise ShopInventoryValidationError("inventory opening catalog identity is stale.")
-    _project([command["payload"] for command in commands])
-    return deepcopy(
-        {
-            "schema": SHOP_INVENTORY_SCHEMA,
-            "revision": revision,
-            "headDigest": head_digest,
-            "commands": commands,
-        }
+    if checkpoint is not None and start == len(commands):
+        return checkpoint
+    ledger = _new_ledger() if checkpoint is None else _copy_ledger(checkpoint._ledger)
+    _apply_commands(ledger, [command["payload"] for command in commands[start:]], start)
+    view = ShopInventoryView(
+        commands=tuple(commands),
+        command_ids=frozenset(command_ids),
+        action_ids=frozenset(action_ids),
+        captured_at=previous_timestamp,
+        ledger=ledger,
     )
+    _remember_checkpoint(catalog_key, view)
+    return view
+
+
+def validate_shop_inventory_state(
+    value: object,
+    catalog_skus: Sequence[str],
+    *,
+    require_current_catalog_digest: bool = False,
+    full_verification: bool = False,
+) -> dict[str, Any]:
+    return shop_inventory_view(
+        value,
+        catalog_skus,
+        require_current_catalog_digest=require_current_catalog_digest,
+        full_verification=full_verification,
+    ).state()
 
 
 def reserve_shop_inventory_order(
@@ -1690,7 +2005,7 @@ def reserve_shop_inventory_order(
     trusted_catalog = sorted({_text(sku, "catalog sku", 80) for sku in catalog_skus})
     if len(trusted_catalog) != len(catalog_skus):
         raise ShopInventoryValidationError("catalog skus contain duplicates.")
-    current = validate_shop_inventory_state(value, trusted_catalog)
+    current = shop_inventory_view(value, trusted_catalog)
     canonical_order_id = _text(order_id, "order reservation.orderId", 160)
     canonical_customer = _text(
         customer_reference,
@@ -1720,27 +2035,23 @@ def reserve_shop_inventory_order(
         raise ShopInventoryValidationError("order reservation line SKUs are duplicated.")
 
     command_id = _order_inventory_command_id("ORS", canonical_order_id)
-    if any(command["payload"]["id"] == command_id for command in current["commands"]):
+    if current.has_command(command_id):
         raise ShopInventoryValidationError(
             "the order location reservation is already recorded."
         )
 
-    projection = _project([command["payload"] for command in current["commands"]])
     allocations: list[dict[str, Any]] = []
     for line in canonical_lines:
         remaining = line["quantity"]
-        candidates: list[dict[str, Any]] = []
-        for (stock_unit_id, location_id), balance in projection["balances"].items():
-            unit = projection["units"][stock_unit_id]
-            available = balance["onHand"] - balance["reserved"]
-            if unit["sku"] == line["sku"] and available > 0:
-                candidates.append(
-                    {
-                        "stockUnitId": stock_unit_id,
-                        "locationId": location_id,
-                        "available": available,
-                    }
-                )
+        candidates = [
+            {
+                "stockUnitId": balance["stockUnitId"],
+                "locationId": balance["locationId"],
+                "available": balance["availableToPromise"],
+            }
+            for balance in current.available_balances
+            if balance["sku"] == line["sku"]
+        ]
         candidates.sort(
             key=lambda row: (
                 -row["available"],
@@ -1789,8 +2100,8 @@ def reserve_shop_inventory_order(
         trusted_catalog,
     )
     body = {
-        "sequence": current["revision"] + 1,
-        "previousDigest": current["headDigest"],
+        "sequence": current.revision + 1,
+        "previousDigest": current.head_digest,
         "payload": payload,
     }
     envelope = {**body, "digest": _canonical_digest(body)}
@@ -1799,54 +2110,13 @@ def reserve_shop_inventory_order(
             "schema": SHOP_INVENTORY_SCHEMA,
             "revision": body["sequence"],
             "headDigest": envelope["digest"],
-            "commands": [*current["commands"], envelope],
+            "commands": [*current._commands, envelope],
         },
         trusted_catalog,
     )
 
 
-def shop_inventory_sku_totals(
-    value: object, catalog_skus: Sequence[str]
-) -> dict[str, int]:
-    state = validate_shop_inventory_state(value, catalog_skus)
-    return dict(_project([command["payload"] for command in state["commands"]])["skuTotals"])
-
-
-def shop_inventory_business_partners(
-    value: object, catalog_skus: Sequence[str]
-) -> dict[str, list[dict[str, str]]]:
-    state = validate_shop_inventory_state(value, catalog_skus)
-    projection = _project([command["payload"] for command in state["commands"]])
-    return {
-        "clients": deepcopy(projection["clients"]),
-        "vendors": deepcopy(projection["vendors"]),
-    }
-
-
-def shop_inventory_supplier_policies(
-    value: object, catalog_skus: Sequence[str]
-) -> list[dict[str, Any]]:
-    state = validate_shop_inventory_state(value, catalog_skus)
-    projection = _project([command["payload"] for command in state["commands"]])
-    return deepcopy(projection["supplierPolicies"])
-
-
-def shop_inventory_sku_available_to_promise(
-    value: object, catalog_skus: Sequence[str]
-) -> dict[str, int]:
-    state = validate_shop_inventory_state(value, catalog_skus)
-    return dict(
-        _project([command["payload"] for command in state["commands"]])[
-            "skuAvailableToPromise"
-        ]
-    )
-
-
-def shop_inventory_available_balances(
-    value: object, catalog_skus: Sequence[str]
-) -> list[dict[str, Any]]:
-    state = validate_shop_inventory_state(value, catalog_skus)
-    projection = _project([command["payload"] for command in state["commands"]])
+def _available_balance_rows(projection: Mapping[str, Any]) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
     for (stock_unit_id, location_id), balance in projection["balances"].items():
         available = balance["onHand"] - balance["reserved"]
@@ -1866,11 +2136,7 @@ def shop_inventory_available_balances(
     )
 
 
-def shop_inventory_balances(
-    value: object, catalog_skus: Sequence[str]
-) -> list[dict[str, Any]]:
-    state = validate_shop_inventory_state(value, catalog_skus)
-    projection = _project([command["payload"] for command in state["commands"]])
+def _balance_rows(projection: Mapping[str, Any]) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
     for (stock_unit_id, location_id), balance in projection["balances"].items():
         if balance["onHand"] == 0 and balance["reserved"] == 0:
@@ -1892,6 +2158,43 @@ def shop_inventory_balances(
     )
 
 
+def shop_inventory_sku_totals(
+    value: object, catalog_skus: Sequence[str]
+) -> dict[str, int]:
+    return dict(shop_inventory_view(value, catalog_skus).sku_totals)
+
+
+def shop_inventory_business_partners(
+    value: object, catalog_skus: Sequence[str]
+) -> dict[str, list[dict[str, str]]]:
+    view = shop_inventory_view(value, catalog_skus)
+    return {"clients": _thaw(view.clients), "vendors": _thaw(view.vendors)}
+
+
+def shop_inventory_supplier_policies(
+    value: object, catalog_skus: Sequence[str]
+) -> list[dict[str, Any]]:
+    return _thaw(shop_inventory_view(value, catalog_skus).supplier_policies)
+
+
+def shop_inventory_sku_available_to_promise(
+    value: object, catalog_skus: Sequence[str]
+) -> dict[str, int]:
+    return dict(shop_inventory_view(value, catalog_skus).sku_available_to_promise)
+
+
+def shop_inventory_available_balances(
+    value: object, catalog_skus: Sequence[str]
+) -> list[dict[str, Any]]:
+    return _thaw(shop_inventory_view(value, catalog_skus).available_balances)
+
+
+def shop_inventory_balances(
+    value: object, catalog_skus: Sequence[str]
+) -> list[dict[str, Any]]:
+    return _thaw(shop_inventory_view(value, catalog_skus).balances)
+
+
 def restamp_latest_shop_inventory_command(
     value: object,
     *,
@@ -1926,6 +2229,8 @@ __all__ = [
     "SHOP_INVENTORY_IMPORT_CONTRACT",
     "SHOP_INVENTORY_SCHEMA",
     "ShopInventoryValidationError",
+    "ShopInventoryView",
+    "clear_shop_inventory_checkpoints",
     "restamp_latest_shop_inventory_command",
     "reserve_shop_inventory_order",
     "shop_inventory_available_balances",
@@ -1934,5 +2239,6 @@ __all__ = [
     "shop_inventory_catalog_digest",
     "shop_inventory_sku_available_to_promise",
     "shop_inventory_sku_totals",
+    "shop_inventory_view",
     "validate_shop_inventory_state",
 ]
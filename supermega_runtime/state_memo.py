@@ -0,0 +1,143 @@
+"""Bounded memo of surface states that already passed full validation."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from copy import deepcopy
+from hashlib import sha256
+import json
+from threading import RLock
+from typing import Any, Callable, Mapping
+
+
+VALIDATED_STATE_LIMIT = 128
+_JSON_SCALARS = frozenset({str, int, float, bool, type(None)})
+# Entries are keyed by (surface, schema, digest of the submitted value) and
+# hold a private copy of the validator's result. Validators are pure functions
+# of the snapshot, so an identical snapshot can reuse the earlier verdict; any
+# edit changes the digest and falls through to full validation.
+_LOCK = RLock()
+_ENTRIES: OrderedDict[tuple[str, str, str], dict[str, Any]] = OrderedDict()
+_COUNTERS = {"hits": 0, "misses": 0}
+
+
+def copy_json_tree(value: Any) -> Any:
+    """Copy a JSON-shaped tree without deepcopy's memo bookkeeping."""
+
+    kind = type(value)
+    if kind is dict:
+        return {
+            key: item if type(item) in _JSON_SCALARS else copy_json_tree(item)
+            for key, item in value.items()
+        }
+    if kind is list:
+        return [item if type(item) in _JSON_SCALARS else copy_json_tree(item) for item in value]
+    if kind in _JSON_SCALARS:
+        return value
+    return deepcopy(value)
+
+
+def state_digest(value: object) -> str | None:
+    """Return a length-prefixed canonical digest, or None for non-JSON values."""
+
+    try:
+        encoded = json.dumps(
+            value,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            sort_keys=True,
+            allow_nan=False,
+        ).encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+    digest = sha256(f"{len(encoded)}:".encode("ascii"))
+    digest.update(encoded)
+    return f"sha256:{digest.hexdigest()}"
+
+
+def _key(surface: str, value: object) -> tuple[str, str, str] | None:
+    if not isinstance(value, Mapping):
+        return None
+    digest = state_digest(value)
+    if digest is None:
+        return None
+    schema = value.get("schema")
+    return (surface, schema if isinstance(schema, str) else "", digest)
+
+
+def _store(key: tuple[str, str, str], state: dict[str, Any]) -> None:
+    with _LOCK:
+        _ENTRIES[key] = state
+        _ENTRIES.move_to_end(key)
+        while len(_ENTRIES) > VALIDATED_STATE_LIMIT:
+            _ENTRIES.popitem(last=False)
+
+
+def validated_state(
+    surface: str,
+    value: object,
+    validator: Callable[[object], dict[str, Any]],
+) -> dict[str, Any]:
+    """Return ``validator(value)``, reusing the verdict for a known snapshot.
+
+    The caller owns the returned state; the memo keeps its own copy. Errors
+    are never cached, so an invalid snapshot is rejected on every call.
+    """
+
+    key = _key(surface, value)
+    if key is not None:
+        with _LOCK:
+            cached = _ENTRIES.get(key)
+            if cached is not None:
+                _ENTRIES.move_to_end(key)
+                _COUNTERS["hits"] += 1
+                return copy_json_tree(cached)
+            _COUNTERS["misses"] += 1
+    state = validator(value)
+    if key is not None:
+        _store(key, copy_json_tree(state))
+    return state
+
+
+def remember_validated_state(surface: str, state: Mapping[str, Any]) -> None:
+    """Record a state a reducer just validated so its next command skips revalidation.
+
+    Only call this for validators that return their input unchanged; the
+    state is remembered as its own validated form.
+    """
+
+    key = _key(surface, state)
+    if key is not None:
+        _store(key, copy_json_tree(dict(state)))
+
+
+def validated_state_stats() -> dict[str, int]:
+    """Return memo hit/miss counters and current occupancy."""
+
+    with _LOCK:
+        return {
+            "hits": _COUNTERS["hits"],
+            "misses": _COUNTERS["misses"],
+            "size": len(_ENTRIES),
+            "limit": VALIDATED_STATE_LIMIT,
+        }
+
+
+def clear_validated_states() -> None:
+    """Forget every remembered state and reset the counters."""
+
+    with _LOCK:
+        _ENTRIES.clear()
+        _COUNTERS["hits"] = 0
+        _COUNTERS["misses"] = 0
+
+
+__all__ = [
+    "VALIDATED_STATE_LIMIT",
+    "clear_validated_states",
+    "copy_json_tree",
+    "remember_validated_state",
+    "state_digest",
+    "validated_state",
+    "validated_state_stats",
+]
@@ -35,6 +35,7 @@ isolation from the web layer.
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Iterable, Mapping, Sequence
 from contextvars import ContextVar, Token
 import re
@@ -57,6 +58,13 @@ MYANMAR_PHONE_PATTERN = re.compile(r"(?<!\d)09\d{7,9}(?!\d)")
 # Rule 2: MMK amounts written as digits followed by "MMK" or "kyat(s)".
 MMK_AMOUNT_PATTERN = re.compile(r"(?<![\w.])[0-9][0-9,]*(?:\.[0-9]+)?\s*(?:mmk|kyats?)\b", re.IGNORECASE)
 
+# Both rule 2 patterns fused so a value is scanned once. Case folding is a
+# no-op for the digit-only phone branch.
+_PII_PATTERN = re.compile(
+    f"(?:{MYANMAR_PHONE_PATTERN.pattern})|(?:{MMK_AMOUNT_PATTERN.pattern})",
+    re.IGNORECASE,
+)
+
 # Rule 1: request-body field names that mark a leaf value as customer
 # content, matched as a case-insensitive substring of the JSON key. This is
 # deliberately broader than the plan's parenthetical list (name, phone,
@@ -74,6 +82,85 @@ CUSTOMER_CONTENT_FIELD_MARKERS: tuple[str, ...] = (
     "price",
 )
 
+class _DenyValueAutomaton:
+    """Aho-Corasick automaton answering "does a string contain any deny value?".
+
+    Built once per deny-list, then each scan is linear in the scanned
+    string no matter how many values the request body contributed.
+    """
+
+    __slots__ = ("_goto", "_fail", "_terminal")
+
+    def __init__(self, patterns: Iterable[str]):
+        goto: list[dict[str, int]] = [{}]
+        terminal = [False]
+        for pattern in patterns:
+            state = 0
+            for char in pattern:
+                following = goto[state].get(char)
+                if following is None:
+                    following = len(goto)
+                    goto[state][char] = following
+                    goto.append({})
+                    terminal.append(False)
+                state = following
+            terminal[state] = True
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, following in goto[state].items():
+                queue.append(following)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[following] = goto[fallback].get(char, 0)
+                terminal[following] = terminal[following] or terminal[fail[following]]
+        self._goto = goto
+        self._fail = fail
+        self._terminal = terminal
+
+    def search(self, text: str) -> bool:
+        goto, fail, terminal = self._goto, self._fail, self._terminal
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if terminal[state]:
+                return True
+        return False
+
+
+def _substring_patterns(values: Iterable[str]) -> list[str]:
+    return [value for value in values if len(value) >= _MIN_SUBSTRING_MATCH_LENGTH]
+
+
+class CustomerContentDenyList(frozenset):
+    """A request's deny-list with its substring automaton compiled up front.
+
+    Still a ``frozenset[str]``, so every ``deny_values`` parameter accepts
+    it unchanged. Plain frozensets passed by other callers are compiled per
+    call and never cached, so customer values never outlive their request.
+    """
+
+    __slots__ = ("automaton",)
+
+    def __new__(cls, values: Iterable[str] = ()) -> "CustomerContentDenyList":
+        instance = super().__new__(cls, values)
+        instance.automaton = _DenyValueAutomaton(_substring_patterns(instance))
+        return instance
+
+
+def _deny_list(deny_values: frozenset[str]) -> CustomerContentDenyList:
+    if isinstance(deny_values, CustomerContentDenyList):
+        return deny_values
+    return CustomerContentDenyList(deny_values)
+
+
+_EMPTY_DENY_LIST = CustomerContentDenyList()
+
 # Populated per-request by `supermega_runtime.telemetry.tracing`'s request
 # middleware, and read here at span-export time. A SpanProcessor has no
 # access to the HTTP request, so the deny-list of literal customer-content
@@ -82,7 +169,7 @@ CUSTOMER_CONTENT_FIELD_MARKERS: tuple[str, ...] = (
 # requests never see each other's values.
 _CUSTOMER_CONTENT_VALUES: ContextVar[frozenset[str]] = ContextVar(
     "supermega_customer_content_values",
-    default=frozenset(),
+    default=_EMPTY_DENY_LIST,
 )
 
 
@@ -93,9 +180,9 @@ def customer_content_values() -> frozenset[str]:
 
 
 def push_customer_content_scope(payload: Any) -> Token[frozenset[str]]:
-    """Extract and activate the deny-list for one request. Returns a reset token."""
+    """Extract, compile and activate the deny-list for one request. Returns a reset token."""
 
-    return _CUSTOMER_CONTENT_VALUES.set(extract_customer_content_values(payload))
+    return _CUSTOMER_CONTENT_VALUES.set(CustomerContentDenyList(extract_customer_content_values(payload)))
 
 
 def pop_customer_content_scope(token: Token[frozenset[str]]) -> None:
@@ -139,10 +226,7 @@ def extract_customer_content_values(payload: Any) -> frozenset[str]:
             continue
         lowered_key = key_hint.casefold()
         is_marked_field = any(marker in lowered_key for marker in CUSTOMER_CONTENT_FIELD_MARKERS)
-        looks_sensitive = bool(
-            MYANMAR_PHONE_PATTERN.search(text) or MMK_AMOUNT_PATTERN.search(text)
-        )
-        if is_marked_field or looks_sensitive:
+        if is_marked_field or _PII_PATTERN.search(text):
             values.add(text)
     return frozenset(values)
 
@@ -154,14 +238,11 @@ def _matches_customer_content(value: str, deny_values: frozenset[str]) -> bool:
         return True
     if len(value) < _MIN_SUBSTRING_MATCH_LENGTH:
         return False
-    return any(
-        len(deny) >= _MIN_SUBSTRING_MATCH_LENGTH and deny in value
-        for deny in deny_values
-    )
+    return _deny_list(deny_values).automaton.search(value)
 
 
 def _looks_like_pii_pattern(value: str) -> bool:
-    return bool(MYANMAR_PHONE_PATTERN.search(value) or MMK_AMOUNT_PATTERN.search(value))
+    return _PII_PATTERN.search(value) is not None
 
 
 def is_string_value_safe(value: str, deny_values: frozenset[str]) -> bool:
@@ -171,11 +252,12 @@ def is_string_value_safe(value: str, deny_values: frozenset[str]) -> bool:
     whole span) can exercise the string-level rules directly.
     """
 
-    if _matches_customer_content(value, deny_values):
+    # Cheapest check first; any failing rule rejects the value.
+    if len(value) > MAX_ATTRIBUTE_LENGTH:
         return False
     if _looks_like_pii_pattern(value):
         return False
-    if len(value) > MAX_ATTRIBUTE_LENGTH:
+    if _matches_customer_content(value, deny_values):
         return False
     return True
 
@@ -220,7 +302,8 @@ def scrub_attributes(
 ) -> dict[str, Any]:
     """Return a new attribute mapping with every unsafe entry removed."""
 
-    active_deny_values = deny_values if deny_values is not None else customer_content_values()
+    # Compile a plain deny-list once for the whole mapping, not per value.
+    active_deny_values = _deny_list(deny_values if deny_values is not None else customer_content_values())
     sanitized: dict[str, Any] = {}
     for key, value in attributes.items():
         scrubbed = scrub_attribute(key, value, active_deny_values)
@@ -301,6 +384,7 @@ __all__ = [
     "MYANMAR_PHONE_PATTERN",
     "MMK_AMOUNT_PATTERN",
     "CUSTOMER_CONTENT_FIELD_MARKERS",
+    "CustomerContentDenyList",
     "customer_content_values",
     "push_customer_content_scope",
     "pop_customer_content_scope",
@@ -10,9 +10,11 @@ Phase A (see the implementation plan, section 6) is local-only:
 * Setting ``OTEL_LOCAL=1`` switches to an OTLP gRPC exporter pointed at
   ``OTEL_EXPORTER_OTLP_ENDPOINT`` (default ``localhost:4317`` — a local
   Jaeger, see ``docker-compose.telemetry.yml``).
-* Every exporter, console or OTLP, sits behind the same
+* Every exporter, console or OTLP, sits behind a
   ``RedactingSpanProcessor``. There is no code path that reaches an
-  exporter without going through the scrubber first.
+  exporter without going through the scrubber first. The provider uses
+  ``BatchingRedactingSpanProcessor``, which scrubs and exports on a
+  background thread so request threads never wait on the exporter.
 
 Nothing in this module is imported by default from
 ``supermega_runtime.runtime`` unless ``configure_tracing`` is called
@@ -27,6 +29,9 @@ from contextlib import contextmanager
 import json
 import logging
 import os
+import threading
+import time
+from collections import deque
 from collections.abc import Iterator
 from typing import Any
 
@@ -36,6 +41,12 @@ from supermega_runtime.telemetry import redact
 _LOGGER = logging.getLogger("supermega.telemetry")
 SERVICE_NAME = "supermega-runtime"
 _DEFAULT_OTLP_ENDPOINT = "localhost:4317"
+# Batching defaults mirror the SDK's BatchSpanProcessor and honour the same
+# OTEL_BSP_* environment variables.
+_DEFAULT_MAX_QUEUE_SIZE = 2048
+_DEFAULT_MAX_EXPORT_BATCH_SIZE = 512
+_DEFAULT_SCHEDULE_DELAY_MILLIS = 5000
+_DEFAULT_EXPORT_TIMEOUT_MILLIS = 30_000
 
 _tracer_provider: Any = None
 _psycopg_instrumented = False
@@ -46,6 +57,14 @@ def _flag(name: str) -> bool:
     return value in {"1", "true", "yes", "on"}
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        value = int(str(os.getenv(name) or "").strip())
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
 def tracing_enabled() -> bool:
     """Tracing is opt-out via `SUPERMEGA_OTEL_DISABLED=1`, never opt-in.
 
@@ -78,13 +97,19 @@ class RedactingSpanProcessor:
     def _on_ending(self, span: Any) -> None:  # noqa: D401 - required by SpanProcessor's newer lifecycle hook
         return None
 
-    def on_end(self, span: Any) -> None:
+    @staticmethod
+    def _is_sampled(span: Any) -> bool:
         try:
             context = span.get_span_context() if hasattr(span, "get_span_context") else span.context
             if context is not None and not context.trace_flags.sampled:
-                return
+                return False
         except Exception:  # pragma: no cover - defensive, never blocks a scrub
             pass
+        return True
+
+    def on_end(self, span: Any) -> None:
+        if not self._is_sampled(span):
+            return
         try:
             sanitized = self._sanitized_copy(span)
         except Exception:  # pragma: no cover - a scrub bug must never leak a span
@@ -105,7 +130,7 @@ class RedactingSpanProcessor:
         return True
 
     @staticmethod
-    def _sanitized_copy(span: Any) -> Any:
+    def _sanitized_copy(span: Any, deny_values: frozenset[str] | None = None) -> Any:
         """Build a new, exporter-bound ReadableSpan with scrubbed name/attributes.
 
         `ReadableSpan.attributes` is an immutable `BoundedAttributes` by the
@@ -114,6 +139,10 @@ class RedactingSpanProcessor:
         fresh `ReadableSpan` via its public constructor — rather than
         reaching into `_immutable`/`_attributes` to force a mutation — keeps
         this scrubber independent of that private implementation detail.
+
+        ``deny_values`` defaults to the current request's customer-content
+        scope; a caller scrubbing outside that request must pass the scope
+        it captured.
         """
 
         from opentelemetry.sdk.trace import ReadableSpan
@@ -121,8 +150,8 @@ class RedactingSpanProcessor:
         current = dict(span.attributes or {})
         if any(key in current for key in redact.FORBIDDEN_ATTRIBUTE_KEYS):
             current = redact.enrich_and_scrub_db_attributes(current)
-        sanitized_attributes = redact.scrub_attributes(current)
-        sanitized_name = redact.scrub_span_name(span.name)
+        sanitized_attributes = redact.scrub_attributes(current, deny_values)
+        sanitized_name = redact.scrub_span_name(span.name, deny_values)
         return ReadableSpan(
             name=sanitized_name,
             context=span.context,
@@ -139,6 +168,169 @@ class RedactingSpanProcessor:
         )
 
 
+class BatchingRedactingSpanProcessor(RedactingSpanProcessor):
+    """Queue ended spans and scrub + export them in batches off-thread.
+
+    ``on_end`` only captures the request's customer-content deny-list (a
+    contextvar the background thread cannot see) and appends the span to a
+    bounded queue; when the queue is full the span is dropped and counted,
+    never waited on. A daemon worker drains up to ``max_export_batch_size``
+    spans once a batch fills or ``schedule_delay_millis`` passes, scrubs
+    each with its captured deny-list and exports the batch. A span whose
+    scrub fails is dropped, exactly as in the synchronous processor.
+
+    Each export call gets ``export_timeout_millis``; a batch whose export
+    outlives it is dropped, and so is every batch offered while that export
+    is still stuck, so a hung exporter never stalls the worker.
+    """
+
+    def __init__(
+        self,
+        exporter: Any,
+        *,
+        max_queue_size: int = _DEFAULT_MAX_QUEUE_SIZE,
+        max_export_batch_size: int = _DEFAULT_MAX_EXPORT_BATCH_SIZE,
+        schedule_delay_millis: int = _DEFAULT_SCHEDULE_DELAY_MILLIS,
+        export_timeout_millis: int = _DEFAULT_EXPORT_TIMEOUT_MILLIS,
+    ):
+        super().__init__(exporter)
+        self._max_queue_size = max(1, int(max_queue_size))
+        self._max_export_batch_size = max(1, min(int(max_export_batch_size), self._max_queue_size))
+        self._schedule_delay = max(0, int(schedule_delay_millis)) / 1000
+        self._export_timeout_millis = max(1, int(export_timeout_millis))
+        self._queue: deque[tuple[Any, frozenset[str]]] = deque()
+        self._condition = threading.Condition()
+        self._flush_waiters: list[threading.Event] = []
+        self._stopping = False
+        self._stuck_export: threading.Thread | None = None
+        self._counters = {
+            "enqueued": 0,
+            "exported": 0,
+            "dropped": 0,
+            "scrub_failures": 0,
+            "export_failures": 0,
+        }
+        self._worker = threading.Thread(
+            target=self._run,
+            name="supermega-span-export",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def on_end(self, span: Any) -> None:
+        if not self._is_sampled(span):
+            return
+        deny_values = redact.customer_content_values()
+        with self._condition:
+            if self._stopping or len(self._queue) >= self._max_queue_size:
+                self._counters["dropped"] += 1
+                return
+            self._queue.append((span, deny_values))
+            self._counters["enqueued"] += 1
+            if len(self._queue) >= self._max_export_batch_size:
+                self._condition.notify()
+
+    def stats(self) -> dict[str, int]:
+        """Return queue depth and enqueue/export/drop counters."""
+
+        with self._condition:
+            return {
+                "queue_depth": len(self._queue),
+                "max_queue_size": self._max_queue_size,
+                **self._counters,
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                deadline = time.monotonic() + self._schedule_delay
+                while (
+                    len(self._queue) < self._max_export_batch_size
+                    and not self._flush_waiters
+                    and not self._stopping
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(len(self._queue), self._max_export_batch_size))
+                ]
+                waiters: list[threading.Event] = []
+                if not self._queue:
+                    waiters, self._flush_waiters = self._flush_waiters, []
+                stop = self._stopping and not self._queue
+            if batch:
+                self._export_batch(batch)
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+
+    def _export_batch(self, batch: list[tuple[Any, frozenset[str]]]) -> None:
+        sanitized: list[Any] = []
+        scrub_failures = 0
+        for span, deny_values in batch:
+            try:
+                sanitized.append(self._sanitized_copy(span, deny_values))
+            except Exception:  # pragma: no cover - a scrub bug must never leak a span
+                _LOGGER.exception("supermega.telemetry: span scrub failed; dropping span")
+                scrub_failures += 1
+        exported = bool(sanitized) and self._export_within_timeout(tuple(sanitized))
+        with self._condition:
+            self._counters["scrub_failures"] += scrub_failures
+            if exported:
+                self._counters["exported"] += len(sanitized)
+            elif sanitized:
+                self._counters["export_failures"] += len(sanitized)
+
+    def _export_within_timeout(self, spans: tuple[Any, ...]) -> bool:
+        if self._stuck_export is not None and self._stuck_export.is_alive():
+            _LOGGER.warning("supermega.telemetry: previous span export is still running; dropping batch")
+            return False
+        outcome: list[bool] = []
+
+        def export() -> None:
+            try:
+                result = self._exporter.export(spans)
+                outcome.append(getattr(result, "name", "SUCCESS") == "SUCCESS")
+            except Exception:
+                _LOGGER.exception("supermega.telemetry: span export failed; dropping batch")
+
+        call = threading.Thread(target=export, name="supermega-span-export-call", daemon=True)
+        call.start()
+        call.join(self._export_timeout_millis / 1000)
+        if call.is_alive():
+            self._stuck_export = call
+            _LOGGER.warning(
+                "supermega.telemetry: span export exceeded %d ms; dropping batch",
+                self._export_timeout_millis,
+            )
+            return False
+        return bool(outcome) and outcome[0]
+
+    def force_flush(self, timeout_millis: int = 30_000) -> bool:
+        waiter = threading.Event()
+        with self._condition:
+            if not self._worker.is_alive():
+                return not self._queue
+            self._flush_waiters.append(waiter)
+            self._condition.notify()
+        if not waiter.wait(max(0, timeout_millis) / 1000):
+            return False
+        return super().force_flush(timeout_millis)
+
+    def shutdown(self) -> None:
+        with self._condition:
+            if self._stopping:
+                return
+            self._stopping = True
+            self._condition.notify()
+        self._worker.join(self._export_timeout_millis / 1000)
+        super().shutdown()
+
+
 def _build_exporter() -> Any:
     from opentelemetry.sdk.trace.export import ConsoleSpanExporter
 
@@ -181,7 +373,13 @@ def configure_tracing() -> Any | None:
 
     resource = Resource.create({"service.name": SERVICE_NAME})
     provider = TracerProvider(resource=resource)
-    processor = RedactingSpanProcessor(_build_exporter())
+    processor = BatchingRedactingSpanProcessor(
+        _build_exporter(),
+        max_queue_size=_env_int("OTEL_BSP_MAX_QUEUE_SIZE", _DEFAULT_MAX_QUEUE_SIZE),
+        max_export_batch_size=_env_int("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", _DEFAULT_MAX_EXPORT_BATCH_SIZE),
+        schedule_delay_millis=_env_int("OTEL_BSP_SCHEDULE_DELAY", _DEFAULT_SCHEDULE_DELAY_MILLIS),
+        export_timeout_millis=_env_int("OTEL_BSP_EXPORT_TIMEOUT", _DEFAULT_EXPORT_TIMEOUT_MILLIS),
+    )
     provider.add_span_processor(processor)  # type: ignore[arg-type]
 
     # `set_tracer_provider` warns (and no-ops) if called twice in the same
@@ -193,6 +391,32 @@ def configure_tracing() -> Any | None:
     return provider
 
 
+def flush_tracing(timeout_millis: int = _DEFAULT_EXPORT_TIMEOUT_MILLIS) -> bool:
+    """Export every span queued so far; True when none were left behind."""
+
+    provider = _tracer_provider
+    if provider is None:
+        return True
+    try:
+        return bool(provider.force_flush(timeout_millis))
+    except Exception:  # pragma: no cover - flushing must never break shutdown
+        _LOGGER.exception("supermega.telemetry: span flush failed.")
+        return False
+
+
+def shutdown_tracing() -> None:
+    """Drain and stop the process TracerProvider; the next call builds a new one."""
+
+    global _tracer_provider
+    provider, _tracer_provider = _tracer_provider, None
+    if provider is None:
+        return
+    try:
+        provider.shutdown()
+    except Exception:  # pragma: no cover - shutdown must never raise at exit
+        _LOGGER.exception("supermega.telemetry: tracing shutdown failed.")
+
+
 def get_tracer(instrumenting_module_name: str = __name__) -> Any:
     """Return a tracer bound to the configured provider, or a real no-op tracer."""
 
@@ -357,6 +581,8 @@ __all__ = [
     "SERVICE_NAME",
     "tracing_enabled",
     "configure_tracing",
+    "flush_tracing",
+    "shutdown_tracing",
     "get_tracer",
     "instrument_fastapi_app",
     "instrument_psycopg",
@@ -364,4 +590,5 @@ __all__ = [
     "instrument_app",
     "domain_span",
     "RedactingSpanProcessor",
+    "BatchingRedactingSpanProcessor",
 ]
@@ -56,6 +56,7 @@ from supermega_runtime.plant_equipment_import import (
     PlantEquipmentImportError,
     validate_plant_equipment_import,
 )
+from supermega_runtime.state_memo import validated_state
 from supermega_runtime.telemetry import schema as telemetry_schema
 from supermega_runtime.telemetry.tracing import domain_span
 from supermega_runtime.production_material_handoff import (
@@ -946,7 +947,7 @@ def _client_import_apply_preflight(
         if expected_version < 1:
             raise _error(409, "client_import_activation_not_ready", product="ecommerce")
         try:
-            commerce_state = validate_commerce_state(current_state.state)
+            commerce_state = validated_state("commerce", current_state.state, validate_commerce_state)
             configuration = commerce_state.get("storefrontConfiguration")
             current_skus = {item["sku"] for item in commerce_state["items"]}
             rows = package.get("rows")
@@ -1674,7 +1675,7 @@ def create_trial_router(
         commerce = _invoke(lambda: store.get_state(principal, "commerce"))
         if not commerce.state:
             raise _error(409, "commerce_workspace_required")
-        state = _invoke(lambda: validate_commerce_state(commerce.state))
+        state = _invoke(lambda: validated_state("commerce", commerce.state, validate_commerce_state))
         return {
             "workspace_id": principal.workspace_id,
             "version": commerce.version,
@@ -1702,7 +1703,7 @@ def create_trial_router(
         commerce = _invoke(lambda: store.get_state(principal, "commerce"))
         if not commerce.state:
             raise _error(409, "commerce_workspace_required")
-        current_state = _invoke(lambda: validate_commerce_state(commerce.state))
+        current_state = _invoke(lambda: validated_state("commerce", commerce.state, validate_commerce_state))
         schedule = deepcopy(body.schedule)
         events = schedule.get("events")
         revision = schedule.get("revision")
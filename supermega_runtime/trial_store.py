@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass
@@ -11,6 +12,8 @@ import json
 import os
 import re
 from threading import RLock
+import time
+from weakref import WeakKeyDictionary
 from typing import Any, Callable, Iterator, Mapping, Protocol, Sequence
 from uuid import NAMESPACE_URL, UUID, uuid4, uuid5
 
@@ -18,6 +21,7 @@ from supermega_runtime.shop_inventory_runtime import (
     ShopInventoryValidationError,
     restamp_latest_shop_inventory_command,
 )
+from supermega_runtime.state_memo import copy_json_tree
 
 
 TRIAL_SCHEMA_COMPONENT = "private_trial_backend"
@@ -72,6 +76,11 @@ PRODUCT_ACCEPTANCE_EVENT_TYPE = "client.product_acceptance.recorded"
 # authoritative client->server (or client->Supavisor-pooler) guarantee -- a
 # per-backend pg_stat_ssl read cannot observe the client leg through a pooler.
 TRIAL_TLS_SSLMODES = frozenset({"require", "verify-ca", "verify-full"})
+# Pooled connections re-run the role, schema and audit catalog checks once per
+# physical connection and again after this many seconds, so a migration applied
+# under a running process is picked up without a per-request catalog scan.
+TRIAL_POOL_VERIFY_TTL_SECONDS = 300.0
+TRIAL_POOL_TIMEOUT_SECONDS = 5.0
 TRUSTED_ACTOR_KINDS = frozenset({"human", "service", "agent"})
 TRUSTED_IDENTITY_PROVIDERS = frozenset({"gateway", "supabase"})
 HUMAN_ACTOR_KIND = "human"
@@ -168,6 +177,19 @@ APPROVAL_REQUEST_CAPABILITY = "approvals.request"
 APPROVAL_DECIDE_CAPABILITY = "approvals.decide"
 DECISION_PACKET_CONTRACT = "decision_packet.v1"
 MAX_JSON_BYTES = 64 * 1024
+# Client payloads and unsegmented stored documents keep the 64 KiB ceiling.
+# Assembled surface states may grow past it once their long collections are
+# stored as append-only segment rows (schema v14).
+MAX_STATE_BYTES = 2 * 1024 * 1024
+STATE_SEGMENT_SCHEMA_VERSION = 14
+STATE_SEGMENT_RECORDS = 64
+STATE_SEGMENT_BYTES = 32 * 1024
+STATE_SEGMENT_CACHE_LIMIT = 1024
+SEGMENTED_STATE_COLLECTIONS = {
+    "commerce": ("orders", "movements", "closes", "purchaseOrders"),
+}
+STATE_SEGMENTS_KEY = "$segments"
+_STATE_SEGMENT_DIGEST_PATTERN = re.compile(r"^sha256:[0-9a-f]{64}$")
 
 # Self-serve tenant provisioning (SELF-SERVE-ONBOARDING-SPEC.md step D).
 # The claim alphabet mirrors the client generator in
@@ -1052,6 +1074,49 @@ def _restamp_order_inventory(
     return authoritative_state
 
 
+def _expanded_delta_payload(
+    payload: Mapping[str, Any],
+    current_state: Mapping[str, Any],
+) -> JsonObject:
+    """Expand a delta command so server stamping sees the whole next state."""
+
+    if set(payload) != {"delta", "evidence"}:
+        raise TrialValidationError("Delta payload must contain exactly delta and evidence objects.")
+    return _json_object(
+        {
+            "state": apply_state_delta(current_state, payload["delta"]),
+            "evidence": payload["evidence"],
+        },
+        field_name="payload",
+        maximum=MAX_STATE_BYTES,
+    )
+
+
+def _reducer_delta_payload(
+    payload: Mapping[str, Any],
+    current_state: Mapping[str, Any],
+) -> Mapping[str, Any]:
+    """Hand the reducer only the top-level fields a stamped command changed.
+
+    Server stamping may rewrite records anywhere in the expanded state, so the
+    delta is taken from the stamped state rather than the caller's delta. The
+    whole payload is kept when nothing changed or a field disappeared, which a
+    delta cannot express.
+    """
+
+    state = payload.get("state")
+    if not isinstance(state, Mapping) or not set(current_state) <= set(state):
+        return payload
+    delta = {
+        key: {"value": value}
+        for key, value in state.items()
+        if key not in current_state or current_state[key] != value
+    }
+    if not delta:
+        return payload
+    return {"delta": delta, "evidence": payload.get("evidence")}
+
+
 def _authoritative_command_payload(
     payload: Mapping[str, Any],
     *,
@@ -2980,7 +3045,12 @@ def _normalize_expected_related_versions(
     return normalized
 
 
-def _json_object(value: Mapping[str, Any], *, field_name: str) -> JsonObject:
+def _json_object(
+    value: Mapping[str, Any],
+    *,
+    field_name: str,
+    maximum: int = MAX_JSON_BYTES,
+) -> JsonObject:
     if not isinstance(value, Mapping):
         raise TrialValidationError(f"{field_name} must be a JSON object.")
     try:
@@ -2993,11 +3063,192 @@ def _json_object(value: Mapping[str, Any], *, field_name: str) -> JsonObject:
         )
     except (TypeError, ValueError) as exc:
         raise TrialValidationError(f"{field_name} must contain valid JSON values.") from exc
-    if len(encoded.encode("utf-8")) > MAX_JSON_BYTES:
-        raise TrialValidationError(f"{field_name} exceeds {MAX_JSON_BYTES} bytes.")
+    if len(encoded.encode("utf-8")) > maximum:
+        raise TrialValidationError(f"{field_name} exceeds {maximum} bytes.")
     return json.loads(encoded)
 
 
+def max_state_bytes(surface: str) -> int:
+    """Largest assembled state ``surface`` may hold.
+
+    Only surfaces with segmented collections may outgrow one stored document.
+    """
+
+    return MAX_STATE_BYTES if surface in SEGMENTED_STATE_COLLECTIONS else MAX_JSON_BYTES
+
+
+def _canonical_json_text(value: Any) -> str:
+    return json.dumps(
+        value,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        allow_nan=False,
+    )
+
+
+def _segment_digest(text: str) -> str:
+    return f"sha256:{sha256(text.encode('utf-8')).hexdigest()}"
+
+
+def _seal_segment(encoded_records: list[str]) -> tuple[str, str]:
+    text = "[" + ",".join(reversed(encoded_records)) + "]"
+    return _segment_digest(text), text
+
+
+def _split_segment_records(records: list[Any]) -> tuple[list[Any], list[tuple[str, str]]]:
+    """Seal a newest-first collection into chunks counted from its oldest end.
+
+    Chunk boundaries depend only on the records behind them, so prepending a
+    new order leaves every sealed chunk, and its digest, unchanged. Records
+    that do not yet fill a chunk stay inline in the head document.
+    """
+
+    sealed: list[tuple[str, str]] = []
+    pending: list[str] = []
+    pending_bytes = 0
+    boundary = len(records)
+    for position in range(len(records) - 1, -1, -1):
+        encoded = _canonical_json_text(records[position])
+        size = len(encoded.encode("utf-8"))
+        if pending and pending_bytes + size > STATE_SEGMENT_BYTES:
+            sealed.append(_seal_segment(pending))
+            boundary = position + 1
+            pending, pending_bytes = [], 0
+        pending.append(encoded)
+        pending_bytes += size
+        if len(pending) == STATE_SEGMENT_RECORDS:
+            sealed.append(_seal_segment(pending))
+            boundary = position
+            pending, pending_bytes = [], 0
+    sealed.reverse()
+    return records[:boundary], sealed
+
+
+def split_state_segments(surface: str, state: Mapping[str, Any]) -> tuple[JsonObject, dict[str, str]]:
+    """Return the head document for ``state`` and its sealed chunks by digest.
+
+    The head keeps every unsegmented field plus, under ``$segments``, each
+    collection's inline newest records and the digests of its older chunks.
+    """
+
+    collections = SEGMENTED_STATE_COLLECTIONS.get(surface, ())
+    head: JsonObject = {key: value for key, value in state.items() if key not in collections}
+    pointers: JsonObject = {}
+    chunks: dict[str, str] = {}
+    for collection in collections:
+        records = state.get(collection)
+        if not isinstance(records, list):
+            if collection in state:
+                head[collection] = records
+            continue
+        inline, sealed = _split_segment_records(records)
+        pointers[collection] = {"inline": inline, "chunks": [digest for digest, _ in sealed]}
+        chunks.update(sealed)
+    if pointers:
+        head[STATE_SEGMENTS_KEY] = pointers
+    return head, chunks
+
+
+def state_segment_digests(head: Mapping[str, Any]) -> list[str]:
+    """Return the chunk digests a stored head references, in head order."""
+
+    pointers = head.get(STATE_SEGMENTS_KEY)
+    if pointers is None:
+        return []
+    if not isinstance(pointers, Mapping):
+        raise TrialValidationError("state segments must be a JSON object.")
+    digests: list[str] = []
+    for collection, pointer in pointers.items():
+        if (
+            not isinstance(pointer, Mapping)
+            or set(pointer) != {"inline", "chunks"}
+            or not isinstance(pointer["inline"], list)
+            or not isinstance(pointer["chunks"], list)
+        ):
+            raise TrialValidationError(f"state segment pointer for {collection} is malformed.")
+        for digest in pointer["chunks"]:
+            if not isinstance(digest, str) or not _STATE_SEGMENT_DIGEST_PATTERN.fullmatch(digest):
+                raise TrialValidationError(f"state segment digest for {collection} is malformed.")
+            digests.append(digest)
+    return digests
+
+
+def join_state_segments(head: Mapping[str, Any], chunks: Mapping[str, str]) -> JsonObject:
+    """Assemble a surface state from its head document and chunk texts."""
+
+    digests = state_segment_digests(head)
+    missing = [digest for digest in digests if digest not in chunks]
+    if missing:
+        raise TrialValidationError("stored state references a missing segment.")
+    state: JsonObject = {key: value for key, value in head.items() if key != STATE_SEGMENTS_KEY}
+    for collection, pointer in (head.get(STATE_SEGMENTS_KEY) or {}).items():
+        records = list(pointer["inline"])
+        for digest in pointer["chunks"]:
+            records.extend(json.loads(chunks[digest]))
+        state[collection] = records
+    return state
+
+
+_STATE_DELTA_OPERATIONS = frozenset({"value", "set", "prepend", "append"})
+
+
+def apply_state_delta(current: Mapping[str, Any], delta: object) -> JsonObject:
+    """Rebuild a surface state from the top-level collections a command changed.
+
+    Each delta key names one top-level state field. ``{"value": x}`` replaces
+    the field outright; list fields may instead carry ``set`` (a map of
+    existing indexes to replacement records), ``prepend`` and ``append``.
+    Index replacements apply to the current list before records are added, so
+    the caller never has to resend unchanged records. Untouched fields are
+    shared with ``current``; callers that keep the result must copy it.
+    """
+
+    if not isinstance(delta, Mapping) or not delta:
+        raise TrialValidationError("delta must be a non-empty object.")
+    next_state: JsonObject = dict(current)
+    for key, operation in delta.items():
+        if not isinstance(key, str) or not key:
+            raise TrialValidationError("delta keys must be non-empty state field names.")
+        if (
+            not isinstance(operation, Mapping)
+            or not operation
+            or not set(operation) <= _STATE_DELTA_OPERATIONS
+        ):
+            raise TrialValidationError(
+                f"delta.{key} must use only value, set, prepend, or append."
+            )
+        if "value" in operation:
+            if len(operation) != 1:
+                raise TrialValidationError(f"delta.{key}.value cannot be combined with list edits.")
+            next_state[key] = operation["value"]
+            continue
+        records = current.get(key, [])
+        if not isinstance(records, list):
+            raise TrialValidationError(f"delta.{key} list edits require a list field.")
+        records = list(records)
+        replacements = operation.get("set", {})
+        if not isinstance(replacements, Mapping):
+            raise TrialValidationError(f"delta.{key}.set must map indexes to records.")
+        for index_text, record in replacements.items():
+            if (
+                not isinstance(index_text, str)
+                or not index_text.isdigit()
+                or str(int(index_text)) != index_text
+                or int(index_text) >= len(records)
+            ):
+                raise TrialValidationError(
+                    f"delta.{key}.set indexes must address existing records."
+                )
+            records[int(index_text)] = record
+        prepend = operation.get("prepend", [])
+        append = operation.get("append", [])
+        if not isinstance(prepend, list) or not isinstance(append, list):
+            raise TrialValidationError(f"delta.{key} prepend and append must be lists.")
+        next_state[key] = [*prepend, *records, *append]
+    return next_state
+
+
 def _decision_packet(value: Mapping[str, Any]) -> JsonObject:
     packet = _json_object(value, field_name="proposal")
     allowed = {
@@ -3117,8 +3368,13 @@ def _decision_evidence_refs(packet: Mapping[str, Any], evidence_refs: Sequence[s
     return evidence
 
 
-def _canonical_fingerprint(kind: str, payload: Mapping[str, Any]) -> str:
-    normalized = _json_object(payload, field_name="fingerprint payload")
+def _canonical_fingerprint(
+    kind: str,
+    payload: Mapping[str, Any],
+    *,
+    maximum: int = MAX_JSON_BYTES,
+) -> str:
+    normalized = _json_object(payload, field_name="fingerprint payload", maximum=maximum)
     encoded = json.dumps(
         {"kind": kind, "payload": normalized},
         sort_keys=True,
@@ -3367,19 +3623,50 @@ class PostgresTrialStore:
     probe succeeds with a dedicated non-BYPASSRLS login role.
     """
 
-    def __init__(self, database_url: str, *, reducer: StateReducer, write_enabled: bool = False):
+    def __init__(
+        self,
+        database_url: str,
+        *,
+        reducer: StateReducer,
+        write_enabled: bool = False,
+        pool_size: int = 0,
+    ):
         self.database_url = str(database_url or "").strip()
         self.reducer = reducer
         self.write_enabled = bool(write_enabled)
+        self.pool_size = max(0, int(pool_size))
         self._self_serve_attempts: dict[str, int] = {}
         self._self_serve_attempt_lock = RLock()
+        self._pool: Any = None
+        self._pool_lock = RLock()
+        self._verified_connections: WeakKeyDictionary[Any, dict[str, Any]] = WeakKeyDictionary()
+        # Chunk rows are immutable and content-addressed, so their text can be
+        # reused across requests; heads are always read under the row lock.
+        self.segmented_state = TRIAL_SCHEMA_VERSION >= STATE_SEGMENT_SCHEMA_VERSION
+        self._segment_cache: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+        self._segment_cache_lock = RLock()
+
+    def _connection_kwargs(self) -> dict[str, Any]:
+        try:
+            from psycopg.rows import dict_row
+        except ImportError as exc:
+            raise TrialNotReadyError(("postgres_driver_ready",)) from exc
+        # Keep autocommit explicitly disabled so every request can bind its
+        # identity to one transaction, and disable automatic prepared statements
+        # for Supavisor transaction mode.
+        return {
+            "row_factory": dict_row,
+            "connect_timeout": 5,
+            "autocommit": False,
+            "prepare_threshold": None,
+            "application_name": "supermega-trial-runtime",
+        }
 
     def _connect(self):
         if not self.database_url:
             raise TrialNotReadyError(("database_ready",))
         try:
             import psycopg
-            from psycopg.rows import dict_row
         except ImportError as exc:
             raise TrialNotReadyError(("postgres_driver_ready",)) from exc
         # Enforce encrypted transport by CONNECTION CONFIGURATION -- the only place
@@ -3393,17 +3680,107 @@ class PostgresTrialStore:
         # (finding 6) -- so this configuration assertion, not a query, is the
         # authoritative guarantee. Fail closed; never silently downgrade or force.
         self._require_dsn_tls(self.database_url)
-        # Keep autocommit explicitly disabled so every request can bind its
-        # identity to one transaction, and disable automatic prepared statements
-        # for Supavisor transaction mode.
-        connection_kwargs: dict[str, Any] = {
-            "row_factory": dict_row,
-            "connect_timeout": 5,
-            "autocommit": False,
-            "prepare_threshold": None,
-            "application_name": "supermega-trial-runtime",
-        }
-        return psycopg.connect(self.database_url, **connection_kwargs)
+        return psycopg.connect(self.database_url, **self._connection_kwargs())
+
+    def _connection_pool(self) -> Any:
+        """Return the shared pool, or None when pooling is disabled."""
+
+        if self.pool_size <= 0:
+            return None
+        with self._pool_lock:
+            if self._pool is not None:
+                return self._pool
+            if not self.database_url:
+                raise TrialNotReadyError(("database_ready",))
+            try:
+                from psycopg_pool import ConnectionPool
+            except ImportError as exc:
+                raise TrialNotReadyError(("postgres_driver_ready",)) from exc
+            # The same sslmode assertion as _connect guards every pooled connection.
+            self._require_dsn_tls(self.database_url)
+            self._pool = ConnectionPool(
+                self.database_url,
+                kwargs=self._connection_kwargs(),
+                min_size=0,
+                max_size=self.pool_size,
+                timeout=TRIAL_POOL_TIMEOUT_SECONDS,
+                name="supermega-trial-runtime",
+                open=True,
+            )
+            return self._pool
+
+    def close(self) -> None:
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+
+    @contextmanager
+    def _checkout(self) -> Iterator[Any]:
+        """Yield one connection, pooled when enabled, mapping failures to database_ready."""
+
+        try:
+            pool = self._connection_pool()
+            if pool is None:
+                connection = self._connect()
+            else:
+                connection = pool.getconn()
+        except TrialStoreError:
+            raise
+        except Exception as exc:
+            raise TrialNotReadyError(("database_ready",)) from exc
+        if pool is None:
+            with connection:
+                yield connection
+            return
+        try:
+            yield connection
+        except TrialStoreError:
+            raise
+        except BaseException:
+            # Never trust a connection that failed mid-request; verify it again.
+            self._verified_connections.pop(connection, None)
+            raise
+        finally:
+            pool.putconn(connection)
+
+    def _verified(self, connection: Any) -> dict[str, Any] | None:
+        if self.pool_size <= 0:
+            return None
+        record = self._verified_connections.get(connection)
+        if record is None:
+            return None
+        if time.monotonic() - float(record["verified_at"]) >= TRIAL_POOL_VERIFY_TTL_SECONDS:
+            self._verified_connections.pop(connection, None)
+            return None
+        return record
+
+    def _verify_connection(self, connection: Any, cursor: Any) -> dict[str, Any]:
+        """Run the role and schema checks unless this pooled connection already passed them."""
+
+        record = self._verified(connection)
+        if record is not None:
+            return record
+        try:
+            self._assert_runtime_role(cursor)
+            self._assert_schema(cursor)
+        except BaseException:
+            self._verified_connections.pop(connection, None)
+            raise
+        record = {"verified_at": time.monotonic(), "audit": False}
+        if self.pool_size > 0:
+            self._verified_connections[connection] = record
+        return record
+
+    def _verify_audit(self, connection: Any, cursor: Any, record: dict[str, Any]) -> None:
+        if record.get("audit") and self._verified(connection) is record:
+            return
+        try:
+            self._assert_audit(cursor)
+        except BaseException:
+            self._verified_connections.pop(connection, None)
+            raise
+        record["audit"] = True
 
     @staticmethod
     def _require_dsn_tls(database_url: str) -> None:
@@ -3503,6 +3880,8 @@ class PostgresTrialStore:
                     'workspace_events_approval_surface_v4_check'
                   )
               ) as security_constraints_ready,
+              to_regclass('app_private.workspace_state_segments') is not null
+                as state_segments_ready,
               true as schema_contract_row_ready
             from app_private.trial_schema_meta schema_meta
             where schema_meta.component = %s
@@ -3516,6 +3895,10 @@ class PostgresTrialStore:
             or not bool(row.get("actor_decision_columns_ready"))
             or not bool(row.get("workspace_access_control_ready"))
             or not bool(row.get("security_constraints_ready"))
+            or (
+                TRIAL_SCHEMA_VERSION >= STATE_SEGMENT_SCHEMA_VERSION
+                and not bool(row.get("state_segments_ready"))
+            )
         ):
             raise TrialNotReadyError(("schema_ready",))
         cursor.execute(
@@ -3779,19 +4162,11 @@ class PostgresTrialStore:
         if not isinstance(limit, int) or isinstance(limit, bool) or not 1 <= limit <= 50:
             raise TrialValidationError("Workspace discovery limit must be between 1 and 50.")
         try:
-            connection = self._connect()
-        except TrialStoreError:
-            raise
-        except Exception as exc:
-            raise TrialNotReadyError(("database_ready",)) from exc
-
-        try:
-            with connection:
+            with self._checkout() as connection:
                 with connection.transaction():
                     with connection.cursor() as cursor:
                         cursor.execute("set transaction read only")
-                        self._assert_runtime_role(cursor)
-                        self._assert_schema(cursor)
+                        self._verify_connection(connection, cursor)
                         self._set_context(cursor, normalized)
                         self._assert_active_identity_session(cursor, normalized)
                         cursor.execute(
@@ -3885,22 +4260,15 @@ class PostgresTrialStore:
         with self._self_serve_attempt_lock:
             _count_self_serve_attempt(self._self_serve_attempts, principal.actor_id)
         try:
-            connection = self._connect()
-        except TrialStoreError:
-            raise
-        except Exception as exc:
-            raise TrialNotReadyError(("database_ready",)) from exc
-        try:
-            with connection:
+            with self._checkout() as connection:
                 with connection.transaction():
                     with connection.cursor() as cursor:
                         cursor.execute("set transaction isolation level serializable")
                         try:
-                            self._assert_runtime_role(cursor)
-                            self._assert_schema(cursor)
+                            verification = self._verify_connection(connection, cursor)
                             self._set_context(cursor, principal)
                             self._assert_active_identity_session(cursor, principal)
-                            self._assert_audit(cursor)
+                            self._verify_audit(connection, cursor, verification)
                         except TrialStoreError:
                             raise
                         except Exception as exc:
@@ -4177,19 +4545,12 @@ class PostgresTrialStore:
             raise TrialNotReadyError(("auth_ready",))
         if write and not self.write_enabled:
             raise TrialNotReadyError(("write_enabled",))
-        try:
-            connection = self._connect()
-        except TrialStoreError:
-            raise
-        except Exception as exc:
-            raise TrialNotReadyError(("database_ready",)) from exc
 
-        with connection:
+        with self._checkout() as connection:
             with connection.transaction():
                 with connection.cursor() as cursor:
                     try:
-                        self._assert_runtime_role(cursor)
-                        self._assert_schema(cursor)
+                        verification = self._verify_connection(connection, cursor)
                         self._set_context(cursor, normalized)
                         self._assert_active_identity_session(cursor, normalized)
                         capabilities = self._load_membership(cursor, normalized)
@@ -4200,7 +4561,7 @@ class PostgresTrialStore:
                             capabilities, product_entitlements
                         )
                         if write:
-                            self._assert_audit(cursor)
+                            self._verify_audit(connection, cursor, verification)
                     except TrialStoreError:
                         raise
                     except Exception as exc:
@@ -4295,7 +4656,7 @@ class PostgresTrialStore:
                 write_enabled=self.write_enabled,
             )
         try:
-            with self._connect() as connection:
+            with self._checkout() as connection:
                 with connection.transaction():
                     with connection.cursor() as cursor:
                         cursor.execute("select 1 as ready")
@@ -4365,16 +4726,20 @@ class PostgresTrialStore:
                 (principal.normalized().workspace_id, normalized_surface),
             )
             row = cursor.fetchone()
-        if not row:
-            return TrialState(principal.normalized().workspace_id, normalized_surface, 0, {})
-        state = row.get("state_json") or {}
-        if isinstance(state, str):
-            state = json.loads(state)
+            if not row:
+                return TrialState(principal.normalized().workspace_id, normalized_surface, 0, {})
+            state = self._load_state(
+                cursor,
+                principal.normalized().workspace_id,
+                normalized_surface,
+                row.get("state_json"),
+                field_name="state",
+            )
         return TrialState(
             workspace_id=str(row["workspace_id"]),
             surface=str(row["surface"]),
             version=int(row["version"]),
-            state=_json_object(state, field_name="state"),
+            state=state,
             updated_by=str(row.get("updated_by", "")),
             updated_at=str(row.get("updated_at", "")),
         )
@@ -4403,6 +4768,124 @@ class PostgresTrialStore:
     def _lock(cursor: Any, key: str) -> None:
         cursor.execute("select pg_advisory_xact_lock(hashtextextended(%s, 0))", (key,))
 
+    def _cache_segments(self, workspace_id: str, surface: str, chunks: Mapping[str, str]) -> None:
+        with self._segment_cache_lock:
+            for digest, text in chunks.items():
+                key = (workspace_id, surface, digest)
+                self._segment_cache[key] = text
+                self._segment_cache.move_to_end(key)
+            while len(self._segment_cache) > STATE_SEGMENT_CACHE_LIMIT:
+                self._segment_cache.popitem(last=False)
+
+    def _segment_texts(
+        self,
+        cursor: Any,
+        workspace_id: str,
+        surface: str,
+        digests: Sequence[str],
+    ) -> dict[str, str]:
+        chunks: dict[str, str] = {}
+        missing: list[str] = []
+        with self._segment_cache_lock:
+            for digest in digests:
+                key = (workspace_id, surface, digest)
+                text = self._segment_cache.get(key)
+                if text is None:
+                    missing.append(digest)
+                    continue
+                self._segment_cache.move_to_end(key)
+                chunks[digest] = text
+        if not missing:
+            return chunks
+        cursor.execute(
+            """
+            select digest, records
+            from app_private.workspace_state_segments
+            where workspace_id = %s and surface = %s and digest = any(%s)
+            """,
+            (workspace_id, surface, missing),
+        )
+        fetched: dict[str, str] = {}
+        for row in cursor.fetchall():
+            records = row.get("records")
+            if isinstance(records, str):
+                records = json.loads(records)
+            text = _canonical_json_text(records)
+            if not isinstance(records, list) or _segment_digest(text) != row.get("digest"):
+                raise TrialValidationError("stored state segment failed digest verification.")
+            fetched[str(row["digest"])] = text
+        self._cache_segments(workspace_id, surface, fetched)
+        chunks.update(fetched)
+        return chunks
+
+    def _segments_surface(self, surface: str) -> bool:
+        return self.segmented_state and surface in SEGMENTED_STATE_COLLECTIONS
+
+    def _load_state(
+        self,
+        cursor: Any,
+        workspace_id: str,
+        surface: str,
+        stored: object,
+        *,
+        field_name: str,
+    ) -> JsonObject:
+        """Assemble a stored head, fetching only chunks this process has not seen."""
+
+        if isinstance(stored, str):
+            stored = json.loads(stored)
+        stored = stored or {}
+        if (
+            not self._segments_surface(surface)
+            or not isinstance(stored, Mapping)
+            or STATE_SEGMENTS_KEY not in stored
+        ):
+            return _json_object(stored, field_name=field_name, maximum=MAX_STATE_BYTES)
+        chunks = self._segment_texts(cursor, workspace_id, surface, state_segment_digests(stored))
+        return join_state_segments(stored, chunks)
+
+    def _store_state(
+        self,
+        cursor: Any,
+        workspace_id: str,
+        surface: str,
+        state: JsonObject,
+        *,
+        stored_digests: set[str],
+        field_name: str,
+    ) -> JsonObject:
+        """Insert the chunks ``state`` needs and return the head document to store.
+
+        Chunks already referenced by the locked head are known to exist and are
+        skipped; others are inserted idempotently. The process cache is never
+        used to skip an insert because it may hold chunks from a rolled-back
+        transaction.
+        """
+
+        if STATE_SEGMENTS_KEY in state:
+            raise TrialValidationError(f"{field_name} must not contain {STATE_SEGMENTS_KEY}.")
+        if not self._segments_surface(surface):
+            encoded = json.dumps(state, ensure_ascii=False, separators=(",", ":"))
+            if len(encoded.encode("utf-8")) > MAX_JSON_BYTES:
+                raise TrialValidationError(f"{field_name} exceeds {MAX_JSON_BYTES} bytes.")
+            return state
+        head, chunks = split_state_segments(surface, state)
+        for digest, text in chunks.items():
+            if digest in stored_digests:
+                continue
+            cursor.execute(
+                """
+                insert into app_private.workspace_state_segments
+                  (workspace_id, surface, digest, records)
+                values (%s, %s, %s, %s::jsonb)
+                on conflict (workspace_id, surface, digest) do nothing
+                """,
+                (workspace_id, surface, digest, text),
+            )
+            stored_digests.add(digest)
+        self._cache_segments(workspace_id, surface, chunks)
+        return head
+
     @staticmethod
     def _load_event_replay(
         cursor: Any,
@@ -4500,7 +4983,13 @@ class PostgresTrialStore:
                     surface=str(replay["surface"]),
                     event_type=str(replay["event_type"]),
                     version=int(replay["version"]),
-                    state=_json_object(replay.get("state", {}), field_name="state"),
+                    state=self._load_state(
+                        cursor,
+                        normalized.workspace_id,
+                        str(replay["surface"]),
+                        replay.get("state"),
+                        field_name="state",
+                    ),
                     idempotent_replay=True,
                 )
             locked_surfaces = tuple(sorted({surface_value, *related_surface_values}))
@@ -4508,6 +4997,7 @@ class PostgresTrialStore:
                 self._lock(cursor, f"{normalized.workspace_id}:state:{locked_surface}")
             rows: dict[str, Mapping[str, Any] | None] = {}
             states: dict[str, JsonObject] = {}
+            stored_digests: set[str] = set()
             for locked_surface in locked_surfaces:
                 cursor.execute(
                     """
@@ -4523,10 +5013,20 @@ class PostgresTrialStore:
                 locked_state = locked_row.get("state_json", {}) if locked_row else {}
                 if isinstance(locked_state, str):
                     locked_state = json.loads(locked_state)
-                states[locked_surface] = _json_object(
+                if (
+                    locked_surface == surface_value
+                    and self._segments_surface(locked_surface)
+                    and isinstance(locked_state, Mapping)
+                ):
+                    stored_digests.update(state_segment_digests(locked_state))
+                states[locked_surface] = self._load_state(
+                    cursor,
+                    normalized.workspace_id,
+                    locked_surface,
                     locked_state,
                     field_name=f"{locked_surface} state",
                 )
+            previous_digests = set(stored_digests)
             row = rows[surface_value]
             current_version = int(row["version"]) if row else 0
             current_state = states[surface_value]
@@ -4571,6 +5071,9 @@ class PostgresTrialStore:
                         for related_surface in related_surface_values
                     },
                 )
+            delta_command = surface_value == "commerce" and "delta" in payload_value
+            if delta_command:
+                payload_value = _expanded_delta_payload(payload_value, current_state)
             now = _utc_now()
             authoritative_payload = _json_object(
                 _authoritative_command_payload(
@@ -4581,16 +5084,47 @@ class PostgresTrialStore:
                     captured_at=now,
                 ),
                 field_name="authoritative payload",
+                maximum=MAX_STATE_BYTES,
             )
+            # The loaded state is private to this command and the payload is
+            # serialized before the reducer sees it, so neither needs a copy.
+            # Events store state heads too; their chunks are shared with the
+            # surface state they describe.
+            stored_payload = authoritative_payload
+            if isinstance(authoritative_payload.get("state"), Mapping):
+                stored_payload = {
+                    **authoritative_payload,
+                    "state": self._store_state(
+                        cursor,
+                        normalized.workspace_id,
+                        surface_value,
+                        authoritative_payload["state"],
+                        stored_digests=stored_digests,
+                        field_name="authoritative payload state",
+                    ),
+                }
+            authoritative_json = json.dumps(stored_payload, ensure_ascii=False)
             next_state = _json_object(
                 self.reducer(
                     surface_value,
                     event_type_value,
-                    deepcopy(current_state),
-                    deepcopy(authoritative_payload),
+                    current_state,
+                    _reducer_delta_payload(authoritative_payload, current_state)
+                    if delta_command
+                    else authoritative_payload,
                 ),
                 field_name="reduced state",
+                maximum=max_state_bytes(surface_value),
+            )
+            next_head = self._store_state(
+                cursor,
+                normalized.workspace_id,
+                surface_value,
+                next_state,
+                stored_digests=stored_digests,
+                field_name="reduced state",
             )
+            next_state_json = json.dumps(next_head, ensure_ascii=False)
             next_version = current_version + 1
             if row:
                 cursor.execute(
@@ -4601,7 +5135,7 @@ class PostgresTrialStore:
                     """,
                     (
                         next_version,
-                        json.dumps(next_state, ensure_ascii=False),
+                        next_state_json,
                         normalized.actor_id,
                         now,
                         normalized.workspace_id,
@@ -4619,7 +5153,7 @@ class PostgresTrialStore:
                         normalized.workspace_id,
                         surface_value,
                         next_version,
-                        json.dumps(next_state, ensure_ascii=False),
+                        next_state_json,
                         normalized.actor_id,
                         now,
                     ),
@@ -4629,7 +5163,7 @@ class PostgresTrialStore:
                 "surface": surface_value,
                 "event_type": event_type_value,
                 "version": next_version,
-                "state": next_state,
+                "state": next_head,
             }
             cursor.execute(
                 """
@@ -4650,11 +5184,22 @@ class PostgresTrialStore:
                     normalized.actor_kind,
                     int(expected_version),
                     next_version,
-                    json.dumps(authoritative_payload, ensure_ascii=False),
+                    authoritative_json,
                     json.dumps(result, ensure_ascii=False),
                     now,
                 ),
             )
+            dropped_digests = previous_digests.difference(
+                state_segment_digests(next_head),
+                state_segment_digests(stored_payload.get("state") or {}),
+            )
+            if dropped_digests:
+                # Chunks the new head no longer references may still back an
+                # event head; the collector deletes only fully orphaned ones.
+                cursor.execute(
+                    "select app_private.collect_workspace_state_segments(%s, %s, %s)",
+                    (normalized.workspace_id, surface_value, sorted(dropped_digests)),
+                )
         return CommandResult(
             command_id=command_id_value,
             surface=surface_value,
@@ -4718,11 +5263,16 @@ class PostgresTrialStore:
             )
             state_row = cursor.fetchone() or {}
             state_version = int(state_row.get("version", 0) or 0)
-            state = state_row.get("state_json", {}) or {}
-            if isinstance(state, str):
-                state = json.loads(state)
-            state_value = _json_object(state, field_name="acceptance state")
-            state_digest = f"sha256:{_canonical_fingerprint('product_state', state_value)}"
+            state_value = self._load_state(
+                cursor,
+                normalized.workspace_id,
+                surface,
+                state_row.get("state_json"),
+                field_name="acceptance state",
+            )
+            state_digest = (
+                f"sha256:{_canonical_fingerprint('product_state', state_value, maximum=MAX_STATE_BYTES)}"
+            )
             recorded_at = _utc_now()
             result = ProductAcceptanceRecord(
                 probe_id=probe_id_value,
@@ -5403,7 +5953,11 @@ class InMemoryTrialStore:
                     surface=str(replay["surface"]),
                     event_type=str(replay["event_type"]),
                     version=int(replay["version"]),
-                    state=_json_object(replay.get("state", {}), field_name="state"),
+                    state=_json_object(
+                        replay.get("state", {}),
+                        field_name="state",
+                        maximum=MAX_STATE_BYTES,
+                    ),
                     idempotent_replay=True,
                 )
             current = self._states.get(
@@ -5449,6 +6003,9 @@ class InMemoryTrialStore:
                         for related_surface in related_surface_values
                     },
                 )
+            delta_command = surface_value == "commerce" and "delta" in payload_value
+            if delta_command:
+                payload_value = _expanded_delta_payload(payload_value, current.state)
             now = _utc_now()
             authoritative_payload = _json_object(
                 _authoritative_command_payload(
@@ -5459,22 +6016,26 @@ class InMemoryTrialStore:
                     captured_at=now,
                 ),
                 field_name="authoritative payload",
+                maximum=MAX_STATE_BYTES,
             )
             next_state = _json_object(
                 self.reducer(
                     surface_value,
                     event_type_value,
-                    deepcopy(current.state),
-                    deepcopy(authoritative_payload),
+                    copy_json_tree(current.state),
+                    _reducer_delta_payload(authoritative_payload, current.state)
+                    if delta_command
+                    else authoritative_payload,
                 ),
                 field_name="reduced state",
+                maximum=max_state_bytes(surface_value),
             )
             next_version = current.version + 1
             next_row = TrialState(
                 workspace_id=normalized.workspace_id,
                 surface=surface_value,
                 version=next_version,
-                state=deepcopy(next_state),
+                state=next_state,
                 updated_by=normalized.actor_id,
                 updated_at=now,
             )
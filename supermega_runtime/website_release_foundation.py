@@ -7,11 +7,15 @@ deployment, domain, credential, provider request, or public claim.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime
 from hashlib import sha256
 import json
 import re
+from threading import RLock
+from types import MappingProxyType
 import unicodedata
 from typing import Any
 
@@ -50,12 +54,34 @@ _MIGRATION_OPERATIONS = ("CMP-HERO:1->2", "CMP-NAVIGATION:1->2")
 _COMMAND_KINDS = frozenset(
     {"prepare_package", "upgrade_template", "approve_release", "prepare_deploy_plan"}
 )
+# Verified command chains are checkpointed by (scope, revision, headDigest)
+# with the read-only replay cursor they produced. A later state whose prefix
+# encodes exactly like a checkpoint only verifies and replays its new envelopes;
+# the lookback bounds how many trailing envelopes are probed.
+WEBSITE_RELEASE_CHECKPOINT_LIMIT = 64
+_CHECKPOINT_LOOKBACK = 16
 
 
 class WebsiteReleaseValidationError(ValueError):
     """Raised when Website release evidence cannot be proved consistent."""
 
 
+@dataclass(frozen=True)
+class _ReleaseCheckpoint:
+    """A fully verified command prefix and the replay cursor it produced."""
+
+    commands: tuple[dict[str, Any], ...]
+    encoded_commands: tuple[str, ...]
+    command_ids: tuple[str, ...]
+    action_ids: tuple[str, ...]
+    captured_at: datetime | None
+    cursor: Mapping[str, Any]
+
+
+_CHECKPOINT_LOCK = RLock()
+_CHECKPOINTS: OrderedDict[tuple[str, int, str], _ReleaseCheckpoint] = OrderedDict()
+
+
 def _fail(message: str) -> WebsiteReleaseValidationError:
     return WebsiteReleaseValidationError(message)
 
@@ -863,13 +889,26 @@ def _empty_projection() -> dict[str, Any]:
     }
 
 
-def _replay_commands(commands: list[dict[str, Any]], scope: str) -> dict[str, Any]:
-    if not commands:
-        return _empty_projection()
-    package: dict[str, Any] | None = None
-    approval: dict[str, Any] | None = None
-    deploy_plan: dict[str, Any] | None = None
-    for index, command in enumerate(commands):
+def _new_cursor() -> dict[str, Any]:
+    return {"package": None, "approval": None, "deployPlan": None}
+
+
+def _apply_commands(
+    cursor: dict[str, Any],
+    commands: Sequence[dict[str, Any]],
+    scope: str,
+    start: int = 0,
+) -> None:
+    """Replay command payloads, numbered from ``start``, onto a release cursor.
+
+    Every cursor entry is replaced rather than mutated, so a checkpointed cursor
+    only needs a shallow copy before new commands are applied to it.
+    """
+
+    package: dict[str, Any] | None = cursor["package"]
+    approval: dict[str, Any] | None = cursor["approval"]
+    deploy_plan: dict[str, Any] | None = cursor["deployPlan"]
+    for index, command in enumerate(commands, start):
         field = f"commands[{index}].payload"
         kind = command["kind"]
         if index == 0 and kind != "prepare_package":
@@ -927,8 +966,17 @@ def _replay_commands(commands: list[dict[str, Any]], scope: str) -> dict[str, An
             raise _fail(f"{field} rollback target cannot equal the candidate package.")
         deploy_plan = _deploy_plan(package, approval, command)
 
-    if package is None:
+    if package is None and (start or commands):
         raise _fail("Website release history lacks its package.")
+    cursor.update(package=package, approval=approval, deployPlan=deploy_plan)
+
+
+def _cursor_projection(cursor: Mapping[str, Any]) -> dict[str, Any]:
+    package = cursor["package"]
+    if package is None:
+        return _empty_projection()
+    approval = cursor["approval"]
+    deploy_plan = cursor["deployPlan"]
     if deploy_plan:
         status = "plan_ready"
     elif approval:
@@ -949,6 +997,61 @@ def _replay_commands(commands: list[dict[str, Any]], scope: str) -> dict[str, An
     }
 
 
+def _same_canonical_commands(
+    raw_commands: list[Any], verified: tuple[str, ...]
+) -> bool:
+    try:
+        return all(
+            _canonical_json(raw) == encoded
+            for raw, encoded in zip(raw_commands, verified, strict=True)
+        )
+    except WebsiteReleaseValidationError:
+        return False
+
+
+def _trusted_prefix(raw_commands: list[Any], scope: str) -> _ReleaseCheckpoint | None:
+    """Return the longest checkpoint that the submitted chain extends unchanged."""
+
+    with _CHECKPOINT_LOCK:
+        for length in range(
+            len(raw_commands), max(0, len(raw_commands) - _CHECKPOINT_LOOKBACK), -1
+        ):
+            envelope = raw_commands[length - 1]
+            digest = envelope.get("digest") if isinstance(envelope, Mapping) else None
+            if not isinstance(digest, str):
+                continue
+            key = (scope, length, digest)
+            checkpoint = _CHECKPOINTS.get(key)
+            if checkpoint is None:
+                continue
+            # The head digest only names the prefix; the submitted envelopes must
+            # still encode exactly like the verified ones before any check is
+            # skipped. Plain equality would accept True or 1.0 for 1.
+            if not _same_canonical_commands(
+                raw_commands[:length], checkpoint.encoded_commands
+            ):
+                return None
+            _CHECKPOINTS.move_to_end(key)
+            return checkpoint
+    return None
+
+
+def _remember_checkpoint(scope: str, checkpoint: _ReleaseCheckpoint) -> None:
+    if not checkpoint.commands:
+        return
+    key = (scope, len(checkpoint.commands), checkpoint.commands[-1]["digest"])
+    with _CHECKPOINT_LOCK:
+        _CHECKPOINTS[key] = checkpoint
+        _CHECKPOINTS.move_to_end(key)
+        while len(_CHECKPOINTS) > WEBSITE_RELEASE_CHECKPOINT_LIMIT:
+            _CHECKPOINTS.popitem(last=False)
+
+
+def clear_website_release_checkpoints() -> None:
+    with _CHECKPOINT_LOCK:
+        _CHECKPOINTS.clear()
+
+
 def create_empty_website_release_state(scope: object) -> dict[str, Any]:
     return {
         "schema": WEBSITE_RELEASE_STATE_SCHEMA,
@@ -959,9 +1062,9 @@ def create_empty_website_release_state(scope: object) -> dict[str, Any]:
     }
 
 
-def validate_website_release_state(value: object) -> dict[str, Any]:
-    """Validate the append-only Website release command chain."""
-
+def _verify_state(
+    value: object, *, full_verification: bool
+) -> tuple[dict[str, Any], Mapping[str, Any]]:
     source = _object(
         value,
         "Website release state",
@@ -977,12 +1080,21 @@ def validate_website_release_state(value: object) -> dict[str, Any]:
     )
     if revision != len(raw_commands):
         raise _fail("Website release state.revision must equal its command count.")
+    checkpoint = None if full_verification else _trusted_prefix(raw_commands, scope)
     commands: list[dict[str, Any]] = []
     command_ids: list[str] = []
     action_ids: list[str] = []
     prior_digest = EMPTY_WEBSITE_RELEASE_DIGEST
     prior_timestamp: datetime | None = None
-    for index, candidate in enumerate(raw_commands):
+    if checkpoint is not None:
+        commands = list(checkpoint.commands)
+        command_ids = list(checkpoint.command_ids)
+        action_ids = list(checkpoint.action_ids)
+        prior_digest = commands[-1]["digest"]
+        prior_timestamp = checkpoint.captured_at
+    start = len(commands)
+    for index in range(start, len(raw_commands)):
+        candidate = raw_commands[index]
         field = f"Website release state.commands[{index}]"
         envelope = _object(
             candidate, field, ("sequence", "previousDigest", "payload", "digest")
@@ -1019,31 +1131,63 @@ def validate_website_release_state(value: object) -> dict[str, Any]:
     expected_head = prior_digest if commands else EMPTY_WEBSITE_RELEASE_DIGEST
     if head_digest != expected_head:
         raise _fail("Website release state.headDigest does not match its command chain.")
-    _replay_commands([command["payload"] for command in commands], scope)
-    return _canonical_copy(
-        {
-            "schema": WEBSITE_RELEASE_STATE_SCHEMA,
-            "scope": scope,
-            "revision": revision,
-            "headDigest": head_digest,
-            "commands": commands,
-        }
-    )
+    cursor: Mapping[str, Any]
+    if checkpoint is not None and start == len(commands):
+        cursor = checkpoint.cursor
+    else:
+        replayed = _new_cursor() if checkpoint is None else dict(checkpoint.cursor)
+        _apply_commands(
+            replayed, [command["payload"] for command in commands[start:]], scope, start
+        )
+        cursor = MappingProxyType(replayed)
+        encoded_prefix = () if checkpoint is None else checkpoint.encoded_commands
+        _remember_checkpoint(
+            scope,
+            _ReleaseCheckpoint(
+                commands=tuple(commands),
+                encoded_commands=encoded_prefix
+                + tuple(_canonical_json(command) for command in commands[start:]),
+                command_ids=tuple(command_ids),
+                action_ids=tuple(action_ids),
+                captured_at=prior_timestamp,
+                cursor=cursor,
+            ),
+        )
+    state = {
+        "schema": WEBSITE_RELEASE_STATE_SCHEMA,
+        "scope": scope,
+        "revision": revision,
+        "headDigest": head_digest,
+        "commands": commands,
+    }
+    return state, cursor
 
 
-def project_website_release(state: object) -> dict[str, Any]:
-    validated = validate_website_release_state(state)
-    projection = _replay_commands(
-        [command["payload"] for command in validated["commands"]],
-        validated["scope"],
-    )
+def validate_website_release_state(
+    value: object, *, full_verification: bool = False
+) -> dict[str, Any]:
+    """Validate the append-only Website release command chain.
+
+    A chain that extends a verified checkpoint only verifies and replays its new
+    envelopes. ``full_verification`` ignores checkpoints and replays the whole
+    chain; audits use it to recheck a stored release end to end.
+    """
+
+    state, _cursor = _verify_state(value, full_verification=full_verification)
+    return _canonical_copy(state)
+
+
+def project_website_release(
+    state: object, *, full_verification: bool = False
+) -> dict[str, Any]:
+    validated, cursor = _verify_state(state, full_verification=full_verification)
     return _canonical_copy(
         {
             "contract": WEBSITE_RELEASE_PROJECTION_CONTRACT,
             "scope": validated["scope"],
             "revision": validated["revision"],
             "headDigest": validated["headDigest"],
-            **projection,
+            **_cursor_projection(cursor),
         }
     )
 
@@ -1184,6 +1328,7 @@ __all__ = (
     "apply_website_template_upgrade",
     "approve_website_release_package",
     "build_website_release_package",
+    "clear_website_release_checkpoints",
     "create_empty_website_release_state",
     "prepare_website_deploy_plan",
     "prepare_website_release_package",
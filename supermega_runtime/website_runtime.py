@@ -10,6 +10,7 @@ import re
 from typing import Any
 from urllib.parse import urlsplit
 
+from supermega_runtime.state_memo import validated_state
 from supermega_runtime.trial_store import TrialValidationError
 from supermega_runtime.website_release_foundation import (
     WebsiteReleaseValidationError,
@@ -728,7 +729,7 @@ def validate_website_snapshot_source(
 ) -> dict[str, Any]:
     """Require a Commerce intake source to name retained managed Website proof."""
 
-    state = validate_website_state(website_state)
+    state = validated_state("website", website_state, validate_website_state)
     source = _object(source_value, "commerce Website source")
     _exact(source, "commerce Website source", _COMMERCE_INTAKE_SOURCE_FIELDS)
     fingerprint = _text(source["fingerprint"], "commerce Website source.fingerprint", maximum=12)
@@ -1020,7 +1021,7 @@ def reduce_website_state(
             raise TrialValidationError("A managed Website workspace cannot initialize with client-asserted release history.")
         return next_state
 
-    current_state = validate_website_state(current)
+    current_state = validated_state("website", current, validate_website_state)
     if next_state["revision"] != current_state["revision"] + 1:
         raise TrialValidationError("Website revision must advance exactly once per event.")
     if next_state["schema"] != current_state["schema"] or next_state["version"] != current_state["version"]:
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from supermega_runtime.telemetry.tracing import shutdown_tracing
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _drain_span_export() -> Iterator[None]:
+    yield
+    # The console exporter writes to the captured stdout, which pytest closes
+    # after the session; export the last batch before that happens.
+    shutdown_tracing()
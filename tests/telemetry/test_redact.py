@@ -25,6 +25,7 @@ from __future__ import annotations
 
 import unittest
 from typing import Any
+from unittest.mock import patch
 
 from supermega_runtime.telemetry import redact, schema
 
@@ -596,5 +597,44 @@ class ExtractCustomerContentValuesTests(unittest.TestCase):
         self.assertIn("12,500 MMK", values)
 
 
+class CompiledDenyListTests(unittest.TestCase):
+    def test_push_scope_compiles_the_deny_list_once(self) -> None:
+        token = redact.push_customer_content_scope({"customerName": "Ma Thida Win", "note": "ok"})
+        try:
+            deny_values = redact.customer_content_values()
+            self.assertIsInstance(deny_values, redact.CustomerContentDenyList)
+            self.assertEqual(deny_values, frozenset({"Ma Thida Win", "ok"}))
+            self.assertFalse(redact.is_string_value_safe("route for Ma Thida Win", deny_values))
+            # Short deny values only match exactly, never as a substring.
+            self.assertFalse(redact.is_string_value_safe("ok", deny_values))
+            self.assertTrue(redact.is_string_value_safe("looks ok", deny_values))
+        finally:
+            redact.pop_customer_content_scope(token)
+
+    def test_compiled_matcher_agrees_with_a_linear_scan(self) -> None:
+        deny_values = frozenset({"abab", "babc", "bca", "Kyaw Kyaw", "aaaa", "ab"})
+        compiled = redact.CustomerContentDenyList(deny_values)
+        candidates = ["xxababxx", "abababc", "bcabca", "ab", "aaab", "aaaaa", "U Kyaw Kyaw Oo", "kyaw kyaw", ""]
+        for value in candidates:
+            with self.subTest(value=value):
+                expected = value in deny_values or (
+                    len(value) >= 4 and any(len(deny) >= 4 and deny in value for deny in deny_values)
+                )
+                self.assertEqual(redact.is_string_value_safe(value, compiled), not expected)
+                self.assertEqual(redact.is_string_value_safe(value, deny_values), not expected)
+
+    def test_plain_deny_lists_are_compiled_per_call_and_never_retained(self) -> None:
+        deny_values = frozenset({"Ma Thida Win"})
+        attributes = {"http.route": "/api/orders", "workflow": "order for Ma Thida Win"}
+        with patch.object(redact, "_DenyValueAutomaton", wraps=redact._DenyValueAutomaton) as compile_:
+            for _ in range(2):
+                self.assertEqual(
+                    redact.scrub_attributes(attributes, deny_values),
+                    {"http.route": "/api/orders"},
+                )
+        # One compile per scrub call, shared by its attributes; nothing cached.
+        self.assertEqual(compile_.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
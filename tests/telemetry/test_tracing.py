@@ -0,0 +1,157 @@
+"""Batching span export: scrubbing stays fail-closed when it moves off-thread."""
+
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from typing import Any
+
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+
+from supermega_runtime.telemetry import redact
+from supermega_runtime.telemetry.tracing import BatchingRedactingSpanProcessor
+
+
+class InMemoryExporter:
+    """Stand-in exporter that records batches and can be made to stall."""
+
+    def __init__(self) -> None:
+        self.batches: list[tuple[Any, ...]] = []
+        self.release = threading.Event()
+        self.release.set()
+        self.entered = threading.Event()
+        self.shut_down = False
+
+    def export(self, spans: tuple[Any, ...]) -> None:
+        self.entered.set()
+        self.release.wait(5)
+        self.batches.append(spans)
+
+    def shutdown(self) -> None:
+        self.shut_down = True
+
+    @property
+    def spans(self) -> list[Any]:
+        return [span for batch in self.batches for span in batch]
+
+
+def _tracer(processor: BatchingRedactingSpanProcessor) -> Any:
+    provider = TracerProvider(resource=Resource.create({"service.name": "test"}), shutdown_on_exit=False)
+    provider.add_span_processor(processor)  # type: ignore[arg-type]
+    return provider.get_tracer(__name__)
+
+
+class BatchingRedactingSpanProcessorTests(unittest.TestCase):
+    def _processor(self, exporter: InMemoryExporter, **kwargs: Any) -> BatchingRedactingSpanProcessor:
+        processor = BatchingRedactingSpanProcessor(exporter, **kwargs)
+        self.addCleanup(processor.shutdown)
+        return processor
+
+    def test_spans_are_scrubbed_and_exported_in_bounded_batches(self) -> None:
+        exporter = InMemoryExporter()
+        processor = self._processor(exporter, max_export_batch_size=4, schedule_delay_millis=60_000)
+        tracer = _tracer(processor)
+
+        for index in range(10):
+            with tracer.start_as_current_span(f"db.query.{index}") as span:
+                span.set_attribute("db.system", "postgresql")
+                span.set_attribute("db.statement", "select * from app_private.workspace_events where note = 'x'")
+
+        self.assertTrue(processor.force_flush(5_000))
+        self.assertEqual(len(exporter.spans), 10)
+        self.assertTrue(all(len(batch) <= 4 for batch in exporter.batches))
+        for span in exporter.spans:
+            self.assertNotIn("db.statement", span.attributes)
+            self.assertEqual(span.attributes.get("db.operation"), "SELECT")
+        self.assertEqual(processor.stats()["exported"], 10)
+        self.assertEqual(processor.stats()["queue_depth"], 0)
+
+    def test_request_deny_list_is_captured_before_the_span_leaves_the_request(self) -> None:
+        exporter = InMemoryExporter()
+        processor = self._processor(exporter, schedule_delay_millis=60_000)
+        tracer = _tracer(processor)
+
+        token = redact.push_customer_content_scope({"customerName": "Ma Thida Win"})
+        try:
+            with tracer.start_as_current_span("Ma Thida Win"):
+                pass
+        finally:
+            redact.pop_customer_content_scope(token)
+
+        self.assertTrue(processor.force_flush(5_000))
+        self.assertEqual([span.name for span in exporter.spans], ["[redacted]"])
+
+    def test_full_queue_drops_spans_instead_of_blocking(self) -> None:
+        exporter = InMemoryExporter()
+        exporter.release.clear()
+        processor = self._processor(
+            exporter,
+            max_queue_size=3,
+            max_export_batch_size=1,
+            schedule_delay_millis=0,
+        )
+        tracer = _tracer(processor)
+
+        with tracer.start_as_current_span("first"):
+            pass
+        self.assertTrue(exporter.entered.wait(5))
+        started = time.perf_counter()
+        for index in range(10):
+            with tracer.start_as_current_span(f"queued.{index}"):
+                pass
+        elapsed = time.perf_counter() - started
+
+        stats = processor.stats()
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(stats["queue_depth"], 3)
+        self.assertEqual(stats["dropped"], 7)
+        exporter.release.set()
+        self.assertTrue(processor.force_flush(5_000))
+        self.assertEqual(len(exporter.spans), 4)
+
+    def test_hung_exporter_is_abandoned_after_the_export_timeout(self) -> None:
+        exporter = InMemoryExporter()
+        exporter.release.clear()
+        self.addCleanup(exporter.release.set)
+        processor = self._processor(
+            exporter,
+            max_export_batch_size=1,
+            schedule_delay_millis=60_000,
+            export_timeout_millis=100,
+        )
+        tracer = _tracer(processor)
+
+        started = time.perf_counter()
+        with tracer.start_as_current_span("hung"):
+            pass
+        self.assertTrue(processor.force_flush(5_000))
+        with tracer.start_as_current_span("behind.the.hung.export"):
+            pass
+        self.assertTrue(processor.force_flush(5_000))
+        elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(processor.stats()["export_failures"], 2)
+        self.assertEqual(exporter.batches, [])
+
+    def test_shutdown_drains_the_queue_and_stops_accepting_spans(self) -> None:
+        exporter = InMemoryExporter()
+        processor = BatchingRedactingSpanProcessor(exporter, schedule_delay_millis=60_000)
+        tracer = _tracer(processor)
+        for index in range(3):
+            with tracer.start_as_current_span(f"span.{index}"):
+                pass
+
+        processor.shutdown()
+        with tracer.start_as_current_span("late"):
+            pass
+
+        self.assertEqual([span.name for span in exporter.spans], ["span.0", "span.1", "span.2"])
+        self.assertTrue(exporter.shut_down)
+        self.assertEqual(processor.stats()["dropped"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
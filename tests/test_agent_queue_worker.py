@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from typing import Any
+
+from mark1_pilot.agent_queue_signal import AgentQueueListener, FileAgentQueueListener, agent_queue_signal_path
+from mark1_pilot.agent_queue_worker import AgentQueueWorker
+from mark1_pilot.enterprise_store import (
+    complete_agent_run,
+    create_agent_run,
+    dispose_engines,
+    ensure_workspace,
+    get_agent_run,
+    open_agent_queue_listener,
+)
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class AgentQueueWorkerTests(unittest.TestCase):
+    @contextmanager
+    def _database(self) -> Iterator[tuple[str, str, Path]]:
+        with tempfile.TemporaryDirectory(prefix="supermega-agent-queue-") as directory:
+            database_path = Path(directory) / "agent-queue.db"
+            database_url = f"sqlite:///{database_path.as_posix()}"
+            workspace = ensure_workspace(database_url, slug="queue-test", name="Queue Test")
+            try:
+                yield database_url, str(workspace["workspace_id"]), database_path
+            finally:
+                dispose_engines(database_url)
+
+    def _worker(self, database_url: str, workspace_id: str, complete: Any) -> AgentQueueWorker:
+        worker = AgentQueueWorker(
+            database_url=database_url,
+            workspace_id=workspace_id,
+            job_types=["ops_watch", "task_triage"],
+            complete=complete,
+            listener=open_agent_queue_listener(database_url, workspace_id=workspace_id),
+            enqueue_defaults=False,
+            idle_seconds=30,
+        )
+        self.addCleanup(worker.close)
+        return worker
+
+    @staticmethod
+    def _ready(database_url: str) -> Any:
+        def complete(row: dict[str, Any]) -> dict[str, Any]:
+            return complete_agent_run(
+                database_url,
+                workspace_id=row["workspace_id"],
+                run_id=row["run_id"],
+                claim_token=row["claim_token"],
+                status="ready",
+            )
+
+        return complete
+
+    def test_file_listener_wakes_on_a_signal_from_another_process(self) -> None:
+        with self._database() as (database_url, _, database_path):
+            listener = open_agent_queue_listener(database_url)
+            self.assertIsInstance(listener, FileAgentQueueListener)
+            signal_path = agent_queue_signal_path(database_path)
+            script = (
+                "import time\n"
+                "from pathlib import Path\n"
+                "from mark1_pilot.agent_queue_signal import signal_agent_queue\n"
+                "time.sleep(0.2)\n"
+                f"signal_agent_queue('ws', signal_path=Path({str(signal_path)!r}))\n"
+            )
+            child = subprocess.Popen([sys.executable, "-c", script], cwd=ROOT)
+            self.addCleanup(child.wait)
+
+            started = time.perf_counter()
+            self.assertTrue(listener.wait(20))
+            self.assertLess(time.perf_counter() - started, 10)
+            self.assertFalse(listener.wait(0.05))
+
+    def test_queued_runs_are_claimed_on_notification_not_on_the_idle_timeout(self) -> None:
+        with self._database() as (database_url, workspace_id, _):
+            worker = self._worker(database_url, workspace_id, self._ready(database_url))
+            cycles: list[str] = []
+            thread = threading.Thread(target=worker.run, kwargs={"on_cycle": lambda status, *_: cycles.append(status)})
+            thread.start()
+
+            run_ids = [
+                create_agent_run(database_url, workspace_id=workspace_id, job_type=job_type)["run_id"]
+                for job_type in ("ops_watch", "task_triage")
+            ]
+            deadline = time.monotonic() + 10
+            while worker.metrics()["completed_runs"] < 2 and time.monotonic() < deadline:
+                time.sleep(0.02)
+            worker.request_stop()
+            thread.join(10)
+
+            self.assertFalse(thread.is_alive())
+            for run_id in run_ids:
+                self.assertEqual(get_agent_run(database_url, workspace_id=workspace_id, run_id=run_id)["status"], "ready")
+            metrics = worker.metrics()
+            self.assertEqual(metrics["listener"], "sqlite_file_watch")
+            self.assertEqual(metrics["claimed_runs"], 2)
+            self.assertEqual(metrics["completed_runs"], 2)
+            self.assertEqual(metrics["in_flight"], 0)
+            self.assertGreater(metrics["throughput_per_minute"], 0)
+            self.assertGreaterEqual(metrics["queue_lag_seconds"]["max"], metrics["queue_lag_seconds"]["mean"])
+            self.assertLess(metrics["queue_lag_seconds"]["max"], 10)
+            self.assertEqual(metrics["wakeups_idle"], 0)
+            self.assertEqual(cycles[-1], "draining")
+
+    def test_stop_drains_claimed_runs_before_returning(self) -> None:
+        with self._database() as (database_url, workspace_id, _):
+            entered = threading.Event()
+            release = threading.Event()
+            finish = self._ready(database_url)
+
+            def complete(row: dict[str, Any]) -> dict[str, Any]:
+                entered.set()
+                release.wait(5)
+                return finish(row)
+
+            worker = self._worker(database_url, workspace_id, complete)
+            run_id = create_agent_run(database_url, workspace_id=workspace_id, job_type="ops_watch")["run_id"]
+            result: list[bool] = []
+            thread = threading.Thread(target=lambda: result.append(worker.run()))
+            thread.start()
+            self.assertTrue(entered.wait(5))
+
+            worker.request_stop()
+            thread.join(0.2)
+            self.assertTrue(thread.is_alive())
+            release.set()
+            thread.join(10)
+
+            self.assertEqual(result, [True])
+            self.assertEqual(get_agent_run(database_url, workspace_id=workspace_id, run_id=run_id)["status"], "ready")
+            self.assertEqual(worker.metrics()["completed_runs"], 1)
+
+    def test_listener_failure_falls_back_to_idle_polling_and_reopens(self) -> None:
+        class DroppedConnection(Exception):
+            pass
+
+        class BrokenListener(AgentQueueListener):
+            kind = "postgres_listen"
+
+            def wait(self, timeout: float) -> bool:
+                raise DroppedConnection("server closed the connection unexpectedly")
+
+        with self._database() as (database_url, workspace_id, _):
+            reopened: list[AgentQueueListener] = []
+
+            def reopen() -> AgentQueueListener:
+                listener = open_agent_queue_listener(database_url, workspace_id=workspace_id)
+                reopened.append(listener)
+                return listener
+
+            worker = AgentQueueWorker(
+                database_url=database_url,
+                workspace_id=workspace_id,
+                job_types=["ops_watch"],
+                complete=self._ready(database_url),
+                listener=BrokenListener(),
+                enqueue_defaults=False,
+                idle_seconds=0.05,
+                reopen_listener=reopen,
+                listener_retry_seconds=0.01,
+            )
+            self.addCleanup(worker.close)
+            cycles: list[tuple[str, str]] = []
+            thread = threading.Thread(
+                target=worker.run,
+                kwargs={"on_cycle": lambda status, error, *_: cycles.append((status, error))},
+            )
+            thread.start()
+
+            deadline = time.monotonic() + 10
+            while not reopened and time.monotonic() < deadline:
+                time.sleep(0.02)
+            run_id = create_agent_run(database_url, workspace_id=workspace_id, job_type="ops_watch")["run_id"]
+            while worker.metrics()["completed_runs"] < 1 and time.monotonic() < deadline:
+                time.sleep(0.02)
+            worker.request_stop()
+            thread.join(10)
+
+            self.assertFalse(thread.is_alive())
+            self.assertIn(("error", "queue listener failed: server closed the connection unexpectedly"), cycles)
+            self.assertEqual(get_agent_run(database_url, workspace_id=workspace_id, run_id=run_id)["status"], "ready")
+            metrics = worker.metrics()
+            self.assertEqual(metrics["listener_errors"], 1)
+            self.assertEqual(metrics["listener"], "sqlite_file_watch")
+            self.assertEqual(metrics["listener_error"], "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from typing import Any
+
+from mark1_pilot.agent_run_executor import (
+    ClaimedAgentRunExecutor,
+    shared_agent_run_executor,
+    shutdown_shared_agent_run_executor,
+)
+
+
+def _row(run_id: str, job_type: str) -> dict[str, Any]:
+    return {"run_id": run_id, "job_type": job_type, "claim_token": f"claim-{run_id}"}
+
+
+class ClaimedAgentRunExecutorTests(unittest.TestCase):
+    def _executor(self, max_workers: int) -> ClaimedAgentRunExecutor:
+        executor = ClaimedAgentRunExecutor(max_workers=max_workers, concurrency_limit=lambda job_type: 1)
+        self.addCleanup(executor.shutdown)
+        return executor
+
+    def test_drain_time_scales_with_workers_not_the_sum_of_runs(self) -> None:
+        rows = [_row(f"run-{index}", job_type) for index, job_type in enumerate(("ops_watch", "founder_brief", "task_triage"))]
+
+        def complete(row: dict[str, Any]) -> dict[str, Any]:
+            time.sleep(0.2)
+            return {"run_id": row["run_id"], "status": "ready"}
+
+        started = time.perf_counter()
+        completed, pending = self._executor(3).run(
+            rows,
+            complete=complete,
+            renew_lease=lambda row: {"run_id": row["run_id"]},
+            heartbeat_seconds=60,
+            deadline_seconds=5,
+        )
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual([row["run_id"] for row in completed], ["run-0", "run-1", "run-2"])
+        self.assertEqual(pending, [])
+        self.assertLess(elapsed, 0.5)
+
+    def test_job_type_concurrency_limit_serialises_same_type_runs(self) -> None:
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+        lock = threading.Lock()
+
+        def complete(row: dict[str, Any]) -> dict[str, Any]:
+            with lock:
+                active[row["job_type"]] = active.get(row["job_type"], 0) + 1
+                peak[row["job_type"]] = max(peak.get(row["job_type"], 0), active[row["job_type"]])
+            time.sleep(0.05)
+            with lock:
+                active[row["job_type"]] -= 1
+            return {"run_id": row["run_id"], "status": "ready"}
+
+        rows = [_row("a", "ops_watch"), _row("b", "ops_watch"), _row("c", "task_triage")]
+        completed, pending = self._executor(3).run(
+            rows,
+            complete=complete,
+            renew_lease=lambda row: {"run_id": row["run_id"]},
+            heartbeat_seconds=60,
+            deadline_seconds=5,
+        )
+
+        self.assertEqual(len(completed), 3)
+        self.assertEqual(pending, [])
+        self.assertEqual(peak, {"ops_watch": 1, "task_triage": 1})
+
+    def test_deadline_returns_partial_results_while_heartbeats_keep_the_lease(self) -> None:
+        release = threading.Event()
+        renewals: list[str] = []
+        finished = threading.Event()
+
+        def complete(row: dict[str, Any]) -> dict[str, Any]:
+            if row["job_type"] == "founder_brief":
+                release.wait(5)
+                finished.set()
+            return {"run_id": row["run_id"], "status": "ready"}
+
+        def renew(row: dict[str, Any]) -> dict[str, Any]:
+            renewals.append(row["run_id"])
+            return {"run_id": row["run_id"]}
+
+        completed, pending = self._executor(2).run(
+            [_row("quick", "ops_watch"), _row("slow", "founder_brief")],
+            complete=complete,
+            renew_lease=renew,
+            heartbeat_seconds=0.02,
+            deadline_seconds=0.2,
+        )
+
+        self.assertEqual([row["run_id"] for row in completed], ["quick"])
+        self.assertEqual([row["run_id"] for row in pending], ["slow"])
+        self.assertIn("slow", renewals)
+        release.set()
+        self.assertTrue(finished.wait(5))
+
+    def test_lost_lease_stops_the_heartbeat(self) -> None:
+        renewals: list[str] = []
+
+        def complete(row: dict[str, Any]) -> dict[str, Any]:
+            time.sleep(0.3)
+            return {"run_id": row["run_id"], "status": "ready"}
+
+        def renew(row: dict[str, Any]) -> None:
+            renewals.append(row["run_id"])
+            return None
+
+        future = self._executor(1).submit(
+            _row("lost", "ops_watch"),
+            complete=complete,
+            renew_lease=renew,
+            heartbeat_seconds=0.02,
+        )
+        future.result(5)
+
+        self.assertEqual(renewals, ["lost"])
+
+    def test_hung_run_stops_renewing_after_max_runtime_and_frees_its_slot(self) -> None:
+        release = threading.Event()
+        renewals: list[str] = []
+
+        def complete(row: dict[str, Any]) -> dict[str, Any]:
+            if row["run_id"] == "hung":
+                release.wait(5)
+            return {"run_id": row["run_id"], "status": "ready"}
+
+        def renew(row: dict[str, Any]) -> dict[str, Any]:
+            renewals.append(row["run_id"])
+            return {"run_id": row["run_id"]}
+
+        executor = self._executor(2)
+        hung = executor.submit(
+            _row("hung", "ops_watch"),
+            complete=complete,
+            renew_lease=renew,
+            heartbeat_seconds=0.02,
+            max_runtime_seconds=0.15,
+        )
+        queued = executor.submit(
+            _row("queued", "ops_watch"),
+            complete=complete,
+            renew_lease=renew,
+            heartbeat_seconds=60,
+        )
+
+        with self.assertRaises(TimeoutError):
+            hung.result(5)
+        self.assertEqual(queued.result(5)["status"], "ready")
+        renewed = len(renewals)
+        self.assertGreater(renewed, 0)
+        time.sleep(0.1)
+        self.assertEqual(len(renewals), renewed)
+        release.set()
+        time.sleep(0.05)
+        self.assertIsInstance(hung.exception(), TimeoutError)
+
+    def test_slot_handed_over_during_shutdown_fails_the_waiting_run(self) -> None:
+        executor = self._executor(1)
+        running = executor.submit(
+            _row("running", "ops_watch"),
+            complete=lambda row: (time.sleep(0.1), {"run_id": row["run_id"], "status": "ready"})[1],
+            renew_lease=lambda row: {"run_id": row["run_id"]},
+            heartbeat_seconds=60,
+        )
+        waiting = executor.submit(
+            _row("waiting", "ops_watch"),
+            complete=lambda row: {"run_id": row["run_id"], "status": "ready"},
+            renew_lease=lambda row: {"run_id": row["run_id"]},
+            heartbeat_seconds=60,
+        )
+        queued_future, start = executor._waiting["ops_watch"][0]
+
+        def start_after_shutdown() -> None:
+            executor.shutdown(wait_for_runs=False)
+            start()
+
+        executor._waiting["ops_watch"][0] = (queued_future, start_after_shutdown)
+
+        self.assertEqual(running.result(5)["status"], "ready")
+        with self.assertRaises(RuntimeError):
+            waiting.result(5)
+
+    def test_shared_executor_follows_the_policy_size_and_shuts_down(self) -> None:
+        shutdown_shared_agent_run_executor()
+        self.addCleanup(shutdown_shared_agent_run_executor)
+        release = threading.Event()
+        started: list[str] = []
+        lock = threading.Lock()
+
+        def complete(row: dict[str, Any]) -> dict[str, Any]:
+            with lock:
+                started.append(row["run_id"])
+            release.wait(5)
+            return {"run_id": row["run_id"], "status": "ready"}
+
+        def submit(executor: ClaimedAgentRunExecutor, run_id: str, job_type: str) -> Any:
+            return executor.submit(
+                _row(run_id, job_type),
+                complete=complete,
+                renew_lease=lambda row: {"run_id": row["run_id"]},
+                heartbeat_seconds=60,
+            )
+
+        executor = shared_agent_run_executor(1)
+        futures = [submit(executor, "before", "ops_watch")]
+        self.assertIs(shared_agent_run_executor(3), executor)
+        self.assertEqual(executor.max_workers, 3)
+        futures += [submit(executor, f"after-{job_type}", job_type) for job_type in ("founder_brief", "task_triage", "list_clerk")]
+        deadline = time.monotonic() + 5
+        while len(started) < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(started), 4)
+        release.set()
+        self.assertEqual([future.result(5)["status"] for future in futures], ["ready"] * 4)
+
+        shutdown_shared_agent_run_executor()
+        self.assertIsNot(shared_agent_run_executor(3), executor)
+        with self.assertRaises(RuntimeError):
+            submit(executor, "late", "ops_watch")
+
+
+if __name__ == "__main__":
+    unittest.main()
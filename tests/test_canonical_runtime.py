@@ -11,10 +11,12 @@ from unittest.mock import patch
 
 from fastapi.testclient import TestClient
 
+from supermega_runtime.order_intake_provider import OpenAIOrderIntakeProvider
 from supermega_runtime.runtime import create_app, reduce_trial_state
 from supermega_runtime.supabase_auth import VerifiedSupabaseUser
 from supermega_runtime.trial_store import (
     ManagedWorkspaceAccess,
+    PostgresTrialStore,
     TrialNotReadyError,
     TrialPrincipal,
     TrialValidationError,
@@ -76,6 +78,31 @@ class CanonicalRuntimeTests(unittest.TestCase):
         self.assertFalse(manifest["secret_values_exposed"])
         self.assertEqual(response.headers["x-content-type-options"], "nosniff")
 
+    def test_shutdown_closes_the_trial_store_pool(self) -> None:
+        with patch.object(PostgresTrialStore, "close", autospec=True) as close:
+            with self._client() as client:
+                client.get("/api/health")
+                close.assert_not_called()
+        close.assert_called_once()
+
+    def test_shutdown_closes_the_order_intake_provider(self) -> None:
+        with patch.object(OpenAIOrderIntakeProvider, "close", autospec=True) as close:
+            with self._client(
+                OPENAI_API_KEY="sk-test",
+                ANTHROPIC_API_KEY="",
+                SUPERMEGA_ORDER_INTAKE_PROVIDER="openai",
+            ) as client:
+                client.get("/api/health")
+                close.assert_not_called()
+        close.assert_called_once()
+
+    def test_shutdown_flushes_queued_spans(self) -> None:
+        with patch("supermega_runtime.runtime.flush_tracing") as flush:
+            with self._client() as client:
+                client.get("/api/health")
+                flush.assert_not_called()
+        flush.assert_called_once_with()
+
     def test_cors_accepts_only_exact_https_or_explicit_loopback_origins(self) -> None:
         configured = "https://tenant.example.com,http://127.0.0.1:5173"
         with self._client(SUPERMEGA_CORS_ORIGINS=configured) as client:
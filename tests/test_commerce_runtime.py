@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from hashlib import sha256
@@ -29,6 +30,7 @@ from supermega_runtime.commerce_runtime import (
     commerce_supplier_payables_handoff_csv,
     commerce_supplier_payables_aging,
     commerce_website_intake_snapshot_digest,
+    reduce_commerce_state,
     validate_commerce_state,
 )
 from supermega_runtime.client_import_runtime import (
@@ -42,6 +44,7 @@ from supermega_runtime.ecommerce_buying_lifecycle import (
     build_ecommerce_pim_projection,
 )
 from supermega_runtime.runtime import reduce_trial_state
+from supermega_runtime.state_memo import clear_validated_states
 from supermega_runtime.trial_store import (
     InMemoryTrialStore,
     TrialHumanApprovalRequired,
@@ -8888,5 +8891,171 @@ class CommerceRuntimeTests(unittest.TestCase):
             validate_commerce_state({**current, "serviceSchedule": wrong_duration})
 
 
+class CommerceDeltaCommandTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_validated_states()
+        self.addCleanup(clear_validated_states)
+
+    def _order_delta(self, current: dict[str, object]) -> tuple[dict[str, object], dict[str, object]]:
+        whole = apply_event(current, "commerce.order.created", created_state("ORD-DELTA"))
+        delta = {
+            "items": {"set": {"0": whole["items"][0]}},  # type: ignore[index]
+            "orders": {"prepend": [whole["orders"][0]]},  # type: ignore[index]
+            "movements": {"prepend": [whole["movements"][0]]},  # type: ignore[index]
+        }
+        return whole, delta
+
+    def _promotion_policy(self, proof: dict[str, str]) -> dict[str, object]:
+        return {
+            "revision": 1,
+            "code": "WELCOME",
+            "discountBasisPoints": 1_000,
+            "minimumSubtotalMmk": 100,
+            "maximumDiscountMmk": 50,
+            "status": "active",
+            "effectiveFrom": "2026-07-23T08:00:00.000Z",
+            "effectiveUntil": None,
+            "proof": proof,
+        }
+
+    def test_delta_command_matches_the_whole_state_command(self) -> None:
+        current = catalog_state()
+        whole, delta = self._order_delta(current)
+
+        reduced = reduce_commerce_state(
+            "commerce.order.created",
+            current,
+            {"delta": delta, "evidence": evidence_for("commerce.order.created", whole)},
+        )
+
+        self.assertEqual(reduced, whole)
+        self.assertEqual(current, catalog_state())
+
+    def test_delta_command_still_rejects_undeclared_collection_changes(self) -> None:
+        current = catalog_state()
+        whole, delta = self._order_delta(current)
+        evidence = evidence_for("commerce.order.created", whole)
+
+        policy = self._promotion_policy(
+            action_evidence("ACT-PROMOTION-SMUGGLED", captured_at="2026-07-23T08:00:00.000Z")
+        )
+        with self.assertRaisesRegex(TrialValidationError, "cannot change: promotionPolicies"):
+            reduce_commerce_state(
+                "commerce.order.created",
+                current,
+                {
+                    "delta": {**delta, "promotionPolicies": {"append": [policy]}},
+                    "evidence": evidence,
+                },
+            )
+        with self.assertRaisesRegex(TrialValidationError, "existing records"):
+            reduce_commerce_state(
+                "commerce.order.created",
+                current,
+                {"delta": {**delta, "orders": {"set": {"3": {}}}}, "evidence": evidence},
+            )
+        with self.assertRaisesRegex(TrialValidationError, "value, set, prepend, or append"):
+            reduce_commerce_state(
+                "commerce.order.created",
+                current,
+                {"delta": {"orders": {"remove": [0]}}, "evidence": evidence},
+            )
+        with self.assertRaisesRegex(TrialValidationError, "exactly delta and evidence"):
+            reduce_commerce_state(
+                "commerce.order.created",
+                current,
+                {"delta": delta, "state": whole, "evidence": evidence},
+            )
+        with self.assertRaisesRegex(TrialValidationError, "whole state"):
+            reduce_commerce_state(
+                "commerce.workspace.initialized",
+                {},
+                {"delta": {"items": {"value": []}}, "evidence": action_evidence()},
+            )
+
+    def test_reduced_states_are_trusted_without_revalidation(self) -> None:
+        current = catalog_state()
+        whole, delta = self._order_delta(current)
+        evidence = evidence_for("commerce.order.created", whole)
+        payload = {"delta": delta, "evidence": evidence}
+        clear_validated_states()
+        with patch(
+            "supermega_runtime.commerce_runtime.validate_commerce_state",
+            wraps=validate_commerce_state,
+        ) as validate:
+            reduce_commerce_state("commerce.order.created", current, payload)
+            self.assertEqual(validate.call_count, 2)
+            validate.reset_mock()
+            reduce_commerce_state("commerce.order.created", current, payload)
+            self.assertEqual(validate.call_count, 1)
+
+            tampered = deepcopy(current)
+            tampered["items"][0]["onHand"] = -1  # type: ignore[index]
+            with self.assertRaises(TrialValidationError):
+                reduce_commerce_state("commerce.order.created", tampered, payload)
+
+    def test_store_expands_delta_before_server_stamping(self) -> None:
+        reduced_payloads: list[Mapping[str, object]] = []
+
+        def reducer(
+            surface: str,
+            event_type: str,
+            current: Mapping[str, object],
+            payload: Mapping[str, object],
+        ) -> dict[str, object]:
+            reduced_payloads.append(payload)
+            return reduce_trial_state(surface, event_type, current, payload)
+
+        store = InMemoryTrialStore(reducer=reducer)
+        operator = TrialPrincipal("workspace-delta", "operator-delta", "human")
+        store.provision_membership(
+            workspace_id=operator.workspace_id,
+            actor_id=operator.actor_id,
+            actor_kind=operator.actor_kind,
+            capabilities=("commerce.write",),
+        )
+        initialized = store.apply_command(
+            operator,
+            command_id=str(uuid4()),
+            surface="commerce",
+            event_type="commerce.workspace.initialized",
+            expected_version=0,
+            payload={"state": catalog_state(), "evidence": action_evidence("ACT-INIT-DELTA")},
+        )
+        proof = action_evidence(
+            "ACT-PROMOTION-DELTA",
+            captured_at="2099-01-01T00:00:00.000Z",
+            actor="forged-actor",
+        )
+        policy = {
+            **self._promotion_policy(proof),
+            "effectiveFrom": "2099-02-01T00:00:00.000Z",
+        }
+
+        saved = store.apply_command(
+            operator,
+            command_id=str(uuid4()),
+            surface="commerce",
+            event_type="commerce.promotion_policy.saved",
+            expected_version=initialized.version,
+            payload={
+                "delta": {"promotionPolicies": {"append": [policy]}},
+                "evidence": dict(proof),
+            },
+        )
+
+        saved_proof = saved.state["promotionPolicies"][0]["proof"]  # type: ignore[index]
+        self.assertEqual(saved_proof["actor"], operator.actor_id)
+        self.assertNotEqual(saved_proof["capturedAt"], "2099-01-01T00:00:00.000Z")
+        self.assertEqual(saved.state["orders"], [])
+        # The reducer receives the stamped delta, not the expanded whole state.
+        self.assertEqual(set(reduced_payloads[-1]), {"delta", "evidence"})
+        self.assertEqual(set(reduced_payloads[-1]["delta"]), {"promotionPolicies"})  # type: ignore[arg-type]
+        self.assertEqual(
+            reduced_payloads[-1]["delta"]["promotionPolicies"]["value"][0]["proof"],  # type: ignore[index]
+            saved_proof,
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from sqlmodel import SQLModel
+
+from mark1_pilot import enterprise_store
+from mark1_pilot.enterprise_store import (
+    clear_session_cache,
+    create_session,
+    dispose_engines,
+    enterprise_schema_version,
+    ensure_schema,
+    ensure_user,
+    ensure_workspace,
+    flush_session_touches,
+    get_cached_session,
+    get_engine,
+    get_session,
+    invite_workspace_member,
+    list_user_workspaces,
+    revoke_session,
+)
+
+
+class EnterpriseEngineRegistryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(prefix="supermega-enterprise-store-")
+        self.database_path = Path(self.temp_dir.name) / "enterprise.db"
+        self.database_url = f"sqlite:///{self.database_path.as_posix()}"
+
+    def tearDown(self) -> None:
+        dispose_engines(self.database_url)
+        self.temp_dir.cleanup()
+
+    def test_engine_is_shared_per_url_and_uses_a_real_pool(self) -> None:
+        engine = get_engine(self.database_url)
+        self.assertIs(get_engine(self.database_url), engine)
+        self.assertEqual(engine.pool.size(), enterprise_store.ENTERPRISE_SQLITE_POOL_SIZE)
+        with engine.connect() as connection:
+            journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+        self.assertEqual(str(journal_mode).lower(), "wal")
+
+    def test_schema_bootstrap_runs_once_per_process_and_version(self) -> None:
+        with patch.object(SQLModel.metadata, "create_all", wraps=SQLModel.metadata.create_all) as create_all:
+            ensure_workspace(self.database_url, slug="engine-test", name="Engine Test")
+            list_user_workspaces(self.database_url, username="nobody")
+            ensure_schema(self.database_url)
+        self.assertEqual(create_all.call_count, 1)
+        self.assertEqual(len(enterprise_schema_version()), 16)
+
+    def test_rotated_database_file_is_bootstrapped_again(self) -> None:
+        ensure_schema(self.database_url)
+        first_engine = get_engine(self.database_url)
+        dispose_engines(self.database_url)
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{self.database_path}{suffix}").unlink(missing_ok=True)
+
+        workspace = ensure_workspace(self.database_url, slug="rotated", name="Rotated")
+
+        self.assertIsNot(get_engine(self.database_url), first_engine)
+        self.assertEqual(workspace["slug"], "rotated")
+        self.assertTrue(self.database_path.exists())
+
+    def test_file_replaced_without_invalidation_is_detected(self) -> None:
+        ensure_schema(self.database_url)
+        get_engine(self.database_url).dispose()
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{self.database_path}{suffix}").unlink(missing_ok=True)
+
+        workspace = ensure_workspace(self.database_url, slug="replaced", name="Replaced")
+
+        self.assertEqual(workspace["slug"], "replaced")
+
+
+class EnterpriseSessionCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(prefix="supermega-session-cache-")
+        self.database_url = f"sqlite:///{(Path(self.temp_dir.name) / 'sessions.db').as_posix()}"
+        clear_session_cache()
+        ensure_user(
+            self.database_url,
+            username="owner@example.com",
+            password="correct-horse-battery",
+            display_name="Owner",
+            workspace_slug="session-cache",
+            workspace_name="Session Cache",
+        )
+        self.session_id = create_session(
+            self.database_url,
+            username="owner@example.com",
+            role="owner",
+            workspace_slug="session-cache",
+        )["session_id"]
+
+    def tearDown(self) -> None:
+        clear_session_cache()
+        dispose_engines(self.database_url)
+        self.temp_dir.cleanup()
+
+    def _stored_last_seen(self) -> str:
+        return str(get_session(self.database_url, session_id=self.session_id, touch=False)["last_seen_at"])
+
+    def test_cached_reads_do_not_write_until_the_touch_interval(self) -> None:
+        first = get_cached_session(self.database_url, session_id=self.session_id)
+        stored = self._stored_last_seen()
+        with patch.object(enterprise_store, "get_session", wraps=enterprise_store.get_session) as lookup:
+            for _ in range(5):
+                cached = get_cached_session(self.database_url, session_id=self.session_id)
+        self.assertEqual(lookup.call_count, 0)
+        self.assertEqual(cached["username"], first["username"])
+        self.assertGreater(cached["last_seen_at"], stored)
+        self.assertEqual(self._stored_last_seen(), stored)
+
+        self.assertEqual(flush_session_touches(self.database_url), 1)
+        self.assertEqual(self._stored_last_seen(), cached["last_seen_at"])
+
+    def test_touches_flush_once_the_interval_has_elapsed(self) -> None:
+        get_cached_session(self.database_url, session_id=self.session_id)
+        stored = self._stored_last_seen()
+        with patch.object(enterprise_store, "SESSION_TOUCH_FLUSH_SECONDS", 0.0):
+            touched = get_cached_session(self.database_url, session_id=self.session_id)
+        self.assertNotEqual(self._stored_last_seen(), stored)
+        self.assertEqual(self._stored_last_seen(), touched["last_seen_at"])
+
+    def test_any_touch_flushes_sessions_whose_window_has_passed(self) -> None:
+        other_session_id = create_session(
+            self.database_url,
+            username="owner@example.com",
+            role="owner",
+            workspace_slug="session-cache",
+        )["session_id"]
+        get_cached_session(self.database_url, session_id=self.session_id)
+        get_cached_session(self.database_url, session_id=other_session_id)
+        quiet = get_cached_session(self.database_url, session_id=self.session_id)
+        self.assertNotEqual(self._stored_last_seen(), quiet["last_seen_at"])
+
+        started = time.monotonic()
+        with patch.object(
+            enterprise_store.time,
+            "monotonic",
+            return_value=started + enterprise_store.SESSION_TOUCH_FLUSH_SECONDS + 1,
+        ):
+            get_cached_session(self.database_url, session_id=other_session_id)
+
+        self.assertEqual(self._stored_last_seen(), quiet["last_seen_at"])
+        self.assertEqual(flush_session_touches(self.database_url), 0)
+
+    def test_revocation_and_membership_changes_invalidate_cached_sessions(self) -> None:
+        self.assertIsNotNone(get_cached_session(self.database_url, session_id=self.session_id))
+        workspace_id = get_cached_session(self.database_url, session_id=self.session_id)["workspace_id"]
+        invite_workspace_member(
+            self.database_url,
+            workspace_id=workspace_id,
+            email="owner@example.com",
+            display_name="Renamed Owner",
+            role="owner",
+        )
+        self.assertEqual(
+            get_cached_session(self.database_url, session_id=self.session_id)["display_name"],
+            "Renamed Owner",
+        )
+
+        revoke_session(self.database_url, session_id=self.session_id)
+        self.assertIsNone(get_cached_session(self.database_url, session_id=self.session_id))
+
+
+if __name__ == "__main__":
+    unittest.main()
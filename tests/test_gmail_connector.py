@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from mark1_pilot.connectors import gmail
+from mark1_pilot.connectors.gmail import GmailProbe
+
+
+def _message(message_id: str) -> dict[str, object]:
+    return {
+        "id": message_id,
+        "threadId": f"T-{message_id}",
+        "snippet": f"snippet {message_id}",
+        "payload": {"headers": [{"name": "Subject", "value": f"Subject {message_id}"}]},
+    }
+
+
+class FakeRequest:
+    def __init__(self, service: "FakeService", kind: str, **kwargs: object) -> None:
+        self.service = service
+        self.kind = kind
+        self.kwargs = kwargs
+
+    def execute(self, http: object = None) -> dict[str, object]:
+        self.service.round_trips.append((self.kind, http))
+        if self.kind == "list":
+            start = int(self.kwargs.get("pageToken") or 0)
+            size = int(self.kwargs["maxResults"])  # type: ignore[arg-type]
+            ids = list(range(start, min(start + size, self.service.total)))
+            listing: dict[str, object] = {"messages": [{"id": f"M{index}"} for index in ids]}
+            if start + size < self.service.total:
+                listing["nextPageToken"] = str(start + size)
+            return listing
+        return _message(str(self.kwargs["id"]))
+
+
+class FakeBatch:
+    def __init__(self, service: "FakeService", callback) -> None:  # type: ignore[no-untyped-def]
+        self.service = service
+        self.callback = callback
+        self.requests: list[tuple[FakeRequest, str]] = []
+
+    def add(self, request: FakeRequest, request_id: str) -> None:
+        self.requests.append((request, request_id))
+
+    def execute(self) -> None:
+        self.service.round_trips.append(("batch", len(self.requests)))
+        if self.service.batch_fails:
+            raise OSError("batch endpoint unavailable")
+        for request, request_id in self.requests:
+            if request_id in self.service.throttled:
+                self.callback(request_id, None, RuntimeError("rateLimitExceeded"))
+            else:
+                self.callback(request_id, _message(str(request.kwargs["id"])), None)
+
+
+class FakeService:
+    def __init__(self, total: int, *, batch_fails: bool = False, throttled: set[str] | None = None) -> None:
+        self.total = total
+        self.batch_fails = batch_fails
+        self.throttled = throttled or set()
+        self.round_trips: list[tuple[str, object]] = []
+
+    def users(self) -> "FakeService":
+        return self
+
+    def messages(self) -> "FakeService":
+        return self
+
+    def list(self, **kwargs: object) -> FakeRequest:
+        return FakeRequest(self, "list", **kwargs)
+
+    def get(self, **kwargs: object) -> FakeRequest:
+        return FakeRequest(self, "get", **kwargs)
+
+    def new_batch_http_request(self, callback) -> FakeBatch:  # type: ignore[no-untyped-def]
+        return FakeBatch(self, callback)
+
+
+class GmailSearchBatchingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.token = Path(directory.name) / "gmail-token.json"
+        self.token.write_text("{}", encoding="utf-8")
+        self.probe = GmailProbe(None, self.token)
+
+    def search(self, service: FakeService, max_results: int) -> dict[str, object]:
+        with (
+            patch.object(gmail, "_gmail_service", return_value=("credentials", service)),
+            patch.object(gmail, "_thread_http", side_effect=lambda credentials: f"http:{credentials}"),
+        ):
+            return self.probe.search_messages("from:buyer", max_results=max_results)
+
+    def test_metadata_arrives_in_one_batch_after_the_listing(self) -> None:
+        service = FakeService(total=30)
+
+        result = self.search(service, 10)
+
+        self.assertEqual(result["status"], "ready")
+        self.assertEqual([item["id"] for item in result["messages"]], [f"M{index}" for index in range(10)])  # type: ignore[index]
+        self.assertEqual(result["messages"][0]["subject"], "Subject M0")  # type: ignore[index]
+        self.assertEqual(service.round_trips, [("list", None), ("batch", 10)])
+
+    def test_large_searches_stream_pages_and_split_batches(self) -> None:
+        service = FakeService(total=180)
+
+        result = self.search(service, 150)
+
+        self.assertEqual(len(result["messages"]), 150)  # type: ignore[arg-type]
+        self.assertEqual(
+            service.round_trips,
+            [("list", None), ("batch", 50), ("batch", 50), ("list", None), ("batch", 50)],
+        )
+
+    def test_throttled_parts_and_failed_batches_fall_back_to_bounded_gets(self) -> None:
+        throttled = FakeService(total=5, throttled={"M1", "M3"})
+        failed = FakeService(total=3, batch_fails=True)
+
+        partial = self.search(throttled, 5)
+        fallback = self.search(failed, 3)
+
+        self.assertEqual([item["id"] for item in partial["messages"]], ["M0", "M1", "M2", "M3", "M4"])  # type: ignore[index]
+        self.assertEqual(sorted(call for call in throttled.round_trips if call[0] == "get"), [("get", "http:credentials")] * 2)
+        self.assertEqual([item["id"] for item in fallback["messages"]], ["M0", "M1", "M2"])  # type: ignore[index]
+        self.assertEqual(len([call for call in failed.round_trips if call[0] == "get"]), 3)
+
+    def test_missing_client_libraries_report_dependency_missing(self) -> None:
+        with patch.object(gmail, "_gmail_service", side_effect=ImportError("googleapiclient")):
+            result = self.probe.search_messages("from:buyer")
+
+        self.assertEqual(result["status"], "dependency_missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import re
+import tempfile
+import unittest
+
+from mark1_pilot.config import ERPConfig
+from mark1_pilot.connectors.google_drive import FOLDER_MIME_TYPE, GoogleDriveProbe
+from mark1_pilot.erp import sync_erp_drive_activity
+
+
+ROOT_ID = "ROOT"
+
+
+class ExpiredToken(Exception):
+    def __init__(self) -> None:
+        super().__init__("Invalid pageToken")
+        self.resp = type("Response", (), {"status": 410})()
+
+
+class FakeRequest:
+    def __init__(self, result: object) -> None:
+        self.result = result
+
+    def execute(self) -> dict[str, object]:
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result  # type: ignore[return-value]
+
+
+class FakeFiles:
+    def __init__(self, drive: "FakeDrive") -> None:
+        self.drive = drive
+
+    def get(self, **kwargs: object) -> FakeRequest:
+        return FakeRequest({"id": ROOT_ID, "name": "Root", "mimeType": FOLDER_MIME_TYPE})
+
+    def list(self, **kwargs: object) -> FakeRequest:
+        parents = set(re.findall(r"'([^']+)' in parents", str(kwargs["q"])))
+        self.drive.list_queries.append(sorted(parents))
+        children = [
+            dict(item)
+            for item in self.drive.items.values()
+            if parents.intersection(item.get("parents", []))  # type: ignore[arg-type]
+        ]
+        return FakeRequest({"files": children})
+
+
+class FakeChanges:
+    def __init__(self, drive: "FakeDrive") -> None:
+        self.drive = drive
+
+    def getStartPageToken(self, **kwargs: object) -> FakeRequest:
+        return FakeRequest({"startPageToken": str(self.drive.token)})
+
+    def list(self, **kwargs: object) -> FakeRequest:
+        self.drive.change_tokens.append(str(kwargs["pageToken"]))
+        if self.drive.expired:
+            return FakeRequest(ExpiredToken())
+        changes, self.drive.pending = self.drive.pending, []
+        self.drive.token += 1
+        return FakeRequest({"changes": changes, "newStartPageToken": str(self.drive.token)})
+
+
+class FakeDrive:
+    def __init__(self) -> None:
+        self.items: dict[str, dict[str, object]] = {}
+        self.pending: list[dict[str, object]] = []
+        self.list_queries: list[list[str]] = []
+        self.change_tokens: list[str] = []
+        self.token = 1
+        self.expired = False
+
+    def files(self) -> FakeFiles:
+        return FakeFiles(self)
+
+    def changes(self) -> FakeChanges:
+        return FakeChanges(self)
+
+    def put(self, item_id: str, name: str, parent: str, *, folder: bool = False, size: int = 1) -> dict[str, object]:
+        item: dict[str, object] = {
+            "id": item_id,
+            "name": name,
+            "parents": [parent],
+            "mimeType": FOLDER_MIME_TYPE if folder else "text/plain",
+            "modifiedTime": "2026-10-01T00:00:00Z",
+            "size": str(size),
+        }
+        self.items[item_id] = item
+        return item
+
+    def change(self, item_id: str, *, removed: bool = False) -> None:
+        if removed:
+            self.items.pop(item_id, None)
+            self.pending.append({"fileId": item_id, "removed": True})
+        else:
+            self.pending.append({"fileId": item_id, "file": dict(self.items[item_id])})
+
+
+class StubbedDriveProbe(GoogleDriveProbe):
+    def __init__(self, drive: FakeDrive, service_account_json: Path) -> None:
+        super().__init__(service_account_json=service_account_json, folder_id=ROOT_ID)
+        self.drive = drive
+
+    def _build_service(self, scopes: list[str]) -> tuple[object, object]:
+        return self.drive, None
+
+
+class DriveIncrementalIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+        account = self.root / "service_account.json"
+        account.write_text("{}", encoding="utf-8")
+        self.state_path = self.root / "state.json"
+        self.drive = FakeDrive()
+        self.drive.put("F-SALES", "sales", ROOT_ID, folder=True)
+        self.drive.put("F-KCM", "kcm", ROOT_ID, folder=True)
+        self.drive.put("A", "a.txt", ROOT_ID)
+        self.drive.put("B", "b.txt", "F-SALES")
+        self.drive.put("C", "c.txt", "F-KCM")
+        self.probe = StubbedDriveProbe(self.drive, account)
+
+    def _paths(self, index: dict[str, object]) -> dict[str, str]:
+        return {item["id"]: item["path"] for item in index["files"]}  # type: ignore[index,union-attr]
+
+    def test_full_crawl_lists_sibling_folders_in_one_query_and_saves_a_token(self) -> None:
+        index = self.probe.sync_folder_file_index(self.state_path)
+
+        self.assertEqual(index["status"], "ready")
+        self.assertEqual(index["sync"]["mode"], "full")
+        self.assertEqual(self._paths(index), {"A": "a.txt", "B": "sales/b.txt", "C": "kcm/c.txt"})
+        self.assertEqual(self.drive.list_queries, [[ROOT_ID], ["F-KCM", "F-SALES"]])
+        state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        self.assertEqual(state["start_page_token"], "1")
+
+    def test_incremental_sync_applies_changes_without_a_full_recrawl(self) -> None:
+        self.probe.sync_folder_file_index(self.state_path)
+        self.drive.list_queries.clear()
+
+        self.drive.put("B", "b.txt", "F-SALES", size=9)
+        self.drive.change("B")
+        self.drive.change("C", removed=True)
+        # The new file's change arrives before the folder it lives in.
+        self.drive.put("D", "d.txt", "F-NEW")
+        self.drive.change("D")
+        self.drive.put("F-NEW", "new", "F-SALES", folder=True)
+        self.drive.change("F-NEW")
+        self.drive.put("F-KCM", "kcm-archive", ROOT_ID, folder=True)
+        self.drive.change("F-KCM")
+        self.drive.put("E", "e.txt", "F-KCM")
+        self.drive.change("E")
+
+        index = self.probe.sync_folder_file_index(self.state_path)
+
+        self.assertEqual(self.drive.change_tokens, ["1"])
+        # Only the folder new to the index is listed.
+        self.assertEqual(self.drive.list_queries, [["F-NEW"]])
+        self.assertEqual(index["sync"]["mode"], "incremental")
+        self.assertEqual(
+            self._paths(index),
+            {"A": "a.txt", "B": "sales/b.txt", "D": "sales/new/d.txt", "E": "kcm-archive/e.txt"},
+        )
+        self.assertEqual(index["sync"]["changed_file_ids"], ["B", "D", "E"])
+        self.assertEqual(index["sync"]["removed_file_ids"], ["C"])
+
+    def test_folder_moved_into_the_tree_is_crawled(self) -> None:
+        self.probe.sync_folder_file_index(self.state_path)
+        self.drive.list_queries.clear()
+        self.drive.put("F-OLD", "old", "OUTSIDE", folder=True)
+        self.drive.put("G", "g.txt", "F-OLD")
+        self.drive.put("F-OLD", "old", ROOT_ID, folder=True)
+        self.drive.change("F-OLD")
+
+        index = self.probe.sync_folder_file_index(self.state_path)
+
+        self.assertEqual(self.drive.list_queries, [["F-OLD"]])
+        self.assertEqual(self._paths(index)["G"], "old/g.txt")
+        self.assertEqual(index["sync"]["changed_file_ids"], ["G"])
+
+    def test_moved_folder_is_crawled_even_when_a_child_also_changed(self) -> None:
+        self.probe.sync_folder_file_index(self.state_path)
+        self.drive.put("F-OLD", "old", "OUTSIDE", folder=True)
+        self.drive.put("G", "g.txt", "F-OLD")
+        self.drive.put("H", "h.txt", "F-OLD")
+        self.drive.put("F-OLD", "old", ROOT_ID, folder=True)
+        self.drive.change("F-OLD")
+        self.drive.put("G", "g.txt", "F-OLD", size=5)
+        self.drive.change("G")
+
+        incremental = self.probe.sync_folder_file_index(self.state_path)
+        full = self.probe.sync_folder_file_index(self.root / "full.json")
+
+        self.assertEqual(incremental["sync"]["mode"], "incremental")
+        self.assertEqual(self._paths(incremental), self._paths(full))
+        self.assertEqual(self._paths(incremental)["H"], "old/h.txt")
+        self.assertEqual(incremental["sync"]["changed_file_ids"], ["G", "H"])
+
+    def test_expired_page_token_falls_back_to_a_full_crawl(self) -> None:
+        self.probe.sync_folder_file_index(self.state_path)
+        self.drive.expired = True
+
+        index = self.probe.sync_folder_file_index(self.state_path)
+
+        self.assertEqual(index["status"], "ready")
+        self.assertEqual(index["sync"]["mode"], "full")
+
+    def test_uncommitted_sync_replays_its_changes_on_the_next_run(self) -> None:
+        self.probe.sync_folder_file_index(self.state_path, commit=False)
+        self.assertFalse(self.state_path.exists())
+        self.probe.commit_folder_file_index(self.state_path)
+        self.assertEqual(json.loads(self.state_path.read_text(encoding="utf-8"))["start_page_token"], "1")
+
+        self.drive.put("B", "b.txt", "F-SALES", size=9)
+        self.drive.change("B")
+        staged = self.probe.sync_folder_file_index(self.state_path, commit=False)
+        self.assertEqual(staged["sync"]["changed_file_ids"], ["B"])
+        # A crash here, before the delta is consumed, must not advance the token.
+        self.probe.sync_folder_file_index(self.state_path, commit=False)
+
+        self.assertEqual(self.drive.change_tokens, ["1", "1"])
+        self.probe.commit_folder_file_index(self.state_path)
+        self.assertNotEqual(json.loads(self.state_path.read_text(encoding="utf-8"))["start_page_token"], "1")
+
+    def test_erp_drive_activity_uses_the_delta(self) -> None:
+        config = ERPConfig()
+        output_dir = self.root / "erp"
+        first = sync_erp_drive_activity(
+            output_dir=output_dir,
+            config=config,
+            drive_file_index=self.probe.sync_folder_file_index(self.state_path),
+        )
+        self.assertEqual(first["total_changes"], 3)
+
+        self.drive.put("B", "b.txt", "F-SALES", size=9)
+        self.drive.change("B")
+        self.drive.change("A", removed=True)
+        result = sync_erp_drive_activity(
+            output_dir=output_dir,
+            config=config,
+            drive_file_index=self.probe.sync_folder_file_index(self.state_path),
+        )
+
+        register = json.loads((output_dir / config.drive_change_file).read_text(encoding="utf-8"))
+        snapshot = json.loads((output_dir / config.drive_snapshot_file).read_text(encoding="utf-8"))
+        self.assertEqual(result["total_changes"], 2)
+        self.assertEqual(register["sync_mode"], "incremental")
+        self.assertEqual((register["modified_count"], register["removed_count"]), (1, 1))
+        self.assertEqual(sorted(snapshot["files"]), ["B", "C"])
+        self.assertEqual(snapshot["files"]["B"]["size_bytes"], 9)
+
+    def test_erp_drive_activity_rematches_every_file_when_module_keywords_change(self) -> None:
+        output_dir = self.root / "erp"
+        sync_erp_drive_activity(
+            output_dir=output_dir,
+            config=ERPConfig(),
+            drive_file_index=self.probe.sync_folder_file_index(self.state_path),
+        )
+        self.drive.put("A", "a.txt", ROOT_ID, size=4)
+        self.drive.change("A")
+
+        config = ERPConfig(module_keywords={"quality": ["kcm"]})
+        sync_erp_drive_activity(
+            output_dir=output_dir,
+            config=config,
+            drive_file_index=self.probe.sync_folder_file_index(self.state_path),
+        )
+
+        snapshot = json.loads((output_dir / config.drive_snapshot_file).read_text(encoding="utf-8"))
+        self.assertEqual(snapshot["files"]["C"]["module"], "quality")
+        self.assertEqual(snapshot["files"]["A"]["size_bytes"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
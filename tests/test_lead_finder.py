@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from email.message import Message
+from io import BytesIO
+from pathlib import Path
+import tempfile
+from threading import Lock
+import time
+import unittest
+from unittest.mock import patch
+from urllib.error import HTTPError
+
+from mark1_pilot import lead_finder
+from mark1_pilot.lead_cache import LeadResponseCache
+from mark1_pilot.lead_finder import configure_lead_cache, discover_leads, run_lead_finder_batch
+
+
+def _candidate(query: str, index: int, source: str = "Social") -> dict[str, str]:
+    return {
+        "title": f"{query} lead {index}",
+        "url": f"https://example.com/{abs(hash(query))}/{index}",
+        "snippet": "tyre distributor",
+        "source": source,
+        "provider": "DuckDuckGo",
+    }
+
+
+class LeadFinderFanOutTests(unittest.TestCase):
+    def setUp(self) -> None:
+        lead_finder._HOST_NEXT_START.clear()
+        self.addCleanup(lead_finder._HOST_NEXT_START.clear)
+
+    def test_search_queries_run_concurrently_with_stable_output(self) -> None:
+        def slow_search(query: str, limit: int, *, deadline: float | None = None) -> list[dict[str, str]]:
+            time.sleep(0.2)
+            return [_candidate(query, index) for index in range(2)]
+
+        with patch.object(lead_finder, "_parse_duckduckgo_results", side_effect=slow_search):
+            started = time.monotonic()
+            first = discover_leads("tyre shop", sources=["web", "social"], limit=10)
+            elapsed = time.monotonic() - started
+            second = discover_leads("tyre shop", sources=["web", "social"], limit=10)
+
+        self.assertLess(elapsed, 0.35)
+        self.assertEqual(len(first["rows"]), 4)
+        self.assertEqual(first["provider"], "DuckDuckGo")
+        self.assertFalse(first["partial"])
+        self.assertEqual(first["rows"], second["rows"])
+
+    def test_deadline_returns_the_results_that_arrived(self) -> None:
+        def search(query: str, limit: int, *, deadline: float | None = None) -> list[dict[str, str]]:
+            if "site:" in query:
+                time.sleep(1.0)
+            return [_candidate(query, 0)]
+
+        with patch.object(lead_finder, "_parse_duckduckgo_results", side_effect=search):
+            started = time.monotonic()
+            result = discover_leads("tyre shop", sources=["web", "social"], deadline_seconds=0.2)
+            elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 0.6)
+        self.assertTrue(result["partial"])
+        self.assertEqual([row["name"] for row in result["rows"]], ["tyre shop lead 0"])
+
+    def test_page_enrichment_is_bounded_parallel(self) -> None:
+        lock = Lock()
+        active = {"now": 0, "peak": 0}
+
+        def signals(url: str, *, deadline: float | None = None) -> dict[str, object]:
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            return {"title": url, "emails": ["owner@example.com"], "phones": [], "social_profiles": []}
+
+        def search(query: str, limit: int, *, deadline: float | None = None) -> list[dict[str, str]]:
+            return [_candidate(query, index, source="Website") for index in range(4)]
+
+        with (
+            patch.object(lead_finder, "_parse_duckduckgo_results", side_effect=search),
+            patch.object(lead_finder, "_extract_page_signals", side_effect=signals),
+        ):
+            result = discover_leads("tyre shop", sources=["web", "social"], limit=20)
+
+        self.assertEqual(len(result["rows"]), 8)
+        self.assertTrue(all(row["email"] == "owner@example.com" for row in result["rows"]))
+        self.assertEqual(active["peak"], lead_finder.LEAD_ENRICH_WORKERS)
+
+    def test_requests_to_one_host_are_spaced_and_respect_the_deadline(self) -> None:
+        lead_finder._wait_for_host_slot("https://html.duckduckgo.com/html/?q=a", None)
+        started = time.monotonic()
+        lead_finder._wait_for_host_slot("https://html.duckduckgo.com/html/?q=b", None)
+        self.assertGreaterEqual(time.monotonic() - started, lead_finder.LEAD_HOST_MIN_INTERVAL_SECONDS * 0.8)
+
+        with self.assertRaises(TimeoutError):
+            lead_finder._wait_for_host_slot("https://html.duckduckgo.com/html/?q=c", time.monotonic())
+        lead_finder._wait_for_host_slot("https://www.bing.com/search?q=a", time.monotonic() + 1)
+
+    def test_batch_keeps_job_order(self) -> None:
+        jobs = [{"raw_text": f"Lead {index} | lead{index}@example.com"} for index in range(3)]
+
+        results = run_lead_finder_batch(jobs)
+
+        self.assertEqual([result["rows"][0]["name"] for result in results], ["Lead 0", "Lead 1", "Lead 2"])
+
+    def test_batch_reports_a_failed_job_as_an_error(self) -> None:
+        jobs = [{"raw_text": "Lead 0 | lead0@example.com"}, {"query": "tyre shop"}]
+
+        with (
+            patch.object(lead_finder, "discover_leads", side_effect=RuntimeError("search backend down")),
+            self.assertLogs("supermega.lead_finder", level="ERROR"),
+        ):
+            results = run_lead_finder_batch(jobs)
+
+        self.assertEqual(results[0]["rows"][0]["name"], "Lead 0")
+        self.assertEqual(results[1]["status"], "error")
+        self.assertEqual(results[1]["message"], "search backend down")
+        self.assertEqual(results[1]["rows"], [])
+
+
+class FakeResponse(BytesIO):
+    def __init__(self, body: bytes, headers: dict[str, str]) -> None:
+        super().__init__(body)
+        self.headers = Message()
+        for name, value in headers.items():
+            self.headers[name] = value
+
+
+class LeadResponseCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "lead_cache.sqlite3"
+        self.addCleanup(configure_lead_cache, None)
+        lead_finder._HOST_NEXT_START.clear()
+        self.addCleanup(lead_finder._HOST_NEXT_START.clear)
+
+    def test_fresh_responses_are_served_without_network(self) -> None:
+        configure_lead_cache(self.path)
+        url = "https://maps.googleapis.com/maps/api/place/textsearch/json?key=secret-places-key"
+        with patch.object(
+            lead_finder, "urlopen", side_effect=lambda *args, **kwargs: FakeResponse(b"{}", {})
+        ) as urlopen:
+            self.assertEqual(lead_finder._http_get(url), "{}")
+            self.assertEqual(lead_finder._http_get(url), "{}")
+
+        self.assertEqual(urlopen.call_count, 1)
+        self.assertNotIn(b"secret-places-key", self.path.read_bytes())
+
+    def test_stale_entries_revalidate_with_their_validators(self) -> None:
+        configure_lead_cache(self.path, ttl_seconds=0)
+        url = "https://example.com/about"
+        requests: list[dict[str, str]] = []
+
+        def urlopen(request, timeout):  # type: ignore[no-untyped-def]
+            requests.append(dict(request.header_items()))
+            if len(requests) == 1:
+                return FakeResponse(b"<title>Shop</title>", {"ETag": '"v1"', "Last-Modified": "Mon, 05 Oct 2026 00:00:00 GMT"})
+            raise HTTPError(request.full_url, 304, "Not Modified", Message(), None)
+
+        with patch.object(lead_finder, "urlopen", side_effect=urlopen):
+            self.assertEqual(lead_finder._http_get(url), "<title>Shop</title>")
+            self.assertEqual(lead_finder._http_get(url), "<title>Shop</title>")
+
+        self.assertNotIn("If-none-match", requests[0])
+        self.assertEqual(requests[1]["If-none-match"], '"v1"')
+        self.assertEqual(requests[1]["If-modified-since"], "Mon, 05 Oct 2026 00:00:00 GMT")
+
+    def test_cache_is_bounded_least_recently_used(self) -> None:
+        cache = LeadResponseCache(self.path, max_entries=2)
+        self.addCleanup(cache.close)
+        cache.put("a", "A")
+        time.sleep(0.01)
+        cache.put("b", "B")
+        time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.put("c", "C")
+
+        self.assertEqual(cache.count(), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a").body, "A")  # type: ignore[union-attr]
+
+    def test_repeat_hunts_reuse_parsed_candidates_and_report_hit_rate(self) -> None:
+        configure_lead_cache(self.path)
+
+        def search(query: str, limit: int, *, deadline: float | None = None) -> list[dict[str, str]]:
+            return [_candidate(query, 0)]
+
+        with patch.object(lead_finder, "_parse_duckduckgo_results", side_effect=search) as parser:
+            first = discover_leads("Tyre   Shop", sources=["web", "social"])
+            second = discover_leads("tyre shop", sources=["web", "social"])
+
+        self.assertEqual(parser.call_count, 2)
+        self.assertEqual(first["cache"], {"hits": 0, "revalidated": 0, "misses": 2, "hit_rate": 0.0})
+        self.assertEqual(second["cache"], {"hits": 2, "revalidated": 0, "misses": 0, "hit_rate": 1.0})
+        self.assertEqual(len(second["rows"]), len(first["rows"]))
+
+    def test_provider_errors_served_as_200_are_not_cached(self) -> None:
+        configure_lead_cache(self.path)
+        places_url = "https://maps.googleapis.com/maps/api/place/textsearch/json?key=k"
+        captcha = b"<html><body>Unfortunately, bots use DuckDuckGo too.</body></html>"
+        with patch.object(
+            lead_finder,
+            "urlopen",
+            side_effect=lambda request, timeout: FakeResponse(
+                b'{"status":"OVER_QUERY_LIMIT","results":[]}' if "maps.googleapis" in request.full_url else captcha,
+                {},
+            ),
+        ) as urlopen:
+            for _ in range(2):
+                lead_finder._http_get(places_url, cacheable=lead_finder._places_payload_cacheable)
+                self.assertEqual(lead_finder._parse_duckduckgo_results("tyre shop", 4), [])
+
+        self.assertEqual(urlopen.call_count, 4)
+        self.assertEqual(lead_finder._LEAD_CACHE.count(), 0)  # type: ignore[union-attr]
+
+    def test_search_misses_are_counted_once_even_without_candidates(self) -> None:
+        configure_lead_cache(self.path)
+        with patch.object(
+            lead_finder, "urlopen", side_effect=lambda *args, **kwargs: FakeResponse(b"<html></html>", {})
+        ):
+            result = discover_leads("tyre shop", sources=["web"])
+
+        self.assertEqual(result["cache"], {"hits": 0, "revalidated": 0, "misses": 1, "hit_rate": 0.0})
+        self.assertIsNone(lead_finder._HUNT_CACHE_STATS.get())
+
+    def test_reconfiguring_closes_the_old_cache_after_the_swap(self) -> None:
+        old = configure_lead_cache(self.path)
+        new = configure_lead_cache(self.path.with_name("next.sqlite3"))
+
+        self.assertIs(lead_finder._LEAD_CACHE, new)
+        self.assertIsNone(old.get("url|https://example.com"))  # type: ignore[union-attr]
+        old.put("url|https://example.com", "stale")  # type: ignore[union-attr]
+
+    def test_hunts_without_a_configured_cache_report_none(self) -> None:
+        with patch.object(lead_finder, "_parse_duckduckgo_results", return_value=[]):
+            with patch.object(lead_finder, "_parse_bing_results", return_value=[]):
+                self.assertIsNone(discover_leads("tyre shop", sources=["web"])["cache"])
+
+
+if __name__ == "__main__":
+    unittest.main()
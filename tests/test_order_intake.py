@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from contextlib import redirect_stderr, redirect_stdout
 from datetime import UTC, datetime
+from io import StringIO
 import json
 from pathlib import Path
+import tempfile
 import unittest
 
 from pydantic import ValidationError
@@ -953,5 +956,38 @@ class OrderIntakeMultipleItemProvenanceTests(unittest.TestCase):
         )
 
 
+class OrderIntakeEvalBatchTests(unittest.TestCase):
+    def test_mock_provider_batch_streams_every_fixture_and_reports_each_worker(self) -> None:
+        from tools.run_order_intake_eval import run_mock
+
+        corpus = load_fixture_corpus()
+        with tempfile.TemporaryDirectory() as directory:
+            output_path = Path(directory) / "results.json"
+            stdout, stderr = StringIO(), StringIO()
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                status = run_mock(output_path, concurrency=4, rate_per_second=0.0, latency_ms=20)
+            document = json.loads(output_path.read_text(encoding="utf-8"))
+
+        summary = next(
+            json.loads(line)
+            for line in reversed(stdout.getvalue().splitlines())
+            if line.startswith('{"ok"')
+        )
+        progress = [json.loads(line) for line in stderr.getvalue().splitlines()]
+        self.assertEqual(status, 0)
+        self.assertTrue(summary["quality_gate_passed"])
+        self.assertEqual(summary["mode"], "mock")
+        self.assertEqual(summary["batch"]["concurrency"], 4)
+        workers = summary["batch"]["workers"]
+        self.assertEqual([worker["worker"] for worker in workers], [1, 2, 3, 4])
+        self.assertEqual(sum(worker["fixtures"] for worker in workers), len(corpus["fixtures"]))
+        self.assertTrue(all(worker["latency_ms"]["p95"] >= 20 for worker in workers))
+        self.assertEqual([entry["completed"] for entry in progress], list(range(1, 21)))
+        self.assertEqual(
+            [result["fixture_id"] for result in document["results"]],
+            [fixture["id"] for fixture in corpus["fixtures"]],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import BytesIO
 import json
 import os
+from threading import Lock, Thread
+import time
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from urllib.error import HTTPError, URLError
 
 from supermega_runtime.order_intake import OrderIntakeCatalogItem
@@ -20,7 +24,9 @@ from supermega_runtime.order_intake_provider import (
     OpenAIOrderIntakeProvider,
     OrderIntakeBudgetReservation,
     OrderIntakeProviderError,
+    PooledProviderTransport,
     PostgresOrderIntakeBudget,
+    ProviderConnectionPool,
     UnavailableOrderIntakeBudget,
     _anthropic_transport,
     _openai_transport,
@@ -699,5 +705,199 @@ class OrderIntakeProviderSelectionTests(unittest.TestCase):
         self.assertEqual(overridden._model, "claude-opus-5")  # type: ignore[union-attr]
 
 
+class StandInProviderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server hook name
+        server = self.server
+        self.rfile.read(int(self.headers["content-length"]))
+        with server.lock:  # type: ignore[attr-defined]
+            server.requests += 1  # type: ignore[attr-defined]
+            dropped = server.requests in server.drop_requests  # type: ignore[attr-defined]
+        if dropped:
+            # Hang up after reading the request, as a crashing proxy would.
+            self.close_connection = True
+            return
+        with server.lock:  # type: ignore[attr-defined]
+            server.peers.add(self.client_address)  # type: ignore[attr-defined]
+            server.in_flight += 1  # type: ignore[attr-defined]
+            server.peak = max(server.peak, server.in_flight)  # type: ignore[attr-defined]
+        time.sleep(server.delay)  # type: ignore[attr-defined]
+        status, body, headers = server.reply  # type: ignore[attr-defined]
+        with server.lock:  # type: ignore[attr-defined]
+            server.in_flight -= 1  # type: ignore[attr-defined]
+        encoded = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+        if server.close_idle:  # type: ignore[attr-defined]
+            # Close the keep-alive connection without announcing it.
+            self.close_connection = True
+
+    def log_message(self, format: str, *args: object) -> None:
+        return None
+
+
+class PooledProviderTransportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StandInProviderHandler)
+        server.daemon_threads = True
+        server.lock = Lock()  # type: ignore[attr-defined]
+        server.peers = set()  # type: ignore[attr-defined]
+        server.in_flight = 0  # type: ignore[attr-defined]
+        server.peak = 0  # type: ignore[attr-defined]
+        server.delay = 0.0  # type: ignore[attr-defined]
+        server.reply = (200, {"id": "resp_1"}, {})  # type: ignore[attr-defined]
+        server.requests = 0  # type: ignore[attr-defined]
+        server.drop_requests = set()  # type: ignore[attr-defined]
+        server.close_idle = False  # type: ignore[attr-defined]
+        Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.server = server
+        self.url = f"http://127.0.0.1:{server.server_port}/v1/responses"
+
+    def transport(self, provider: str = "openai", **kwargs: object) -> PooledProviderTransport:
+        transport = PooledProviderTransport(provider, url=self.url, **kwargs)  # type: ignore[arg-type]
+        self.addCleanup(transport.close)
+        return transport
+
+    def test_sequential_calls_reuse_one_keep_alive_connection(self) -> None:
+        transport = self.transport()
+
+        for _ in range(5):
+            self.assertEqual(transport("sk-test", {"input": "x"}, 5.0), {"id": "resp_1"})
+
+        self.assertEqual(transport.pool.connections_opened, 1)
+        self.assertEqual(len(self.server.peers), 1)  # type: ignore[attr-defined]
+
+    def test_idle_connection_closed_by_the_server_is_replaced_before_sending(self) -> None:
+        self.server.close_idle = True  # type: ignore[attr-defined]
+        transport = self.transport()
+
+        self.assertEqual(transport("sk-test", {"input": "x"}, 5.0), {"id": "resp_1"})
+        time.sleep(0.05)
+        self.assertEqual(transport("sk-test", {"input": "x"}, 5.0), {"id": "resp_1"})
+
+        self.assertEqual(transport.pool.connections_opened, 2)
+        self.assertEqual(self.server.requests, 2)  # type: ignore[attr-defined]
+
+    def test_request_dropped_on_a_reused_connection_is_never_resent(self) -> None:
+        self.server.drop_requests = {2}  # type: ignore[attr-defined]
+        transport = self.transport()
+
+        self.assertEqual(transport("sk-test", {"input": "x"}, 5.0), {"id": "resp_1"})
+        with self.assertRaisesRegex(OrderIntakeProviderError, "provider_unavailable"):
+            transport("sk-test", {"input": "x"}, 5.0)
+
+        self.assertEqual(self.server.requests, 2)  # type: ignore[attr-defined]
+        self.assertEqual(transport.pool.connections_opened, 1)
+
+    def test_provider_close_releases_the_budget_pool_and_connections(self) -> None:
+        budget = PostgresOrderIntakeBudget("postgresql://budget", 10_000, pool_size=2)
+        budget._pool = pool = Mock()
+        transport = self.transport()
+        provider = OpenAIOrderIntakeProvider(api_key="sk-test", budget=budget, transport=transport)
+
+        self.assertEqual(transport("sk-test", {"input": "x"}, 5.0), {"id": "resp_1"})
+        provider.close()
+
+        pool.close.assert_called_once_with()
+        self.assertEqual(transport.pool._idle, [])
+
+    def test_concurrent_calls_stay_within_the_connection_bound(self) -> None:
+        self.server.delay = 0.05  # type: ignore[attr-defined]
+        transport = self.transport(max_connections=2)
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            results = list(
+                executor.map(lambda _: transport("sk-test", {"input": "x"}, 5.0), range(6))
+            )
+
+        self.assertEqual(results, [{"id": "resp_1"}] * 6)
+        self.assertEqual(self.server.peak, 2)  # type: ignore[attr-defined]
+        self.assertLessEqual(transport.pool.connections_opened, 2)
+
+    def test_error_statuses_and_redirects_keep_their_stable_codes(self) -> None:
+        cases = [
+            ("openai", 429, {"error": {"code": "insufficient_quota"}}, {}, "order_intake_provider_quota_exhausted"),
+            ("openai", 429, {"error": {"code": "rate_limit_exceeded"}}, {}, "order_intake_provider_rate_limited"),
+            ("anthropic", 529, {"error": {"type": "overloaded_error"}}, {}, "order_intake_provider_rate_limited"),
+            ("anthropic", 307, {}, {"location": "https://attacker.example/"}, "order_intake_provider_unavailable"),
+            ("openai", 204, {}, {}, "order_intake_provider_unavailable"),
+        ]
+        for provider, status, body, headers, expected in cases:
+            with self.subTest(provider=provider, status=status):
+                self.server.reply = (status, body, headers)  # type: ignore[attr-defined]
+                with self.assertRaises(OrderIntakeProviderError) as raised:
+                    self.transport(provider)("sk-test", {"input": "x"}, 5.0)
+                self.assertEqual(str(raised.exception), expected)
+        self.assertEqual(len(self.server.peers), len(cases))  # type: ignore[attr-defined]
+
+    def test_oversized_and_invalid_bodies_fail_closed(self) -> None:
+        transport = self.transport()
+        for body in ("x" * (MAX_ORDER_INTAKE_PROVIDER_RESPONSE_BYTES + 1), ["not", "an", "object"]):
+            with self.subTest(kind=type(body).__name__):
+                self.server.reply = (200, body, {})  # type: ignore[attr-defined]
+                with self.assertRaisesRegex(OrderIntakeProviderError, "invalid_response"):
+                    transport("sk-test", {"input": "x"}, 5.0)
+
+    def test_unreachable_endpoint_is_unavailable(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        with self.assertRaisesRegex(OrderIntakeProviderError, "provider_unavailable"):
+            self.transport()("sk-test", {"input": "x"}, 5.0)
+
+    def test_plain_http_is_limited_to_loopback_stand_ins(self) -> None:
+        for url in ("http://api.openai.com/v1/responses", "ftp://127.0.0.1/", "https:///v1"):
+            with self.subTest(url=url):
+                with self.assertRaisesRegex(OrderIntakeProviderError, "not_configured"):
+                    ProviderConnectionPool(url)
+        self.assertEqual(ProviderConnectionPool("https://api.openai.com/v1", max_connections=99).max_connections, 16)
+
+
+class RecordingPool:
+    def __init__(self) -> None:
+        self.checkouts = 0
+
+    def connection(self):  # type: ignore[no-untyped-def]
+        pool = self
+
+        class Checkout:
+            def __enter__(self):  # type: ignore[no-untyped-def]
+                pool.checkouts += 1
+                return self
+
+            def __exit__(self, *exc_info: object) -> None:
+                return None
+
+            def execute(self, _sql: str, _params: object):  # type: ignore[no-untyped-def]
+                class Cursor:
+                    def fetchone(self) -> tuple[bool, int, int, str]:
+                        return (True, 100, 10_000, "granted")
+
+                return Cursor()
+
+        return Checkout()
+
+
+class PooledOrderIntakeBudgetTests(unittest.TestCase):
+    def test_reserve_and_settle_check_out_pooled_connections(self) -> None:
+        budget = PostgresOrderIntakeBudget("postgresql://budget", 10_000, pool_size=2)
+        pool = RecordingPool()
+        budget._pool = pool
+
+        with patch("psycopg.connect") as connect:
+            reservation = budget.reserve(workspace_id="ws-1", reserved_units=100)
+            budget.settle(reservation, status="consumed", actual_units=80)
+
+        connect.assert_not_called()
+        self.assertEqual(pool.checkouts, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,10 +3,12 @@ from __future__ import annotations
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 import unittest
+from unittest.mock import patch
 
 from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
 
+from supermega_runtime import production_runtime
 from supermega_runtime.plant_equipment_import import validate_plant_equipment_import
 from supermega_runtime.production_runtime import (
     project_production_maintenance_due_queue,
@@ -14,6 +16,7 @@ from supermega_runtime.production_runtime import (
     validate_production_state,
 )
 from supermega_runtime.runtime import reduce_trial_state
+from supermega_runtime.state_memo import clear_validated_states
 from supermega_runtime.trial_runtime import create_trial_router
 from supermega_runtime.trial_store import (
     InMemoryTrialStore,
@@ -740,6 +743,19 @@ class PlantEquipmentMaintenanceStrategyRuntimeTests(unittest.TestCase):
         self.assertEqual(mixer["lastCompletedAt"], completion_evidence["capturedAt"])
         self.assertEqual(mixer["dueAt"], COMPLETED_NEXT_DUE_AT)
 
+        index_class = production_runtime._ProductionEventIndex
+        with patch.object(
+            production_runtime, "_ProductionEventIndex", wraps=index_class
+        ) as built:
+            validate_production_state(completed)
+            self.assertEqual(built.call_count, 1)
+            clear_validated_states()
+            self.assertEqual(
+                project_production_maintenance_due_queue(completed, _ts(18, 1)),
+                completed_queue,
+            )
+            self.assertEqual(built.call_count, 3)
+
 
 class PlantEquipmentMaintenanceStrategyRouteTests(unittest.TestCase):
     def setUp(self) -> None:
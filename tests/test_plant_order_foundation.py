@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from copy import deepcopy
 import unittest
+from unittest.mock import patch
 
+from supermega_runtime import plant_order_foundation
 from supermega_runtime.plant_order_foundation import (
     EMPTY_PLANT_ORDER_DIGEST,
     PLANT_ORDER_CONTROLLED_PLAN_CONTRACT,
@@ -34,6 +36,7 @@ from supermega_runtime.plant_order_foundation import (
     supersede_plant_order_plan,
     validate_plant_order_state,
 )
+from supermega_runtime.state_memo import clear_validated_states
 
 
 def proof(sequence: int, label: str = "reviewed Plant order evidence") -> dict[str, str]:
@@ -1605,5 +1608,96 @@ class PlantOrderFoundationTests(unittest.TestCase):
             )
 
 
+class PlantOrderEngineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_validated_states()
+        plant_order_foundation._ENGINES.clear()
+        self.addCleanup(clear_validated_states)
+        self.addCleanup(plant_order_foundation._ENGINES.clear)
+
+    def cold_projection(self, state: dict[str, object]) -> dict[str, object]:
+        clear_validated_states()
+        plant_order_foundation._ENGINES.clear()
+        return project_plant_order(deepcopy(state))
+
+    def test_incremental_appends_match_full_validation_and_replay(self) -> None:
+        state = fully_issued_state()
+        projection = project_plant_order(state)
+
+        self.assertEqual(validate_plant_order_state(deepcopy(state)), state)
+        self.assertEqual(projection, self.cold_projection(state))
+        self.assertEqual(projection["metrics"]["issuedMaterialCount"], 2)
+
+    def test_append_folds_only_the_new_envelope(self) -> None:
+        state = released_state()
+        applied = []
+        original_apply = plant_order_foundation._PlantOrderReplay.apply
+
+        def counting_apply(replay, index, command):
+            applied.append(index)
+            return original_apply(replay, index, command)
+
+        with patch.object(plant_order_foundation._PlantOrderReplay, "apply", counting_apply):
+            issued = issue_plant_order_material(
+                state,
+                issue_id="ISSUE-20260726-001",
+                material_id="MAT-FILTER-001",
+                input_lot_id="LOT-FILTER-2407",
+                quantity_milli=15_000,
+                proof=proof(4, "issued reviewed filter-media lot"),
+                expected_head_digest=state["headDigest"],
+            )
+            replay = issue_plant_order_material(
+                issued["state"],
+                issue_id="ISSUE-20260726-001",
+                material_id="MAT-FILTER-001",
+                input_lot_id="LOT-FILTER-2407",
+                quantity_milli=15_000,
+                proof=proof(4, "issued reviewed filter-media lot"),
+                expected_head_digest=state["headDigest"],
+            )
+            project_plant_order(issued["state"])
+
+        self.assertEqual(applied, [3])
+        self.assertFalse(issued["replayed"])
+        self.assertTrue(replay["replayed"])
+        self.assertEqual(replay["state"], issued["state"])
+        self.assertEqual(validate_plant_order_state(deepcopy(issued["state"])), issued["state"])
+
+    def test_rejected_append_discards_the_engine_and_the_next_append_recovers(self) -> None:
+        state = released_state()
+        with self.assertRaisesRegex(PlantOrderValidationError, "exceed"):
+            issue_plant_order_material(
+                state,
+                issue_id="ISSUE-20260726-009",
+                material_id="MAT-FILTER-001",
+                input_lot_id="LOT-FILTER-2407",
+                quantity_milli=99_000,
+                proof=proof(4, "over-issue attempt"),
+                expected_head_digest=state["headDigest"],
+            )
+        issued = issue_plant_order_material(
+            state,
+            issue_id="ISSUE-20260726-001",
+            material_id="MAT-FILTER-001",
+            input_lot_id="LOT-FILTER-2407",
+            quantity_milli=15_000,
+            proof=proof(4, "issued reviewed filter-media lot"),
+            expected_head_digest=state["headDigest"],
+        )["state"]
+
+        self.assertEqual(project_plant_order(issued), self.cold_projection(issued))
+        with self.assertRaisesRegex(PlantOrderValidationError, "different evidence"):
+            issue_plant_order_material(
+                issued,
+                issue_id="ISSUE-20260726-001",
+                material_id="MAT-FILTER-001",
+                input_lot_id="LOT-FILTER-2407",
+                quantity_milli=14_000,
+                proof=proof(4, "issued reviewed filter-media lot"),
+                expected_head_digest=issued["headDigest"],
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from typing import Any
+
+from mark1_pilot.runtime_probe_cache import DaemonProbeExecutor, RuntimeProbeCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RuntimeProbeCacheTests(unittest.TestCase):
+    def test_concurrent_misses_share_one_build(self) -> None:
+        cache = RuntimeProbeCache()
+        calls: list[int] = []
+        release = threading.Event()
+
+        def build() -> dict[str, Any]:
+            calls.append(1)
+            release.wait(5)
+            return {"status": "ready"}
+
+        results: list[Any] = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get("drive", 180, build))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"status": "ready"}] * 8)
+        stats = cache.stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["coalesced"], 7)
+        self.assertEqual(stats["in_flight"], 0)
+
+    def test_expired_entry_is_served_stale_while_one_refresh_runs(self) -> None:
+        clock = FakeClock()
+        cache = RuntimeProbeCache(stale_seconds=600, clock=clock)
+        cache.get("gmail", 180, lambda: "v1")
+        clock.now += 181
+
+        refreshes: list[int] = []
+        entered = threading.Event()
+        release = threading.Event()
+
+        def refresh() -> str:
+            refreshes.append(1)
+            entered.set()
+            release.wait(5)
+            return "v2"
+
+        started = time.perf_counter()
+        self.assertEqual([cache.get("gmail", 180, refresh) for _ in range(5)], ["v1"] * 5)
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertTrue(entered.wait(5))
+        release.set()
+        deadline = time.monotonic() + 5
+        while cache.stats()["in_flight"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(refreshes, [1])
+        self.assertEqual(cache.get("gmail", 180, refresh), "v2")
+        stats = cache.stats()
+        self.assertEqual(stats["stale_hits"], 5)
+        self.assertEqual(stats["refreshes"], 1)
+
+    def test_entries_past_the_stale_window_are_rebuilt_before_returning(self) -> None:
+        clock = FakeClock()
+        cache = RuntimeProbeCache(stale_seconds=60, clock=clock)
+        cache.get("github", 180, lambda: "old")
+        clock.now += 181 + 61
+
+        self.assertEqual(cache.get("github", 180, lambda: "new"), "new")
+
+    def test_failed_builds_reach_every_waiter_and_are_not_cached(self) -> None:
+        cache = RuntimeProbeCache()
+
+        def fail() -> Any:
+            raise OSError("probe failed")
+
+        with self.assertRaises(OSError):
+            cache.get("local-root", 900, fail)
+        self.assertEqual(cache.get("local-root", 900, lambda: {"files": 3}), {"files": 3})
+
+    def test_least_recently_used_entries_are_evicted(self) -> None:
+        cache = RuntimeProbeCache(max_entries=2)
+        cache.get("a", 60, lambda: 1)
+        cache.get("b", 60, lambda: 2)
+        cache.get("a", 60, lambda: 0)
+        cache.get("c", 60, lambda: 3)
+
+        self.assertEqual(cache.stats()["entries"], 2)
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertEqual(cache.get("a", 60, lambda: 0), 1)
+        self.assertEqual(cache.get("b", 60, lambda: "rebuilt"), "rebuilt")
+
+
+class DaemonProbeExecutorTests(unittest.TestCase):
+    def test_pool_stays_bounded_and_queued_probes_can_be_cancelled(self) -> None:
+        executor = DaemonProbeExecutor(2, thread_name_prefix="test-probe")
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        hung = [executor.submit(lambda: release.wait(5)) for _ in range(2)]
+        queued = executor.submit(lambda: "never")
+        time.sleep(0.05)
+
+        self.assertTrue(queued.cancel())
+        self.assertEqual(len(executor._threads), 2)
+        self.assertTrue(all(thread.daemon for thread in executor._threads))
+        release.set()
+        self.assertEqual([future.result(5) for future in hung], [True, True])
+        self.assertEqual(executor.submit(lambda: "after").result(5), "after")
+
+    def test_probes_stuck_past_their_timeout_are_replaced_up_to_the_hard_cap(self) -> None:
+        executor = DaemonProbeExecutor(2, hard_cap=4, thread_name_prefix="test-probe")
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        hung = [executor.submit(lambda: release.wait(10), timeout_seconds=0.05) for _ in range(2)]
+        time.sleep(0.1)
+        self.assertEqual(executor.submit(lambda: "fresh", timeout_seconds=0.05).result(2), "fresh")
+        self.assertEqual(executor.worker_count(), 3)
+
+        hung += [executor.submit(lambda: release.wait(10), timeout_seconds=0.05) for _ in range(2)]
+        time.sleep(0.1)
+        capped = executor.submit(lambda: "capped", timeout_seconds=0.05)
+        time.sleep(0.1)
+        self.assertFalse(capped.done())
+        self.assertEqual(executor.worker_count(), 4)
+
+        release.set()
+        self.assertEqual(capped.result(5), "capped")
+        self.assertEqual([future.result(5) for future in hung], [True] * 4)
+        deadline = time.monotonic() + 5
+        while executor.worker_count() > 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(executor.worker_count(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
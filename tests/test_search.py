@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import tempfile
+import unittest
+
+from mark1_pilot.search import build_search_index, search_index
+
+
+class IncrementalSearchIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name) / "mirror"
+        (self.root / "sales").mkdir(parents=True)
+        (self.root / "quality").mkdir()
+        self.db_path = Path(self._tmp.name) / "index" / "search.sqlite"
+        self._write("sales/quotation.txt", "tyre quotation for fleet customer")
+        self._write("quality/claim.md", "warranty claim bead failure")
+        self._write("quality/notes.txt", "daily line notes")
+
+    def _write(self, rel: str, text: str, *, mtime: int | None = None) -> Path:
+        path = self.root / rel
+        path.write_text(text, encoding="utf-8")
+        if mtime is not None:
+            os.utime(path, ns=(mtime, mtime))
+        return path
+
+    def _hits(self, query: str) -> list[str]:
+        return [row["path"] for row in search_index(self.db_path, query)["results"]]
+
+    def test_incremental_build_only_reextracts_changed_files(self) -> None:
+        first = build_search_index(self.root, self.db_path, incremental=True, workers=1)
+        self.assertEqual((first["mode"], first["extracted_documents"]), ("full", 3))
+
+        self._write("sales/quotation.txt", "radial tyre quotation revised", mtime=2_000_000_000_000_000_000)
+        (self.root / "quality" / "claim.md").unlink()
+        self._write("sales/order.txt", "new fleet order")
+        second = build_search_index(self.root, self.db_path, incremental=True, workers=1)
+
+        self.assertEqual(second["mode"], "incremental")
+        self.assertEqual(
+            (second["extracted_documents"], second["unchanged_documents"], second["removed_documents"]),
+            (2, 1, 1),
+        )
+        self.assertEqual(second["indexed_documents"], 3)
+        self.assertEqual(self._hits("radial"), ["sales/quotation.txt"])
+        self.assertEqual(self._hits("warranty"), [])
+        self.assertEqual(self._hits("fleet"), ["sales/order.txt"])
+
+    def test_touched_file_with_same_bytes_is_not_reextracted(self) -> None:
+        build_search_index(self.root, self.db_path, incremental=True, workers=1)
+        path = self.root / "quality" / "notes.txt"
+        os.utime(path, ns=(2_000_000_000_000_000_000, 2_000_000_000_000_000_000))
+
+        result = build_search_index(self.root, self.db_path, incremental=True, workers=1)
+
+        self.assertEqual((result["extracted_documents"], result["unchanged_documents"]), (0, 3))
+        self.assertEqual(self._hits("notes"), ["quality/notes.txt"])
+
+    def test_changed_settings_force_a_full_rebuild(self) -> None:
+        build_search_index(self.root, self.db_path, incremental=True, workers=1)
+
+        result = build_search_index(self.root, self.db_path, char_limit=10, incremental=True, workers=1)
+
+        self.assertEqual(result["mode"], "full")
+        self.assertEqual(result["extracted_documents"], 3)
+
+    def test_process_pool_extraction_matches_inline_extraction(self) -> None:
+        for index in range(40):
+            self._write(f"sales/file_{index:02d}.txt", f"batch document number{index:02d}")
+
+        pooled = build_search_index(self.root, self.db_path, workers=2)
+
+        self.assertEqual(pooled["indexed_documents"], 43)
+        self.assertEqual(pooled["documents_with_content"], 43)
+        self.assertEqual(self._hits("number07"), ["sales/file_07.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
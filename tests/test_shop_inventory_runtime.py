@@ -9,17 +9,20 @@ from uuid import uuid4
 
 from supermega_runtime.commerce_runtime import reduce_commerce_state
 from supermega_runtime.runtime import reduce_trial_state
+import supermega_runtime.shop_inventory_runtime as shop_inventory_module
 from supermega_runtime.shop_inventory_runtime import (
     EMPTY_SHOP_INVENTORY_DIGEST,
     SHOP_INVENTORY_IMPORT_CONTRACT,
     SHOP_INVENTORY_SCHEMA,
     ShopInventoryValidationError,
+    clear_shop_inventory_checkpoints,
     restamp_latest_shop_inventory_command,
     shop_inventory_balances,
     shop_inventory_catalog_digest,
     shop_inventory_supplier_policies,
     shop_inventory_sku_available_to_promise,
     shop_inventory_sku_totals,
+    shop_inventory_view,
     validate_shop_inventory_state,
 )
 from supermega_runtime.trial_store import (
@@ -2098,5 +2101,105 @@ class ShopInventoryRuntimeTests(unittest.TestCase):
         self.assertEqual(counted.state["items"][0]["onHand"], 13)
 
 
+class ShopInventoryCheckpointTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_shop_inventory_checkpoints()
+        self.addCleanup(clear_shop_inventory_checkpoints)
+        self.opening = validate_shop_inventory_state(opening_inventory(), ["SKU-1"])
+
+    def _count_payload_checks(self, value: dict[str, object], **options: object) -> int:
+        with patch.object(
+            shop_inventory_module, "_payload", wraps=shop_inventory_module._payload
+        ) as payload:
+            validate_shop_inventory_state(value, ["SKU-1"], **options)
+        return payload.call_count
+
+    def test_appended_command_is_verified_from_the_trusted_checkpoint(self) -> None:
+        transferred = transferred_inventory(self.opening)
+
+        self.assertEqual(self._count_payload_checks(transferred), 1)
+        self.assertEqual(self._count_payload_checks(transferred), 0)
+        self.assertEqual(
+            self._count_payload_checks(transferred, full_verification=True), 2
+        )
+        self.assertEqual(
+            shop_inventory_balances(transferred, ["SKU-1"]),
+            shop_inventory_balances(
+                validate_shop_inventory_state(
+                    transferred, ["SKU-1"], full_verification=True
+                ),
+                ["SKU-1"],
+            ),
+        )
+
+    def test_rewritten_prefix_does_not_inherit_checkpoint_trust(self) -> None:
+        transferred = validate_shop_inventory_state(
+            transferred_inventory(self.opening), ["SKU-1"]
+        )
+        tampered = deepcopy(transferred)
+        tampered["commands"][0]["payload"]["proof"]["actor"] = "operator-b"  # type: ignore[index]
+        with self.assertRaises(ShopInventoryValidationError):
+            validate_shop_inventory_state(tampered, ["SKU-1"])
+
+        rejected = transferred_inventory(
+            self.opening, action_proof("ACT-TRANSFER-001", TRANSFER_AT)
+        )
+        rejected["commands"][-1]["payload"]["quantity"] = 11  # type: ignore[index]
+        with self.assertRaises(ShopInventoryValidationError):
+            validate_shop_inventory_state(rejected, ["SKU-1"])
+        # A failed extension leaves the opening checkpoint usable.
+        self.assertEqual(self._count_payload_checks(self.opening), 0)
+
+    def test_type_mutated_prefix_falls_back_to_full_verification(self) -> None:
+        transferred = validate_shop_inventory_state(
+            transferred_inventory(self.opening), ["SKU-1"]
+        )
+        for mutated_sequence in (True, 1.0):
+            mutated = deepcopy(transferred)
+            mutated["commands"][0]["sequence"] = mutated_sequence  # type: ignore[index]
+            with self.subTest(sequence=mutated_sequence):
+                with self.assertRaisesRegex(ShopInventoryValidationError, "integer"):
+                    validate_shop_inventory_state(mutated, ["SKU-1"])
+                with self.assertRaisesRegex(ShopInventoryValidationError, "integer"):
+                    validate_shop_inventory_state(
+                        mutated, ["SKU-1"], full_verification=True
+                    )
+
+
+class ShopInventoryViewTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_shop_inventory_checkpoints()
+        self.addCleanup(clear_shop_inventory_checkpoints)
+
+    def test_view_is_shared_per_digest_and_read_only(self) -> None:
+        opening = opening_inventory()
+        view = shop_inventory_view(opening, ["SKU-1"])
+
+        self.assertIs(shop_inventory_view(deepcopy(opening), ["SKU-1"]), view)
+        self.assertEqual(view.sku_totals, {"SKU-1": 10})
+        self.assertIs(view.balances, view.balances)
+        with self.assertRaises(TypeError):
+            view.sku_totals["SKU-1"] = 0  # type: ignore[index]
+        with self.assertRaises(TypeError):
+            view.balances[0]["onHand"] = 0  # type: ignore[index]
+        rows = shop_inventory_balances(opening, ["SKU-1"])
+        rows[0]["onHand"] = 0
+        self.assertEqual(view.balances[0]["onHand"], 10)
+
+    def test_extends_requires_one_appended_command_of_the_named_kind(self) -> None:
+        opening = shop_inventory_view(opening_inventory(), ["SKU-1"])
+        transferred = shop_inventory_view(
+            transferred_inventory(opening_inventory()), ["SKU-1"]
+        )
+
+        self.assertTrue(transferred.extends(opening, kind="transfer"))
+        self.assertFalse(transferred.extends(opening, kind="count"))
+        self.assertFalse(opening.extends(transferred))
+        payload = transferred.latest_payload()
+        payload["quantity"] = 99
+        self.assertEqual(transferred.latest_payload()["quantity"], 3)
+        self.assertEqual(transferred.sku_available_to_promise, {"SKU-1": 10})
+
+
 if __name__ == "__main__":
     unittest.main()
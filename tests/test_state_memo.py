@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from supermega_runtime import state_memo
+from supermega_runtime.state_memo import (
+    clear_validated_states,
+    remember_validated_state,
+    state_digest,
+    validated_state,
+    validated_state_stats,
+)
+from supermega_runtime.trial_store import TrialValidationError
+
+
+def _validator(calls: list[object]):
+    def validate(value: object) -> dict[str, object]:
+        calls.append(value)
+        if not isinstance(value, dict) or value.get("count", 0) < 0:
+            raise TrialValidationError("count must not be negative.")
+        return {**value, "items": list(value.get("items", []))}
+
+    return validate
+
+
+class StateMemoTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_validated_states()
+        self.addCleanup(clear_validated_states)
+
+    def test_identical_snapshots_reuse_the_verdict_and_count_hits(self) -> None:
+        calls: list[object] = []
+        validate = _validator(calls)
+        state = {"schema": "test.v1", "count": 1, "items": [{"sku": "A"}]}
+
+        first = validated_state("commerce", state, validate)
+        second = validated_state("commerce", dict(state), validate)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(
+            validated_state_stats(),
+            {"hits": 1, "misses": 1, "size": 1, "limit": state_memo.VALIDATED_STATE_LIMIT},
+        )
+        second["items"][0]["sku"] = "B"
+        self.assertEqual(validated_state("commerce", state, validate)["items"][0]["sku"], "A")
+
+    def test_surface_and_content_partition_the_memo(self) -> None:
+        calls: list[object] = []
+        validate = _validator(calls)
+        state = {"schema": "test.v1", "count": 1}
+
+        validated_state("commerce", state, validate)
+        validated_state("production", state, validate)
+        validated_state("commerce", {**state, "count": 2}, validate)
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(validated_state_stats()["misses"], 3)
+
+    def test_rejections_are_never_cached(self) -> None:
+        calls: list[object] = []
+        validate = _validator(calls)
+        invalid = {"schema": "test.v1", "count": -1}
+
+        for _ in range(2):
+            with self.assertRaises(TrialValidationError):
+                validated_state("commerce", invalid, validate)
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(validated_state_stats()["size"], 0)
+
+    def test_remembered_states_skip_their_first_validation(self) -> None:
+        calls: list[object] = []
+        state = {"schema": "test.v1", "count": 3}
+
+        remember_validated_state("commerce", state)
+        state["count"] = 4
+
+        self.assertEqual(
+            validated_state("commerce", {"schema": "test.v1", "count": 3}, _validator(calls)),
+            {"schema": "test.v1", "count": 3},
+        )
+        self.assertEqual(calls, [])
+
+    def test_memo_is_bounded_least_recently_used(self) -> None:
+        calls: list[object] = []
+        validate = _validator(calls)
+        with patch.object(state_memo, "VALIDATED_STATE_LIMIT", 2):
+            for count in range(3):
+                validated_state("commerce", {"count": count}, validate)
+            validated_state("commerce", {"count": 0}, validate)
+
+            self.assertEqual(len(calls), 4)
+            self.assertEqual(validated_state_stats()["size"], 2)
+
+    def test_digest_is_canonical_and_rejects_non_json(self) -> None:
+        self.assertEqual(state_digest({"a": 1, "b": [2]}), state_digest({"b": [2], "a": 1}))
+        self.assertNotEqual(state_digest({"a": 1}), state_digest({"a": "1"}))
+        self.assertIsNone(state_digest({"a": object()}))
+        self.assertIsNone(state_digest({"a": float("nan")}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from contextlib import closing
+from pathlib import Path
+from unittest.mock import patch
+
+from mark1_pilot import state_store
+from mark1_pilot.state_store import (
+    STATE_SCHEMA_VERSION,
+    _connect,
+    close_state_connections,
+    ensure_schema,
+    add_approval_entry,
+    add_maintenance_record,
+    add_receiving_record,
+    load_approval_summary,
+    load_dashboard_summary,
+    load_json_artifact,
+    load_maintenance_summary,
+    load_receiving_summary,
+    update_approval_entry,
+    upsert_snapshot,
+)
+
+
+class StateStoreDashboardSummaryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(prefix="supermega-state-store-")
+        self.db_path = Path(self.temp_dir.name) / "state.db"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _receiving(self, supplier: str, status: str, received_qty: str) -> None:
+        add_receiving_record(
+            self.db_path,
+            received_at="2026-10-01",
+            supplier=supplier,
+            po_or_pi="PO-1",
+            grn_or_batch="GRN-1",
+            material="Resin",
+            expected_qty="10",
+            received_qty=received_qty,
+            status=status,
+            owner="Stores",
+            next_action="Check",
+            evidence_link="",
+        )
+
+    def test_counters_match_a_direct_scan_after_inserts_updates_and_deletes(self) -> None:
+        self._receiving("Acme", "received", "10")
+        self._receiving("Acme", "hold", "8")
+        self._receiving("Beta", "review", "12")
+        for minutes in ("1,200", "0.1", "0.2", ""):
+            add_maintenance_record(
+                self.db_path,
+                logged_at="2026-10-01",
+                asset_name="Press 1",
+                issue_type="breakdown",
+                priority="high",
+                status="open",
+                owner="Maintenance",
+                downtime_minutes=minutes,
+                next_action="Fix",
+                evidence_link="",
+            )
+        first = add_approval_entry(
+            self.db_path,
+            workspace_id="ws-1",
+            title="PO",
+            summary="",
+            approval_gate="purchase",
+            requested_by="ops",
+            owner="owner",
+            status="pending",
+            due="",
+            related_route="",
+            related_entity="",
+            evidence_link="",
+        )
+        add_approval_entry(
+            self.db_path,
+            workspace_id="ws-2",
+            title="Hold",
+            summary="",
+            approval_gate="quality",
+            requested_by="ops",
+            owner="owner",
+            status="pending",
+            due="",
+            related_route="",
+            related_entity="",
+            evidence_link="",
+        )
+        update_approval_entry(
+            self.db_path,
+            approval_id=first["approval_id"],
+            workspace_id="ws-1",
+            actor="owner",
+            status="approved",
+            note="Budget confirmed.",
+        )
+
+        receiving = load_receiving_summary(self.db_path)
+        self.assertEqual(receiving["receiving_count"], 3)
+        self.assertEqual(receiving["by_status"], {"hold": 1, "received": 1, "review": 1})
+        self.assertEqual(receiving["hold_count"], 2)
+        self.assertEqual(receiving["variance_count"], 2)
+        self.assertEqual(receiving["top_suppliers"][0], {"supplier": "Acme", "receiving_count": 2})
+        self.assertEqual(load_maintenance_summary(self.db_path)["downtime_minutes_total"], 1200.3)
+        self.assertEqual(load_approval_summary(self.db_path, workspace_id="ws-1")["by_status"], {"approved": 1})
+        self.assertEqual(load_approval_summary(self.db_path)["by_status"], {"approved": 1, "pending": 1})
+
+        with closing(sqlite3.connect(self.db_path)) as connection:
+            connection.execute("DELETE FROM receiving_records WHERE supplier = 'Acme'")
+            connection.commit()
+        receiving = load_receiving_summary(self.db_path)
+        self.assertEqual(receiving["receiving_count"], 1)
+        self.assertEqual(receiving["by_status"], {"review": 1})
+        self.assertEqual(receiving["top_suppliers"], [{"supplier": "Beta", "receiving_count": 1}])
+
+    def test_changed_counter_dimensions_replace_the_installed_triggers(self) -> None:
+        self._receiving("Acme", "received", "10")
+
+        def material_counts() -> dict[str, int]:
+            with closing(sqlite3.connect(self.db_path)) as connection:
+                rows = connection.execute(
+                    "SELECT value, item_count FROM register_counters"
+                    " WHERE register = 'receiving_records' AND dimension = 'material'"
+                ).fetchall()
+            return {str(value): int(count) for value, count in rows}
+
+        dimensions = {**state_store.REGISTER_COUNTER_DIMENSIONS["receiving_records"], "material": "{row}.material"}
+        with patch.dict(state_store.REGISTER_COUNTER_DIMENSIONS, {"receiving_records": dimensions}):
+            close_state_connections()
+            ensure_schema(self.db_path)
+            self.assertEqual(material_counts(), {"Resin": 1})
+            self._receiving("Beta", "review", "12")
+            self.assertEqual(material_counts(), {"Resin": 2})
+
+        close_state_connections()
+        ensure_schema(self.db_path)
+        self.assertEqual(material_counts(), {})
+        self.assertEqual(load_receiving_summary(self.db_path)["receiving_count"], 2)
+
+    def test_dashboard_summary_matches_the_individual_summaries(self) -> None:
+        self._receiving("Acme", "received", "9")
+        upsert_snapshot(self.db_path, "product_lab", {"summary": {"pilot_ready_count": 2}})
+
+        dashboard = load_dashboard_summary(self.db_path, workspace_id="ws-1")
+
+        self.assertEqual(dashboard["receiving"], load_receiving_summary(self.db_path))
+        self.assertEqual(dashboard["approvals"], load_approval_summary(self.db_path, workspace_id="ws-1"))
+        self.assertEqual(dashboard["snapshots"], {"product_lab": {"summary": {"pilot_ready_count": 2}}})
+
+
+class StateStoreConnectionPoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(prefix="supermega-state-pool-")
+        self.db_path = Path(self.temp_dir.name) / "state.db"
+
+    def tearDown(self) -> None:
+        close_state_connections()
+        self.temp_dir.cleanup()
+
+    def test_connection_is_reused_per_thread_with_production_pragmas(self) -> None:
+        with _connect(self.db_path) as first:
+            synchronous = first.execute("PRAGMA synchronous").fetchone()[0]
+            busy_timeout = first.execute("PRAGMA busy_timeout").fetchone()[0]
+        with _connect(self.db_path) as second:
+            self.assertIs(second, first)
+        self.assertEqual(synchronous, 1)
+        self.assertEqual(busy_timeout, 5000)
+
+        other_thread: list[object] = []
+
+        def connect_in_thread() -> None:
+            with _connect(self.db_path) as connection:
+                other_thread.append(connection)
+            close_state_connections()
+
+        worker = threading.Thread(target=connect_in_thread)
+        worker.start()
+        worker.join()
+        self.assertIsNot(other_thread[0], first)
+
+    def test_schema_migrates_once_and_stamps_user_version(self) -> None:
+        with patch.object(state_store, "_migrate_schema", wraps=state_store._migrate_schema) as migrate:
+            ensure_schema(self.db_path)
+            load_receiving_summary(self.db_path)
+            close_state_connections()
+            ensure_schema(self.db_path)
+        self.assertEqual(migrate.call_count, 1)
+        with closing(sqlite3.connect(self.db_path)) as connection:
+            self.assertEqual(connection.execute("PRAGMA user_version").fetchone()[0], STATE_SCHEMA_VERSION)
+
+    def test_replaced_database_file_gets_a_fresh_connection_and_schema(self) -> None:
+        self.assertEqual(load_receiving_summary(self.db_path)["receiving_count"], 0)
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{self.db_path}{suffix}").unlink(missing_ok=True)
+
+        self.assertEqual(load_receiving_summary(self.db_path)["receiving_count"], 0)
+        self.assertTrue(self.db_path.exists())
+
+
+class JsonArtifactCacheTests(unittest.TestCase):
+    def test_artifact_is_reparsed_only_when_the_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="supermega-artifact-") as directory:
+            path = Path(directory) / "autopilot_status.json"
+            self.assertEqual(load_json_artifact(path), {})
+            path.write_text(json.dumps({"status": "ready"}), encoding="utf-8")
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+            cached = load_json_artifact(path)
+            cached["status"] = "mutated"
+            self.assertEqual(load_json_artifact(path), {"status": "ready"})
+
+            path.write_text(json.dumps({"status": "failed"}), encoding="utf-8")
+            os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+            self.assertEqual(load_json_artifact(path), {"status": "failed"})
+
+
+if __name__ == "__main__":
+    unittest.main()
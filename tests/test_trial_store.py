@@ -7,6 +7,7 @@ from datetime import datetime, timedelta, timezone
 import json
 import os
 import unittest
+from unittest.mock import patch
 from uuid import uuid4
 
 import supermega_runtime.trial_store as trial_store_module
@@ -22,6 +23,9 @@ from supermega_runtime.trial_store import (
     TrialPrincipal,
     TrialValidationError,
     TrialVersionConflict,
+    join_state_segments,
+    split_state_segments,
+    state_segment_digests,
 )
 
 
@@ -1326,5 +1330,343 @@ class PostgresConnectTlsTests(unittest.TestCase):
         self.assertIn("tls_required", raised.exception.reasons)
 
 
+
+class PostgresTrialStorePoolTests(unittest.TestCase):
+    """Pooled connections keep the role and schema checks but run them once per
+    physical connection, and re-run them after a failure or once the TTL lapses."""
+
+    def setUp(self) -> None:
+        self.events: list[str] = []
+        self.operator = TrialPrincipal("workspace-a", "actor-operator", "human")
+        events = self.events
+
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *_exc):
+                return False
+
+        class Transaction:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *_exc):
+                return False
+
+        class Connection:
+            def transaction(self):
+                return Transaction()
+
+            def cursor(self):
+                return Cursor()
+
+        class Pool:
+            def __init__(self):
+                self.connection = Connection()
+                self.checked_out = 0
+
+            def getconn(self):
+                self.checked_out += 1
+                return self.connection
+
+            def putconn(self, _connection):
+                self.checked_out -= 1
+
+        self.pool = Pool()
+        pool = self.pool
+
+        class PooledStore(PostgresTrialStore):
+            def _connection_pool(self):
+                return pool
+
+            def _assert_runtime_role(self, _cursor) -> None:
+                events.append("role_checked")
+
+            def _assert_schema(self, _cursor) -> None:
+                events.append("schema_checked")
+
+            def _set_context(self, _cursor, _principal) -> None:
+                events.append("identity_set")
+
+            def _load_membership(self, _cursor, _principal) -> frozenset[str]:
+                return frozenset()
+
+            def _product_entitlements(self, _cursor, _workspace_id) -> tuple[str, ...]:
+                return ()
+
+        self.store = PooledStore("postgresql://runtime.invalid/db", reducer=RecordingReducer(), pool_size=2)
+
+    def _read(self) -> None:
+        with self.store._guarded_cursor(self.operator, write=False):
+            pass
+
+    def test_pooled_connection_is_verified_once_and_returned(self) -> None:
+        self._read()
+        self._read()
+
+        self.assertEqual(self.events.count("role_checked"), 1)
+        self.assertEqual(self.events.count("schema_checked"), 1)
+        self.assertEqual(self.events.count("identity_set"), 2)
+        self.assertEqual(self.pool.checked_out, 0)
+
+    def test_failed_request_forces_reverification(self) -> None:
+        self._read()
+        with self.assertRaises(RuntimeError):
+            with self.store._guarded_cursor(self.operator, write=False):
+                raise RuntimeError("connection broke mid-request")
+        self._read()
+
+        self.assertEqual(self.events.count("role_checked"), 2)
+        self.assertEqual(self.pool.checked_out, 0)
+
+    def test_verification_expires_after_ttl(self) -> None:
+        self._read()
+        record = self.store._verified_connections[self.pool.connection]
+        record["verified_at"] -= trial_store_module.TRIAL_POOL_VERIFY_TTL_SECONDS
+        self._read()
+
+        self.assertEqual(self.events.count("schema_checked"), 2)
+
+    def test_pool_fails_closed_on_weak_sslmode(self) -> None:
+        store = PostgresTrialStore(
+            PostgresConnectTlsTests._BASE + "?sslmode=disable",
+            reducer=RecordingReducer(),
+            pool_size=2,
+        )
+        with self.assertRaises(TrialNotReadyError) as raised:
+            store._connection_pool()
+        self.assertIn("tls_required", raised.exception.reasons)
+
+
+def _segment_order(index: int) -> dict[str, object]:
+    return {"id": f"ORD-{index:04d}", "item": "Rice 5kg", "quantity": 1, "total": 100}
+
+
+class SegmentStore(PostgresTrialStore):
+    """Postgres adapter over in-process rows for the segmented state tests."""
+
+    def __init__(self) -> None:
+        super().__init__("postgres://runtime", reducer=self._prepend_orders, write_enabled=True)
+        self.segmented_state = True
+        self.rows: dict[tuple[str, str], dict[str, object]] = {}
+        self.segments: dict[tuple[str, str, str], str] = {}
+        self.events: dict[str, dict[str, object]] = {}
+        self.statements: list[str] = []
+        self.collected: list[list[str]] = []
+        store = self
+
+        class Cursor:
+            def __init__(self) -> None:
+                self.result: object = None
+
+            def execute(self, query: str, parameters: tuple[object, ...] = ()) -> None:
+                query = " ".join(query.split()).lower()
+                store.statements.append(query)
+                self.result = None
+                if query.startswith("select command_fingerprint, result_json"):
+                    self.result = store.events.get(str(parameters[1]))
+                elif query.startswith("select version, state_json") or query.startswith(
+                    "select workspace_id, surface, version, state_json"
+                ):
+                    row = store.rows.get((str(parameters[0]), str(parameters[1])))
+                    self.result = deepcopy(row)
+                elif query.startswith("select digest, records"):
+                    workspace_id, surface, digests = parameters
+                    self.result = [
+                        {"digest": digest, "records": json.loads(store.segments[(workspace_id, surface, digest)])}
+                        for digest in digests
+                        if (workspace_id, surface, digest) in store.segments
+                    ]
+                elif query.startswith("insert into app_private.workspace_state_segments"):
+                    workspace_id, surface, digest, text = parameters
+                    store.segments.setdefault((workspace_id, surface, digest), text)
+                elif query.startswith("update app_private.workspace_state"):
+                    version, state_json, updated_by, _now, workspace_id, surface = parameters
+                    store.rows[(workspace_id, surface)].update(
+                        version=version, state_json=json.loads(state_json), updated_by=updated_by
+                    )
+                elif query.startswith("insert into app_private.workspace_state"):
+                    workspace_id, surface, version, state_json, updated_by, _now = parameters
+                    store.rows[(workspace_id, surface)] = {
+                        "workspace_id": workspace_id,
+                        "surface": surface,
+                        "version": version,
+                        "state_json": json.loads(state_json),
+                        "updated_by": updated_by,
+                        "updated_at": "",
+                    }
+                elif query.startswith("insert into app_private.workspace_events"):
+                    store.events[str(parameters[2])] = {
+                        "command_fingerprint": parameters[3],
+                        "result_json": json.loads(str(parameters[11])),
+                    }
+                elif query.startswith("select app_private.collect_workspace_state_segments"):
+                    workspace_id, surface, digests = parameters
+                    store.collected.append(list(digests))
+                    heads = [row["state_json"] for row in store.rows.values()] + [
+                        event["result_json"]["state"] for event in store.events.values()
+                    ]
+                    referenced = {digest for head in heads for digest in state_segment_digests(head)}
+                    for digest in digests:
+                        if digest not in referenced:
+                            store.segments.pop((workspace_id, surface, digest), None)
+
+            def fetchone(self) -> object:
+                return self.result
+
+            def fetchall(self) -> object:
+                return self.result or []
+
+        self.cursor = Cursor()
+
+    @staticmethod
+    def _prepend_orders(_surface, _event_type, current, payload):
+        orders = [_segment_order(index) for index in payload["changes"]["orders"]]
+        return {**current, "orders": [*orders, *current.get("orders", [])]}
+
+    @contextmanager
+    def _guarded_cursor(self, *_args, **_kwargs):
+        yield self.cursor, frozenset({"commerce.write"})
+
+    def add_orders(self, principal: TrialPrincipal, version: int, orders: range):
+        return self.apply_command(
+            principal,
+            command_id=str(uuid4()),
+            surface="commerce",
+            event_type="commerce.order.created",
+            expected_version=version,
+            payload={"changes": {"orders": list(orders)}},
+        )
+
+
+@patch.object(trial_store_module, "STATE_SEGMENT_RECORDS", 4)
+class StateSegmentTests(unittest.TestCase):
+    """Long commerce collections are stored as immutable chunks behind a head."""
+
+    def setUp(self) -> None:
+        self.operator = TrialPrincipal("workspace-a", "actor-operator", "human")
+
+    def test_split_and_join_round_trip_and_prepends_keep_sealed_chunks(self) -> None:
+        state = {
+            "schema": "supermega.commerce.workspace.v2",
+            "items": [{"sku": "RICE-5KG"}],
+            "orders": [_segment_order(index) for index in range(10, 0, -1)],
+            "closes": [],
+        }
+        head, chunks = split_state_segments("commerce", state)
+
+        self.assertNotIn("orders", head)
+        self.assertEqual(head["items"], state["items"])
+        self.assertEqual(len(head["$segments"]["orders"]["inline"]), 2)
+        self.assertEqual(len(head["$segments"]["orders"]["chunks"]), 2)
+        self.assertEqual(head["$segments"]["closes"], {"inline": [], "chunks": []})
+        self.assertEqual(state_segment_digests(head), head["$segments"]["orders"]["chunks"])
+        self.assertEqual(join_state_segments(head, chunks), state)
+
+        grown = {**state, "orders": [_segment_order(11), *state["orders"]]}
+        grown_head, grown_chunks = split_state_segments("commerce", grown)
+        self.assertEqual(grown_head["$segments"]["orders"]["chunks"], head["$segments"]["orders"]["chunks"])
+        self.assertEqual(grown_chunks, chunks)
+        self.assertEqual(split_state_segments("production", state), (state, {}))
+
+        with self.assertRaisesRegex(TrialValidationError, "missing segment"):
+            join_state_segments(head, {})
+        with self.assertRaisesRegex(TrialValidationError, "malformed"):
+            state_segment_digests({"$segments": {"orders": {"inline": [], "chunks": ["sha256:bad"]}}})
+
+    def test_postgres_commands_write_only_new_chunks_and_keep_the_version_contract(self) -> None:
+        store = SegmentStore()
+        store.add_orders(self.operator, 0, range(6))
+        self.assertEqual(len(store.segments), 1)
+
+        store.statements.clear()
+        result = store.add_orders(self.operator, 1, range(6, 8))
+        self.assertEqual(result.version, 2)
+        self.assertEqual(
+            [order["id"] for order in result.state["orders"]],
+            [f"ORD-{index:04d}" for index in (6, 7, 0, 1, 2, 3, 4, 5)],
+        )
+        self.assertEqual(len(store.segments), 2)
+        inserted = [query for query in store.statements if "insert into app_private.workspace_state_segments" in query]
+        self.assertEqual(len(inserted), 1)
+        stored_head = store.rows[("workspace-a", "commerce")]["state_json"]
+        self.assertNotIn("orders", stored_head)
+        event_state = next(iter(store.events.values()))["result_json"]["state"]
+        self.assertIn("$segments", event_state)
+
+        with self.assertRaises(TrialVersionConflict):
+            store.add_orders(self.operator, 1, range(8, 9))
+        self.assertEqual(store.get_state(self.operator, "commerce").state, result.state)
+
+        cold = SegmentStore()
+        cold.rows, cold.segments = store.rows, dict(store.segments)
+        self.assertEqual(cold.get_state(self.operator, "commerce").state, result.state)
+        cold.statements.clear()
+        cold.get_state(self.operator, "commerce")
+        self.assertFalse(any("workspace_state_segments" in query for query in cold.statements))
+
+        tampered = SegmentStore()
+        tampered.rows = store.rows
+        tampered.segments = {key: json.dumps([_segment_order(99)]) for key in store.segments}
+        with self.assertRaisesRegex(TrialValidationError, "digest verification"):
+            tampered.get_state(self.operator, "commerce")
+
+    def test_rewritten_chunks_are_offered_to_the_collector(self) -> None:
+        store = SegmentStore()
+        store.add_orders(self.operator, 0, range(6))
+        store.add_orders(self.operator, 1, range(6, 8))
+        self.assertEqual(store.collected, [])
+
+        def rewrite(quantity: int):
+            store.reducer = lambda _surface, _event_type, current, _payload: {
+                **current,
+                "orders": [{**order, "quantity": quantity} for order in current["orders"]],
+            }
+
+        def head_chunks() -> set[str]:
+            return set(state_segment_digests(store.rows[("workspace-a", "commerce")]["state_json"]))
+
+        original = head_chunks()
+        rewrite(2)
+        store.add_orders(self.operator, 2, range(0))
+        self.assertEqual(store.collected, [sorted(original)])
+        # Earlier event heads still reference the old chunks, so they stay.
+        self.assertTrue(original <= {digest for _, _, digest in store.segments})
+
+        rewritten = head_chunks()
+        store.events.clear()
+        rewrite(3)
+        store.add_orders(self.operator, 3, range(0))
+        self.assertEqual(store.collected[-1], sorted(rewritten))
+        self.assertFalse(rewritten & {digest for _, _, digest in store.segments})
+        self.assertEqual(len(store.get_state(self.operator, "commerce").state["orders"]), 8)
+
+    def test_unsegmented_schema_keeps_the_single_document_ceiling(self) -> None:
+        store = SegmentStore()
+        store.segmented_state = False
+        result = store.add_orders(self.operator, 0, range(6))
+
+        self.assertEqual(store.rows[("workspace-a", "commerce")]["state_json"], result.state)
+        self.assertEqual(store.segments, {})
+        with patch.object(trial_store_module, "MAX_JSON_BYTES", 512):
+            with self.assertRaisesRegex(TrialValidationError, "reduced state exceeds 512 bytes"):
+                store.add_orders(self.operator, 1, range(6, 20))
+
+    def test_segment_key_is_only_read_on_segmented_surfaces_and_never_written(self) -> None:
+        store = SegmentStore()
+        document = {"$segments": {"orders": {"inline": [], "chunks": ["sha256:" + "0" * 64]}}}
+        self.assertEqual(store._load_state(store.cursor, "workspace-a", "setup", document, field_name="state"), document)
+
+        store.segmented_state = False
+        self.assertEqual(
+            store._load_state(store.cursor, "workspace-a", "commerce", document, field_name="state"), document
+        )
+        with self.assertRaisesRegex(TrialValidationError, r"must not contain \$segments"):
+            store._store_state(
+                store.cursor, "workspace-a", "setup", document, stored_digests=set(), field_name="reduced state"
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
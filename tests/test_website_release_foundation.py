@@ -3,7 +3,9 @@ from __future__ import annotations
 from copy import deepcopy
 import json
 import unittest
+from unittest.mock import patch
 
+from supermega_runtime import website_release_foundation as website_release_module
 from supermega_runtime.website_release_foundation import (
     EMPTY_WEBSITE_RELEASE_DIGEST,
     WEBSITE_BRAND_TOKEN_CONTRACT,
@@ -13,6 +15,7 @@ from supermega_runtime.website_release_foundation import (
     apply_website_template_upgrade,
     approve_website_release_package,
     build_website_release_package,
+    clear_website_release_checkpoints,
     create_empty_website_release_state,
     prepare_website_deploy_plan,
     prepare_website_release_package,
@@ -512,5 +515,54 @@ class WebsiteReleaseFoundationTests(unittest.TestCase):
             )
 
 
+class WebsiteReleaseCheckpointTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_website_release_checkpoints()
+        self.addCleanup(clear_website_release_checkpoints)
+
+    def _count_payload_checks(self, value: dict[str, object], **options: object) -> int:
+        with patch.object(
+            website_release_module,
+            "_command_payload",
+            wraps=website_release_module._command_payload,
+        ) as payload:
+            validate_website_release_state(value, **options)
+        return payload.call_count
+
+    def test_appended_command_replays_from_the_trusted_checkpoint(self) -> None:
+        state = approved_state()
+
+        self.assertEqual(self._count_payload_checks(state), 0)
+        self.assertEqual(self._count_payload_checks(state, full_verification=True), 3)
+        clear_website_release_checkpoints()
+        cold = project_website_release(state, full_verification=True)
+        self.assertEqual(self._count_payload_checks(state), 0)
+        self.assertEqual(project_website_release(state), cold)
+        self.assertEqual(cold["status"], "ready_for_plan")
+
+    def test_rewritten_prefix_does_not_inherit_trust(self) -> None:
+        state = upgraded_state()
+        tampered = deepcopy(state)
+        tampered["commands"][0]["payload"]["proof"]["actor"] = "Content owner"  # type: ignore[index]
+        with self.assertRaises(WebsiteReleaseValidationError):
+            validate_website_release_state(tampered)
+
+        key = next(reversed(website_release_module._CHECKPOINTS))
+        with self.assertRaises(TypeError):
+            website_release_module._CHECKPOINTS[key].cursor["approval"] = {"id": "forged"}  # type: ignore[index]
+        self.assertEqual(self._count_payload_checks(state), 0)
+        self.assertIsNone(project_website_release(state)["approval"])
+
+    def test_type_mutated_prefix_falls_back_to_full_verification(self) -> None:
+        state = upgraded_state()
+        for mutated_sequence in (True, 1.0):
+            mutated = deepcopy(state)
+            mutated["commands"][0]["sequence"] = mutated_sequence  # type: ignore[index]
+            with self.subTest(sequence=mutated_sequence):
+                with self.assertRaises(WebsiteReleaseValidationError):
+                    validate_website_release_state(mutated)
+                with self.assertRaises(WebsiteReleaseValidationError):
+                    validate_website_release_state(mutated, full_verification=True)
+
 if __name__ == "__main__":
     unittest.main()
@@ -6,8 +6,10 @@ from pathlib import Path
 import tempfile
 import unittest
 
+from supermega_runtime.trial_store import split_state_segments
 from tools.manage_workspace_recovery import (
     EXPECTED_SCHEMA_VERSION,
+    STATE_SEGMENT_SCHEMA_VERSION,
     RecoveryError,
     build_package,
     build_restore_plan,
@@ -47,6 +49,23 @@ def fixture_sections(workspace_id: str = "client-one"):
     }
 
 
+def segmented_fixture_sections(workspace_id: str = "client-one"):
+    sections = fixture_sections(workspace_id)
+    orders = [{"id": f"SO-{index}", "total": index} for index in range(70, 0, -1)]
+    head, chunks = split_state_segments("commerce", {"orders": orders})
+    sections["workspace_state"][0]["state_json"] = head
+    sections["workspace_events"][0].update(
+        surface="commerce",
+        payload_json={"kind": "order"},
+        result_json={"version": 7, "state": head},
+    )
+    sections["workspace_state_segments"] = [
+        {"workspace_id": workspace_id, "surface": "commerce", "digest": digest, "records": json.loads(text)}
+        for digest, text in sorted(chunks.items())
+    ]
+    return sections
+
+
 class WorkspaceRecoveryTests(unittest.TestCase):
     def build(self, workspace_id: str = "client-one"):
         return build_package(
@@ -113,6 +132,50 @@ class WorkspaceRecoveryTests(unittest.TestCase):
             ["workspace_memberships", "workspace_state", "workspace_events", "approval_requests"],
         )
 
+    def test_segmented_workspace_round_trips_its_state_chunks(self):
+        package = build_package(
+            workspace_id="client-one",
+            schema_version=STATE_SEGMENT_SCHEMA_VERSION,
+            sections=segmented_fixture_sections(),
+            exported_at=datetime(2026, 7, 29, tzinfo=timezone.utc),
+        )
+        self.assertEqual(package["counts"]["workspace_state_segments"], 1)
+        with tempfile.TemporaryDirectory() as directory:
+            destination = Path(directory) / "client-one-recovery.json"
+            write_package(destination, package)
+            restored = read_package(destination)
+        self.assertEqual(restored, package)
+        plan = build_restore_plan(restored, destination_workspace="client-one-recovered")
+        self.assertEqual(plan["schema_version_required"], STATE_SEGMENT_SCHEMA_VERSION)
+        self.assertEqual(
+            plan["transaction_order"],
+            [
+                "workspace_memberships",
+                "workspace_state_segments",
+                "workspace_state",
+                "workspace_events",
+                "approval_requests",
+            ],
+        )
+
+    def test_segmented_package_requires_every_referenced_intact_chunk(self):
+        missing = segmented_fixture_sections()
+        missing["workspace_state_segments"] = []
+        with self.assertRaisesRegex(RecoveryError, "workspace_recovery_state_segment_missing"):
+            build_package(
+                workspace_id="client-one",
+                schema_version=STATE_SEGMENT_SCHEMA_VERSION,
+                sections=missing,
+            )
+        altered = segmented_fixture_sections()
+        altered["workspace_state_segments"][0]["records"][0]["total"] = 0
+        with self.assertRaisesRegex(RecoveryError, "workspace_recovery_state_segment_digest_invalid"):
+            build_package(
+                workspace_id="client-one",
+                schema_version=STATE_SEGMENT_SCHEMA_VERSION,
+                sections=altered,
+            )
+
     def test_bad_workspace_and_row_limit_fail_closed(self):
         with self.assertRaisesRegex(RecoveryError, "workspace_id_invalid"):
             self.build("../unsafe")
@@ -124,9 +187,7 @@ class WorkspaceRecoveryTests(unittest.TestCase):
                 max_rows_per_section=0,
             )
 
-    def test_database_export_is_read_only_scoped_and_closed(self):
-        sections = fixture_sections()
-
+    def export(self, sections, schema_version=EXPECTED_SCHEMA_VERSION):
         class Cursor:
             def __init__(self):
                 self.executed = []
@@ -144,14 +205,14 @@ class WorkspaceRecoveryTests(unittest.TestCase):
 
             def fetchone(self):
                 if "trial_schema_meta" in self.current:
-                    return {"schema_version": EXPECTED_SCHEMA_VERSION}
+                    return {"schema_version": schema_version}
                 if "pg_roles" in self.current:
                     return {"recovery_authority": True}
                 raise AssertionError(self.current)
 
             def fetchall(self):
                 for section, rows in sections.items():
-                    if f"app_private.{section}" in self.current:
+                    if f"app_private.{section} " in self.current:
                         return [{"row_json": row} for row in rows]
                 raise AssertionError(self.current)
 
@@ -181,6 +242,10 @@ class WorkspaceRecoveryTests(unittest.TestCase):
             workspace_id="client-one",
             connection_factory=lambda _url: connection,
         )
+        return package, connection
+
+    def test_database_export_is_read_only_scoped_and_closed(self):
+        package, connection = self.export(fixture_sections())
         self.assertTrue(connection.closed)
         statements = connection.cursor_instance.executed
         self.assertEqual(statements[0][0], "set transaction read only")
@@ -189,6 +254,16 @@ class WorkspaceRecoveryTests(unittest.TestCase):
         self.assertTrue(all(entry[1][0] == "client-one" for entry in scoped_queries))
         self.assertEqual(package["counts"]["workspace_events"], 1)
 
+    def test_segmented_database_export_includes_state_chunks(self):
+        package, connection = self.export(segmented_fixture_sections(), STATE_SEGMENT_SCHEMA_VERSION)
+        scoped_queries = [
+            entry[0] for entry in connection.cursor_instance.executed if "where workspace_id = %s" in entry[0]
+        ]
+        self.assertEqual(len(scoped_queries), 5)
+        self.assertIn("order by surface, digest", scoped_queries[1])
+        self.assertEqual(package["schema_version"], STATE_SEGMENT_SCHEMA_VERSION)
+        self.assertEqual(package["counts"]["workspace_state_segments"], 1)
+        self.assertTrue(verify_package(package)["valid"])
 
 if __name__ == "__main__":
     unittest.main()
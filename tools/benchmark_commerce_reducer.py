@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import argparse
+from copy import deepcopy
+import json
+from pathlib import Path
+import statistics
+import sys
+import time
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from supermega_runtime.commerce_runtime import reduce_commerce_state, validate_commerce_state
+from supermega_runtime.state_memo import clear_validated_states, validated_state_stats
+
+
+CAPTURED_AT = "2026-07-23T09:00:00.000Z"
+PROMISED_AT = "2026-07-23T11:00:00.000Z"
+ORDER_QUANTITY = 2
+UNIT_PRICE_MMK = 100
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure one commerce.order.created command against a workspace that "
+            "already holds many orders, comparing the whole-state payload (cold "
+            "and with a remembered current state) with the delta payload."
+        )
+    )
+    parser.add_argument("--orders", type=int, default=1000, help="Orders seeded before the timed command.")
+    parser.add_argument("--calls", type=int, default=5, help="Timed calls per mode.")
+    return parser.parse_args()
+
+
+def _order(order_id: str) -> dict[str, Any]:
+    return {
+        "id": order_id,
+        "createdAt": CAPTURED_AT,
+        "customer": "Customer ref",
+        "owner": "Accountable operator",
+        "channel": "Website",
+        "item": "Benchmark item",
+        "itemSku": "SKU-1",
+        "quantity": ORDER_QUANTITY,
+        "payment": "Manual QR review",
+        "paymentStatus": "pending",
+        "refundStatus": "none",
+        "fulfilment": "pickup",
+        "fulfilmentReference": f"FUL-{order_id}",
+        "promisedAt": PROMISED_AT,
+        "sourceRecordId": f"WEB-{order_id}",
+        "total": ORDER_QUANTITY * UNIT_PRICE_MMK,
+        "status": "confirmed",
+    }
+
+
+def _reserve(order_id: str) -> dict[str, Any]:
+    action_id = f"ACT-{order_id}"
+    return {
+        "id": f"MOV2:{action_id}",
+        "actionId": action_id,
+        "createdAt": CAPTURED_AT,
+        "actor": "Accountable operator",
+        "reason": "Verified against the source record.",
+        "evidenceReference": f"EV-{action_id}",
+        "kind": "reserve",
+        "sku": "SKU-1",
+        "quantityDelta": -ORDER_QUANTITY,
+        "orderId": order_id,
+    }
+
+
+def build_workspace(orders: int) -> dict[str, Any]:
+    order_ids = [f"ORD-{index:05d}" for index in range(orders)]
+    return validate_commerce_state(
+        {
+            "schema": "supermega.commerce.workspace.v2",
+            "items": [
+                {
+                    "sku": "SKU-1",
+                    "name": "Benchmark item",
+                    "onHand": 10,
+                    "reorderAt": 2,
+                    "price": UNIT_PRICE_MMK,
+                }
+            ],
+            "orders": [_order(order_id) for order_id in order_ids],
+            "movements": [_reserve(order_id) for order_id in order_ids],
+            "closes": [],
+        }
+    )
+
+
+def build_command(current: dict[str, Any]) -> tuple[dict[str, Any], dict[str, str]]:
+    """Return the delta and evidence for one new reserved order."""
+
+    order = _order("ORD-NEW")
+    order["calculation"] = {
+        "schema": "supermega.commerce.order-calculation.v1",
+        "currency": "MMK",
+        "catalogRevision": 0,
+        "subtotalMmk": ORDER_QUANTITY * UNIT_PRICE_MMK,
+        "taxMode": "not_configured",
+        "taxMmk": 0,
+        "totalMmk": ORDER_QUANTITY * UNIT_PRICE_MMK,
+    }
+    reserve = _reserve("ORD-NEW")
+    item = {**current["items"][0], "onHand": current["items"][0]["onHand"] - ORDER_QUANTITY}
+    delta = {
+        "items": {"set": {"0": item}},
+        "orders": {"prepend": [order]},
+        "movements": {"prepend": [reserve]},
+    }
+    evidence = {
+        "actionId": reserve["actionId"],
+        "capturedAt": reserve["createdAt"],
+        "actor": reserve["actor"],
+        "reason": reserve["reason"],
+        "evidenceReference": reserve["evidenceReference"],
+    }
+    return delta, evidence
+
+
+def _time_calls(operation: Callable[[], Any], calls: int) -> dict[str, float]:
+    samples: list[float] = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        operation()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "calls": calls,
+        "mean_ms": round(statistics.fmean(samples), 2),
+        "p50_ms": round(samples[len(samples) // 2], 2),
+        "max_ms": round(samples[-1], 2),
+    }
+
+
+def run_benchmark(*, orders: int, calls: int) -> dict[str, Any]:
+    current = build_workspace(orders)
+    delta, evidence = build_command(current)
+    next_state = deepcopy(current)
+    next_state["items"][0] = delta["items"]["set"]["0"]
+    next_state["orders"] = [*delta["orders"]["prepend"], *next_state["orders"]]
+    next_state["movements"] = [*delta["movements"]["prepend"], *next_state["movements"]]
+    whole_payload = {"state": next_state, "evidence": evidence}
+    delta_payload = {"delta": delta, "evidence": evidence}
+    event_type = "commerce.order.created"
+
+    whole_result = reduce_commerce_state(event_type, current, whole_payload)
+    delta_result = reduce_commerce_state(event_type, current, delta_payload)
+    if whole_result != delta_result:
+        raise SystemExit("delta and whole-state commands produced different states")
+
+    def whole_cold() -> None:
+        clear_validated_states()
+        reduce_commerce_state(event_type, current, whole_payload)
+
+    def whole_warm() -> None:
+        reduce_commerce_state(event_type, current, whole_payload)
+
+    def delta_warm() -> None:
+        reduce_commerce_state(event_type, current, delta_payload)
+
+    results = {
+        "whole_state_cold": _time_calls(whole_cold, calls),
+        "whole_state_trusted_current": _time_calls(whole_warm, calls),
+        "delta_trusted_current": _time_calls(delta_warm, calls),
+    }
+    return {
+        "orders": orders,
+        "state_bytes": len(json.dumps(current, separators=(",", ":")).encode("utf-8")),
+        "delta_bytes": len(json.dumps(delta_payload, separators=(",", ":")).encode("utf-8")),
+        "results": results,
+        "memo": validated_state_stats(),
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    print(json.dumps(run_benchmark(orders=args.orders, calls=args.calls), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
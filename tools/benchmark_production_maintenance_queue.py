@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timedelta, timezone
+import json
+from pathlib import Path
+import statistics
+import sys
+import time
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from supermega_runtime.production_runtime import (
+    project_production_maintenance_due_queue,
+    validate_production_state,
+)
+from supermega_runtime.state_memo import clear_validated_states, validated_state_stats
+
+
+# Production validation caps a workspace at 100 equipment records and 100
+# runtime machines, so that is the largest fleet a valid state can hold.
+MAX_ASSETS = 100
+STARTED_AT = datetime(2026, 1, 5, 6, 0, tzinfo=timezone.utc)
+INTERVAL_DAYS = 30
+IMPORT_ACTION_ID = "ACT-BENCH-IMPORT"
+PACKAGE_DIGEST = f"sha256:{'b' * 64}"
+OWNER = "Maintenance lead"
+PROCEDURE = "SOP-PM-BENCH-R1"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure project_production_maintenance_due_queue against a workspace "
+            "with many commissioned assets and a long maintenance history, cold "
+            "(full validation) and with a remembered validated state."
+        )
+    )
+    parser.add_argument(
+        "--assets",
+        type=int,
+        default=MAX_ASSETS,
+        help=f"Commissioned assets with a strategy (at most {MAX_ASSETS}).",
+    )
+    parser.add_argument(
+        "--events",
+        type=int,
+        default=20_000,
+        help="Approximate maintenance events, spread evenly across the assets.",
+    )
+    parser.add_argument("--calls", type=int, default=5, help="Timed calls per mode.")
+    return parser.parse_args()
+
+
+def _stamp(value: datetime) -> str:
+    return value.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _event(
+    action_id: str,
+    at: datetime,
+    kind: str,
+    subject_id: str,
+    summary: str,
+    **fields: Any,
+) -> dict[str, Any]:
+    return {
+        "id": f"EVT-{action_id}",
+        "actionId": action_id,
+        "createdAt": _stamp(at),
+        "actor": "plant-owner",
+        "reason": "Benchmark maintenance history",
+        "evidenceReference": fields.pop("evidenceReference", f"EVIDENCE-{action_id}"),
+        "kind": kind,
+        "subjectId": subject_id,
+        "summary": summary,
+        **fields,
+    }
+
+
+def build_workspace(assets: int, events: int) -> dict[str, Any]:
+    """Return a valid Production state with ``assets`` strategies and their history."""
+
+    if not 1 <= assets <= MAX_ASSETS:
+        raise SystemExit(f"--assets must be between 1 and {MAX_ASSETS}")
+    cycles = max(1, events // (2 * assets))
+    asset_ids = [f"EQ-BENCH-{index:03d}" for index in range(assets)]
+    imported_at = STARTED_AT - timedelta(days=2)
+    commissioned_at = STARTED_AT - timedelta(days=1)
+    chronological = [
+        _event(
+            IMPORT_ACTION_ID,
+            imported_at,
+            "equipment_master_imported",
+            "equipment-master",
+            f"Imported {assets} equipment master records",
+            evidenceReference=PACKAGE_DIGEST,
+            equipmentIds=asset_ids,
+        )
+    ]
+    records: list[dict[str, Any]] = []
+    for index, asset_id in enumerate(asset_ids):
+        name = f"Bench asset {index:03d}"
+        commission_id = f"ACT-BENCH-COMMISSION-{index:03d}"
+        strategy_id = f"ACT-BENCH-STRATEGY-{index:03d}"
+        saved_at = STARTED_AT - timedelta(hours=12)
+        planned_due_at = _stamp(STARTED_AT + timedelta(minutes=index))
+        chronological.append(
+            _event(
+                commission_id,
+                commissioned_at,
+                "equipment_commissioned",
+                asset_id,
+                f"Commissioned {name} at WC-BENCH",
+                evidenceReference=f"SAFETY-{asset_id}",
+                installedAt=_stamp(imported_at),
+                toState="running",
+                workCentreId="WC-BENCH",
+            )
+        )
+        chronological.append(
+            _event(
+                strategy_id,
+                saved_at,
+                "equipment_maintenance_strategy_saved",
+                asset_id,
+                f"Saved maintenance strategy R1 for {asset_id}",
+                evidenceReference=f"SAFETY-PM-{asset_id}",
+                strategyRevision=1,
+                maintenanceOwner=OWNER,
+                intervalDays=INTERVAL_DAYS,
+                nextDueAt=planned_due_at,
+                procedureReference=PROCEDURE,
+            )
+        )
+        records.append(
+            {
+                "id": asset_id,
+                "name": name,
+                "workCentreId": "WC-BENCH",
+                "criticality": ("critical", "high", "medium", "low")[index % 4],
+                "owner": "Plant engineering owner",
+                "commissioningStatus": "commissioned",
+                "sourceActionId": IMPORT_ACTION_ID,
+                "sourcePackageDigest": PACKAGE_DIGEST,
+                "importedAt": _stamp(imported_at),
+                "commissioning": {
+                    "actionId": commission_id,
+                    "commissionedAt": _stamp(commissioned_at),
+                    "commissionedBy": "plant-owner",
+                    "installedAt": _stamp(imported_at),
+                    "initialState": "running",
+                    "safetyBaselineReference": f"SAFETY-{asset_id}",
+                },
+                "maintenanceStrategy": {
+                    "revision": 1,
+                    "actionId": strategy_id,
+                    "savedAt": _stamp(saved_at),
+                    "savedBy": "plant-owner",
+                    "maintenanceOwner": OWNER,
+                    "intervalDays": INTERVAL_DAYS,
+                    "nextDueAt": planned_due_at,
+                    "procedureReference": PROCEDURE,
+                    "safetyBaselineReference": f"SAFETY-PM-{asset_id}",
+                },
+            }
+        )
+    for cycle in range(cycles):
+        for index, (asset_id, record) in enumerate(zip(asset_ids, records)):
+            strategy = record["maintenanceStrategy"]
+            binding = {
+                "maintenanceStrategyActionId": strategy["actionId"],
+                "maintenanceStrategyRevision": 1,
+                "maintenanceProcedureReference": PROCEDURE,
+                "maintenancePlannedDueAt": _stamp(STARTED_AT + timedelta(minutes=index)),
+            }
+            started_at = STARTED_AT + timedelta(days=cycle, minutes=index)
+            completed_at = started_at + timedelta(minutes=30)
+            start_id = f"ACT-BENCH-START-{index:03d}-{cycle:05d}"
+            next_due_at = _stamp(completed_at + timedelta(days=INTERVAL_DAYS))
+            chronological.append(
+                _event(
+                    start_id,
+                    started_at,
+                    "maintenance_started",
+                    asset_id,
+                    f"Started maintenance for {record['name']}",
+                    maintenanceOwner=OWNER,
+                    **binding,
+                )
+            )
+            chronological.append(
+                _event(
+                    f"ACT-BENCH-COMPLETE-{index:03d}-{cycle:05d}",
+                    completed_at,
+                    "maintenance_completed",
+                    asset_id,
+                    f"Completed maintenance for {record['name']}",
+                    maintenanceStartActionId=start_id,
+                    nextDueAt=next_due_at,
+                    **binding,
+                )
+            )
+            strategy["nextDueAt"] = next_due_at
+    return validate_production_state(
+        {
+            "schema": "supermega.production.workspace.v2",
+            "revision": len(chronological),
+            "jobs": [
+                {
+                    "id": "JOB-OPEN-1",
+                    "line": "Line A",
+                    "product": "Opening batch",
+                    "target": 100,
+                    "output": 0,
+                }
+            ],
+            "issues": [],
+            "machines": [
+                {"id": record["id"], "name": record["name"], "state": "running"}
+                for record in records
+            ],
+            "events": list(reversed(chronological)),
+            "openingPlan": {
+                "contract": "supermega.production.opening-plan.v1",
+                "packageDigest": PACKAGE_DIGEST,
+                "confirmedAt": _stamp(imported_at - timedelta(hours=1)),
+                "jobIds": ["JOB-OPEN-1"],
+                "machineIds": [],
+            },
+            "equipmentMaster": {
+                "contract": "supermega.production.equipment-master.v1",
+                "assets": records,
+            },
+        }
+    )
+
+
+def _time_calls(operation: Callable[[], Any], calls: int) -> dict[str, float]:
+    samples: list[float] = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        operation()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "calls": calls,
+        "mean_ms": round(statistics.fmean(samples), 2),
+        "p50_ms": round(samples[len(samples) // 2], 2),
+        "max_ms": round(samples[-1], 2),
+    }
+
+
+def run_benchmark(*, assets: int, events: int, calls: int) -> dict[str, Any]:
+    state = build_workspace(assets, events)
+    as_of = state["events"][0]["createdAt"]
+    queue = project_production_maintenance_due_queue(state, as_of)
+    if len(queue["items"]) != assets or any(
+        "lastCompletionActionId" not in item for item in queue["items"]
+    ):
+        raise SystemExit("maintenance queue did not project every completed asset")
+
+    def cold() -> None:
+        clear_validated_states()
+        project_production_maintenance_due_queue(state, as_of)
+
+    def warm() -> None:
+        project_production_maintenance_due_queue(state, as_of)
+
+    results = {
+        "queue_cold": _time_calls(cold, calls),
+        "queue_validated_state": _time_calls(warm, calls),
+    }
+    return {
+        "assets": assets,
+        "events": len(state["events"]),
+        "results": results,
+        "memo": validated_state_stats(),
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    print(
+        json.dumps(
+            run_benchmark(assets=args.assets, events=args.events, calls=args.calls),
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+from typing import Any, Callable
+from zipfile import ZipFile
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from mark1_pilot.search import build_search_index
+
+
+TOP_LEVELS = ("sales", "quality", "procurement", "finance", "production")
+WORDS = (
+    "tyre radial bias bead tread compound curing press batch supplier invoice "
+    "claim warranty shipment quotation customer fleet inspection defect"
+).split()
+DOCX_BODY = (
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "<w:body><w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:body></w:document>"
+)
+XLSX_WORKBOOK = (
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheets><sheet name="{text}" sheetId="1"/></sheets></workbook>'
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure build_search_index over a synthetic mirror: a full build "
+            "inline and with a process pool, then incremental builds with no "
+            "changes and after editing and removing a slice of the files."
+        )
+    )
+    parser.add_argument("--files", type=int, default=10_000, help="Files in the synthetic tree.")
+    parser.add_argument(
+        "--changed-percent",
+        type=float,
+        default=1.0,
+        help="Share of files rewritten (and, at half that share, removed) before the last build.",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Pool size for the parallel builds.")
+    return parser.parse_args()
+
+
+def _text(index: int) -> str:
+    words = [WORDS[(index * 7 + offset) % len(WORDS)] for offset in range(60)]
+    return f"document{index:06d} " + " ".join(words)
+
+
+def build_tree(root: Path, files: int) -> list[Path]:
+    """Write ``files`` documents: mostly text, with every tenth a DOCX or XLSX."""
+
+    paths: list[Path] = []
+    for index in range(files):
+        folder = root / TOP_LEVELS[index % len(TOP_LEVELS)] / f"batch_{index // 500:03d}"
+        folder.mkdir(parents=True, exist_ok=True)
+        text = _text(index)
+        if index % 10 == 3:
+            path = folder / f"report_{index:06d}.docx"
+            with ZipFile(path, "w") as archive:
+                archive.writestr("word/document.xml", DOCX_BODY.format(text=text))
+        elif index % 10 == 7:
+            path = folder / f"register_{index:06d}.xlsx"
+            with ZipFile(path, "w") as archive:
+                archive.writestr("xl/workbook.xml", XLSX_WORKBOOK.format(text=text[:31]))
+        else:
+            path = folder / f"note_{index:06d}.{('txt', 'md', 'csv')[index % 3]}"
+            path.write_text(text, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _timed(operation: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+    started = time.perf_counter()
+    result = operation()
+    return {
+        "seconds": round(time.perf_counter() - started, 3),
+        "mode": result["mode"],
+        "extracted": result["extracted_documents"],
+        "unchanged": result["unchanged_documents"],
+        "removed": result["removed_documents"],
+        "indexed": result["indexed_documents"],
+    }
+
+
+def run_benchmark(*, files: int, changed_percent: float, workers: int | None) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as scratch:
+        root = Path(scratch) / "mirror"
+        db_path = Path(scratch) / "search_index.sqlite"
+        paths = build_tree(root, files)
+
+        results = {
+            "full_inline": _timed(lambda: build_search_index(root, db_path, workers=1)),
+            "full_parallel": _timed(lambda: build_search_index(root, db_path, workers=workers)),
+            "incremental_unchanged": _timed(
+                lambda: build_search_index(root, db_path, incremental=True, workers=workers)
+            ),
+        }
+
+        step = max(1, round(100 / changed_percent)) if changed_percent > 0 else 0
+        if step:
+            for index, path in enumerate(paths[::step]):
+                if index % 3 == 2:
+                    path.unlink()
+                elif path.suffix in {".txt", ".md", ".csv"}:
+                    path.write_text(_text(index) + " revised", encoding="utf-8")
+                else:
+                    stat = path.stat()
+                    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        results["incremental_after_changes"] = _timed(
+            lambda: build_search_index(root, db_path, incremental=True, workers=workers)
+        )
+        return {"files": files, "changed_percent": changed_percent, "results": results}
+
+
+def main() -> int:
+    args = parse_args()
+    print(
+        json.dumps(
+            run_benchmark(files=args.files, changed_percent=args.changed_percent, workers=args.workers),
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
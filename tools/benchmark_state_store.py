@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from mark1_pilot.state_store import add_inventory_record, add_metric_entry, list_inventory_records
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure per-call overhead of the local state store for one write "
+            "(add_metric_entry) and one read (list_inventory_records) against a "
+            "throwaway SQLite database."
+        )
+    )
+    parser.add_argument("--calls", type=int, default=500, help="Timed calls per operation.")
+    parser.add_argument("--inventory-rows", type=int, default=200, help="Inventory rows seeded before reads.")
+    return parser.parse_args()
+
+
+def _time_calls(operation: Callable[[int], Any], calls: int) -> dict[str, float]:
+    samples: list[float] = []
+    for index in range(calls):
+        started = time.perf_counter()
+        operation(index)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    samples.sort()
+    return {
+        "calls": calls,
+        "mean_us": round(statistics.fmean(samples), 1),
+        "p50_us": round(samples[len(samples) // 2], 1),
+        "p95_us": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 1),
+    }
+
+
+def run_benchmark(db_path: Path, *, calls: int, inventory_rows: int) -> dict[str, Any]:
+    for index in range(inventory_rows):
+        add_inventory_record(
+            db_path,
+            captured_at="2026-10-01",
+            item_code=f"SKU-{index:05d}",
+            item_name=f"Item {index}",
+            warehouse=f"WH-{index % 4}",
+            on_hand_qty=str(100 + index),
+            reserved_qty="5",
+            reorder_point="20",
+            status="",
+            owner="Stores",
+            next_action="Count",
+            evidence_link="",
+        )
+
+    def write(index: int) -> None:
+        add_metric_entry(
+            db_path,
+            captured_at="2026-10-01",
+            metric_name=f"Output {index}",
+            metric_group="production",
+            metric_value=str(index),
+            unit="pcs",
+            period_label="shift",
+            scope="line-1",
+            owner="Plant",
+            status="recorded",
+            notes="",
+            evidence_link="",
+        )
+
+    def read(_index: int) -> None:
+        list_inventory_records(db_path, limit=50)
+
+    return {
+        "add_metric_entry": _time_calls(write, calls),
+        "list_inventory_records": _time_calls(read, calls),
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    with tempfile.TemporaryDirectory(prefix="supermega-state-benchmark-") as directory:
+        report = run_benchmark(
+            Path(directory) / "state.db",
+            calls=max(1, args.calls),
+            inventory_rows=max(0, args.inventory_rows),
+        )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import statistics
+import sys
+import time
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from supermega_runtime.telemetry import redact
+
+
+SPAN_ATTRIBUTES = 12
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure span attribute scrubbing against the deny-list extracted "
+            "from a large order payload, with the compiled per-request matcher "
+            "and with the previous value-by-value scan."
+        )
+    )
+    parser.add_argument("--lines", type=int, default=500, help="Order lines in the request payload.")
+    parser.add_argument("--spans", type=int, default=200, help="Spans scrubbed per timed call.")
+    parser.add_argument("--calls", type=int, default=5, help="Timed calls per mode.")
+    return parser.parse_args()
+
+
+def build_payload(lines: int) -> dict[str, Any]:
+    return {
+        "surface": "commerce",
+        "payload": {
+            "order": {
+                "id": "ORD-BENCH",
+                "customerName": "Daw Khin Myat Noe",
+                "customerPhone": "09512345678",
+                "deliveryAddress": "No. 42, Bo Aung Kyaw Street, Kyauktada, Yangon",
+                "note": "Deliver after 5pm, call the shop manager first.",
+                "totalMmk": lines * 12_500,
+                "lines": [
+                    {
+                        "sku": f"SKU-{index:04d}",
+                        "itemName": f"Radial tyre 195/65R15 batch {index:04d}",
+                        "quantity": 1 + index % 4,
+                        "unitPrice": 12_500 + index,
+                        "lineNote": f"Fit at bay {index % 12}, rotate set {index:04d}",
+                    }
+                    for index in range(lines)
+                ],
+            },
+            "evidence": {"actor": "actor-operator", "reason": "Phone order confirmed with the customer."},
+        },
+    }
+
+
+def build_spans(spans: int) -> list[tuple[str, dict[str, Any]]]:
+    keys = sorted(redact.ATTRIBUTE_WHITELIST)[:SPAN_ATTRIBUTES]
+    built = []
+    for index in range(spans):
+        attributes: dict[str, Any] = {
+            key: f"{key}-value-{index:05d}-workspace-ws-bench-0001" for key in keys
+        }
+        attributes["http.route"] = "POST /api/trial/v1/commands"
+        attributes["duration_ms"] = index % 90
+        if index % 50 == 0:
+            attributes["workflow"] = f"Radial tyre 195/65R15 batch {index % 500:04d}"
+        built.append((f"commerce.command.{index % 7}", attributes))
+    return built
+
+
+def _linear_matches(value: str, deny_values: frozenset[str]) -> bool:
+    """The value-by-value scan the compiled matcher replaced."""
+
+    if not value or not deny_values:
+        return False
+    if value in deny_values:
+        return True
+    if len(value) < 4:
+        return False
+    return any(len(deny) >= 4 and deny in value for deny in deny_values)
+
+
+def _linear_scrub(attributes: dict[str, Any], deny_values: frozenset[str]) -> dict[str, Any]:
+    kept = {}
+    for key, value in attributes.items():
+        if key not in redact.ATTRIBUTE_WHITELIST:
+            continue
+        if isinstance(value, str) and (
+            _linear_matches(value, deny_values)
+            or redact.MYANMAR_PHONE_PATTERN.search(value)
+            or redact.MMK_AMOUNT_PATTERN.search(value)
+            or len(value) > redact.MAX_ATTRIBUTE_LENGTH
+        ):
+            continue
+        kept[key] = value
+    return kept
+
+
+def _time_calls(operation: Callable[[], Any], calls: int) -> dict[str, float]:
+    samples: list[float] = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        operation()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "calls": calls,
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "p50_ms": round(samples[len(samples) // 2], 3),
+        "max_ms": round(samples[-1], 3),
+    }
+
+
+def run_benchmark(*, lines: int, spans: int, calls: int) -> dict[str, Any]:
+    payload = build_payload(lines)
+    span_inputs = build_spans(spans)
+    extracted = redact.extract_customer_content_values(payload)
+    compiled = redact.CustomerContentDenyList(extracted)
+
+    for name, attributes in span_inputs:
+        if redact.scrub_attributes(attributes, compiled) != _linear_scrub(attributes, extracted):
+            raise SystemExit(f"compiled and linear scrubbing disagree on span {name!r}")
+
+    def scope() -> None:
+        token = redact.push_customer_content_scope(payload)
+        redact.pop_customer_content_scope(token)
+
+    def scrub_compiled() -> None:
+        for name, attributes in span_inputs:
+            redact.scrub_span_name(name, compiled)
+            redact.scrub_attributes(attributes, compiled)
+
+    def scrub_linear() -> None:
+        for name, attributes in span_inputs:
+            _linear_matches(name, extracted)
+            _linear_scrub(attributes, extracted)
+
+    return {
+        "lines": lines,
+        "deny_values": len(extracted),
+        "spans_per_call": spans,
+        "results": {
+            "push_scope_extract_and_compile": _time_calls(scope, calls),
+            "scrub_compiled": _time_calls(scrub_compiled, calls),
+            "scrub_linear_scan": _time_calls(scrub_linear, calls),
+        },
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    print(json.dumps(run_benchmark(lines=args.lines, spans=args.spans, calls=args.calls), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -26,6 +26,11 @@ CONTRACT = "supermega.workspace_recovery.v1"
 RESTORE_PLAN_CONTRACT = "supermega.workspace_restore_plan.v1"
 SCHEMA_COMPONENT = "private_trial_backend"
 EXPECTED_SCHEMA_VERSION = 5
+# From v14 long commerce collections live in content-addressed chunks that the
+# workspace_state and workspace_events heads reference by digest.
+STATE_SEGMENT_SCHEMA_VERSION = 14
+SUPPORTED_SCHEMA_VERSIONS = (EXPECTED_SCHEMA_VERSION, STATE_SEGMENT_SCHEMA_VERSION)
+STATE_SEGMENTS_KEY = "$segments"
 DEFAULT_ENV_KEY = "SUPERMEGA_RECOVERY_ADMIN_DATABASE_URL"
 DEFAULT_MAX_ROWS_PER_SECTION = 50_000
 MAX_PACKAGE_BYTES = 32 * 1024 * 1024
@@ -52,8 +57,17 @@ SECTION_ORDER = (
     "workspace_events",
     "approval_requests",
 )
+# Chunks restore before the heads that reference them.
+SEGMENTED_SECTION_ORDER = (
+    "workspace_memberships",
+    "workspace_state_segments",
+    "workspace_state",
+    "workspace_events",
+    "approval_requests",
+)
 SECTION_ORDER_BY = {
     "workspace_memberships": "actor_id",
+    "workspace_state_segments": "surface, digest",
     "workspace_state": "surface",
     "workspace_events": "created_at, event_id",
     "approval_requests": "requested_at, approval_id",
@@ -142,6 +156,58 @@ def _assert_no_secret_fields(value: Any) -> None:
             _assert_no_secret_fields(item)
 
 
+def section_order(schema_version: int) -> tuple[str, ...]:
+    if schema_version not in SUPPORTED_SCHEMA_VERSIONS:
+        _fail("workspace_recovery_schema_version_mismatch")
+    return SEGMENTED_SECTION_ORDER if schema_version >= STATE_SEGMENT_SCHEMA_VERSION else SECTION_ORDER
+
+
+def _segment_text(records: Any) -> str:
+    return json.dumps(records, ensure_ascii=False, allow_nan=False, sort_keys=True, separators=(",", ":"))
+
+
+def _head_segment_digests(head: Any) -> list[str]:
+    if not isinstance(head, Mapping):
+        return []
+    pointers = head.get(STATE_SEGMENTS_KEY)
+    if pointers is None:
+        return []
+    if not isinstance(pointers, Mapping):
+        _fail("workspace_recovery_state_segments_invalid")
+    digests: list[str] = []
+    for pointer in pointers.values():
+        if not isinstance(pointer, Mapping) or not isinstance(pointer.get("chunks"), list):
+            _fail("workspace_recovery_state_segments_invalid")
+        digests.extend(str(digest) for digest in pointer["chunks"])
+    return digests
+
+
+def _validate_state_segments(sections: Mapping[str, list[dict[str, Any]]]) -> None:
+    """Require every chunk a stored head references, and only intact chunks."""
+
+    exported: set[tuple[str, str]] = set()
+    for row in sections["workspace_state_segments"]:
+        records = row.get("records")
+        digest = row.get("digest")
+        if not isinstance(records, list) or not isinstance(digest, str):
+            _fail("workspace_state_segments_row_invalid")
+        if digest != f"sha256:{sha256(_segment_text(records).encode('utf-8')).hexdigest()}":
+            _fail("workspace_recovery_state_segment_digest_invalid")
+        exported.add((str(row.get("surface", "")), digest))
+    referenced: set[tuple[str, str]] = set()
+    for row in sections["workspace_state"]:
+        surface = str(row.get("surface", ""))
+        referenced.update((surface, digest) for digest in _head_segment_digests(row.get("state_json")))
+    for row in sections["workspace_events"]:
+        surface = str(row.get("surface", ""))
+        for column in ("payload_json", "result_json"):
+            document = row.get(column)
+            if isinstance(document, Mapping):
+                referenced.update((surface, digest) for digest in _head_segment_digests(document.get("state")))
+    if referenced - exported:
+        _fail("workspace_recovery_state_segment_missing")
+
+
 def _validate_section_rows(
     section: str,
     rows: Any,
@@ -173,9 +239,8 @@ def build_package(
     max_rows_per_section: int = DEFAULT_MAX_ROWS_PER_SECTION,
 ) -> dict[str, Any]:
     workspace_id = _validate_workspace_id(workspace_id)
-    if schema_version != EXPECTED_SCHEMA_VERSION:
-        _fail("workspace_recovery_schema_version_mismatch")
-    if set(sections) != set(SECTION_ORDER):
+    ordered_sections = section_order(schema_version)
+    if set(sections) != set(ordered_sections):
         _fail("workspace_recovery_sections_invalid")
     if max_rows_per_section < 1 or max_rows_per_section > DEFAULT_MAX_ROWS_PER_SECTION:
         _fail("workspace_recovery_row_limit_invalid")
@@ -189,11 +254,13 @@ def build_package(
             workspace_id=workspace_id,
             max_rows_per_section=max_rows_per_section,
         )
-        for section in SECTION_ORDER
+        for section in ordered_sections
     }
     if not normalized_sections["workspace_memberships"]:
         _fail("workspace_recovery_workspace_not_found")
     _assert_no_secret_fields(normalized_sections)
+    if "workspace_state_segments" in normalized_sections:
+        _validate_state_segments(normalized_sections)
     package: dict[str, Any] = {
         "contract": CONTRACT,
         "schema_component": SCHEMA_COMPONENT,
@@ -203,8 +270,8 @@ def build_package(
         "data_classification": "confidential_customer_data",
         "storage_protection": "owner_protected_plaintext_file",
         "sections": normalized_sections,
-        "counts": {section: len(normalized_sections[section]) for section in SECTION_ORDER},
-        "section_sha256": {section: _digest(normalized_sections[section]) for section in SECTION_ORDER},
+        "counts": {section: len(normalized_sections[section]) for section in ordered_sections},
+        "section_sha256": {section: _digest(normalized_sections[section]) for section in ordered_sections},
         "secret_values_exposed": False,
     }
     package["integrity_sha256"] = _digest(package)
@@ -224,8 +291,10 @@ def verify_package(
         _fail("workspace_recovery_contract_invalid")
     if package.get("schema_component") != SCHEMA_COMPONENT:
         _fail("workspace_recovery_schema_component_invalid")
-    if package.get("schema_version") != EXPECTED_SCHEMA_VERSION:
+    schema_version = package.get("schema_version")
+    if type(schema_version) is not int:
         _fail("workspace_recovery_schema_version_mismatch")
+    ordered_sections = section_order(schema_version)
     if package.get("data_classification") != "confidential_customer_data":
         _fail("workspace_recovery_classification_invalid")
     if package.get("storage_protection") != "owner_protected_plaintext_file":
@@ -241,7 +310,7 @@ def verify_package(
     except ValueError as exc:
         raise RecoveryError("workspace_recovery_timestamp_invalid") from exc
     sections = package.get("sections")
-    if not isinstance(sections, Mapping) or set(sections) != set(SECTION_ORDER):
+    if not isinstance(sections, Mapping) or set(sections) != set(ordered_sections):
         _fail("workspace_recovery_sections_invalid")
     normalized_sections = {
         section: _validate_section_rows(
@@ -250,15 +319,17 @@ def verify_package(
             workspace_id=workspace_id,
             max_rows_per_section=max_rows_per_section,
         )
-        for section in SECTION_ORDER
+        for section in ordered_sections
     }
     if not normalized_sections["workspace_memberships"]:
         _fail("workspace_recovery_workspace_not_found")
     _assert_no_secret_fields(normalized_sections)
-    expected_counts = {section: len(normalized_sections[section]) for section in SECTION_ORDER}
+    if "workspace_state_segments" in normalized_sections:
+        _validate_state_segments(normalized_sections)
+    expected_counts = {section: len(normalized_sections[section]) for section in ordered_sections}
     if package.get("counts") != expected_counts:
         _fail("workspace_recovery_counts_invalid")
-    expected_section_digests = {section: _digest(normalized_sections[section]) for section in SECTION_ORDER}
+    expected_section_digests = {section: _digest(normalized_sections[section]) for section in ordered_sections}
     if package.get("section_sha256") != expected_section_digests:
         _fail("workspace_recovery_section_digest_invalid")
     unsigned = dict(package)
@@ -271,7 +342,7 @@ def verify_package(
         "contract": CONTRACT,
         "valid": True,
         "workspace_id": workspace_id,
-        "schema_version": EXPECTED_SCHEMA_VERSION,
+        "schema_version": schema_version,
         "counts": expected_counts,
         "integrity_sha256": observed_digest,
     }
@@ -383,8 +454,10 @@ def export_workspace(
                     (SCHEMA_COMPONENT,),
                 )
                 schema_row = cursor.fetchone()
-                if not schema_row or int(schema_row["schema_version"]) != EXPECTED_SCHEMA_VERSION:
+                if not schema_row:
                     _fail("workspace_recovery_schema_version_mismatch")
+                schema_version = int(schema_row["schema_version"])
+                ordered_sections = section_order(schema_version)
                 cursor.execute(
                     "select coalesce(rolsuper or rolbypassrls, false) as recovery_authority "
                     "from pg_roles where rolname = current_user"
@@ -393,7 +466,7 @@ def export_workspace(
                 if not authority_row or authority_row["recovery_authority"] is not True:
                     _fail("workspace_recovery_admin_role_required")
                 sections: dict[str, list[dict[str, Any]]] = {}
-                for section in SECTION_ORDER:
+                for section in ordered_sections:
                     cursor.execute(
                         f"select to_jsonb(source_row) as row_json from app_private.{section} as source_row "
                         f"where workspace_id = %s order by {SECTION_ORDER_BY[section]} limit %s",
@@ -405,7 +478,7 @@ def export_workspace(
                     sections[section] = rows
         return build_package(
             workspace_id=workspace_id,
-            schema_version=EXPECTED_SCHEMA_VERSION,
+            schema_version=schema_version,
             sections=sections,
             max_rows_per_section=max_rows_per_section,
         )
@@ -426,7 +499,7 @@ def build_restore_plan(package: Mapping[str, Any], *, destination_workspace: str
         "source_workspace_id": verification["workspace_id"],
         "destination_workspace_id": destination,
         "source_integrity_sha256": verification["integrity_sha256"],
-        "schema_version_required": EXPECTED_SCHEMA_VERSION,
+        "schema_version_required": verification["schema_version"],
         "counts": verification["counts"],
         "write_performed": False,
         "required_gates": [
@@ -437,7 +510,7 @@ def build_restore_plan(package: Mapping[str, Any], *, destination_workspace: str
             "integrity_reverified_inside_restore_transaction",
             "tenant_isolation_and_row_count_acceptance",
         ],
-        "transaction_order": list(SECTION_ORDER),
+        "transaction_order": list(section_order(verification["schema_version"])),
         "rollback_rule": "rollback_on_any_insert_or_acceptance_failure",
     }
 
@@ -16,9 +16,9 @@ const branchPattern = /^(?:agent|codex)\/[a-z0-9][a-z0-9._/-]{0,119}$/
 // an isolated branch (hq/readiness/self-serve-pilot-proof.json), fingerprint-
 // pinned in verify_private_trial_migrations.mjs. The packet describes the full
 // reviewed chain; applying it to production remains a separate founder decision.
-const expectedSchemaVersion = 13
-const expectedMigrationCount = 14
-const expectedFinalMigration = '20260818090000_private_trial_backend_v13_billing_entitlement_read.sql'
+const expectedSchemaVersion = 14
+const expectedMigrationCount = 15
+const expectedFinalMigration = '20260820090000_private_trial_backend_v14_state_segments.sql'
 const browserQuarantinePath = 'supabase/rehearsal/20260804_public_browser_quarantine.sql'
 const securityAuditPath = 'hq/readiness/supabase-security-advisor-audit.json'
 
@@ -54,7 +54,7 @@ async function browserQuarantineInventory(repositoryRoot) {
   ])
   const audit = JSON.parse(auditRaw)
   // The source audit may trail the full isolated rehearsal chain, but it must
-  // describe a reviewed managed schema no newer than this packet's v13 target.
+  // describe a reviewed managed schema no newer than this packet's v14 target.
   // The rehearsal remains responsible for applying and validating later
   // migrations; the audit remains the exact current public-object inventory.
   if (audit?.contract !== 'supermega.supabase-security-advisor-audit.v2'
@@ -280,8 +280,8 @@ export async function buildSupabaseRehearsalPacket({
       'provider-backup-inventory-before-migration',
       'independent-restore-to-isolated-target',
       'hostname-verified-postgresql-17-preflight',
-      'ordered-migration-application-through-v13',
-      'read-only-v13-runtime-validator',
+      'ordered-migration-application-through-v14',
+      'read-only-v14-runtime-validator',
       'supabase-security-advisor-without-applicable-errors',
       'private-storage-isolation-proof',
       'named-user-auth-and-cross-tenant-denial',
@@ -9,6 +9,15 @@ evaluator. `--self-test` proves the whole pipeline offline: drafts are built
 from the corpus's expected values, the produced document must pass every
 quality gate, and no network is touched.
 
+`--concurrency N` runs extractions through N asyncio workers sharing the
+provider's keep-alive connection pool; every call still reserves and settles
+its own budget units, and `--rate-per-second` spaces request starts for the
+provider. Results join the document as they finish (with one progress line per
+fixture on stderr) and the summary reports p50/p95 latency per worker.
+`--mock-provider` runs the same batch path offline against a loopback
+stand-in that answers from the corpus expectations, so batch turnaround can be
+measured without a key; `--mock-latency-ms` sets its simulated model latency.
+
 The results document is structurally sanitized: it carries only drafts and
 bounded metrics, and the scorer rejects any private-source or operational key.
 """
@@ -17,12 +26,16 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 import json
 import os
 import sys
 import time
 from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from threading import Thread
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO_ROOT))
@@ -34,6 +47,10 @@ from supermega_runtime.order_intake import (  # noqa: E402
 from supermega_runtime.order_intake_eval import (  # noqa: E402
     ORDER_INTAKE_RESULT_SCHEMA,
     evaluate_order_intake_results,
+    order_intake_latency_summary,
+)
+from supermega_runtime.order_intake_provider import (  # noqa: E402
+    ORDER_INTAKE_HARD_MAX_CONNECTIONS,
 )
 
 FIXTURE_PATH = REPO_ROOT / "tests" / "fixtures" / "order_intake_v1.json"
@@ -45,6 +62,37 @@ INPUT_PRICE_MICROUSD_PER_TOKEN = float(os.getenv("SUPERMEGA_ORDER_INTAKE_INPUT_P
 CACHED_PRICE_MICROUSD_PER_TOKEN = float(os.getenv("SUPERMEGA_ORDER_INTAKE_CACHED_PRICE", "0.025"))
 OUTPUT_PRICE_MICROUSD_PER_TOKEN = float(os.getenv("SUPERMEGA_ORDER_INTAKE_OUTPUT_PRICE", "2.0"))
 
+MOCK_PROVIDER_MODEL = "mock-order-intake-model"
+# Each in-flight fixture owns one usage slot; asyncio.to_thread copies the
+# worker's context into the transport thread, so concurrent calls never read
+# each other's token counts.
+_FIXTURE_USAGE: ContextVar[dict[str, int] | None] = ContextVar("fixture_usage", default=None)
+
+
+class EvalFixtureFailed(Exception):
+    def __init__(self, fixture_id: str, error: Exception):
+        super().__init__(str(error))
+        self.fixture_id = fixture_id
+
+
+class ProviderRateLimiter:
+    """Space request starts at most ``rate_per_second`` apart; 0 disables it."""
+
+    def __init__(self, rate_per_second: float):
+        self._interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self._interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
 
 def load_corpus() -> dict[str, object]:
     return json.loads(FIXTURE_PATH.read_text(encoding="utf-8"))
@@ -60,9 +108,12 @@ def estimated_cost_microusd(input_tokens: int, cached_tokens: int, output_tokens
     return max(0, round(cost))
 
 
-def run_live(output_path: Path) -> int:
+def run_live(output_path: Path, *, concurrency: int = 1, rate_per_second: float = 0.0) -> int:
     from supermega_runtime.order_intake_provider import order_intake_provider_from_environment
 
+    # The provider sizes its keep-alive pool from the environment; widen it to
+    # the requested worker count unless an operator pinned it.
+    os.environ.setdefault("SUPERMEGA_ORDER_INTAKE_MAX_CONNECTIONS", str(concurrency))
     provider = order_intake_provider_from_environment()
     if provider is None:
         print(json.dumps({
@@ -76,8 +127,16 @@ def run_live(output_path: Path) -> int:
         return 2
 
     corpus = load_corpus()
-    catalog = [OrderIntakeCatalogItem.model_validate(item) for item in corpus["catalog"]]
-    captured_usage: list[dict[str, int]] = []
+    return run_provider_batch(
+        provider,
+        corpus,
+        output_path,
+        concurrency=concurrency,
+        rate_per_second=rate_per_second,
+    )
+
+
+def capture_usage(provider) -> None:
     original_transport = provider._transport  # noqa: SLF001 - deliberate capture shim
 
     def capturing_transport(*args, **kwargs):
@@ -91,55 +150,247 @@ def run_live(output_path: Path) -> int:
         cached_input_tokens = int(
             details.get("cached_tokens") or usage.get("cache_read_input_tokens") or 0
         )
-        captured_usage.append({
-            "input_tokens": int(usage.get("input_tokens") or 0),
-            "cached_input_tokens": cached_input_tokens,
-            "output_tokens": int(usage.get("output_tokens") or 0),
-        })
+        slot = _FIXTURE_USAGE.get()
+        if slot is not None:
+            slot.update({
+                "input_tokens": int(usage.get("input_tokens") or 0),
+                "cached_input_tokens": cached_input_tokens,
+                "output_tokens": int(usage.get("output_tokens") or 0),
+            })
         return response
 
     provider._transport = capturing_transport  # noqa: SLF001
 
-    results: list[dict[str, object]] = []
+
+async def run_batch(
+    provider,
+    corpus: dict[str, object],
+    document: dict[str, object],
+    *,
+    concurrency: int,
+    rate_per_second: float = 0.0,
+) -> list[dict[str, object]]:
+    """Feed every fixture through ``concurrency`` workers; return per-worker latency."""
+
+    catalog = [OrderIntakeCatalogItem.model_validate(item) for item in corpus["catalog"]]
+    # Provider and budget calls run through asyncio.to_thread; give every worker
+    # its own thread so a small host's default executor never caps the batch.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="order-intake-eval")
+    )
+    limiter = ProviderRateLimiter(rate_per_second)
+    pending: asyncio.Queue[dict[str, object]] = asyncio.Queue()
     for fixture in corpus["fixtures"]:
-        fixture_id = str(fixture["id"])
-        started = time.monotonic()
-        try:
-            draft = asyncio.run(provider.generate(
-                message=str(fixture["message"]),
-                catalog=catalog,
-                workspace_id="order-intake-eval",
-                actor_id="eval-runner",
-            ))
-        except Exception as error:  # noqa: BLE001 - abort with a truthful failure record
+        pending.put_nowait(fixture)
+    results: list[dict[str, object]] = document["results"]  # type: ignore[assignment]
+    latencies: dict[int, list[int]] = {worker: [] for worker in range(1, concurrency + 1)}
+
+    async def work(worker: int) -> None:
+        while True:
+            try:
+                fixture = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            fixture_id = str(fixture["id"])
+            await limiter.wait()
+            usage = {"input_tokens": 0, "cached_input_tokens": 0, "output_tokens": 0}
+            token = _FIXTURE_USAGE.set(usage)
+            started = time.monotonic()
+            try:
+                draft = await provider.generate(
+                    message=str(fixture["message"]),
+                    catalog=catalog,
+                    workspace_id="order-intake-eval",
+                    actor_id="eval-runner",
+                )
+            except Exception as error:  # noqa: BLE001 - surfaced as a truthful failure record
+                raise EvalFixtureFailed(fixture_id, error) from error
+            finally:
+                _FIXTURE_USAGE.reset(token)
+            latency_ms = min(max(0, round((time.monotonic() - started) * 1_000)), 600_000)
+            results.append({
+                "fixture_id": fixture_id,
+                "outcome": "completed",
+                "draft": draft.model_dump(mode="json"),
+                "metrics": {
+                    "latency_ms": latency_ms,
+                    "input_tokens": usage["input_tokens"],
+                    "cached_input_tokens": min(usage["cached_input_tokens"], usage["input_tokens"]),
+                    "output_tokens": usage["output_tokens"],
+                    "estimated_cost_microusd": estimated_cost_microusd(
+                        usage["input_tokens"], usage["cached_input_tokens"], usage["output_tokens"],
+                    ),
+                    "schema_attempts": 1,
+                },
+            })
+            latencies[worker].append(latency_ms)
             print(json.dumps({
-                "ok": False,
-                "error": "order_intake_eval_fixture_failed",
                 "fixture_id": fixture_id,
-                "detail": str(error)[:240],
-                "completed_before_failure": len(results),
-            }))
-            return 1
-        latency_ms = max(0, round((time.monotonic() - started) * 1_000))
-        usage = captured_usage[-1] if captured_usage else {"input_tokens": 0, "cached_input_tokens": 0, "output_tokens": 0}
-        results.append({
-            "fixture_id": fixture_id,
-            "outcome": "completed",
-            "draft": draft.model_dump(mode="json"),
-            "metrics": {
-                "latency_ms": min(latency_ms, 600_000),
-                "input_tokens": usage["input_tokens"],
-                "cached_input_tokens": min(usage["cached_input_tokens"], usage["input_tokens"]),
-                "output_tokens": usage["output_tokens"],
-                "estimated_cost_microusd": estimated_cost_microusd(
-                    usage["input_tokens"], usage["cached_input_tokens"], usage["output_tokens"],
-                ),
-                "schema_attempts": 1,
-            },
-        })
+                "worker": worker,
+                "latency_ms": latency_ms,
+                "completed": len(results),
+            }), file=sys.stderr, flush=True)
+
+    workers = [asyncio.create_task(work(worker)) for worker in latencies]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        raise
+    return [
+        {
+            "worker": worker,
+            "fixtures": len(values),
+            "latency_ms": order_intake_latency_summary(values),
+        }
+        for worker, values in latencies.items()
+    ]
+
+
+def run_provider_batch(
+    provider,
+    corpus: dict[str, object],
+    output_path: Path,
+    *,
+    concurrency: int,
+    rate_per_second: float,
+    mode: str = "live",
+) -> int:
+    pool = getattr(provider._transport, "pool", None)  # noqa: SLF001
+    if pool is not None:
+        # Workers beyond the connection bound would only queue for a slot.
+        concurrency = min(concurrency, pool.max_connections)
+    capture_usage(provider)
+    document: dict[str, object] = {"schema": ORDER_INTAKE_RESULT_SCHEMA, "results": []}
+    started = time.monotonic()
+    try:
+        workers = asyncio.run(run_batch(
+            provider,
+            corpus,
+            document,
+            concurrency=concurrency,
+            rate_per_second=rate_per_second,
+        ))
+    except EvalFixtureFailed as failure:
+        print(json.dumps({
+            "ok": False,
+            "error": "order_intake_eval_fixture_failed",
+            "fixture_id": failure.fixture_id,
+            "detail": str(failure)[:240],
+            "completed_before_failure": len(document["results"]),  # type: ignore[arg-type]
+        }))
+        return 1
+    finally:
+        if pool is not None:
+            pool.close()
+    order = {str(fixture["id"]): index for index, fixture in enumerate(corpus["fixtures"])}
+    document["results"].sort(key=lambda result: order[result["fixture_id"]])  # type: ignore[union-attr]
+    return score_and_write(
+        corpus,
+        document,
+        output_path,
+        mode=mode,
+        batch={
+            "concurrency": concurrency,
+            "elapsed_ms": round((time.monotonic() - started) * 1_000),
+            "workers": workers,
+        },
+    )
+
+
+class _MockProviderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server hook name
+        body = self.rfile.read(int(self.headers.get("content-length") or 0))
+        payload = json.loads(body)
+        message = json.loads(payload["input"])["message"]
+        extraction = self.server.extractions.get(message)  # type: ignore[attr-defined]
+        time.sleep(self.server.latency_seconds)  # type: ignore[attr-defined]
+        if extraction is None:
+            status, response = 400, {"error": {"type": "invalid_request_error"}}
+        else:
+            status, response = 200, {
+                "id": f"resp-mock-{extraction['index']}",
+                "model": MOCK_PROVIDER_MODEL,
+                "status": "completed",
+                "usage": {"input_tokens": len(body) // 4, "output_tokens": 120},
+                "output": [{
+                    "type": "message",
+                    "content": [{"type": "output_text", "text": extraction["text"]}],
+                }],
+            }
+        encoded = json.dumps(response, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return None
 
-    document = {"schema": ORDER_INTAKE_RESULT_SCHEMA, "results": results}
-    return score_and_write(corpus, document, output_path)
+
+def start_mock_provider(corpus: dict[str, object], latency_ms: int) -> ThreadingHTTPServer:
+    """Serve OpenAI-shaped answers built from the corpus expectations on loopback."""
+
+    from tests.test_order_intake import extraction_from_fixture
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MockProviderHandler)
+    server.daemon_threads = True
+    server.latency_seconds = max(0, latency_ms) / 1_000  # type: ignore[attr-defined]
+    server.extractions = {  # type: ignore[attr-defined]
+        str(fixture["message"]): {
+            "index": index,
+            "text": extraction_from_fixture(fixture).model_dump_json(),
+        }
+        for index, fixture in enumerate(corpus["fixtures"], start=1)
+    }
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_mock(
+    output_path: Path,
+    *,
+    concurrency: int,
+    rate_per_second: float,
+    latency_ms: int,
+) -> int:
+    from supermega_runtime.order_intake_provider import (
+        COMPANY_DAILY_BUDGET_DEFAULT_UNITS,
+        ORDER_INTAKE_PROVIDER_OPENAI,
+        InMemoryOrderIntakeBudget,
+        OpenAIOrderIntakeProvider,
+        PooledProviderTransport,
+    )
+
+    corpus = load_corpus()
+    server = start_mock_provider(corpus, latency_ms)
+    try:
+        provider = OpenAIOrderIntakeProvider(
+            api_key="mock-provider-key",
+            budget=InMemoryOrderIntakeBudget(COMPANY_DAILY_BUDGET_DEFAULT_UNITS),
+            model=MOCK_PROVIDER_MODEL,
+            transport=PooledProviderTransport(
+                ORDER_INTAKE_PROVIDER_OPENAI,
+                url=f"http://127.0.0.1:{server.server_port}/v1/responses",
+                max_connections=concurrency,
+            ),
+        )
+        return run_provider_batch(
+            provider,
+            corpus,
+            output_path,
+            concurrency=concurrency,
+            rate_per_second=rate_per_second,
+            mode="mock",
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
 
 
 def run_self_test(output_path: Path) -> int:
@@ -165,7 +416,7 @@ def run_self_test(output_path: Path) -> int:
             "metrics": evaluation_metrics(index),
         })
     document = {"schema": ORDER_INTAKE_RESULT_SCHEMA, "results": results}
-    return score_and_write(corpus, document, output_path, self_test=True)
+    return score_and_write(corpus, document, output_path, mode="self_test")
 
 
 def score_and_write(
@@ -173,7 +424,8 @@ def score_and_write(
     document: dict[str, object],
     output_path: Path,
     *,
-    self_test: bool = False,
+    mode: str = "live",
+    batch: dict[str, object] | None = None,
 ) -> int:
     report = evaluate_order_intake_results(corpus, document)
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -181,9 +433,9 @@ def score_and_write(
         json.dumps(document, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
         encoding="utf-8",
     )
-    print(json.dumps({
+    summary = {
         "ok": bool(report["quality_gate_passed"]),
-        "mode": "self_test" if self_test else "live",
+        "mode": mode,
         "output": str(output_path.relative_to(REPO_ROOT)) if output_path.is_relative_to(REPO_ROOT) else str(output_path),
         "total": report["total"],
         "passed": report["passed"],
@@ -191,7 +443,10 @@ def score_and_write(
         "quality_gate_passed": report["quality_gate_passed"],
         "quality": report["quality"],
         "usage": report["usage"],
-    }, ensure_ascii=False))
+    }
+    if batch is not None:
+        summary["batch"] = batch
+    print(json.dumps(summary, ensure_ascii=False))
     return 0 if report["quality_gate_passed"] else 1
 
 
@@ -203,15 +458,45 @@ def main() -> int:
         action="store_true",
         help="Prove the runner offline from fixture expectations; no network, no key.",
     )
+    parser.add_argument(
+        "--mock-provider",
+        action="store_true",
+        help="Run the provider batch offline against a loopback stand-in; no key.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help=f"Concurrent extraction workers (1-{ORDER_INTAKE_HARD_MAX_CONNECTIONS}).",
+    )
+    parser.add_argument(
+        "--rate-per-second",
+        type=float,
+        default=0.0,
+        help="Maximum provider request starts per second; 0 leaves it unlimited.",
+    )
+    parser.add_argument(
+        "--mock-latency-ms",
+        type=int,
+        default=200,
+        help="Simulated model latency of the --mock-provider stand-in.",
+    )
     args = parser.parse_args()
+    if not 1 <= args.concurrency <= ORDER_INTAKE_HARD_MAX_CONNECTIONS:
+        parser.error(f"--concurrency must be between 1 and {ORDER_INTAKE_HARD_MAX_CONNECTIONS}")
+    if args.rate_per_second < 0:
+        parser.error("--rate-per-second must not be negative")
+    if args.self_test and args.mock_provider:
+        parser.error("--self-test and --mock-provider are exclusive")
     if args.out is None:
         # A synthetic self-test document must never land beside real evidence.
         import tempfile
-        default_out = (
-            Path(tempfile.gettempdir()) / "supermega-order-intake-self-test.json"
-            if args.self_test
-            else DEFAULT_OUTPUT_PATH
-        )
+        if args.self_test:
+            default_out = Path(tempfile.gettempdir()) / "supermega-order-intake-self-test.json"
+        elif args.mock_provider:
+            default_out = Path(tempfile.gettempdir()) / "supermega-order-intake-mock.json"
+        else:
+            default_out = DEFAULT_OUTPUT_PATH
     else:
         default_out = Path(args.out)
     output_path = default_out
@@ -219,7 +504,18 @@ def main() -> int:
         output_path = REPO_ROOT / output_path
     if args.self_test:
         return run_self_test(output_path)
-    return run_live(output_path)
+    if args.mock_provider:
+        return run_mock(
+            output_path,
+            concurrency=args.concurrency,
+            rate_per_second=args.rate_per_second,
+            latency_ms=args.mock_latency_ms,
+        )
+    return run_live(
+        output_path,
+        concurrency=args.concurrency,
+        rate_per_second=args.rate_per_second,
+    )
 
 
 if __name__ == "__main__":
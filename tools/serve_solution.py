@@ -14,12 +14,14 @@ import sys
 import tempfile
 import threading
 import time
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import asynccontextmanager
 from datetime import timedelta
 from datetime import datetime
 from datetime import timezone
 from html import escape, unescape
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Callable
 from urllib.parse import quote, urlparse
 from urllib.error import HTTPError, URLError
 from urllib.request import Request as UrlRequest, urlopen
@@ -89,7 +91,9 @@ from mark1_pilot.state_store import (  # noqa: E402
     load_agent_team_summary,
     load_decision_summary,
     load_approval_summary,
+    load_dashboard_summary,
     load_inventory_summary,
+    load_json_artifact,
     load_maintenance_summary,
     load_metric_summary,
     load_product_feedback_summary,
@@ -126,7 +130,8 @@ from mark1_pilot.enterprise_store import (  # noqa: E402
     get_lead as enterprise_get_lead,
     get_lead_hunt_profile as enterprise_get_lead_hunt_profile,
     get_agent_capacity_plan as enterprise_get_agent_capacity_plan,
-    get_session as enterprise_get_session,
+    flush_session_touches as enterprise_flush_session_touches,
+    get_cached_session as enterprise_get_cached_session,
     get_workspace_profile as enterprise_get_workspace_profile,
     get_workspace_domain_by_hostname as enterprise_get_workspace_domain_by_hostname,
     invite_workspace_member as enterprise_invite_workspace_member,
@@ -144,6 +149,7 @@ from mark1_pilot.enterprise_store import (  # noqa: E402
     list_workspace_tasks as enterprise_list_workspace_tasks,
     load_lead_summary as enterprise_load_lead_summary,
     remove_workspace_task as enterprise_remove_workspace_task,
+    renew_agent_run_lease as enterprise_renew_agent_run_lease,
     resolve_database_url as resolve_enterprise_database_url,
     revoke_session as enterprise_revoke_session,
     save_lead_hunt_profile as enterprise_save_lead_hunt_profile,
@@ -158,10 +164,18 @@ from mark1_pilot.agent_governance import (  # noqa: E402
     AGENT_AUTOMATED_JOB_TYPES,
     AGENT_BUDGET_ACCOUNTING_CONTRACT,
     AgentGovernanceError,
+    agent_lease_heartbeat_seconds,
     build_agent_failure,
     load_agent_workforce_policy,
 )
-from mark1_pilot.lead_finder import run_lead_finder  # noqa: E402
+from mark1_pilot.agent_run_executor import (  # noqa: E402
+    AGENT_RUN_RESPONSE_DEADLINE_SECONDS,
+    shared_agent_run_executor,
+    shutdown_shared_agent_run_executor,
+)
+from mark1_pilot.lead_cache import LEAD_CACHE_FILE  # noqa: E402
+from mark1_pilot.runtime_probe_cache import RuntimeProbeCache, shared_probe_executor  # noqa: E402
+from mark1_pilot.lead_finder import configure_lead_cache, run_lead_finder, run_lead_finder_batch  # noqa: E402
 from mark1_pilot.lead_to_pilot import build_lead_to_pilot_pack  # noqa: E402
 from mark1_pilot.document_intake import analyze_document  # noqa: E402
 from mark1_pilot.metric_intake import extract_metric_candidates, summarize_metric_rows  # noqa: E402
@@ -927,6 +941,11 @@ def _load_json(path: Path) -> dict[str, Any]:
     return payload if isinstance(payload, dict) else {}
 
 
+def _load_cached_json(path: Path) -> dict[str, Any]:
+    payload = load_json_artifact(path)
+    return payload if isinstance(payload, dict) else {}
+
+
 def _unique_values(values: list[str]) -> list[str]:
     output: list[str] = []
     seen: set[str] = set()
@@ -2864,17 +2883,11 @@ def _github_probe_for_repo(repo_root: Path) -> GitHubRepoProbe:
     return GitHubRepoProbe(repo_root, token=token, repo_slug=repo_slug)
 
 
-_LIVE_RUNTIME_CACHE: dict[str, tuple[float, Any]] = {}
+_LIVE_RUNTIME_CACHE = RuntimeProbeCache()
 
 
 def _cached_runtime_probe(cache_key: str, ttl_seconds: int, builder: Callable[[], Any]) -> Any:
-    now = time.time()
-    cached = _LIVE_RUNTIME_CACHE.get(cache_key)
-    if cached and cached[0] >= now:
-        return cached[1]
-    value = builder()
-    _LIVE_RUNTIME_CACHE[cache_key] = (now + max(1, ttl_seconds), value)
-    return value
+    return _LIVE_RUNTIME_CACHE.get(cache_key, ttl_seconds, builder)
 
 
 def _probe_with_timeout(
@@ -2884,30 +2897,24 @@ def _probe_with_timeout(
     timeout_status: str = "timeout",
     timeout_message: str = "Probe timed out.",
 ) -> Any:
-    result: dict[str, Any] = {}
-    error: dict[str, Exception] = {}
-    completed = threading.Event()
-
-    def run() -> None:
-        try:
-            result["value"] = builder()
-        except Exception as exc:  # pragma: no cover - defensive wrapper for external probes
-            error["value"] = exc
-        finally:
-            completed.set()
-
-    threading.Thread(target=run, daemon=True).start()
-    if not completed.wait(max(0.1, float(timeout_seconds))):
+    timeout = max(0.1, float(timeout_seconds))
+    future = shared_probe_executor().submit(builder, timeout_seconds=timeout)
+    try:
+        return future.result(timeout=timeout)
+    except FuturesTimeoutError:
+        # A probe still queued never starts; a running one finishes on its
+        # worker, which the pool replaces while it is stuck, and its result
+        # is dropped.
+        future.cancel()
         return {
             "status": timeout_status,
             "message": timeout_message,
         }
-    if "value" in error:
+    except Exception as exc:  # pragma: no cover - defensive wrapper for external probes
         return {
             "status": "error",
-            "message": str(error["value"]),
+            "message": str(exc),
         }
-    return result.get("value")
 
 
 def _probe_command_output(command: str, *args: str, timeout_seconds: int = 4) -> tuple[str, str]:
@@ -3171,6 +3178,7 @@ def create_app(site_root: Path, pilot_data: Path) -> FastAPI:
     _init_sentry_runtime()
     state_db = resolve_state_db(pilot_data)
     enterprise_db_url = resolve_enterprise_database_url(pilot_data)
+    configure_lead_cache(pilot_data / LEAD_CACHE_FILE)
     preview_release_review_lock = threading.Lock()
     sync_state_from_output_dir(pilot_data)
     runtime_environment = str(os.getenv("SUPERMEGA_ENV", "production")).strip().lower() or "production"
@@ -3233,7 +3241,16 @@ def create_app(site_root: Path, pilot_data: Path) -> FastAPI:
             rows=state_list_lead_pipeline(state_db, limit=500),
         )
 
-    app = FastAPI(title="SuperMega Service", version="0.2.0")
+    @asynccontextmanager
+    async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            # Buffered last_seen_at touches would otherwise be lost on restart.
+            enterprise_flush_session_touches()
+            shutdown_shared_agent_run_executor()
+
+    app = FastAPI(title="SuperMega Service", version="0.2.0", lifespan=_lifespan)
     default_cors = "https://app.supermega.dev,https://supermega.dev,https://www.supermega.dev" if production_mode else "*"
     cors_origins = [origin.strip() for origin in os.getenv("SUPERMEGA_CORS_ORIGINS", default_cors).split(",") if origin.strip()]
     if not cors_origins:
@@ -3252,7 +3269,7 @@ def create_app(site_root: Path, pilot_data: Path) -> FastAPI:
         session_id = str(request.cookies.get(SESSION_COOKIE_NAME, "")).strip()
         if not session_id:
             return None
-        return enterprise_get_session(enterprise_db_url, session_id=session_id)
+        return enterprise_get_cached_session(enterprise_db_url, session_id=session_id)
 
     def _require_session(request: Request) -> dict[str, Any]:
         if not auth_required:
@@ -3455,8 +3472,8 @@ def create_app(site_root: Path, pilot_data: Path) -> FastAPI:
                     "side_effects": {"writes_performed": False, "external_messages_sent": False},
                 },
             )
-        completed_rows = [
-            _complete_existing_agent_run(
+        def complete_claimed_run(row: dict[str, Any]) -> dict[str, Any]:
+            return _complete_existing_agent_run(
                 state_db=state_db,
                 enterprise_db_url=enterprise_db_url,
                 workspace_id=workspace_id,
@@ -3465,8 +3482,35 @@ def create_app(site_root: Path, pilot_data: Path) -> FastAPI:
                 claim_token=str(row.get("claim_token", "")).strip(),
                 payload=row.get("payload", {}) if isinstance(row.get("payload", {}), dict) else {},
             )
-            for row in claimed_rows
-            if str(row.get("run_id", "")).strip() and str(row.get("job_type", "")).strip()
+
+        def renew_claimed_run(row: dict[str, Any]) -> dict[str, Any] | None:
+            return enterprise_renew_agent_run_lease(
+                enterprise_db_url,
+                workspace_id=workspace_id,
+                run_id=str(row.get("run_id", "")).strip(),
+                claim_token=str(row.get("claim_token", "")).strip(),
+            )
+
+        policy = load_agent_workforce_policy()
+        completed_rows, pending_rows = shared_agent_run_executor(policy.max_running).run(
+            [
+                row
+                for row in claimed_rows
+                if str(row.get("run_id", "")).strip() and str(row.get("job_type", "")).strip()
+            ],
+            complete=complete_claimed_run,
+            renew_lease=renew_claimed_run,
+            heartbeat_seconds=agent_lease_heartbeat_seconds(policy),
+            deadline_seconds=AGENT_RUN_RESPONSE_DEADLINE_SECONDS,
+        )
+        running_rows = [
+            {
+                "run_id": str(row.get("run_id", "")).strip(),
+                "job_type": str(row.get("job_type", "")).strip(),
+                "status": "running",
+                "lease_heartbeat": True,
+            }
+            for row in pending_rows
         ]
         reserved_units = sum(
             int((row.get("budget_reservation", {}) or {}).get("units", 0) or 0)
@@ -3502,9 +3546,12 @@ def create_app(site_root: Path, pilot_data: Path) -> FastAPI:
             enterprise_db_url=enterprise_db_url,
             workspace_id=workspace_id,
             rows=completed_rows,
+            status="partial" if running_rows else "ready",
             extra={
                 "claimed_count": len(claimed_rows),
                 "processed_count": len(completed_rows),
+                "running_count": len(running_rows),
+                "running_rows": running_rows,
                 "mode": source,
                 "budget_accounting": accounting,
                 "side_effects": {
@@ -4202,10 +4249,25 @@ def create_app(site_root: Path, pilot_data: Path) -> FastAPI:
         limit: int,
         campaign_goal: str,
         export_workspace: bool,
+        lead_result: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        lead_result = run_lead_finder(raw_text=raw_text, query=query, keywords=keywords, sources=sources, limit=limit)
+        if lead_result is None:
+            lead_result = run_lead_finder(raw_text=raw_text, query=query, keywords=keywords, sources=sources, limit=limit)
         lead_rows = list(lead_result.get("rows") or [])
         provider = str(lead_result.get("provider", "")).strip()
+        cache_stats = lead_result.get("cache")
+        if lead_result.get("status") == "error":
+            return {
+                "status": "error",
+                "provider": provider,
+                "engine": "rules",
+                "row_count": 0,
+                "saved_count": 0,
+                "summary": f"Lead search failed: {lead_result.get('message') or 'unknown error'}",
+                "rows": [],
+                "opportunities": [],
+                "cache": cache_stats,
+            }
         if not lead_rows:
             return {
                 "status": "ready",
@@ -4216,6 +4278,7 @@ def create_app(site_root: Path, pilot_data: Path) -> FastAPI:
                 "summary": "No matching leads found for this hunt.",
                 "rows": [],
                 "opportunities": [],
+                "cache": cache_stats,
             }
 
         lead_pack = build_lead_to_pilot_pack(
@@ -4278,6 +4341,7 @@ def create_app(site_root: Path, pilot_data: Path) -> FastAPI:
             },
             "export": export_result,
             "hunt": profile_row,
+            "cache": cache_stats,
         }
 
     def _runtime_health_from_team_status(value: str) -> str:
@@ -7580,40 +7644,40 @@ def create_app(site_root: Path, pilot_data: Path) -> FastAPI:
         }
 
     def _summary_payload(session: dict[str, Any]) -> dict[str, Any]:
-        review = _load_json(pilot_data / "execution_review.json")
-        autopilot = _load_json(pilot_data / "autopilot_status.json")
-        coverage = _load_json(pilot_data / "data_coverage_report.json")
-        publish = _load_json(pilot_data / "platform_publish.json")
-        product_lab = load_snapshot(state_db, "product_lab") or _load_json(pilot_data / "product_lab.json")
-        action_summary = load_action_summary(state_db)
+        review = _load_cached_json(pilot_data / "execution_review.json")
+        autopilot = _load_cached_json(pilot_data / "autopilot_status.json")
+        coverage = _load_cached_json(pilot_data / "data_coverage_report.json")
+        publish = _load_cached_json(pilot_data / "platform_publish.json")
+        workspace_id = str(session.get("workspace_id", "")).strip()
+        dashboard = load_dashboard_summary(state_db, workspace_id=workspace_id)
+        snapshots = dashboard["snapshots"]
+        product_lab = snapshots.get("product_lab") or _load_cached_json(pilot_data / "product_lab.json")
+        action_summary = dashboard["actions"]
         tenant_key = _agent_workspace_resource_key(session)
         agent_team_summary = load_agent_team_summary(state_db, tenant_key=tenant_key)
-        quality_summary = load_quality_summary(state_db)
-        supplier_summary = load_supplier_risk_summary(state_db)
-        receiving_summary = load_receiving_summary(state_db)
-        inventory_summary = load_inventory_summary(state_db)
-        maintenance_summary = load_maintenance_summary(state_db)
-        approval_summary = load_approval_summary(
-            state_db,
-            workspace_id=str(session.get("workspace_id", "")).strip(),
-        )
-        metric_summary = load_metric_summary(state_db)
-        feedback_summary = load_product_feedback_summary(state_db)
+        quality_summary = dashboard["quality"]
+        supplier_summary = dashboard["supplier_watch"]
+        receiving_summary = dashboard["receiving"]
+        inventory_summary = dashboard["inventory"]
+        maintenance_summary = dashboard["maintenance"]
+        approval_summary = dashboard["approvals"]
+        metric_summary = dashboard["metrics"]
+        feedback_summary = dashboard["feedback"]
         lead_pipeline_summary = enterprise_load_lead_summary(
             enterprise_db_url,
-            workspace_id=str(session.get("workspace_id", "")).strip(),
+            workspace_id=workspace_id,
         )
         latest_agent_runs = enterprise_list_agent_runs(
             enterprise_db_url,
-            workspace_id=str(session.get("workspace_id", "")).strip(),
+            workspace_id=workspace_id,
             limit=20,
         )
         latest_agent_runs_by_type = _group_agent_runs_by_job_type(latest_agent_runs)
-        portfolio = load_snapshot(state_db, "solution_portfolio_manifest") or _load_json(
+        portfolio = snapshots.get("solution_portfolio_manifest") or _load_cached_json(
             REPO_ROOT / "Super Mega Inc" / "sales" / "solution_portfolio_manifest.json"
         )
-        platform_digest = load_snapshot(state_db, "platform_digest") or _load_json(pilot_data / "platform_digest.json")
-        supervisor = _load_json(pilot_data / "supervisor_status.json")
+        platform_digest = snapshots.get("platform_digest") or _load_cached_json(pilot_data / "platform_digest.json")
+        supervisor = _load_cached_json(pilot_data / "supervisor_status.json")
         return {
             "review": {
                 "project_status": review.get("project_status", {}),
@@ -12650,22 +12714,32 @@ def create_app(site_root: Path, pilot_data: Path) -> FastAPI:
         )
         results: list[dict[str, Any]] = []
         total_saved = 0
-        for hunt in hunts:
+        # Discovery is network-bound and independent per hunt, so every hunt's
+        # lead search runs up front in parallel; saving stays one hunt at a time.
+        lead_jobs = [
+            {
+                "raw_text": str(hunt.get("raw_text", "")).strip(),
+                "query": str(hunt.get("query", "")).strip(),
+                "keywords": [str(item).strip() for item in (hunt.get("keywords") or []) if str(item).strip()],
+                "sources": [str(item).strip() for item in (hunt.get("sources") or []) if str(item).strip()],
+                "limit": int(hunt.get("limit", 8) or 8),
+            }
+            for hunt in hunts
+        ]
+        lead_results = run_lead_finder_batch(lead_jobs)
+        for hunt, lead_job, lead_result in zip(hunts, lead_jobs, lead_results):
             result = _run_autonomous_lead_hunt(
                 workspace_id=workspace_id,
                 workspace_name=workspace_name,
                 hunt_id=str(hunt.get("hunt_id", "")).strip(),
-                query=str(hunt.get("query", "")).strip(),
-                raw_text=str(hunt.get("raw_text", "")).strip(),
-                keywords=[str(item).strip() for item in (hunt.get("keywords") or []) if str(item).strip()],
-                sources=[str(item).strip() for item in (hunt.get("sources") or []) if str(item).strip()],
-                limit=int(hunt.get("limit", 8) or 8),
                 campaign_goal=str(hunt.get("campaign_goal", "")).strip() or "Book one discovery call.",
                 export_workspace=bool(
                     request.export_workspace
                     if request.export_workspace is not None
                     else hunt.get("export_workspace", True)
                 ),
+                lead_result=lead_result,
+                **lead_job,
             )
             saved_count = int(result.get("saved_count", 0) or 0)
             total_saved += saved_count
@@ -12673,10 +12747,12 @@ def create_app(site_root: Path, pilot_data: Path) -> FastAPI:
                 {
                     "hunt_id": str(hunt.get("hunt_id", "")).strip(),
                     "name": str(hunt.get("name", "")).strip(),
+                    "status": str(result.get("status", "")).strip(),
                     "saved_count": saved_count,
                     "provider": str(result.get("provider", "")).strip(),
                     "engine": str(result.get("engine", "")).strip(),
                     "summary": str(result.get("summary", "")).strip(),
+                    "cache": result.get("cache"),
                 }
             )
         return {
@@ -5,6 +5,8 @@ param(
     [int]$PollSeconds = 30,
     [int]$Limit = 12,
     [int]$MaxCycles = 0,
+    [ValidateSet("http", "push")]
+    [string]$WorkerMode = "http",
     [switch]$NoEnqueueDefaults
 )
 
@@ -57,7 +59,8 @@ $args = @(
     "--interval-minutes", $IntervalMinutes,
     "--poll-seconds", $PollSeconds,
     "--limit", $Limit,
-    "--max-cycles", $MaxCycles
+    "--max-cycles", $MaxCycles,
+    "--worker-mode", $WorkerMode
 )
 
 if ($NoEnqueueDefaults) {
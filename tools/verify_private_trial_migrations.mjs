@@ -28,6 +28,7 @@ const expectedMigrations = [
   '20260816120000_private_trial_backend_v11_self_serve_grants.sql',
   '20260817090000_private_trial_backend_v12_billing_rail.sql',
   '20260818090000_private_trial_backend_v13_billing_entitlement_read.sql',
+  '20260820090000_private_trial_backend_v14_state_segments.sql',
 ]
 const expectedPolicyFingerprints = {
   approval_requests_access_gate: {
@@ -138,6 +139,24 @@ const expectedPolicyFingerprints = {
     qual: '0fd69d13f5845335429f2bc0254d43285c74db27185502b49d71277a1b037e29',
     check: null,
   },
+  workspace_state_segments_access_gate: {
+    command: 'ALL',
+    permissive: 'RESTRICTIVE',
+    qual: '62b06512b305b9314444df79e58ab5aa64b5d67d60e3449a110f7e1393fa0a5b',
+    check: '62b06512b305b9314444df79e58ab5aa64b5d67d60e3449a110f7e1393fa0a5b',
+  },
+  workspace_state_segments_capability_insert: {
+    command: 'INSERT',
+    permissive: 'PERMISSIVE',
+    qual: null,
+    check: 'd6b9abc807ba7fd919e6ce46fe2e2f651508a7483283731e391e4c97cf804e64',
+  },
+  workspace_state_segments_member_read: {
+    command: 'SELECT',
+    permissive: 'PERMISSIVE',
+    qual: 'cac7b3eeb701d27ff0bd88a50044f2d008606409bae9d4ce9b701fd8071a78de',
+    check: null,
+  },
 }
 const initplanPolicyNames = [
   'approval_requests_capability_insert',
@@ -151,6 +170,8 @@ const initplanPolicyNames = [
   'workspace_state_capability_insert',
   'workspace_state_capability_update',
   'workspace_state_member_read',
+  'workspace_state_segments_capability_insert',
+  'workspace_state_segments_member_read',
 ]
 const expectedAccessFunction = {
   name: 'workspace_is_active',
@@ -166,6 +187,13 @@ const expectedDirectoryFunction = {
   language: 'sql',
   sourceHash: '6f7002c211b52aef98a7dd702a1ca112163570ceb03446883ee3d332bea867d0',
 }
+const expectedSegmentCollectorFunction = {
+  name: 'collect_workspace_state_segments',
+  identityArguments: 'target_workspace_id text, target_surface text, candidate_digests text[]',
+  resultType: 'integer',
+  language: 'plpgsql',
+  sourceHash: '053d73ff55e4593ca46327f872cac39f5b689dc2cbca824e36a5aa293b50447d',
+}
 const expectedSessionFunction = {
   name: 'supabase_session_is_active',
   identityArguments: 'target_user_id uuid, target_session_id uuid',
@@ -353,6 +381,14 @@ const expectedIndexes = {
     true,
     'p',
   ],
+  workspace_state_segments_pkey: [
+    'workspace_state_segments',
+    ['workspace_id', 'surface', 'digest'],
+    [0, 0, 0],
+    true,
+    true,
+    'p',
+  ],
 }
 
 const checks = []
@@ -427,7 +463,7 @@ await applyMigrations(database)
 const version = await database.query(
   "select schema_version from app_private.trial_schema_meta where component = 'private_trial_backend'",
 )
-requireCheck('schema version thirteen', version.rows[0]?.schema_version === 13)
+requireCheck('schema version fourteen', version.rows[0]?.schema_version === 14)
 
 const relations = await database.query(`
   select relation.relname as relation_name, relation.relkind::text as relation_kind,
@@ -453,6 +489,7 @@ requireCheck(
         'workspace_events',
         'workspace_memberships',
         'workspace_state',
+        'workspace_state_segments',
       ].map((relation_name) => ({ relation_name, relation_kind: 'r', owner_name: 'postgres' })),
     ),
 )
@@ -477,6 +514,7 @@ const expectedRls = [
   { relation_name: 'workspace_events', rls_enabled: true, rls_forced: true },
   { relation_name: 'workspace_memberships', rls_enabled: true, rls_forced: true },
   { relation_name: 'workspace_state', rls_enabled: true, rls_forced: true },
+  { relation_name: 'workspace_state_segments', rls_enabled: true, rls_forced: true },
 ]
 requireCheck(
   'metadata RLS and tenant force-RLS are exact',
@@ -578,6 +616,36 @@ requireCheck(
   entitlementRuntimeReadRow.rows[0]?.select_privilege === true,
 )
 
+// v14 state segments are content-addressed and immutable: the runtime role may
+// read and append chunks, never rewrite or remove them, and no Supabase API
+// role can reach them at all.
+const segmentPrivilegeRows = await database.query(`
+  select
+    has_table_privilege('supermega_trial_backend', 'app_private.workspace_state_segments', 'SELECT')
+      and has_table_privilege('supermega_trial_backend', 'app_private.workspace_state_segments', 'INSERT')
+      as runtime_append,
+    (
+      select bool_or(
+        has_table_privilege(role_name, 'app_private.workspace_state_segments', privilege_name)
+      )
+      from unnest(array['supermega_trial_backend', 'anon', 'authenticated', 'service_role']) role_name,
+           unnest(array['UPDATE', 'DELETE', 'TRUNCATE']) privilege_name
+    ) as any_rewrite,
+    (
+      select bool_or(
+        has_table_privilege(role_name, 'app_private.workspace_state_segments', privilege_name)
+      )
+      from unnest(array['anon', 'authenticated', 'service_role']) role_name,
+           unnest(array['SELECT', 'INSERT']) privilege_name
+    ) as any_api_access
+`)
+requireCheck(
+  'v14 state segments are append-only for the runtime role and dark to API roles',
+  segmentPrivilegeRows.rows[0]?.runtime_append === true &&
+    segmentPrivilegeRows.rows[0]?.any_rewrite === false &&
+    segmentPrivilegeRows.rows[0]?.any_api_access === false,
+)
+
 const accessFunctionRows = await database.query(`
   select function_record.proname as function_name,
          pg_get_function_identity_arguments(function_record.oid) as identity_arguments,
@@ -634,6 +702,46 @@ requireCheck(
       JSON.stringify(['search_path=pg_catalog, app_private']),
 )
 
+// The collector is the only path that removes state segments; it runs as the
+// owner so the runtime role stays append-only on the table itself.
+const segmentCollectorRows = await database.query(`
+  select function_record.proname as function_name,
+         pg_get_function_identity_arguments(function_record.oid) as identity_arguments,
+         pg_get_function_result(function_record.oid) as result_type,
+         function_record.prosrc as function_source,
+         function_record.prosecdef as security_definer,
+         function_record.proconfig as function_config,
+         language_record.lanname as function_language,
+         has_function_privilege(
+           'supermega_trial_backend', function_record.oid, 'EXECUTE'
+         ) as runtime_execute,
+         (
+           select bool_or(has_function_privilege(role_name, function_record.oid, 'EXECUTE'))
+           from unnest(array['anon', 'authenticated', 'service_role']) role_name
+         ) as any_api_execute
+  from pg_proc function_record
+  join pg_namespace schema_record on schema_record.oid = function_record.pronamespace
+  join pg_language language_record on language_record.oid = function_record.prolang
+  where schema_record.nspname = 'app_private'
+    and function_record.proname = 'collect_workspace_state_segments'
+`)
+requireCheck(
+  'exact v14 state segment collector function',
+  segmentCollectorRows.rows.length === 1 &&
+    segmentCollectorRows.rows[0].function_name === expectedSegmentCollectorFunction.name &&
+    segmentCollectorRows.rows[0].identity_arguments ===
+      expectedSegmentCollectorFunction.identityArguments &&
+    segmentCollectorRows.rows[0].result_type === expectedSegmentCollectorFunction.resultType &&
+    segmentCollectorRows.rows[0].function_language === expectedSegmentCollectorFunction.language &&
+    normalizedSourceHash(segmentCollectorRows.rows[0].function_source) ===
+      expectedSegmentCollectorFunction.sourceHash &&
+    segmentCollectorRows.rows[0].security_definer === true &&
+    JSON.stringify(segmentCollectorRows.rows[0].function_config) ===
+      JSON.stringify(['search_path=pg_catalog, app_private']) &&
+    segmentCollectorRows.rows[0].runtime_execute === true &&
+    segmentCollectorRows.rows[0].any_api_execute === false,
+)
+
 const sessionFunctionRows = await database.query(`
   select function_record.proname as function_name,
          pg_get_function_identity_arguments(function_record.oid) as identity_arguments,
@@ -904,7 +1012,7 @@ const hostedVersion = await hostedDatabase.query(
 )
 requireCheck(
   'exact Supabase hosted administrative membership accepted',
-  hostedVersion.rows[0]?.schema_version === 13,
+  hostedVersion.rows[0]?.schema_version === 14,
 )
 
 const memberDatabase = new PGlite()